@@ -0,0 +1,210 @@
+"""Shared fixtures for the python-sec micro-benchmarks.
+
+Every benchmark runs offline. The company facts payload is the recorded
+SEC response in ``samples/responses``; the Atom, HTML and DERA inputs
+are generated here in the shape of the SEC pages they stand in for.
+
+Run the suite (it isn't collected by a plain ``pytest``)::
+
+    pip install python-sec[bench]
+    pytest benchmarks/
+
+Each benchmark also reports its throughput (``items_per_second``) and
+the peak memory Python allocated during one run (``peak_memory_kib``).
+Both are printed in the terminal summary and stored in the saved JSON.
+
+Save a baseline, then fail a later run that is more than 10% slower::
+
+    pytest benchmarks/ --benchmark-save=baseline
+    pytest benchmarks/ --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+
+# pylint: disable=redefined-outer-name
+
+from __future__ import annotations
+
+import io
+import json
+import tracemalloc
+import zipfile
+from pathlib import Path
+
+import pytest
+
+COMPANY_FACTS_PATH = Path(__file__).parent.parent / "samples" / "responses" / "xbrl_company_facts.jsonc"
+
+# Results of the ``measure`` fixture, printed in the terminal summary.
+_MEASUREMENTS: list[tuple[str, int, float, float]] = []
+
+
+def build_atom_feed(count: int) -> bytes:
+    """Builds a browse-edgar ``getcompany`` Atom page holding ``count`` filings."""
+
+    entries = "".join(
+        "<entry>"
+        '<category label="form type" scheme="https://www.sec.gov/" term="10-Q"/>'
+        '<content type="text/xml">'
+        f"<accession-number>0000320193-21-{i:06d}</accession-number>"
+        "<act>34</act><file-number>000-10030</file-number><film-number>21866987</film-number>"
+        "<filing-date>2021-04-29</filing-date>"
+        f"<filing-href>https://www.sec.gov/Archives/edgar/data/320193/{i:06d}-index.htm</filing-href>"
+        "<filing-type>10-Q</filing-type><form-name>Quarterly report [Sections 13 or 15(d)]</form-name>"
+        "<size>5 MB</size><xbrl_href>https://www.sec.gov/cgi-bin/viewer?action=view</xbrl_href>"
+        "</content>"
+        f"<id>urn:tag:sec.gov,2008:accession-number=0000320193-21-{i:06d}</id>"
+        '<link href="https://www.sec.gov/index.htm" rel="alternate" type="text/html"/>'
+        '<summary type="html"> &lt;b&gt;Filed:&lt;/b&gt; 2021-04-29 &lt;b&gt;AccNo:&lt;/b&gt; </summary>'
+        "<title>10-Q  - Quarterly report [Sections 13 or 15(d)]</title>"
+        "<updated>2021-04-29T18:03:20-04:00</updated>"
+        "</entry>"
+        for i in range(count)
+    )
+    return (
+        '<?xml version="1.0" encoding="ISO-8859-1" ?>'
+        '<feed xmlns="http://www.w3.org/2005/Atom">'
+        "<company-info><cik>0000320193</cik><conformed-name>Apple Inc.</conformed-name></company-info>"
+        '<link href="https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&amp;start=100" '
+        'rel="next" type="application/atom+xml"/>'
+        f"{entries}</feed>"
+    ).encode("latin-1")
+
+
+def build_issuer_page(count: int) -> str:
+    """Builds an ``own-disp`` owner page listing ``count`` issuers and transactions."""
+
+    issuers = "".join(
+        "<tr>\n"
+        f'<td><a href="/cgi-bin/browse-edgar?action=getcompany&CIK={i:010d}">Issuer {i}</a></td>\n'
+        f'<td><a href="/cgi-bin/own-disp?action=getissuer&CIK={i:010d}">{i % 40} filings</a></td>\n'
+        "<td>2021-04-01</td>\n<td>director</td>\n"
+        "</tr>\n"
+        for i in range(count)
+    )
+    transactions = "".join(
+        "<tr>\n<td>2021-04-01</td>\n"
+        f'<td><a href="/Archives/edgar/data/{i}/000000000021000001/wf-form4.xml">Issuer {i}</a></td>\n'
+        "<td>4</td>\n<td>S-Sale</td>\n<td>2500</td>\n<td>$123.00</td>\n</tr>\n"
+        for i in range(count)
+    )
+    filler = "<div class='nav'>" + "<p><a href='/'>SEC</a> <span>menu</span></p>" * count + "</div>"
+    return (
+        "<html><head><title>EDGAR Ownership</title></head><body>\n"
+        f"{filler}\n"
+        + "<table><tr><td>header</td></tr></table>\n" * 4
+        + f"<table>\n{issuers}</table>\n"
+        '<table id="transaction-report">\n<tr>\n<td>Date</td>\n<td>Reporting Owner</td>\n<td>Form</td>\n'
+        "<td>Transaction Type</td>\n<td>Shares</td>\n<td>Price</td>\n</tr>\n"
+        f"{transactions}</table>\n</body></html>"
+    )
+
+
+def build_variable_products_page(count: int) -> str:
+    """Builds a variable insurance product search page with ``count`` rows."""
+
+    prefixes = ("", "S", "C")
+    rows = "".join(
+        '<tr valign="top">\n'
+        f'<td><a href="/cgi-bin/browse-edgar?action=getcompany&CIK={prefixes[i % 3]}{i:09d}">'
+        f"{prefixes[i % 3]}{i:09d}</a></td>\n<td>Product {i}</td>\n<td>TICK{i % 100}</td>\n</tr>\n"
+        for i in range(count)
+    )
+    filler = "<div class='nav'>" + "<p><a href='/'>SEC</a> <span>menu</span></p>" * count + "</div>"
+    return (
+        "<html><body>\n"
+        f"{filler}\n"
+        '<center><a href="/cgi-bin/series?company=a&CIK=&start=0">1</a></center>\n'
+        f'<table summary=".">\n{rows}</table>\n</body></html>'
+    )
+
+
+def build_dera_zip(count: int) -> bytes:
+    """Builds a DERA Financial Statement Data Sets ZIP with ``count`` ``num`` rows."""
+
+    sub = "adsh\tcik\tname\tsic\tcountryba\tform\tperiod\tfy\tfp\tfiled\taccepted\n" + "".join(
+        f"0000000000-24-{i:06d}\t{i}\tCompany {i}\t3571\tUS\t10-K\t20231231\t2023\tFY\t20240215"
+        "\t2024-02-15 16:05:00.0\n"
+        for i in range(max(1, count // 50))
+    )
+    num = "adsh\ttag\tversion\tcoreg\tddate\tqtrs\tuom\tvalue\tfootnote\n" + "".join(
+        f"0000000000-24-{i // 50:06d}\tTag{i % 500}\tus-gaap/2023\t\t20231231\t4\tUSD\t{i * 1000}.5000\t\n"
+        for i in range(count)
+    )
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("sub.txt", sub)
+        zf.writestr("num.txt", num)
+        zf.writestr("tag.txt", "tag\tversion\tcustom\tabstract\tdatatype\n")
+        zf.writestr("pre.txt", "adsh\treport\tline\tstmt\tinpth\trfile\ttag\tversion\tplabel\tnegating\n")
+    return buf.getvalue()
+
+
+@pytest.fixture(scope="session")
+def atom_feed() -> bytes:
+    """A 5,000-entry browse-edgar Atom page."""
+    return build_atom_feed(5_000)
+
+
+@pytest.fixture(scope="session")
+def company_facts() -> dict:
+    """The recorded company facts response for Facebook (CIK 1326801)."""
+    return json.loads(COMPANY_FACTS_PATH.read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="session")
+def issuer_page() -> str:
+    """An owner page with 1,000 issuers and transactions."""
+    return build_issuer_page(1_000)
+
+
+@pytest.fixture(scope="session")
+def variable_products_page() -> str:
+    """A variable insurance product page with 1,000 rows."""
+    return build_variable_products_page(1_000)
+
+
+@pytest.fixture(scope="session")
+def dera_zip() -> bytes:
+    """A DERA archive with 50,000 ``num`` rows."""
+    return build_dera_zip(50_000)
+
+
+@pytest.fixture
+def measure(benchmark, request):
+    """Benchmarks ``func`` and records its throughput and peak memory.
+
+    Call as ``measure(func, items, *args, **kwargs)`` where ``items`` is
+    how many records one call processes. Returns ``func``'s result.
+    """
+
+    def run(func, items: int, *args, **kwargs):
+        result = benchmark(func, *args, **kwargs)
+
+        tracemalloc.start()
+        try:
+            func(*args, **kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        benchmark.extra_info["items"] = items
+        benchmark.extra_info["peak_memory_kib"] = round(peak / 1024)
+        if benchmark.stats is not None:
+            throughput = items / benchmark.stats.stats.mean
+            benchmark.extra_info["items_per_second"] = round(throughput)
+            _MEASUREMENTS.append((request.node.name, items, throughput, peak / 1024))
+        return result
+
+    return run
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Prints the throughput and peak memory of every measured benchmark."""
+
+    if not _MEASUREMENTS:
+        return
+    terminalreporter.section("throughput and peak memory")
+    width = max(len(name) for name, *_ in _MEASUREMENTS)
+    for name, items, throughput, peak_kib in _MEASUREMENTS:
+        terminalreporter.write_line(
+            f"{name:<{width}}  {items:>8,} items  {throughput:>14,.0f} items/s  {peak_kib:>10,.0f} KiB peak"
+        )
@@ -0,0 +1,46 @@
+"""Benchmarks for the in-memory TTLCache hot paths."""
+
+# pylint: disable=redefined-outer-name
+
+import pytest
+
+from edgar.cache import DEFAULT_MAX_BYTES, DEFAULT_MAX_ENTRIES, TTLCache
+
+KEYS = [f"https://data.sec.gov/submissions/CIK{cik:010d}.json" for cik in range(10_000)]
+
+
+@pytest.fixture
+def warm_cache(company_facts) -> TTLCache:
+    """A bounded cache holding one entry per key."""
+    cache = TTLCache(max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES)
+    for key in KEYS[:DEFAULT_MAX_ENTRIES]:
+        cache.set(key, company_facts["facts"]["dei"], ttl=3600)
+    return cache
+
+
+def test_get_hits(measure, warm_cache):
+    """Reads of keys that are all cached."""
+    keys = KEYS[:DEFAULT_MAX_ENTRIES]
+
+    def read_all():
+        for key in keys:
+            warm_cache.get(key)
+
+    measure(read_all, len(keys))
+
+    assert warm_cache.stats.hit_ratio == 1.0
+
+
+def test_set_with_eviction(measure, company_facts):
+    """Writes of more keys than the cache holds, so every write evicts."""
+    value = company_facts["facts"]["dei"]
+
+    def write_all():
+        cache = TTLCache(max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES)
+        for key in KEYS:
+            cache.set(key, value, ttl=3600)
+        return cache
+
+    cache = measure(write_all, len(KEYS))
+
+    assert len(cache) == DEFAULT_MAX_ENTRIES
@@ -0,0 +1,42 @@
+"""Benchmarks for reading DERA Financial Statement Data Sets."""
+
+# pylint: disable=redefined-outer-name
+
+import io
+
+import pytest
+
+from edgar.datasets import FinancialStatementArchive
+
+
+@pytest.mark.parametrize("typed", [True, False])
+def test_iter_num_rows(measure, dera_zip, typed):
+    """Streams every ``num`` row, with and without type conversion."""
+
+    def read_all():
+        with FinancialStatementArchive(io.BytesIO(dera_zip)) as archive:
+            return sum(1 for _ in archive.iter_rows("num", typed=typed))
+
+    assert measure(read_all, 50_000) == 50_000
+
+
+def test_iter_num_filtered(measure, dera_zip):
+    """Projects two columns and filters on a tag while streaming."""
+
+    def read_filtered():
+        with FinancialStatementArchive(io.BytesIO(dera_zip)) as archive:
+            return list(archive.iter_rows("num", columns=["adsh", "value"], where={"tag": "Tag7"}))
+
+    assert len(measure(read_filtered, 50_000)) == 100
+
+
+def test_extract_whole_archive(measure, dera_zip):
+    """Reads every table into untyped row dicts, as ``get_financial_statements`` does."""
+
+    def read_tables():
+        with FinancialStatementArchive(io.BytesIO(dera_zip)) as archive:
+            return {table: list(archive.iter_rows(table, typed=False)) for table in archive.tables}
+
+    tables = measure(read_tables, 50_000)
+
+    assert len(tables["num"]) == 50_000
@@ -0,0 +1,25 @@
+"""Benchmarks for package import time, each in a fresh interpreter."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _run(code: str) -> None:
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "pass",
+        "import edgar",
+        "import edgar; edgar.EdgarClient(user_agent='Bench bench@example.com')",
+        "from edgar.client import EdgarClient; EdgarClient(user_agent='Bench bench@example.com').xbrl()",
+    ],
+    ids=["interpreter", "import_edgar", "create_client", "first_service"],
+)
+def test_startup(benchmark, code):
+    """Interpreter start plus the import; compare against the ``interpreter`` baseline."""
+    benchmark.pedantic(_run, args=(code,), rounds=10, warmup_rounds=1)
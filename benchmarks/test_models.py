@@ -0,0 +1,115 @@
+"""Benchmarks for the XBRL Facts model and the export helpers."""
+
+# pylint: disable=redefined-outer-name
+
+import pytest
+
+from edgar.models import CompanyInfo, Facts, Filing, to_csv, to_dataframe
+from edgar.parser import EdgarParser
+
+
+@pytest.fixture(scope="module")
+def fact_count(company_facts) -> int:
+    """Number of data points in the recorded response."""
+    return sum(
+        len(points)
+        for concepts in company_facts["facts"].values()
+        for concept in concepts.values()
+        for points in concept["units"].values()
+    )
+
+
+@pytest.fixture(scope="module")
+def facts(company_facts) -> Facts:
+    """Facts over the recorded response, with the fact table already built."""
+    warm = Facts(raw=company_facts)
+    warm.get("dei", "EntityPublicFloat")
+    return warm
+
+
+@pytest.fixture(scope="module")
+def submissions() -> dict:
+    """A submissions response with 10,000 recent filings."""
+    count = 10_000
+    return {
+        "cik": "320193",
+        "name": "Apple Inc.",
+        "filings": {
+            "recent": {
+                "accessionNumber": [f"0000320193-24-{i:06d}" for i in range(count)],
+                "filingDate": ["2024-01-02"] * count,
+                "reportDate": ["2023-12-30"] * count,
+                "acceptanceDateTime": ["2024-01-02T16:30:00.000Z"] * count,
+                "form": ["8-K", "10-Q", "4", "SC 13G/A"] * (count // 4),
+                "primaryDocument": [f"doc{i}.htm" for i in range(count)],
+                "primaryDocDescription": ["8-K"] * count,
+                "isXBRL": [1, 0] * (count // 2),
+                "isInlineXBRL": [1, 0] * (count // 2),
+                "size": list(range(count)),
+            },
+            "files": [],
+        },
+    }
+
+
+@pytest.fixture(scope="module")
+def filings(atom_feed) -> list[Filing]:
+    """The 5,000 Atom fixture entries as ``Filing`` models."""
+    entries, _ = EdgarParser(backend="etree").parse_page(atom_feed)
+    return [Filing(raw=entry) for entry in entries]
+
+
+def test_facts_first_get(measure, company_facts, fact_count):
+    """First lookup on a fresh Facts, which builds the fact table."""
+
+    def first_get():
+        return Facts(raw=company_facts).get("us-gaap", "Revenues")
+
+    measure(first_get, fact_count)
+
+
+def test_facts_get_every_concept(measure, facts):
+    """Looks up every concept of every taxonomy on a warm Facts."""
+    pairs = [(taxonomy, concept) for taxonomy in facts.taxonomies for concept in facts.concepts(taxonomy)]
+
+    def get_all():
+        return [facts.get(taxonomy, concept) for taxonomy, concept in pairs]
+
+    results = measure(get_all, len(pairs))
+
+    assert len(results) == len(pairs)
+
+
+def test_facts_to_dataframe(measure, facts, fact_count):
+    """Exports every fact as one DataFrame."""
+    pytest.importorskip("pandas")
+
+    frame = measure(facts.to_dataframe, fact_count)
+
+    assert len(frame) == fact_count
+
+
+def test_recent_submissions(measure, submissions):
+    """Builds the Submission rows of a large filer and reads one field of each."""
+    count = len(submissions["filings"]["recent"]["form"])
+
+    def forms():
+        return [row.form for row in CompanyInfo(raw=submissions).recent_submissions]
+
+    assert len(measure(forms, count)) == count
+
+
+def test_filings_to_dataframe(measure, filings):
+    """Converts Filing models with the generic ``to_dataframe``."""
+    pytest.importorskip("pandas")
+
+    frame = measure(to_dataframe, len(filings), filings)
+
+    assert len(frame) == len(filings)
+
+
+def test_filings_to_csv(measure, filings):
+    """Serializes Filing models with the shared CSV writer."""
+    text = measure(to_csv, len(filings), filings)
+
+    assert text.count("\n") == len(filings) + 1
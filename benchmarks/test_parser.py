@@ -0,0 +1,45 @@
+"""Benchmarks for EdgarParser's Atom and HTML parsing."""
+
+# pylint: disable=redefined-outer-name
+
+import pytest
+
+from edgar.parser import EdgarParser
+
+
+@pytest.mark.parametrize("backend", ["etree", "lxml"])
+def test_atom_page(measure, atom_feed, backend):
+    """One large browse-edgar page, per Atom backend."""
+    if backend == "lxml":
+        pytest.importorskip("lxml")
+    parser = EdgarParser(backend=backend)
+
+    entries, next_page = measure(parser.parse_page, 5_000, atom_feed)
+
+    assert len(entries) == 5_000
+    assert next_page is not None
+
+
+@pytest.mark.parametrize("backend", ["etree", "lxml"])
+def test_issuer_table(measure, issuer_page, backend):
+    """An owner page with 1,000 issuers and 1,000 transactions."""
+    if backend == "lxml":
+        pytest.importorskip("lxml")
+    parser = EdgarParser(backend=backend)
+
+    pages = measure(parser.parse_issuer_table, 2_000, issuer_page)
+
+    assert len(pages[0]["ownership_report"]) == 1_000
+    assert len(pages[0]["ownership_transaction_report"]) == 1_000
+
+
+@pytest.mark.parametrize("backend", ["etree", "lxml"])
+def test_variable_products_table(measure, variable_products_page, backend):
+    """A variable insurance product page with 1,000 rows."""
+    if backend == "lxml":
+        pytest.importorskip("lxml")
+    parser = EdgarParser(backend=backend)
+
+    products = measure(parser.parse_variable_products_company_table, 1_000, variable_products_page)
+
+    assert len(products) == 1_000
@@ -0,0 +1,49 @@
+"""Benchmarks for ticker and company name search."""
+
+# pylint: disable=redefined-outer-name
+
+import pytest
+
+from edgar.tickers import TickerIndex
+
+QUERIES = ["AAPL", "app", "holdings", "technologies inc", "m", "xyz corp", "bancorp"]
+
+
+@pytest.fixture(scope="module")
+def entries() -> list[dict]:
+    """10,000 entries in the shape of ``company_tickers.json``."""
+    words = ["Apple", "Micro", "Holdings", "Technologies", "Bancorp", "Energy", "Capital", "Pharma", "Group"]
+    return [
+        {
+            "cik_str": 100_000 + i,
+            "ticker": f"{chr(65 + i % 26)}{chr(65 + i // 26 % 26)}{i % 97:02d}",
+            "title": f"{words[i % 9]} {words[i // 9 % 9]} {i} Inc.",
+        }
+        for i in range(10_000)
+    ]
+
+
+@pytest.fixture(scope="module")
+def index(entries) -> TickerIndex:
+    """The search index over ``entries``."""
+    return TickerIndex(entries)
+
+
+def test_build_index(measure, entries):
+    """Building the index once per ticker file."""
+    measure(lambda: TickerIndex(entries), len(entries))
+
+
+def test_search(measure, index):
+    """Ranked searches against the prebuilt index."""
+
+    def search_all():
+        for query in QUERIES:
+            index.search(query, limit=10)
+
+    measure(search_all, len(QUERIES))
+
+
+def test_fuzzy_search(measure, index):
+    """Searches with a typo, falling back to trigram overlap."""
+    measure(lambda: index.search("tecnologies", limit=10, fuzzy=True), 1)
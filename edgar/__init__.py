@@ -16,13 +16,19 @@ Set the ``SEC_EDGAR_USER_AGENT`` environment variable to avoid passing
 
 from __future__ import annotations
 
+import importlib
 import logging
 import os
+import sys
+import types
+from typing import TYPE_CHECKING
 
-from edgar.client import EdgarClient
-from edgar.async_client import EdgarAsyncClient
 from edgar.exceptions import EdgarError, EdgarRequestError, EdgarParseError
 
+if TYPE_CHECKING:
+    from edgar.async_client import EdgarAsyncClient
+    from edgar.client import EdgarClient
+
 # Library best practice: add a NullHandler so users don't see
 # "No handlers could be found for logger 'edgar'" warnings.
 # Users configure logging in their own applications.
@@ -40,6 +46,45 @@ __all__ = [
     "set_user_agent",
 ]
 
+# Public name → defining module. ``import edgar`` stays cheap; the
+# clients (and ``requests``, ``bs4``, ``httpx`` behind them) load on
+# first attribute access (PEP 562).
+_LAZY_ATTRIBUTES = {
+    "EdgarClient": "edgar.client",
+    "EdgarAsyncClient": "edgar.async_client",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+class _Package(types.ModuleType):
+    """Keeps ``edgar.company`` and ``edgar.search`` bound to the functions below.
+
+    Importing a submodule binds it on the package, and the
+    ``edgar.company`` / ``edgar.search`` modules are now imported
+    lazily, after the functions of the same name are defined.
+    """
+
+    def __setattr__(self, name: str, value) -> None:
+        if name in ("company", "search") and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
+
 _ENV_VAR = "SEC_EDGAR_USER_AGENT"
 _user_agent: str | None = None
 _client: EdgarClient | None = None
@@ -78,6 +123,8 @@ def _get_client() -> EdgarClient:
             "No user-agent configured. Either call edgar.set_user_agent() "
             f"or set the {_ENV_VAR} environment variable."
         )
+    from edgar.client import EdgarClient  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
     _client = EdgarClient(user_agent=agent)
     return _client
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from edgar.bulk_download import DEFAULT_BULK_WORKERS, BulkDownloader
+from edgar.filing_index import FilingIndex
 from edgar.session import EdgarSession
 
 
@@ -451,3 +453,84 @@ class Archives():
             )
 
         return directories
+
+    def filing_index(self, directory: str) -> FilingIndex:
+        """Opens a local ``FilingIndex`` backed by this session.
+
+        ### Overview
+        ----
+        Downloads and parses the ``master``/``form``/``company`` index
+        files behind ``get_full_index()`` and ``get_daily_index()`` into
+        a SQLite database, so "all filings of form X between dates"
+        becomes a local query.
+
+        ### Parameters
+        ----
+        directory : str
+            Directory holding the index database. Created if missing.
+
+        ### Returns
+        ----
+        FilingIndex:
+            The opened index.
+
+        ### Usage
+        ----
+            >>> edgar_client = EdgarClient(user_agent="Your Name your-email@example.com")
+            >>> archives_services = edgar_client.archives()
+            >>> index = archives_services.filing_index("~/.cache/python-sec")
+            >>> index.load_quarter(year=2023, quarter=4)
+            >>> index.update()
+            >>> index.query(form_type="10-K", start="2023-10-01", end="2023-12-31")
+        """
+
+        return FilingIndex(directory, session=self.edgar_session)
+
+    def bulk_downloader(
+        self,
+        directory: str,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+        patterns: list[str] | None = None,
+    ) -> BulkDownloader:
+        """Creates a ``BulkDownloader`` that saves filing documents under ``directory``.
+
+        ### Overview
+        ----
+        Downloads filings (by accession number or index page URL) and
+        individual documents concurrently, under this session's rate
+        limit. A manifest in ``directory`` records what is done, so
+        re-running a job skips finished files and retries failures.
+
+        ### Parameters
+        ----
+        directory : str
+            Where documents are saved, as ``<cik>/<accession>/<file>``.
+            Created if missing.
+
+        max_workers : int (optional, Default=DEFAULT_BULK_WORKERS)
+            Number of downloads in flight.
+
+        patterns : list[str] | None (optional, Default=None)
+            File name patterns a filing's documents must match, e.g.
+            ``["*.htm"]``. Without them every document is downloaded.
+
+        ### Returns
+        ----
+        BulkDownloader:
+            The downloader.
+
+        ### Usage
+        ----
+            >>> edgar_client = EdgarClient(user_agent="Your Name your-email@example.com")
+            >>> archives_services = edgar_client.archives()
+            >>> downloader = archives_services.bulk_downloader("~/sec-data", patterns=["*.htm", "*.xml"])
+            >>> report = downloader.run(["0000320193-23-000106"])
+            >>> downloader.retry_failed()
+        """
+
+        return BulkDownloader(
+            self.edgar_session,
+            directory,
+            max_workers=max_workers,
+            patterns=patterns,
+        )
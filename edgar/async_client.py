@@ -8,12 +8,45 @@ Provides the same API surface as ``EdgarClient`` but with
 
 from __future__ import annotations
 
+import asyncio
+import itertools
+import logging
+from collections import deque
+from collections.abc import Mapping, Sequence
 from enum import Enum
-from typing import Union
+from typing import AsyncIterator, Iterable, Iterator, Union
 
+from edgar.async_services import AsyncServices
 from edgar.async_session import EdgarAsyncSession
+from edgar.batch import DEFAULT_MAX_WORKERS, BatchResult, check_endpoint, run_async
+from edgar.disk_cache import DiskCache
 from edgar.exceptions import EdgarRequestError
+from edgar.instrumentation import RequestHooks
 from edgar.models import CompanyInfo, Facts, Filing, SearchResult
+from edgar.rate_limiter import RateLimiter
+from edgar.retry import RetryPolicy
+from edgar.snapshot import TickerSnapshot
+from edgar.tickers import TICKERS_ENDPOINT, index_entries
+
+logger = logging.getLogger(__name__)
+
+# browse-edgar returns at most 100 entries per Atom page.
+FILINGS_PAGE_SIZE = 100
+# Atom pages requested ahead of the consumer by ``iter_filings``.
+DEFAULT_PAGE_CONCURRENCY = 4
+
+
+def page_offsets(start: int, limit: int | None, page_size: int) -> Iterator[int]:
+    """Yields the ``start`` offset of each browse-edgar page ``iter_filings`` requests.
+
+    With a ``limit`` the offsets stop at the page holding the last
+    wanted filing; without one they run on until the caller stops at
+    the first short page.
+    """
+
+    if limit is None:
+        return itertools.count(start, page_size)
+    return iter(range(start, start + limit, page_size))
 
 
 class EdgarAsyncClient:
@@ -23,14 +56,30 @@ class EdgarAsyncClient:
     methods are coroutines. Use within an ``async with`` block
     for proper resource cleanup.
 
+    ``client.services`` holds the service accessors (``archives()``,
+    ``companies()``, ``xbrl()`` and so on), which return async versions
+    of the ``EdgarClient`` services whose requests go through this
+    client's session and rate limiter.
+
     ### Usage
     ----
         >>> async with EdgarAsyncClient(user_agent="You you@example.com") as client:
         ...     filings = await client.get_filings("AAPL", form="10-K")
         ...     info = await client.get_company_info("AAPL")
+        ...     frames = await client.services.xbrl().frames(
+        ...         concept="Revenues", unit_of_measure="USD", period="CY2023"
+        ...     )
     """
 
-    def __init__(self, user_agent: str, rate_limit: int = 10) -> None:
+    def __init__(  # pylint: disable=too-many-positional-arguments
+        self,
+        user_agent: str,
+        rate_limit: int = 10,
+        cache_dir: str | None = None,
+        rate_limiter: RateLimiter | None = None,
+        hooks: RequestHooks | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ) -> None:
         """Initializes the ``EdgarAsyncClient``.
 
         ### Parameters
@@ -41,14 +90,48 @@ class EdgarAsyncClient:
 
         rate_limit : int (optional, Default=10)
             Maximum requests per second. SEC allows 10 req/s.
+
+        cache_dir : str | None (optional, Default=None)
+            Directory for a persistent on-disk HTTP cache and the
+            memory-mapped ticker snapshot. May point at the same
+            directory as a synchronous ``EdgarClient``.
+
+        rate_limiter : RateLimiter | None (optional, Default=None)
+            Limiter shared with other clients. A ``FileRateLimiter``
+            lets sync and async workers in separate processes split
+            one budget.
+
+        hooks : RequestHooks | None (optional, Default=None)
+            Instrumentation callbacks for every request the client
+            makes. May be shared with a synchronous ``EdgarClient``.
+
+        retry_policy : RetryPolicy | None (optional, Default=None)
+            Which failures are retried and how long to back off, as for
+            ``EdgarClient``.
         """
 
+        self._disk_cache = DiskCache(cache_dir) if cache_dir else None
         self.edgar_session = EdgarAsyncSession(
             client=self, user_agent=user_agent, rate_limit=rate_limit,
+            disk_cache=self._disk_cache, rate_limiter=rate_limiter, hooks=hooks,
+            retry_policy=retry_policy,
         )
-        self._tickers_data: list[dict] | None = None
-        self._ticker_to_cik: dict[str, int] | None = None
-        self._cik_to_entries: dict[int, list[dict]] | None = None
+        if cache_dir:
+            self.edgar_session.ticker_snapshot = TickerSnapshot(cache_dir)
+        # The async twins of the ``EdgarClient`` services, e.g. ``client.services.xbrl()``.
+        self.services = AsyncServices(self.edgar_session)
+        # The session's ``RequestHooks``; subscribe exporters or a ``MetricsCollector`` here.
+        self.hooks = self.edgar_session.hooks
+        self.bulk = AsyncBulk(self)
+        # ``fetch_many`` is also reachable on the client itself, as before ``bulk`` existed.
+        self.fetch_many = self.bulk.fetch_many
+        self._tickers_data: Sequence[dict] | None = None
+        self._ticker_to_cik: Mapping[str, int] | None = None
+        self._cik_to_entries: Mapping[int, list[dict]] | None = None
+        self._snapshot_refresh: asyncio.Task | None = None
+        # Held while loading, so concurrent first lookups load the tickers
+        # once. Created on first use, inside the running event loop.
+        self._tickers_lock: asyncio.Lock | None = None
 
     async def __aenter__(self):
         return self
@@ -58,6 +141,9 @@ class EdgarAsyncClient:
 
     async def close(self) -> None:
         """Closes the underlying HTTP client."""
+        if self._snapshot_refresh is not None:
+            self._snapshot_refresh.cancel()
+        self.services.close()
         await self.edgar_session.close()
 
     def __repr__(self) -> str:
@@ -68,28 +154,65 @@ class EdgarAsyncClient:
     # ------------------------------------------------------------------
 
     async def _load_tickers(self) -> None:
-        """Fetches and indexes the company tickers data from SEC."""
+        """Loads and indexes the company tickers data.
+
+        Reads the ``TickerSnapshot`` in ``cache_dir`` when there is one,
+        refreshing it in a background task once stale; otherwise
+        fetches from SEC and writes the snapshot. Lookups that arrive
+        while another one is loading wait for it instead of fetching too.
+        """
 
         if self._tickers_data is not None:
             return
 
+        if self._tickers_lock is None:
+            self._tickers_lock = asyncio.Lock()
+        async with self._tickers_lock:
+            if self._tickers_data is not None:
+                return
+
+            snapshot = self.edgar_session.ticker_snapshot
+            table = snapshot.load() if snapshot is not None else None
+            if table is not None:
+                self._tickers_data, self._ticker_to_cik, self._cik_to_entries = (
+                    table, table.ticker_to_cik, table.cik_to_entries
+                )
+                self.edgar_session.hooks.notify(
+                    "on_cache_hit", "GET", self.edgar_session.build_url(TICKERS_ENDPOINT), cache="snapshot"
+                )
+                if snapshot.stale(table) and (self._snapshot_refresh is None or self._snapshot_refresh.done()):
+                    self._snapshot_refresh = asyncio.create_task(self._refresh_snapshot(snapshot))
+                return
+
+            entries = await self._fetch_tickers()
+            self._tickers_data = entries
+            self._ticker_to_cik, self._cik_to_entries = index_entries(entries)
+            if snapshot is not None:
+                await asyncio.to_thread(snapshot.save, entries)
+
+    async def _fetch_tickers(self) -> list[dict]:
+        """Fetches the entries of ``company_tickers.json`` from SEC."""
+
         raw = await self.edgar_session.make_request(
             method="get",
-            endpoint="/files/company_tickers.json",
+            endpoint=TICKERS_ENDPOINT,
         )
 
         if raw is None:
             raise EdgarRequestError("Failed to load company tickers from SEC.")
 
-        entries = list(raw.values())
-        self._tickers_data = entries
-        self._ticker_to_cik = {
-            e["ticker"].upper(): e["cik_str"] for e in entries
-        }
-        self._cik_to_entries = {}
-        for entry in entries:
-            cik_int = int(entry["cik_str"])
-            self._cik_to_entries.setdefault(cik_int, []).append(entry)
+        return list(raw.values())
+
+    async def _refresh_snapshot(self, snapshot: TickerSnapshot) -> None:
+        """Rewrites a stale snapshot; the loaded tables keep serving meanwhile."""
+
+        try:
+            entries = await self._fetch_tickers()
+        except Exception as exc:  # pylint: disable=broad-except
+            # A failed refresh keeps serving the old snapshot.
+            logger.warning("Ticker snapshot refresh failed: %s", exc)
+            return
+        await asyncio.to_thread(snapshot.save, entries)
 
     async def resolve_ticker(self, ticker: str) -> str:
         """Resolves a ticker symbol to a zero-padded 10-digit CIK string.
@@ -174,6 +297,9 @@ class EdgarAsyncClient:
     ) -> list[Filing]:
         """Returns filings for a company, optionally filtered by form type.
 
+        Follows pagination, so ``count`` may exceed the 100 entries SEC
+        serves per page; see ``iter_filings`` to stream instead.
+
         ### Parameters
         ----
         identifier : str
@@ -193,34 +319,140 @@ class EdgarAsyncClient:
         list[Filing]
         """
 
+        return [
+            filing async for filing in self.iter_filings(
+                identifier, form=form, start=start, limit=count,
+                page_size=max(1, min(count, FILINGS_PAGE_SIZE)),
+            )
+        ]
+
+    def iter_filings(  # pylint: disable=too-many-positional-arguments
+        self,
+        identifier: str,
+        form: Union[str, Enum, None] = None,
+        start: int = 0,
+        limit: int | None = None,
+        page_size: int = FILINGS_PAGE_SIZE,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> AsyncIterator[Filing]:
+        """Streams a company's filings across as many Atom pages as needed.
+
+        Page offsets are computed up front (``start``, ``start +
+        page_size``, ...), so up to ``concurrency`` pages are requested
+        at once instead of following next links one by one. Every
+        request still goes through the session's rate limiter, pages
+        are parsed off the event loop, and filings are yielded in feed
+        order (newest first). The stream ends at the first short page.
+
+        ### Parameters
+        ----
+        identifier : str
+            A stock ticker (e.g. ``"AAPL"``) or CIK number.
+
+        form : str | Enum | None (optional, Default=None)
+            Filter by form type (e.g. ``"10-K"``).
+
+        start : int (optional, Default=0)
+            Offset of the first filing.
+
+        limit : int | None (optional, Default=None)
+            Stop after this many filings. ``None`` streams the whole
+            history.
+
+        page_size : int (optional, Default=FILINGS_PAGE_SIZE)
+            Entries requested per page (1-100).
+
+        concurrency : int (optional, Default=DEFAULT_PAGE_CONCURRENCY)
+            Maximum pages in flight.
+
+        ### Returns
+        ----
+        AsyncIterator[Filing]
+
+        ### Usage
+        ----
+            >>> async for filing in client.iter_filings("AAPL", form="8-K"):
+            ...     print(filing.filing_date, filing.title)
+        """
+
+        if not 1 <= page_size <= FILINGS_PAGE_SIZE:
+            raise ValueError(
+                f"page_size must be between 1 and {FILINGS_PAGE_SIZE}, got {page_size}"
+            )
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        if limit is not None and limit < 0:
+            raise ValueError(f"limit must not be negative, got {limit}")
+
+        return self._iter_filings(identifier, form, start, limit, page_size, concurrency)
+
+    async def _iter_filings(  # pylint: disable=too-many-positional-arguments
+        self,
+        identifier: str,
+        form: Union[str, Enum, None],
+        start: int,
+        limit: int | None,
+        page_size: int,
+        concurrency: int,
+    ) -> AsyncIterator[Filing]:
+        """Implements ``iter_filings`` with a window of prefetched pages."""
+
         cik = await self._resolve_to_cik(identifier)
-        cik_unpadded = cik.lstrip("0")
+        offsets = page_offsets(start, limit, page_size)
+        pending: deque[asyncio.Task] = deque()
+
+        def schedule() -> None:
+            offset = next(offsets, None)
+            if offset is not None:
+                page = self._fetch_filings_page(cik, form, offset, page_size)
+                pending.append(asyncio.ensure_future(page))
+
+        try:
+            for _ in range(concurrency):
+                schedule()
+
+            yielded = 0
+            while pending:
+                entries = await pending.popleft()
+                for entry in entries:
+                    if limit is not None and yielded >= limit:
+                        return
+                    yield Filing(raw=entry)
+                    yielded += 1
+                if len(entries) < page_size:
+                    return
+                schedule()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _fetch_filings_page(
+        self, cik: str, form: Union[str, Enum, None], offset: int, page_size: int
+    ) -> list[dict]:
+        """Fetches and parses the browse-edgar Atom page starting at *offset*."""
 
         params = {
             "action": "getcompany",
-            "CIK": cik_unpadded,
-            "start": start,
-            "count": count,
+            "CIK": cik.lstrip("0"),
+            "start": offset,
+            "count": page_size,
             "output": "atom",
         }
         if form is not None:
-            form_value = form.value if isinstance(form, Enum) else form
-            params["type"] = form_value
+            params["type"] = form.value if isinstance(form, Enum) else form
 
         raw = await self.edgar_session.make_request(
             method="get",
             endpoint="/cgi-bin/browse-edgar",
             params=params,
         )
-
         if raw is None:
             return []
-
-        entries = self.edgar_session.edgar_parser.parse_entries(
+        return await asyncio.to_thread(
+            self.edgar_session.edgar_parser.parse_entries,
             response_text=raw,
             fetch_page=None,
         )
-        return [Filing(raw=entry) for entry in entries]
 
     # ------------------------------------------------------------------
     # XBRL facts
@@ -317,7 +549,13 @@ class EdgarAsyncClient:
     # Download
     # ------------------------------------------------------------------
 
-    async def download(self, url: str, path: str | None = None) -> str | bytes:
+    async def download(
+        self,
+        url: str,
+        path: str | None = None,
+        stream: bool = False,
+        checksum: str | None = None,
+    ) -> str | bytes:
         """Downloads a filing document from a full SEC URL.
 
         ### Parameters
@@ -328,12 +566,20 @@ class EdgarAsyncClient:
         path : str | None (optional, Default=None)
             If provided, saves content to this file path.
 
+        stream : bool (optional, Default=False)
+            Write the body to ``path`` chunk by chunk, resuming
+            interrupted transfers.
+
+        checksum : str | None (optional, Default=None)
+            Expected ``"algorithm:hexdigest"`` of the file. Implies
+            ``stream``.
+
         ### Returns
         ----
         str | bytes
         """
 
-        return await self.edgar_session.download(url=url, path=path)
+        return await self.edgar_session.download(url=url, path=path, stream=stream, checksum=checksum)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -346,3 +592,61 @@ class EdgarAsyncClient:
         if stripped.isdigit():
             return stripped.zfill(10)
         return await self.resolve_ticker(identifier)
+
+
+class AsyncBulk:
+    """Async counterpart of ``Bulk``, reached through ``client.bulk``."""
+
+    def __init__(self, client: EdgarAsyncClient) -> None:
+        self._client = client
+
+    def __repr__(self) -> str:
+        return "<EdgarAsyncClient.bulk (active=True, connected=True)>"
+
+    def fetch_many(
+        self,
+        ciks: Iterable[str | int],
+        endpoint: str = "submissions",
+        concurrency: int = DEFAULT_MAX_WORKERS,
+    ) -> AsyncIterator[BatchResult]:
+        """Fetches one endpoint for many companies concurrently.
+
+        Results are yielded as they complete; a failing CIK yields a
+        ``BatchResult`` carrying the error instead of aborting the
+        batch. Values are the raw JSON ``dict`` responses.
+
+        ### Parameters
+        ----
+        ciks : Iterable[str | int]
+            CIK numbers to fetch. Consumed lazily.
+
+        endpoint : str (optional, Default="submissions")
+            Either ``"submissions"`` or ``"company_facts"``.
+
+        concurrency : int (optional, Default=DEFAULT_MAX_WORKERS)
+            Maximum requests in flight.
+
+        ### Returns
+        ----
+        AsyncIterator[BatchResult]
+
+        ### Usage
+        ----
+            >>> async for result in client.bulk.fetch_many(ciks, endpoint="company_facts"):
+            ...     print(result.key, result.ok)
+        """
+
+        path = check_endpoint(endpoint)
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+        async def fetch(cik: str) -> dict | None:
+            if not cik.isdigit():
+                raise ValueError(f"CIK must contain only digits, got: {cik!r}")
+            return await self._client.edgar_session.make_request(
+                method="get",
+                endpoint=path.format(cik=cik.zfill(10)),
+                use_api=True,
+            )
+
+        return run_async(fetch, (str(cik) for cik in ciks), concurrency=concurrency)
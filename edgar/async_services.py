@@ -0,0 +1,483 @@
+"""Async versions of the SEC EDGAR services, backed by ``EdgarAsyncSession``.
+
+Each async service runs the matching synchronous service in a worker
+thread, so XML/HTML/JSON parsing never blocks the event loop. Those
+threads come from a bounded pool owned by ``AsyncServices``, not the
+loop's default executor: a service thread blocks until its request
+finishes on the loop, and the request itself may need the default
+executor (e.g. ``FileRateLimiter.reserve_async``), so sharing one pool
+could leave every worker waiting on work that can never start. Network I/O doesn't stay in that thread: the service
+talks to a session bridge that hands every request back to the event
+loop, where ``EdgarAsyncSession`` sends it through ``httpx`` and the
+async rate limiter. The async services therefore return exactly what
+their synchronous counterparts return while sharing one request budget
+with everything else on the loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Iterator
+
+from edgar.archives import Archives
+from edgar.batch import DEFAULT_MAX_WORKERS
+from edgar.companies import Companies
+from edgar.current_events import CurrentEvents
+from edgar.datasets import Datasets
+from edgar.filings import Filings
+from edgar.issuers import Issuers
+from edgar.mutual_funds import MutualFunds
+from edgar.ownership_filings import OwnershipFilings
+from edgar.search import Search
+from edgar.series import Series
+from edgar.submissions import Submissions
+from edgar.tickers import Tickers
+from edgar.variable_insurance_products import VariableInsuranceProducts
+from edgar.xbrl import Xbrl
+
+if TYPE_CHECKING:
+    from edgar.async_session import EdgarAsyncSession
+
+
+def _service_executor(max_workers: int = DEFAULT_MAX_WORKERS) -> ThreadPoolExecutor:
+    """A bounded pool for running sync services off the event loop."""
+
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="edgar-async-service")
+
+
+async def _run_in(executor: Executor, func, *args, **kwargs):
+    """``asyncio.to_thread`` on *executor* instead of the default executor."""
+
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(executor, functools.partial(context.run, func, *args, **kwargs))
+
+
+class _SessionBridge:
+    """Blocking ``EdgarSession`` look-alike for services in worker threads.
+
+    Every network call is scheduled on the event loop that owns the
+    ``EdgarAsyncSession`` and the calling worker thread waits for it.
+    """
+
+    # Async sessions have no in-memory TTL cache; services skip it.
+    cache = None
+
+    def __init__(self, session: EdgarAsyncSession, loop: asyncio.AbstractEventLoop) -> None:
+        self._session = session
+        self._loop = loop
+        # Bridges are created on the loop's own thread.
+        self._loop_thread = threading.get_ident()
+        self.edgar_parser = session.edgar_parser
+        self.edgar_utilities = session.edgar_utilities
+        self.resource = session.resource
+        self.api_resource = session.api_resource
+        self.hooks = session.hooks
+        self.bulk_data = session.bulk_data
+        self.ticker_snapshot = session.ticker_snapshot
+
+    def __repr__(self) -> str:
+        return f"<_SessionBridge session={self._session!r}>"
+
+    def build_url(self, endpoint: str, use_api: bool = False, base_url: str | None = None) -> str:
+        """Builds the full URL for the endpoint."""
+        return self._session.build_url(endpoint=endpoint, use_api=use_api, base_url=base_url)
+
+    def make_request(self, *args, **kwargs):
+        """Sends ``EdgarAsyncSession.make_request`` on the event loop."""
+        return self._run(self._session.make_request(*args, **kwargs))
+
+    def fetch_page(self, url: str) -> bytes | None:
+        """Sends ``EdgarAsyncSession.fetch_page`` on the event loop."""
+        return self._run(self._session.fetch_page(url))
+
+    def stream_to_file(self, url: str, fileobj, **kwargs) -> bool:
+        """Sends ``EdgarAsyncSession.stream_to_file`` on the event loop."""
+        return self._run(self._session.stream_to_file(url, fileobj, **kwargs))
+
+    def download(self, url: str, path: str | None = None, **kwargs) -> str | bytes:
+        """Sends ``EdgarAsyncSession.download`` on the event loop."""
+        return self._run(self._session.download(url=url, path=path, **kwargs))
+
+    def download_to_file(self, url: str, path: str, **kwargs) -> str:
+        """Sends ``EdgarAsyncSession.download_to_file`` on the event loop."""
+        return self._run(self._session.download_to_file(url, path, **kwargs))
+
+    def _run(self, coro):
+        """Runs *coro* on the owning loop and blocks until it finishes."""
+
+        if threading.get_ident() == self._loop_thread:
+            coro.close()
+            raise RuntimeError(
+                "Async service internals must not be called from the event loop thread; "
+                "await the async service method instead"
+            )
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+
+class _AsyncIteratorAdapter:
+    """Exposes a blocking iterator (e.g. a ``FeedStream``) as an async iterator.
+
+    Each ``next()`` runs in a thread of *executor*, so page fetches and
+    parsing stay off the event loop.
+    """
+
+    _DONE = object()
+
+    def __init__(self, iterator: Iterator, executor: Executor) -> None:
+        self._iterator = iterator
+        self._executor = executor
+
+    def __getattr__(self, name: str) -> Any:
+        # Forward attributes such as ``FeedStream.offset``.
+        return getattr(self._iterator, name)
+
+    def __aiter__(self) -> _AsyncIteratorAdapter:
+        return self
+
+    async def __anext__(self):
+        item = await _run_in(self._executor, next, self._iterator, self._DONE)
+        if item is self._DONE:
+            raise StopAsyncIteration
+        return item
+
+    async def aclose(self) -> None:
+        """Closes the underlying iterator."""
+
+        close = getattr(self._iterator, "close", None)
+        if close is not None:
+            await _run_in(self._executor, close)
+
+
+class AsyncService:
+    """Base class for the async services.
+
+    Every public method of ``service_class`` becomes a coroutine with
+    the same signature and docstring. Methods that return iterators
+    return an async iterator instead.
+    """
+
+    service_class: type = object
+
+    def __init__(self, session: EdgarAsyncSession, executor: Executor | None = None) -> None:
+        """Initializes the async service.
+
+        ### Parameters
+        ----
+        session : EdgarAsyncSession
+            The async session every request is sent through.
+
+        executor : Executor | None (optional, Default=None)
+            Pool the sync service runs in. Must not be the event
+            loop's default executor. Defaults to a new bounded pool.
+        """
+
+        self.edgar_session = session
+        self._executor = executor if executor is not None else _service_executor()
+        self._service = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<EdgarAsyncClient.{self.service_class.__name__} (active=True, connected=True)>"
+
+    def __dir__(self) -> list[str]:
+        return sorted(set(super().__dir__()) | set(self._public_methods()))
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or name not in self._public_methods():
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+        method = getattr(self.service_class, name)
+
+        @functools.wraps(method)
+        async def call(*args, **kwargs):
+            service = self._bind(asyncio.get_running_loop())
+            result = await _run_in(self._executor, getattr(service, name), *args, **kwargs)
+            if isinstance(result, Iterator):
+                return _AsyncIteratorAdapter(result, self._executor)
+            return result
+
+        return call
+
+    def _public_methods(self) -> list[str]:
+        """Names of the wrapped service's public methods."""
+
+        return [
+            name for name, member in inspect.getmembers(self.service_class, inspect.isfunction)
+            if not name.startswith("_")
+        ]
+
+    def _bind(self, loop: asyncio.AbstractEventLoop):
+        """Returns the sync service bound to a bridge for *loop*."""
+
+        with self._lock:
+            if self._service is None or self._loop is not loop:
+                self._service = self.service_class(session=_SessionBridge(self.edgar_session, loop))
+                self._loop = loop
+            return self._service
+
+
+class AsyncArchives(AsyncService):
+    """Async counterpart of ``Archives``."""
+    service_class = Archives
+
+
+class AsyncCompanies(AsyncService):
+    """Async counterpart of ``Companies``."""
+    service_class = Companies
+
+
+class AsyncCurrentEvents(AsyncService):
+    """Async counterpart of ``CurrentEvents``."""
+    service_class = CurrentEvents
+
+
+class AsyncDatasets(AsyncService):
+    """Async counterpart of ``Datasets``."""
+    service_class = Datasets
+
+
+class AsyncFilings(AsyncService):
+    """Async counterpart of ``Filings``."""
+    service_class = Filings
+
+
+class AsyncIssuers(AsyncService):
+    """Async counterpart of ``Issuers``."""
+    service_class = Issuers
+
+
+class AsyncMutualFunds(AsyncService):
+    """Async counterpart of ``MutualFunds``."""
+    service_class = MutualFunds
+
+
+class AsyncOwnershipFilings(AsyncService):
+    """Async counterpart of ``OwnershipFilings``."""
+    service_class = OwnershipFilings
+
+
+class AsyncSearch(AsyncService):
+    """Async counterpart of ``Search``."""
+    service_class = Search
+
+
+class AsyncSeries(AsyncService):
+    """Async counterpart of ``Series``."""
+    service_class = Series
+
+
+class AsyncSubmissions(AsyncService):
+    """Async counterpart of ``Submissions``."""
+    service_class = Submissions
+
+
+class AsyncTickers(AsyncService):
+    """Async counterpart of ``Tickers``."""
+    service_class = Tickers
+
+
+class AsyncVariableInsuranceProducts(AsyncService):
+    """Async counterpart of ``VariableInsuranceProducts``."""
+    service_class = VariableInsuranceProducts
+
+
+class AsyncXbrl(AsyncService):
+    """Async counterpart of ``Xbrl``."""
+    service_class = Xbrl
+
+
+class AsyncServices:
+    """The async services of an ``EdgarAsyncClient``, reached through ``client.services``.
+
+    Each accessor returns the async counterpart of the ``EdgarClient``
+    service of the same name, created on first use and bound to the
+    client's session and rate limiter.
+
+    ### Usage
+    ----
+        >>> frames = await client.services.xbrl().frames(
+        ...     concept="Revenues", unit_of_measure="USD", period="CY2023"
+        ... )
+    """
+
+    def __init__(self, session: EdgarAsyncSession, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        self._session = session
+        self._services: dict[str, AsyncService] = {}
+        # Shared by every service; calls beyond max_workers queue here.
+        self._executor = _service_executor(max_workers)
+
+    def __repr__(self) -> str:
+        return "<EdgarAsyncClient.services (active=True, connected=True)>"
+
+    def close(self) -> None:
+        """Cancels queued service calls and lets the running ones finish."""
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def archives(self) -> AsyncArchives:
+        """Used to access the async `Archives` services.
+
+        ### Returns
+        ---
+        AsyncArchives:
+            The `Archives` services with coroutine methods.
+        """
+
+        return self._service("archives", AsyncArchives)
+
+    def companies(self) -> AsyncCompanies:
+        """Used to access the async `Companies` services.
+
+        ### Returns
+        ---
+        AsyncCompanies:
+            The `Companies` services with coroutine methods.
+        """
+
+        return self._service("companies", AsyncCompanies)
+
+    def series(self) -> AsyncSeries:
+        """Used to access the async `Series` services.
+
+        ### Returns
+        ---
+        AsyncSeries:
+            The `Series` services with coroutine methods.
+        """
+
+        return self._service("series", AsyncSeries)
+
+    def mutual_funds(self) -> AsyncMutualFunds:
+        """Used to access the async `MutualFunds` services.
+
+        ### Returns
+        ---
+        AsyncMutualFunds:
+            The `MutualFunds` services with coroutine methods.
+        """
+
+        return self._service("mutual_funds", AsyncMutualFunds)
+
+    def variable_insurance_products(self) -> AsyncVariableInsuranceProducts:
+        """Used to access the async `VariableInsuranceProducts` services.
+
+        ### Returns
+        ---
+        AsyncVariableInsuranceProducts:
+            The `VariableInsuranceProducts` services with coroutine methods.
+        """
+
+        return self._service("variable_insurance_products", AsyncVariableInsuranceProducts)
+
+    def datasets(self) -> AsyncDatasets:
+        """Used to access the async `Datasets` services.
+
+        ### Returns
+        ---
+        AsyncDatasets:
+            The `Datasets` services with coroutine methods.
+        """
+
+        return self._service("datasets", AsyncDatasets)
+
+    def filings(self) -> AsyncFilings:
+        """Used to access the async `Filings` services.
+
+        ### Returns
+        ---
+        AsyncFilings:
+            The `Filings` services with coroutine methods.
+        """
+
+        return self._service("filings", AsyncFilings)
+
+    def current_events(self) -> AsyncCurrentEvents:
+        """Used to access the async `CurrentEvents` services.
+
+        ### Returns
+        ---
+        AsyncCurrentEvents:
+            The `CurrentEvents` services with coroutine methods.
+        """
+
+        return self._service("current_events", AsyncCurrentEvents)
+
+    def issuers(self) -> AsyncIssuers:
+        """Used to access the async `Issuers` services.
+
+        ### Returns
+        ---
+        AsyncIssuers:
+            The `Issuers` services with coroutine methods.
+        """
+
+        return self._service("issuers", AsyncIssuers)
+
+    def ownership_filings(self) -> AsyncOwnershipFilings:
+        """Used to access the async `OwnershipFilings` services.
+
+        ### Returns
+        ---
+        AsyncOwnershipFilings:
+            The `OwnershipFilings` services with coroutine methods.
+        """
+
+        return self._service("ownership_filings", AsyncOwnershipFilings)
+
+    def submissions(self) -> AsyncSubmissions:
+        """Used to access the async `Submissions` services.
+
+        ### Returns
+        ---
+        AsyncSubmissions:
+            The `Submissions` services with coroutine methods.
+        """
+
+        return self._service("submissions", AsyncSubmissions)
+
+    def xbrl(self) -> AsyncXbrl:
+        """Used to access the async `Xbrl` services.
+
+        ### Returns
+        ---
+        AsyncXbrl:
+            The `Xbrl` services with coroutine methods.
+        """
+
+        return self._service("xbrl", AsyncXbrl)
+
+    def tickers(self) -> AsyncTickers:
+        """Used to access the async `Tickers` services.
+
+        ### Returns
+        ---
+        AsyncTickers:
+            The `Tickers` services with coroutine methods.
+        """
+
+        return self._service("tickers", AsyncTickers)
+
+    def full_text_search(self) -> AsyncSearch:
+        """Used to access the async `Search` services.
+
+        ### Returns
+        ---
+        AsyncSearch:
+            The `Search` services with coroutine methods.
+        """
+
+        return self._service("search", AsyncSearch)
+
+    def _service(self, name: str, service_class: type[AsyncService]) -> AsyncService:
+        """Returns the cached async service *name*, creating it on first use."""
+
+        if name not in self._services:
+            self._services[name] = service_class(session=self._session, executor=self._executor)
+        return self._services[name]
@@ -3,21 +3,34 @@
 from __future__ import annotations
 
 import asyncio
+import copy
+import functools
 import logging
-from collections import deque
-from typing import TYPE_CHECKING, Union
+import time
+from typing import TYPE_CHECKING, Awaitable, Callable, Union
 
+from edgar.disk_cache import DiskCache, charset_of, decode_body
+from edgar.downloads import PartialFile, save_document, validator_of
 from edgar.exceptions import EdgarRequestError
+from edgar.instrumentation import RequestHooks
 from edgar.parser import EdgarParser
+from edgar.rate_limiter import TokenBucketRateLimiter
+from edgar.retry import RetryAttempts, RetryPolicy
+from edgar.single_flight import AsyncSingleFlight
 from edgar.utils import EdgarUtilities
 
 if TYPE_CHECKING:
     from edgar.async_client import EdgarAsyncClient
+    from edgar.bulk_data import BulkData
+    from edgar.disk_cache import CachedResponse
+    from edgar.rate_limiter import RateLimiter
+    from edgar.snapshot import TickerSnapshot
 
 logger = logging.getLogger(__name__)
 
-MAX_RETRIES = 5
 MAX_REQUESTS_PER_SECOND = 10
+# Bytes read per iteration when streaming large downloads to disk.
+STREAM_CHUNK_SIZE = 1024 * 1024
 
 
 def _require_httpx():
@@ -39,11 +52,15 @@ class EdgarAsyncSession:
     ``asyncio.sleep`` for rate limiting.
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-positional-arguments
         self,
         client: EdgarAsyncClient,
         user_agent: str,
         rate_limit: int = MAX_REQUESTS_PER_SECOND,
+        disk_cache: DiskCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        hooks: RequestHooks | None = None,
+        retry_policy: RetryPolicy | None = None,
     ) -> None:
         """Initializes the ``EdgarAsyncSession``.
 
@@ -57,6 +74,20 @@ class EdgarAsyncSession:
 
         rate_limit : int (optional, Default=10)
             Maximum requests per second (1–10).
+
+        disk_cache : DiskCache | None (optional, Default=None)
+            Persistent HTTP response cache shared with ``EdgarSession``.
+
+        rate_limiter : RateLimiter | None (optional, Default=None)
+            Limiter shared with other sessions or processes. ``None``
+            creates a private ``TokenBucketRateLimiter``.
+
+        hooks : RequestHooks | None (optional, Default=None)
+            Instrumentation callbacks, as for ``EdgarSession``.
+
+        retry_policy : RetryPolicy | None (optional, Default=None)
+            Which failures are retried and how long to back off.
+            ``None`` uses ``RetryPolicy()``.
         """
 
         if not 1 <= rate_limit <= MAX_REQUESTS_PER_SECOND:
@@ -71,14 +102,26 @@ class EdgarAsyncSession:
         self.resource = "https://www.sec.gov"
         self.api_resource = "https://data.sec.gov"
         self.user_agent = user_agent
+        self.disk_cache = disk_cache
 
-        self._request_times: deque[float] = deque()
         self._rate_limit = rate_limit
+        self.rate_limiter: RateLimiter = rate_limiter or TokenBucketRateLimiter(rate=rate_limit)
+        self.hooks = hooks if hooks is not None else RequestHooks()
+        self.retry_policy = retry_policy or RetryPolicy()
+
+        # Local bulk archives (``BulkData``) read by the bridged services;
+        # assign one to share archives downloaded by an ``EdgarClient``.
+        self.bulk_data: BulkData | None = None
+
+        # Memory-mapped ticker indexes, set by ``EdgarAsyncClient(cache_dir=...)``.
+        self.ticker_snapshot: TickerSnapshot | None = None
+
+        # GET requests in flight, so concurrent identical ones are sent once.
+        self.in_flight = AsyncSingleFlight()
 
-        transport = httpx.AsyncHTTPTransport(retries=MAX_RETRIES)
+        # Retries are handled by ``_send`` under ``retry_policy``.
         self.http_client = httpx.AsyncClient(
             headers={"user-agent": self.user_agent},
-            transport=transport,
             timeout=30.0,
             follow_redirects=True,
         )
@@ -145,53 +188,62 @@ class EdgarAsyncSession:
 
         url = self.build_url(endpoint=endpoint, use_api=use_api, base_url=base_url)
 
+        send = functools.partial(self._request, method, url, params, data, json_payload)
+        if method.upper() != "GET":
+            return await send()
+
+        # Identical GETs already in flight in another task share its response.
+        result, shared = await self.in_flight.do(DiskCache.make_key(url, params), send)
+        if shared:
+            logger.debug("Coalesced with in-flight request: %s", url)
+            self.hooks.notify("on_cache_hit", method, url, cache="coalesced")
+            # Each caller gets its own copy, so one mutating the parsed
+            # JSON can't change what the others see.
+            return copy.deepcopy(result)
+        return result
+
+    async def _request(  # pylint: disable=too-many-positional-arguments
+        self,
+        method: str,
+        url: str,
+        params: dict | None,
+        data: dict | None,
+        json_payload: dict | None,
+    ) -> Union[dict, str, None]:
+        """Sends one request to *url* for ``make_request``."""
+
         logger.debug("URL: %s", url)
         logger.debug("Parameters: %s", params)
 
-        await self._throttle()
+        cache_key, cached = None, None
+        headers = None
+        if method.upper() == "GET":
+            cache_key, cached = await self._disk_cache_lookup(url=url, params=params)
+            if cached is not None and cached.is_fresh:
+                self.hooks.notify("on_cache_hit", method, url, cache="disk")
+                return decode_body(cached.body, cached.content_type)
+            if cached is not None:
+                headers = cached.conditional_headers()
 
         httpx = _require_httpx()
 
+        send = functools.partial(
+            self.http_client.request,
+            method=method.upper(),
+            url=url,
+            params=params,
+            data=data,
+            json=json_payload,
+            headers=headers,
+        )
         try:
-            response = await self.http_client.request(
-                method=method.upper(),
-                url=url,
-                params=params,
-                data=data,
-                json=json_payload,
-            )
+            response = await self._send(method, url, send)
         except httpx.HTTPError as exc:
             logger.error("Request failed: %s", exc)
             raise EdgarRequestError(f"Request to {url} failed: {exc}") from exc
 
-        retries = 0
-        while response.status_code != 200 and retries < MAX_RETRIES:
-            retries += 1
-            sleep_time = 2 ** retries
-            logger.warning(
-                "Non-200 status %s, retry %s/%s in %ss",
-                response.status_code,
-                retries,
-                MAX_RETRIES,
-                sleep_time,
-            )
-            await asyncio.sleep(sleep_time)
-
-            try:
-                response = await self.http_client.request(
-                    method=method.upper(),
-                    url=url,
-                    params=params,
-                    data=data,
-                    json=json_payload,
-                )
-            except httpx.HTTPError as exc:
-                if retries >= MAX_RETRIES:
-                    logger.error("Retry %s failed: %s", retries, exc)
-                    raise EdgarRequestError(
-                        f"Request to {url} failed after {MAX_RETRIES} retries: {exc}"
-                    ) from exc
-                continue
+        if await self._record(cache_key, url, response, cached, method=method):
+            return decode_body(cached.body, cached.content_type)
 
         if response.status_code != 200:
             raise EdgarRequestError(
@@ -219,88 +271,340 @@ class EdgarAsyncSession:
     async def fetch_page(self, url: str) -> bytes | None:
         """Fetches a raw page by URL, returning bytes or None."""
 
-        await self._throttle()
+        cache_key, cached = await self._disk_cache_lookup(url=url)
+        if cached is not None and cached.is_fresh:
+            self.hooks.notify("on_cache_hit", "GET", url, cache="disk")
+            return cached.body
+
         httpx = _require_httpx()
 
         try:
-            response = await self.http_client.get(url)
+            response = await self._conditional_get(url, cached)
         except httpx.HTTPError as exc:
             logger.error("Failed to fetch page %s: %s", url, exc)
             raise EdgarRequestError(f"Failed to fetch page {url}: {exc}") from exc
 
+        if await self._record(cache_key, url, response, cached):
+            return cached.body
+
         if response.status_code == 200:
             return response.content
         return None
 
-    async def download(self, url: str, path: str | None = None) -> str | bytes:
-        """Downloads a filing document from a full SEC URL.
+    async def stream_to_file(self, url: str, fileobj, chunk_size: int = STREAM_CHUNK_SIZE) -> bool:
+        """Streams a (large) response body into an open binary file.
+
+        Async counterpart of ``EdgarSession.stream_to_file``: the body is
+        never held in memory and the disk cache is bypassed.
 
         ### Parameters
         ----
         url : str
-            The full URL to the filing document.
+            The full URL to download.
 
-        path : str | None (optional, Default=None)
-            If provided, saves the content to this file path.
+        fileobj : BinaryIO
+            A writable binary file object.
+
+        chunk_size : int (optional, Default=STREAM_CHUNK_SIZE)
+            Bytes read from the socket per iteration.
 
         ### Returns
         ----
-        str | bytes
+        bool:
+            ``True`` if the body was written, ``False`` on a non-200
+            status.
+        """
+
+        httpx = _require_httpx()
+
+        started, written = time.perf_counter(), 0
+        try:
+            request = self.http_client.build_request("GET", url)
+            send = functools.partial(self.http_client.send, request, stream=True)
+            response = await self._send("GET", url, send, stream=True)
+            try:
+                if response.status_code == 200:
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        fileobj.write(chunk)
+                        written += len(chunk)
+            finally:
+                await response.aclose()
+        except httpx.HTTPError as exc:
+            logger.error("Failed to stream %s: %s", url, exc)
+            raise EdgarRequestError(f"Failed to stream {url}: {exc}") from exc
+
+        self.hooks.notify(
+            "on_response", "GET", url, status=response.status_code,
+            elapsed=time.perf_counter() - started, size=written,
+        )
+        if response.status_code != 200:
+            logger.debug("Streaming %s returned status %d", url, response.status_code)
+            return False
+        return True
+
+    async def download_to_file(  # pylint: disable=too-many-positional-arguments
+        self,
+        url: str,
+        path: str,
+        checksum: str | None = None,
+        resume: bool = True,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> str:
+        """Async equivalent of ``EdgarSession.download_to_file``.
+
+        Streams the body to ``<path>.part``, resumes interrupted
+        transfers with HTTP ``Range`` requests, verifies ``checksum``
+        and renames the file to ``path`` once complete.
+
+        ### Parameters
+        ----
+        url : str
+            The full URL to download.
+
+        path : str
+            Where to save the file.
+
+        checksum : str | None (optional, Default=None)
+            Expected ``"algorithm:hexdigest"`` of the file.
+
+        resume : bool (optional, Default=True)
+            Continue an existing ``<path>.part``; ``False`` starts over.
+
+        chunk_size : int (optional, Default=STREAM_CHUNK_SIZE)
+            Bytes read from the socket per iteration.
+
+        ### Returns
+        ----
+        str:
+            The ``path`` written.
         """
 
-        await self._throttle()
         httpx = _require_httpx()
+        target = PartialFile(path, checksum=checksum, resume=resume)
+        interruptions = 0
+        while True:
+            try:
+                if await self._stream_into(url, target, chunk_size):
+                    return target.finish()
+            except httpx.TransportError as exc:
+                interruptions += 1
+                if interruptions > self.retry_policy.max_retries:
+                    logger.error("Failed to download %s: %s", url, exc)
+                    raise EdgarRequestError(f"Failed to download {url}: {exc}") from exc
+                delay = self.retry_policy.backoff(interruptions)
+                logger.warning(
+                    "Download of %s interrupted at byte %d (%s), resuming in %.2fs",
+                    url, target.offset, exc, delay,
+                )
+                await asyncio.sleep(delay)
+
+    async def _stream_into(self, url: str, target: PartialFile, chunk_size: int) -> bool:
+        """Async equivalent of ``EdgarSession._stream_into``."""
 
+        httpx = _require_httpx()
+        request = self.http_client.build_request("GET", url, headers=target.range_headers())
+        started = time.perf_counter()
         try:
-            response = await self.http_client.get(url)
+            send = functools.partial(self.http_client.send, request, stream=True)
+            response = await self._send("GET", url, send, stream=True)
         except httpx.HTTPError as exc:
             logger.error("Failed to download %s: %s", url, exc)
             raise EdgarRequestError(f"Failed to download {url}: {exc}") from exc
 
-        if response.status_code != 200:
-            raise EdgarRequestError(
-                f"Download from {url} returned status {response.status_code}"
-            )
+        try:
+            status = response.status_code
+            content_range = response.headers.get("content-range")
+            validator = validator_of(response.headers)
+            if target.is_complete(status, content_range, validator):
+                return True
+            if status == 416 and target.offset:
+                logger.debug("Discarding %s: server rejected its range", target.partial_path)
+                target.restart()
+                return False
+            if status not in (200, 206):
+                logger.error("Download from %s returned status %d", url, status)
+                raise EdgarRequestError(f"Download from {url} returned status {status}")
+
+            if not target.begin(status, content_range, validator):
+                return False
+            written = target.written
+            try:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    target.write(chunk)
+            finally:
+                target.close()
+                self.hooks.notify(
+                    "on_response", "GET", url, status=status,
+                    elapsed=time.perf_counter() - started, size=target.written - written,
+                )
+        finally:
+            await response.aclose()
+        return True
+
+    async def download(
+        self,
+        url: str,
+        path: str | None = None,
+        stream: bool = False,
+        checksum: str | None = None,
+    ) -> str | bytes:
+        """Downloads a filing document from a full SEC URL.
+
+        ### Parameters
+        ----
+        url : str
+            The full URL to the filing document.
+
+        path : str | None (optional, Default=None)
+            If provided, saves the content to this file path.
+
+        stream : bool (optional, Default=False)
+            Stream the body straight to ``path`` with
+            ``download_to_file``. Requires ``path``; implied by
+            ``checksum``.
+
+        checksum : str | None (optional, Default=None)
+            Expected ``"algorithm:hexdigest"`` of the file.
+
+        ### Returns
+        ----
+        str | bytes
+        """
+
+        if stream or checksum:
+            return await self.download_to_file(url, path, checksum=checksum)
+
+        content = await self._fetch_document(url)
+        if path is not None:
+            return save_document(path, content)
+        return content
+
+    async def _fetch_document(self, url: str) -> str | bytes:
+        """Fetches a document for ``download``, through the disk cache when there is one.
+
+        Text content types are decoded to ``str``; anything else is
+        returned as ``bytes``.
+        """
+
+        cache_key, cached = await self._disk_cache_lookup(url=url)
+
+        if cached is not None and cached.is_fresh:
+            self.hooks.notify("on_cache_hit", "GET", url, cache="disk")
+            content_type = cached.content_type
+            body = cached.body
+        else:
+            httpx = _require_httpx()
+
+            try:
+                response = await self._conditional_get(url, cached)
+            except httpx.HTTPError as exc:
+                logger.error("Failed to download %s: %s", url, exc)
+                raise EdgarRequestError(f"Failed to download {url}: {exc}") from exc
+
+            if await self._record(cache_key, url, response, cached):
+                content_type, body = cached.content_type, cached.body
+            elif response.status_code != 200:
+                raise EdgarRequestError(f"Download from {url} returned status {response.status_code}")
+            else:
+                content_type = response.headers.get("content-type", "")
+                body = None
 
-        content_type = response.headers.get("content-type", "")
         is_text = any(
             ct in content_type for ct in ["text/", "application/json", "application/xml"]
         )
-        content = response.text if is_text else response.content
+        if body is None:
+            return response.text if is_text else response.content
+        if is_text:
+            return body.decode(charset_of(content_type), errors="replace")
+        return body
 
-        if path is not None:
-            mode = "w" if is_text else "wb"
-            encoding = "utf-8" if is_text else None
-            with open(path, mode, encoding=encoding) as f:
-                f.write(content)
-            return path
+    async def _disk_cache_lookup(
+        self,
+        url: str,
+        params: dict | None = None,
+    ) -> tuple[str | None, CachedResponse | None]:
+        """Returns the disk cache key and stored entry (if any) for a GET.
 
-        return content
+        ``DiskCache`` is synchronous SQLite that may wait on its lock,
+        so it is read in a worker thread, as are the cache writes.
+        """
 
-    async def close(self) -> None:
-        """Closes the underlying httpx client."""
-        await self.http_client.aclose()
+        if self.disk_cache is None:
+            return None, None
+        cache_key = self.disk_cache.make_key(url, params)
+        return cache_key, await asyncio.to_thread(self.disk_cache.get, cache_key)
 
-    async def _throttle(self) -> None:
-        """Async rate limiter using a sliding-window algorithm."""
+    async def _record(
+        self,
+        cache_key: str | None,
+        url: str,
+        response,
+        cached: CachedResponse | None,
+        *,
+        method: str = "GET",
+    ) -> bool:
+        """Records a GET response in the disk cache; ``True`` if it revalidated ``cached``."""
+
+        if cache_key is None:
+            return False
+        revalidated = await asyncio.to_thread(self.disk_cache.record, cache_key, url, response, cached)
+        if revalidated:
+            self.hooks.notify("on_cache_hit", method, url, cache="revalidated")
+        return revalidated
+
+    async def _conditional_get(self, url: str, cached: CachedResponse | None):
+        """Sends a GET, adding revalidation headers when a stale entry exists."""
+
+        if cached is None:
+            send = functools.partial(self.http_client.get, url)
+        else:
+            send = functools.partial(self.http_client.get, url, headers=cached.conditional_headers())
+        return await self._send("GET", url, send)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        send: Callable[[], Awaitable],
+        stream: bool = False,
+    ):
+        """Async equivalent of ``EdgarSession._send``.
+
+        Retries ``httpx`` transport errors and the policy's retry
+        statuses, honoring ``Retry-After`` and pausing the rate limiter
+        on ``429``. With ``stream=True`` the returned response is left
+        open for the caller to read and close.
+        """
 
-        loop = asyncio.get_event_loop()
-        now = loop.time()
+        httpx = _require_httpx()
+        attempts = RetryAttempts(self.retry_policy, self.hooks, method, url, stream=stream)
+        while True:
+            await self._throttle(method, url)
+            started = time.perf_counter()
+            try:
+                response, error = await send(), None
+            except httpx.TransportError as exc:
+                response, error = None, exc
+
+            delay = attempts.next_delay(response, error, started)
+            if delay is None:
+                return response
+            if response is not None:
+                if response.status_code == 429:
+                    await self.rate_limiter.pause_async(delay)
+                if stream:
+                    await response.aclose()
+            await asyncio.sleep(delay)
 
-        while self._request_times and (now - self._request_times[0]) >= 1.0:
-            self._request_times.popleft()
+    async def close(self) -> None:
+        """Closes the underlying httpx client."""
+        await self.http_client.aclose()
 
-        if len(self._request_times) >= self._rate_limit:
-            sleep_duration = 1.0 - (now - self._request_times[0])
-            if sleep_duration > 0:
-                logger.debug(
-                    "Rate limit: %d requests in window, sleeping %.3fs",
-                    len(self._request_times),
-                    sleep_duration,
-                )
-                await asyncio.sleep(sleep_duration)
-            now = loop.time()
-            while self._request_times and (now - self._request_times[0]) >= 1.0:
-                self._request_times.popleft()
+    async def _throttle(self, method: str = "GET", url: str = "") -> None:
+        """Awaits until ``rate_limiter`` grants the next request slot."""
 
-        self._request_times.append(loop.time())
+        wait = await self.rate_limiter.reserve_async()
+        if wait > 0:
+            logger.debug("Rate limit: sleeping %.3fs", wait)
+            self.hooks.notify("on_throttle_wait", method, url, wait=wait)
+            await asyncio.sleep(wait)
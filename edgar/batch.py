@@ -0,0 +1,144 @@
+"""Concurrent bulk fetching for per-company SEC EDGAR endpoints."""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Endpoints accepted by ``fetch_many`` → data.sec.gov path template.
+BATCH_ENDPOINTS: dict[str, str] = {
+    "submissions": "/submissions/CIK{cik}.json",
+    "company_facts": "/api/xbrl/companyfacts/CIK{cik}.json",
+}
+
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Outcome of one item in a bulk fetch.
+
+    Exactly one of ``value`` and ``error`` is meaningful: a failed item
+    carries the exception it raised instead of aborting the batch.
+    """
+
+    key: str
+    value: object | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item was fetched without raising."""
+        return self.error is None
+
+
+def check_endpoint(endpoint: str) -> str:
+    """Validates *endpoint* and returns its data.sec.gov path template."""
+
+    try:
+        return BATCH_ENDPOINTS[endpoint]
+    except KeyError:
+        raise ValueError(
+            f"endpoint must be one of {sorted(BATCH_ENDPOINTS)}, got {endpoint!r}"
+        ) from None
+
+
+def run_threaded(
+    func: Callable[[str], object],
+    keys: Iterable[str],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Iterator[BatchResult]:
+    """Calls ``func(key)`` for every key on a thread pool.
+
+    Yields a ``BatchResult`` per key as soon as it completes. At most
+    ``2 * max_workers`` calls are in flight, so a slow consumer doesn't
+    pile up results for the whole batch in memory. Closing the
+    generator early cancels the calls that haven't started.
+    """
+
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+    keys = iter(keys)
+    window = 2 * max_workers
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="edgar-batch")
+    pending: dict[Future, str] = {}
+
+    def submit_next() -> bool:
+        key = next(keys, None)
+        if key is None:
+            return False
+        pending[executor.submit(func, key)] = key
+        return True
+
+    try:
+        while len(pending) < window and submit_next():
+            pass
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = pending.pop(future)
+                yield _to_result(key, future.result, future.exception())
+                submit_next()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_async(
+    func: Callable[[str], Awaitable[object]],
+    keys: Iterable[str],
+    concurrency: int = DEFAULT_MAX_WORKERS,
+) -> AsyncIterator[BatchResult]:
+    """Awaits ``func(key)`` for every key with bounded concurrency.
+
+    The ``asyncio`` counterpart of ``run_threaded``: yields a
+    ``BatchResult`` per key as soon as it completes, keeps at most
+    ``concurrency`` calls in flight, and cancels them if the iterator
+    is closed early.
+    """
+
+    # Imported here so sync-only programs don't load asyncio.
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+    keys = iter(keys)
+    pending: dict[asyncio.Task, str] = {}
+
+    def submit_next() -> bool:
+        key = next(keys, None)
+        if key is None:
+            return False
+        pending[asyncio.ensure_future(func(key))] = key
+        return True
+
+    try:
+        while len(pending) < concurrency and submit_next():
+            pass
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                key = pending.pop(task)
+                yield _to_result(key, task.result, task.exception())
+                submit_next()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _to_result(key: str, result: Callable[[], object], error: BaseException | None) -> BatchResult:
+    """Wraps a finished call in a ``BatchResult``, logging failures."""
+
+    if error is None:
+        return BatchResult(key=key, value=result())
+    if not isinstance(error, Exception):
+        raise error
+    logger.warning("Batch item %s failed: %s", key, error)
+    return BatchResult(key=key, error=error)
@@ -0,0 +1,263 @@
+"""Local copies of SEC's nightly ``submissions.zip`` and ``companyfacts.zip`` archives."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+import zipfile
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from edgar.session import EdgarSession
+
+logger = logging.getLogger(__name__)
+
+# Archive name → URL. SEC rebuilds both every night (around 3 a.m. ET).
+BULK_ARCHIVES: dict[str, str] = {
+    "submissions": "https://www.sec.gov/Archives/edgar/daily-index/bulkdata/submissions.zip",
+    "companyfacts": "https://www.sec.gov/Archives/edgar/daily-index/bulkdata/companyfacts.zip",
+}
+
+# Archive name → seconds after its download that lookups stop using it.
+# SEC rebuilds both archives every night, so a copy stays current until
+# the next rebuild, about a day later.
+BULK_MAX_AGE: dict[str, float] = {
+    "submissions": 86400,     # 24 hours
+    "companyfacts": 86400,    # 24 hours
+}
+
+# One member per company. submissions.zip also holds the older-filings
+# pages (``CIK##########-submissions-001.json``), which this skips.
+_MEMBER = re.compile(r"^CIK(\d{10})\.json$")
+
+
+def _check_archive(name: str) -> str:
+    """Validates *name* and returns its URL."""
+
+    try:
+        return BULK_ARCHIVES[name]
+    except KeyError:
+        raise ValueError(f"archive must be one of {sorted(BULK_ARCHIVES)}, got {name!r}") from None
+
+
+class BulkData:
+
+    """
+    ## Overview
+    ----
+    Serves company submissions and XBRL company facts from local copies
+    of SEC's bulk archives instead of one rate-limited request per CIK.
+
+    Each archive is downloaded once, streamed to disk, and then read in
+    place: looking up a company decompresses only its own member, found
+    through the ZIP's central directory, so nothing is extracted and
+    the whole universe is available within minutes of the download.
+    ``Submissions.get_submissions()``, ``Xbrl.company_facts()`` and
+    ``Xbrl.get_facts()`` use it automatically when the client is created
+    with ``bulk_dir``, as long as the archive is younger than its
+    ``max_age``; CIKs missing from an archive, and every CIK once it is
+    stale, fall back to the API.
+
+    ### Usage
+    ----
+        >>> edgar_client = EdgarClient(user_agent="...", bulk_dir="~/sec-bulk")
+        >>> edgar_client.bulk.data.download()
+        >>> edgar_client.submissions().get_submissions(cik="320193")  # read from submissions.zip
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        session: EdgarSession | None = None,
+        max_age: dict[str, float] | None = None,
+    ) -> None:
+        """Initializes the ``BulkData``.
+
+        ### Parameters
+        ----
+        directory : str
+            Directory holding the archives. Created if missing.
+
+        session : EdgarSession | None (optional, Default=None)
+            Session used by ``download()``. Without one only archives
+            already on disk can be read.
+
+        max_age : dict[str, float] | None (optional, Default=None)
+            Seconds after its download that an archive stops serving
+            the services' lookups, per archive name. Defaults to
+            ``BULK_MAX_AGE``: one day, the interval between SEC's
+            nightly rebuilds.
+        """
+
+        self.directory = os.path.expanduser(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.edgar_session = session
+        self.max_age = {**BULK_MAX_AGE, **(max_age or {})}
+        self._lock = threading.Lock()
+        self._archives: dict[str, zipfile.ZipFile] = {}
+
+    def __repr__(self) -> str:
+        available = [name for name in BULK_ARCHIVES if self.has(name)]
+        return f"<BulkData directory={self.directory!r} archives={available}>"
+
+    def path(self, name: str) -> str:
+        """Returns the local path of archive ``name``."""
+
+        _check_archive(name)
+        return os.path.join(self.directory, f"{name}.zip")
+
+    def has(self, name: str) -> bool:
+        """Whether archive ``name`` has been downloaded."""
+
+        return os.path.exists(self.path(name))
+
+    def age(self, name: str) -> float | None:
+        """Seconds since archive ``name`` was downloaded, or ``None`` if it wasn't."""
+
+        if not self.has(name):
+            return None
+        return time.time() - os.path.getmtime(self.path(name))
+
+    def is_fresh(self, name: str) -> bool:
+        """Whether archive ``name`` is downloaded and younger than its ``max_age``."""
+
+        age = self.age(name)
+        return age is not None and age <= self.max_age[name]
+
+    def download(self, names: str | list[str] | None = None) -> list[str]:
+        """Downloads (or refreshes) archives, streaming them to disk.
+
+        Each archive is written to a ``.part`` file and swapped in only
+        when complete, so lookups keep reading the previous copy until
+        then, and an interrupted download resumes on the next call.
+
+        ### Parameters
+        ----
+        names : str | list[str] | None (optional, Default=None)
+            ``"submissions"``, ``"companyfacts"`` or both. Defaults to
+            both.
+
+        ### Returns
+        ----
+        list[str]:
+            The paths of the downloaded archives.
+        """
+
+        if self.edgar_session is None:
+            raise ValueError("BulkData needs a session to download archives")
+
+        if names is None:
+            names = list(BULK_ARCHIVES)
+        elif isinstance(names, str):
+            names = [names]
+
+        paths = []
+        for name in names:
+            url = _check_archive(name)
+            logger.info("Downloading %s", url)
+            path = self.edgar_session.download_to_file(url, self.path(name))
+            self._close(name)
+            paths.append(path)
+        return paths
+
+    def get(self, name: str, cik: str | int) -> dict | None:
+        """Reads one company's JSON from an archive.
+
+        ### Parameters
+        ----
+        name : str
+            ``"submissions"`` or ``"companyfacts"``.
+
+        cik : str | int
+            The company's CIK, with or without leading zeros.
+
+        ### Returns
+        ----
+        dict | None:
+            The same document the API returns, or ``None`` if the
+            archive isn't downloaded or has no such company. The
+            archive's age isn't checked; see ``lookup()``.
+        """
+
+        archive = self._open(name)
+        if archive is None:
+            return None
+        try:
+            data = archive.read(f"CIK{int(cik):010d}.json")
+        except KeyError:
+            return None
+        return json.loads(data)
+
+    def lookup(self, name: str, cik: str | int) -> dict | None:
+        """Reads one company's JSON for the services, if the archive is fresh.
+
+        Unlike ``get()``, returns ``None`` once the archive is older
+        than its ``max_age``, so the caller asks the API instead.
+        """
+
+        if not self.is_fresh(name):
+            logger.debug("Not reading %s for CIK %s: the archive is stale", name, cik)
+            return None
+        return self.get(name, cik)
+
+    def submissions(self, cik: str | int) -> dict | None:
+        """Reads a company's submissions from ``submissions.zip``."""
+
+        return self.get("submissions", cik)
+
+    def company_facts(self, cik: str | int) -> dict | None:
+        """Reads a company's XBRL facts from ``companyfacts.zip``."""
+
+        return self.get("companyfacts", cik)
+
+    def ciks(self, name: str) -> list[str]:
+        """Returns the zero-padded CIKs in an archive, without reading any member."""
+
+        archive = self._open(name)
+        if archive is None:
+            return []
+        return [match.group(1) for match in map(_MEMBER.match, archive.namelist()) if match]
+
+    def iter_companies(self, name: str) -> Iterator[tuple[str, dict]]:
+        """Yields ``(cik, document)`` for every company in an archive.
+
+        Members are decompressed and parsed one at a time, so memory
+        stays flat however large the archive is.
+        """
+
+        for cik in self.ciks(name):
+            document = self.get(name, cik)
+            if document is not None:
+                yield cik, document
+
+    def close(self) -> None:
+        """Closes the open archives."""
+
+        for name in list(self._archives):
+            self._close(name)
+
+    def _open(self, name: str) -> zipfile.ZipFile | None:
+        """Returns the open ``ZipFile`` of an archive, opening it once.
+
+        ``ZipFile`` reads its central directory when opened and
+        serializes member reads on the shared handle, so one instance
+        serves every thread.
+        """
+
+        with self._lock:
+            archive = self._archives.get(name)
+            if archive is None and self.has(name):
+                archive = self._archives[name] = zipfile.ZipFile(self.path(name))  # pylint: disable=consider-using-with
+            return archive
+
+    def _close(self, name: str) -> None:
+        """Closes archive ``name`` so the next lookup opens the current file."""
+
+        with self._lock:
+            archive = self._archives.pop(name, None)
+        if archive is not None:
+            archive.close()
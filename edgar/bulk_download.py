@@ -0,0 +1,447 @@
+"""Concurrent, resumable bulk downloads of SEC EDGAR filing documents."""
+
+from __future__ import annotations
+
+import fnmatch
+import json
+import logging
+import os
+import posixpath
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable, Union
+from urllib.parse import urlsplit
+
+from edgar.batch import run_threaded
+from edgar.session import POOL_MAXSIZE
+
+if TYPE_CHECKING:
+    from edgar.session import EdgarSession
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "manifest.sqlite3"
+
+DEFAULT_BULK_WORKERS = 4
+
+# Statuses recorded per file in the manifest.
+DONE = "done"
+FAILED = "failed"
+
+_ARCHIVES_URL = "https://www.sec.gov/Archives/edgar/data/"
+_ACCESSION = re.compile(r"^(\d{10})-?(\d{2})-?(\d{6})$")
+_ARCHIVE_PATH = re.compile(r"^/Archives/edgar/data/(\d+)/(\d{18})(?:/(.*))?$")
+_INDEX_PAGE = re.compile(r"^(\d{10}-\d{2}-\d{6}-index\.html?|index\.json)?$")
+
+# Appended to listing errors of bare accession numbers, which are looked
+# up under the submitter's CIK and so miss filings made by filing agents.
+_AGENT_HINT = (
+    " (looked up under the CIK in the accession number; if a filing agent"
+    " submitted it, pass (cik, accession) with the company's CIK)"
+)
+
+# Directory listing entries that are sub-folders, not documents.
+_FOLDER_TYPES = {"dir", "folder.gif"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    url TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    status TEXT NOT NULL,
+    size INTEGER,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_status ON files (status);
+CREATE TABLE IF NOT EXISTS filings (
+    filing TEXT PRIMARY KEY,
+    urls TEXT NOT NULL
+);
+"""
+
+
+# A download item: a URL, an accession number, or a (cik, accession number) pair.
+Item = Union[str, tuple[Union[str, int], str]]
+
+
+def filing_directory(item: Item) -> str | None:
+    """Returns the archive directory URL of a filing, or ``None``.
+
+    ### Parameters
+    ----
+    item : str | tuple[str | int, str]
+        A ``(cik, accession number)`` pair, a bare accession number
+        (``"0000320193-23-000106"``, with or without dashes), a filing
+        directory URL, or the URL of its ``-index.htm`` /
+        ``index.json`` page. A bare accession number is looked up under
+        the CIK in its first ten digits, which is the submitter. That
+        is the company itself unless a filing agent filed for it; the
+        archive only lists the filing under the companies it is about,
+        so agent-filed filings need the pair.
+
+    ### Returns
+    ----
+    str | None:
+        ``https://www.sec.gov/Archives/edgar/data/<cik>/<accession>/``,
+        or ``None`` if ``item`` is the URL of a single document.
+
+    ### Raises
+    ----
+    ValueError:
+        If a pair doesn't hold a numeric CIK and an accession number.
+    """
+
+    if isinstance(item, tuple):
+        cik, accession = item
+        match = _ACCESSION.match(str(accession).strip())
+        if not match or not str(cik).strip().isdigit():
+            raise ValueError(f"Expected a (cik, accession number) pair, got {item!r}")
+        return f"{_ARCHIVES_URL}{int(cik)}/{''.join(match.groups())}/"
+
+    match = _ACCESSION.match(item.strip())
+    if match:
+        return f"{_ARCHIVES_URL}{int(match.group(1))}/{''.join(match.groups())}/"
+
+    path = _ARCHIVE_PATH.match(urlsplit(item).path)
+    if path and _INDEX_PAGE.match(path.group(3) or ""):
+        return f"{_ARCHIVES_URL}{int(path.group(1))}/{path.group(2)}/"
+    return None
+
+
+def local_path(directory: str, url: str) -> str:
+    """Where ``url`` is saved below ``directory``.
+
+    Archive documents keep their SEC layout,
+    ``<directory>/<cik>/<accession>/<filename>``; anything else goes to
+    ``<directory>/<host>/<path>``. The same URL always maps to the same
+    file, so re-runs find what earlier runs downloaded.
+    """
+
+    parts = urlsplit(url)
+    match = _ARCHIVE_PATH.match(parts.path)
+    if match and match.group(3):
+        relative = f"{int(match.group(1))}/{match.group(2)}/{match.group(3)}"
+    else:
+        relative = f"{parts.netloc}/{parts.path.lstrip('/') or 'index'}"
+    relative = posixpath.normpath(relative)
+    if relative.startswith("..") or posixpath.isabs(relative):
+        raise ValueError(f"Refusing to download {url} outside {directory}")
+    return os.path.join(directory, *relative.split("/"))
+
+
+@dataclass
+class BulkDownloadReport:
+    """What one ``BulkDownloader.run()`` did.
+
+    ``downloaded`` and ``skipped`` hold document URLs; ``failed`` maps
+    each URL (or filing that couldn't be resolved) to its error.
+    """
+
+    downloaded: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every document is on disk."""
+        return not self.failed
+
+
+class DownloadManifest:
+
+    """
+    ## Overview
+    ----
+    A SQLite record of every document a ``BulkDownloader`` has fetched
+    or failed to fetch, and of the document lists of the filings it has
+    resolved. It is what lets a re-run skip finished files and retry
+    only the failures.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initializes the ``DownloadManifest``.
+
+        ### Parameters
+        ----
+        path : str
+            The SQLite database file. Created if missing.
+        """
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def __repr__(self) -> str:
+        return f"<DownloadManifest path={self.path!r} files={len(self)}>"
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def close(self) -> None:
+        """Closes the database connection."""
+
+        with self._lock:
+            self._conn.close()
+
+    def status(self, url: str) -> str | None:
+        """Returns ``"done"``, ``"failed"`` or ``None`` for a URL never tried."""
+
+        with self._lock:
+            row = self._conn.execute("SELECT status FROM files WHERE url = ?", (url,)).fetchone()
+        return row[0] if row else None
+
+    def counts(self) -> dict[str, int]:
+        """Returns the number of files per status."""
+
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM files GROUP BY status").fetchall()
+        return dict(rows)
+
+    def failed(self) -> list[str]:
+        """Returns the URLs whose last attempt failed."""
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url FROM files WHERE status = ? ORDER BY url", (FAILED,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def record(self, url: str, path: str, status: str, size: int | None = None, error: str | None = None) -> None:
+        """Records the outcome of one download attempt."""
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO files (url, path, status, size, attempts, error, updated_at) "
+                "VALUES (?, ?, ?, ?, 1, ?, ?) "
+                "ON CONFLICT (url) DO UPDATE SET path = excluded.path, status = excluded.status, "
+                "size = excluded.size, attempts = attempts + 1, error = excluded.error, "
+                "updated_at = excluded.updated_at",
+                (url, path, status, size, error, time.time()),
+            )
+
+    def filing_urls(self, filing: str) -> list[str] | None:
+        """Returns the document URLs stored for a filing directory, if resolved before."""
+
+        with self._lock:
+            row = self._conn.execute("SELECT urls FROM filings WHERE filing = ?", (filing,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_filing(self, filing: str, urls: list[str]) -> None:
+        """Stores the document URLs of a filing directory."""
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO filings (filing, urls) VALUES (?, ?)",
+                (filing, json.dumps(urls)),
+            )
+
+
+class BulkDownloader:
+
+    """
+    ## Overview
+    ----
+    Downloads many filing documents into a local directory on a pool of
+    worker threads. Every request goes through the session, so workers
+    share its connection pool, rate limiter and retry policy, and large
+    documents are streamed to disk with resumable transfers.
+
+    Items can be document URLs or whole filings — accession numbers,
+    ``(cik, accession number)`` pairs or filing index page URLs — whose
+    documents are listed from the
+    filing's ``index.json`` (and remembered, so a re-run doesn't list
+    them again). A SQLite manifest in the directory records each
+    document, so running the same job again skips what is already on
+    disk and fetches only what is missing or failed.
+
+    ### Usage
+    ----
+        >>> downloader = edgar_client.archives().bulk_downloader("~/sec-data", patterns=["*.htm"])
+        >>> report = downloader.run(["0000320193-23-000106", "0000789019-23-000095"])
+        >>> report.failed
+        >>> downloader.retry_failed()
+    """
+
+    def __init__(  # pylint: disable=too-many-positional-arguments
+        self,
+        session: EdgarSession,
+        directory: str,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+        patterns: Iterable[str] | None = None,
+        manifest_path: str | None = None,
+    ) -> None:
+        """Initializes the ``BulkDownloader``.
+
+        ### Parameters
+        ----
+        session : EdgarSession
+            The session used for every request.
+
+        directory : str
+            Where documents are saved. Created if missing.
+
+        max_workers : int (optional, Default=DEFAULT_BULK_WORKERS)
+            Number of downloads in flight. Must be between 1 and
+            ``POOL_MAXSIZE``; the rate limiter still caps requests per
+            second across all of them.
+
+        patterns : Iterable[str] | None (optional, Default=None)
+            Shell-style patterns (``fnmatch``) a document's file name
+            must match when a filing is expanded, e.g. ``["*.htm",
+            "*.xml"]``. Documents given by URL are always downloaded.
+
+        manifest_path : str | None (optional, Default=None)
+            The manifest database. Defaults to ``manifest.sqlite3`` in
+            ``directory``.
+        """
+
+        if not 1 <= max_workers <= POOL_MAXSIZE:
+            raise ValueError(
+                f"max_workers must be between 1 and {POOL_MAXSIZE}, got {max_workers}"
+            )
+
+        self.edgar_session = session
+        self.directory = os.path.expanduser(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.max_workers = max_workers
+        self.patterns = list(patterns) if patterns is not None else None
+        self.manifest = DownloadManifest(manifest_path or os.path.join(self.directory, MANIFEST_FILENAME))
+
+    def __repr__(self) -> str:
+        return f"<BulkDownloader directory={self.directory!r} max_workers={self.max_workers}>"
+
+    def close(self) -> None:
+        """Closes the manifest."""
+
+        self.manifest.close()
+
+    def path_for(self, url: str) -> str:
+        """Returns the local path a document URL is saved to."""
+
+        return local_path(self.directory, url)
+
+    def resolve(self, items: Iterable[Item]) -> tuple[list[str], dict[str, str]]:
+        """Expands filings into their document URLs.
+
+        ### Parameters
+        ----
+        items : Iterable[str | tuple[str | int, str]]
+            Document URLs, accession numbers, ``(cik, accession
+            number)`` pairs or filing index page URLs.
+
+        ### Returns
+        ----
+        tuple[list[str], dict[str, str]]:
+            The unique document URLs in input order, and the filings
+            that couldn't be listed, mapped to their error.
+        """
+
+        items = list(items)
+        directories = {item: filing_directory(item) for item in items}
+        unresolved = sorted({d for d in directories.values() if d and self.manifest.filing_urls(d) is None})
+
+        errors: dict[str, str] = {}
+        for result in run_threaded(self._list_filing, unresolved, max_workers=self.max_workers):
+            if result.ok:
+                self.manifest.save_filing(result.key, result.value)
+            else:
+                errors[result.key] = str(result.error)
+        bare = {directories[item] for item in items if isinstance(item, str) and _ACCESSION.match(item.strip())}
+        for filing in bare & errors.keys():
+            errors[filing] += _AGENT_HINT
+
+        urls: dict[str, None] = {}
+        for item in items:
+            filing = directories[item]
+            if filing is None:
+                urls[item] = None
+            elif filing not in errors:
+                urls.update(dict.fromkeys(self._matching(self.manifest.filing_urls(filing))))
+        return list(urls), errors
+
+    def run(self, items: Iterable[Item]) -> BulkDownloadReport:
+        """Downloads every document of ``items`` not already on disk.
+
+        Documents the manifest marks as done whose file still exists
+        are skipped; everything else, including earlier failures, is
+        downloaded. A failing document is recorded and reported
+        instead of aborting the run.
+
+        ### Parameters
+        ----
+        items : Iterable[str | tuple[str | int, str]]
+            Document URLs, accession numbers (``"0000320193-23-000106"``),
+            ``(cik, accession number)`` pairs for filings a filing agent
+            submitted, or filing index page URLs.
+
+        ### Returns
+        ----
+        BulkDownloadReport:
+            The URLs downloaded, skipped and failed.
+        """
+
+        urls, errors = self.resolve(items)
+        report = BulkDownloadReport(failed=errors)
+
+        pending = []
+        for url in urls:
+            if self.manifest.status(url) == DONE and os.path.exists(self.path_for(url)):
+                report.skipped.append(url)
+            else:
+                pending.append(url)
+
+        for result in run_threaded(self._download, pending, max_workers=self.max_workers):
+            path = self.path_for(result.key)
+            if result.ok:
+                self.manifest.record(result.key, path, DONE, size=os.path.getsize(path))
+                report.downloaded.append(result.key)
+            else:
+                self.manifest.record(result.key, path, FAILED, error=str(result.error))
+                report.failed[result.key] = str(result.error)
+
+        logger.info(
+            "Bulk download: %d downloaded, %d skipped, %d failed",
+            len(report.downloaded), len(report.skipped), len(report.failed),
+        )
+        return report
+
+    def retry_failed(self) -> BulkDownloadReport:
+        """Downloads again every document whose last attempt failed."""
+
+        return self.run(self.manifest.failed())
+
+    def _list_filing(self, directory_url: str) -> list[str]:
+        """Lists the document URLs of a filing from its ``index.json``."""
+
+        response = self.edgar_session.make_request(method="get", endpoint=urlsplit(directory_url).path + "index.json")
+        listing = (response or {}).get("directory", {}).get("item", [])
+        return [
+            directory_url + item["name"]
+            for item in listing
+            if item.get("type") not in _FOLDER_TYPES
+        ]
+
+    def _matching(self, urls: list[str]) -> list[str]:
+        """Keeps the URLs whose file name matches ``patterns``."""
+
+        if self.patterns is None:
+            return urls
+        return [
+            url for url in urls
+            if any(fnmatch.fnmatch(url.rsplit("/", 1)[-1], pattern) for pattern in self.patterns)
+        ]
+
+    def _download(self, url: str) -> str:
+        """Streams one document to its local path."""
+
+        path = self.path_for(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return self.edgar_session.download_to_file(url, path)
@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
+import sys
+import threading
 import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
 
 logger = logging.getLogger(__name__)
 
@@ -13,54 +20,242 @@ TTL_TICKERS = 86400       # 24 hours — ticker data changes ~quarterly
 TTL_TAXONOMY = 86400      # 24 hours — static reference data
 TTL_SUBMISSIONS = 3600    # 1 hour — changes on new filings
 
+# Default bounds used by ``EdgarClient(cache=True)``.
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024   # 512 MiB
+
+
+def approximate_size(value: object) -> int:
+    """Estimates the in-memory footprint of *value* in bytes.
+
+    Walks nested ``dict``/``list``/``tuple``/``set`` containers and sums
+    ``sys.getsizeof`` for every distinct object. Shared objects are
+    counted once. The result is an approximation — good enough for a
+    memory budget, not an exact accounting.
+    """
+
+    seen: set[int] = set()
+    stack = [value]
+    total = 0
+
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+
+    return total
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Point-in-time counters for a ``TTLCache``."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    bytes: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache (``0.0`` when unused)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
 
 class TTLCache:
-    """Simple in-memory cache with per-key time-to-live expiration.
+    """In-memory cache with per-key time-to-live expiration.
+
+    Optionally bounded by entry count and by an approximate byte budget.
+    When either bound is exceeded, least-recently-used entries are
+    evicted in O(1). Expired entries are swept in amortized O(log n)
+    on every write via a min-heap of expiry times, so they never pile
+    up waiting for a read.
 
     Uses ``time.monotonic()`` so expiration is immune to wall-clock
     adjustments.
+
+    ### Usage
+    ----
+        >>> cache = TTLCache(max_entries=512, max_bytes=256 * 1024 * 1024)
+        >>> cache.set("key", {"data": 1}, ttl=60)
+        >>> cache.stats.hit_ratio
+        0.0
     """
 
-    def __init__(self) -> None:
-        self._store: dict[str, tuple[object, float]] = {}
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        sizeof: Callable[[object], int] = approximate_size,
+    ) -> None:
+        """Initializes the ``TTLCache``.
+
+        ### Parameters
+        ----
+        max_entries : int | None (optional, Default=None)
+            Maximum number of live entries. ``None`` means unbounded.
+
+        max_bytes : int | None (optional, Default=None)
+            Approximate memory budget in bytes. ``None`` means unbounded.
+
+        sizeof : Callable[[object], int] (optional, Default=approximate_size)
+            Estimates the size of a value when ``max_bytes`` is set.
+        """
+
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(f"max_bytes must be at least 1, got {max_bytes}")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+
+        # key → (value, expires_at, size); ordered oldest → most recently used.
+        self._store: OrderedDict[str, tuple[object, float, int]] = OrderedDict()
+        self._expiry_heap: list[tuple[float, int, str]] = []
+        self._counter = itertools.count()
+        self._bytes = 0
+        self._lock = threading.RLock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
 
     def get(self, key: str) -> object | None:
         """Return the cached value for *key*, or ``None`` if missing/expired."""
 
-        entry = self._store.get(key)
-        if entry is None:
-            logger.debug("Cache miss: %s", key)
-            return None
-        value, expires_at = entry
-        if time.monotonic() >= expires_at:
-            del self._store[key]
-            logger.debug("Cache expired: %s", key)
-            return None
-        logger.debug("Cache hit: %s", key)
-        return value
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                self._misses += 1
+                logger.debug("Cache miss: %s", key)
+                return None
+            value, expires_at, _ = entry
+            if time.monotonic() >= expires_at:
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                logger.debug("Cache expired: %s", key)
+                return None
+            self._store.move_to_end(key)
+            self._hits += 1
+            logger.debug("Cache hit: %s", key)
+            return value
 
     def set(self, key: str, value: object, ttl: float) -> None:
         """Store *value* under *key* with a TTL of *ttl* seconds."""
 
-        self._store[key] = (value, time.monotonic() + ttl)
+        size = self._sizeof(value) if self.max_bytes is not None else 0
+
+        with self._lock:
+            now = time.monotonic()
+            self._sweep(now)
+
+            if key in self._store:
+                self._remove(key)
+
+            if self.max_bytes is not None and size > self.max_bytes:
+                logger.debug("Cache skip: %s (%d bytes exceeds budget)", key, size)
+                return
+
+            expires_at = now + ttl
+            self._store[key] = (value, expires_at, size)
+            self._bytes += size
+            heapq.heappush(self._expiry_heap, (expires_at, next(self._counter), key))
+            self._enforce_bounds()
+
         logger.debug("Cache set: %s (ttl=%.0fs)", key, ttl)
 
     def invalidate(self, key: str) -> None:
         """Remove a single key from the cache."""
 
-        self._store.pop(key, None)
+        with self._lock:
+            if key in self._store:
+                self._remove(key)
         logger.debug("Cache invalidated: %s", key)
 
     def clear(self) -> None:
         """Remove all entries from the cache."""
 
-        self._store.clear()
+        with self._lock:
+            self._store.clear()
+            self._expiry_heap.clear()
+            self._bytes = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit/miss/eviction counters and current size."""
+
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=len(self._store),
+                bytes=self._bytes,
+            )
+
+    def _remove(self, key: str) -> None:
+        """Drops *key* from the store and releases its byte budget."""
+
+        _, _, size = self._store.pop(key)
+        self._bytes -= size
+
+    def _sweep(self, now: float) -> None:
+        """Pops every expired entry off the expiry heap.
+
+        Heap records left behind by overwritten or invalidated keys are
+        discarded lazily; the heap is rebuilt when they outnumber live
+        entries so it stays proportional to the store.
+        """
+
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, _, key = heapq.heappop(heap)
+            entry = self._store.get(key)
+            if entry is not None and entry[1] == expires_at:
+                self._remove(key)
+                self._expirations += 1
+                logger.debug("Cache expired: %s", key)
+
+        if len(heap) > 2 * len(self._store) + 64:
+            self._expiry_heap = [
+                (expires_at, next(self._counter), key)
+                for key, (_, expires_at, _) in self._store.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def _enforce_bounds(self) -> None:
+        """Evicts least-recently-used entries until both bounds hold."""
+
+        while self._store and (
+            (self.max_entries is not None and len(self._store) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            key, (_, _, size) = self._store.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
+            logger.debug("Cache evicted: %s", key)
 
     def __len__(self) -> int:
         """Return the count of non-expired entries."""
 
-        now = time.monotonic()
-        return sum(1 for _, (_, exp) in self._store.items() if now < exp)
+        with self._lock:
+            self._sweep(time.monotonic())
+            return len(self._store)
 
     def __repr__(self) -> str:
-        return f"<TTLCache entries={len(self)}>"
+        return f"<TTLCache entries={len(self)} bytes={self._bytes}>"
@@ -1,26 +1,39 @@
 """Main entry-point client for the SEC EDGAR API."""
 
-import logging
+from __future__ import annotations
 
-from edgar.cache import TTLCache
-from edgar.xbrl import Xbrl
-from edgar.series import Series
-from edgar.search import Search
-from edgar.issuers import Issuers
-from edgar.filings import Filings
-from edgar.company import Company
-from edgar.datasets import Datasets
-from edgar.archives import Archives
-from edgar.tickers import Tickers
-from edgar.companies import Companies
-from edgar.session import EdgarSession
-from edgar.submissions import Submissions
-from edgar.mutual_funds import MutualFunds
-from edgar.current_events import CurrentEvents
-from edgar.ownership_filings import OwnershipFilings
-from edgar.variable_insurance_products import VariableInsuranceProducts
-
-from edgar.models import SearchResult
+import logging
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from edgar.batch import DEFAULT_MAX_WORKERS, BatchResult, check_endpoint, run_threaded
+from edgar.bulk_data import BulkData
+from edgar.cache import DEFAULT_MAX_BYTES, DEFAULT_MAX_ENTRIES, TTLCache
+from edgar.disk_cache import DiskCache
+from edgar.instrumentation import RequestHooks
+from edgar.rate_limiter import RateLimiter
+from edgar.retry import RetryPolicy
+from edgar.session import POOL_MAXSIZE, EdgarSession
+from edgar.snapshot import TickerSnapshot
+
+# Service modules are imported by their accessors on first use, so
+# creating a client doesn't load the ones it never calls.
+if TYPE_CHECKING:
+    from edgar.archives import Archives
+    from edgar.companies import Companies
+    from edgar.company import Company
+    from edgar.current_events import CurrentEvents
+    from edgar.datasets import Datasets
+    from edgar.filings import Filings
+    from edgar.issuers import Issuers
+    from edgar.models import SearchResult
+    from edgar.mutual_funds import MutualFunds
+    from edgar.ownership_filings import OwnershipFilings
+    from edgar.search import Search
+    from edgar.series import Series
+    from edgar.submissions import Submissions
+    from edgar.tickers import Tickers
+    from edgar.variable_insurance_products import VariableInsuranceProducts
+    from edgar.xbrl import Xbrl
 
 
 logger = logging.getLogger(__name__)
@@ -34,7 +47,18 @@ class EdgarClient:
     instantiate the different endpoints.
     """
 
-    def __init__(self, user_agent: str, rate_limit: int = 10, cache: bool = True) -> None:
+    def __init__(  # pylint: disable=too-many-positional-arguments
+        self,
+        user_agent: str,
+        rate_limit: int = 10,
+        cache: bool | TTLCache = True,
+        cache_dir: str | None = None,
+        rate_limiter: RateLimiter | None = None,
+        warehouse_dir: str | None = None,
+        hooks: RequestHooks | None = None,
+        retry_policy: RetryPolicy | None = None,
+        bulk_dir: str | None = None,
+    ) -> None:
         """Initializes the `EdgarClient`.
 
         ### Parameters
@@ -47,28 +71,94 @@ class EdgarClient:
             Maximum requests per second. SEC allows 10 req/s.
             Set lower to be more conservative.
 
-        cache : bool (optional, Default=True)
+        cache : bool | TTLCache (optional, Default=True)
             Enable in-memory TTL caching for ticker resolution (24h),
             submission metadata (1h), and taxonomy data (24h).
+            ``True`` creates a cache bounded to ``DEFAULT_MAX_ENTRIES``
+            entries and ``DEFAULT_MAX_BYTES`` bytes with LRU eviction.
+            Pass a ``TTLCache`` instance to choose your own bounds.
             Set ``False`` to always fetch fresh data from SEC.
 
+        cache_dir : str | None (optional, Default=None)
+            Directory for a persistent on-disk HTTP cache that survives
+            restarts. Stale entries are revalidated with conditional
+            requests, so unchanged resources cost a body-less ``304``.
+            Also holds a memory-mapped ticker snapshot (see
+            ``TickerSnapshot``) that new processes load in milliseconds.
+
+        rate_limiter : RateLimiter | None (optional, Default=None)
+            Share one request budget between clients. Pass the same
+            ``TokenBucketRateLimiter`` to clients used from several
+            threads, or a ``FileRateLimiter`` to clients in several
+            processes. ``None`` gives this client its own limiter at
+            ``rate_limit`` requests per second.
+
+        warehouse_dir : str | None (optional, Default=None)
+            Directory for a local Parquet warehouse of DERA financial
+            statement datasets (see ``DatasetWarehouse``). Each quarter
+            is downloaded and converted once. Requires ``pyarrow``.
+
+        hooks : RequestHooks | None (optional, Default=None)
+            Instrumentation callbacks for every request the client
+            makes (see ``RequestHooks``). ``None`` starts with no
+            subscribers; subscribe later through ``edgar_client.hooks``.
+
+        retry_policy : RetryPolicy | None (optional, Default=None)
+            Which failures are retried and how long to back off between
+            attempts. ``None`` retries ``429`` and ``5xx`` responses and
+            connection errors up to 5 times with jittered exponential
+            backoff, honoring ``Retry-After``, within 60 seconds.
+
+        bulk_dir : str | None (optional, Default=None)
+            Directory for local copies of SEC's nightly
+            ``submissions.zip`` and ``companyfacts.zip`` (see
+            ``BulkData``). Once downloaded with
+            ``edgar_client.bulk.data.download()``, submissions and
+            company facts are read from them instead of the API.
+
         ### Usage
         ----
             >>> edgar_client = EdgarClient(user_agent="Your Name your-email@example.com")
             >>> edgar_client = EdgarClient(user_agent="...", rate_limit=5)
             >>> edgar_client = EdgarClient(user_agent="...", cache=False)
+            >>> edgar_client = EdgarClient(user_agent="...", cache=TTLCache(max_entries=100))
+            >>> edgar_client = EdgarClient(user_agent="...", cache_dir="~/.cache/python-sec")
+            >>> edgar_client = EdgarClient(user_agent="...", rate_limiter=FileRateLimiter("/tmp/sec.rl", rate=10))
+            >>> edgar_client = EdgarClient(user_agent="...", warehouse_dir="~/sec-warehouse")
+            >>> edgar_client = EdgarClient(user_agent="...", hooks=RequestHooks())
+            >>> edgar_client = EdgarClient(user_agent="...", retry_policy=RetryPolicy(max_retries=2))
+            >>> edgar_client = EdgarClient(user_agent="...", bulk_dir="~/sec-bulk")
         """
 
-        self._ttl_cache = TTLCache() if cache else None
+        if isinstance(cache, TTLCache):
+            self._ttl_cache = cache
+        elif cache:
+            self._ttl_cache = TTLCache(
+                max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES,
+            )
+        else:
+            self._ttl_cache = None
+        self._disk_cache = DiskCache(cache_dir) if cache_dir else None
         self.edgar_session = EdgarSession(
             client=self, user_agent=user_agent, rate_limit=rate_limit,
-            cache=self._ttl_cache,
+            cache=self._ttl_cache, disk_cache=self._disk_cache,
+            rate_limiter=rate_limiter, hooks=hooks, retry_policy=retry_policy,
         )
+        if cache_dir:
+            self.edgar_session.ticker_snapshot = TickerSnapshot(cache_dir)
+        if bulk_dir:
+            self.edgar_session.bulk_data = BulkData(bulk_dir, session=self.edgar_session)
         self._services: dict = {}
+        self._warehouse_dir = warehouse_dir
+        # The session's ``RequestHooks``; subscribe exporters or a ``MetricsCollector`` here.
+        self.hooks = self.edgar_session.hooks
+        self.bulk = Bulk(self)
+        # ``fetch_many`` is also reachable on the client itself, as before ``bulk`` existed.
+        self.fetch_many = self.bulk.fetch_many
 
         logger.debug(
-            "EdgarClient initialized (rate_limit=%d, cache=%s)",
-            rate_limit, cache,
+            "EdgarClient initialized (rate_limit=%d, cache=%s, cache_dir=%s)",
+            rate_limit, self._ttl_cache is not None, cache_dir,
         )
 
     def __repr__(self) -> str:
@@ -85,6 +175,8 @@ class EdgarClient:
             The `Archives` services Object.
         """
 
+        from edgar.archives import Archives  # pylint: disable=import-outside-toplevel
+
         if "archives" not in self._services:
             self._services["archives"] = Archives(session=self.edgar_session)
         return self._services["archives"]
@@ -98,6 +190,8 @@ class EdgarClient:
             The `Companies` services Object.
         """
 
+        from edgar.companies import Companies  # pylint: disable=import-outside-toplevel
+
         if "companies" not in self._services:
             self._services["companies"] = Companies(session=self.edgar_session)
         return self._services["companies"]
@@ -111,6 +205,8 @@ class EdgarClient:
             The `Series` services Object.
         """
 
+        from edgar.series import Series  # pylint: disable=import-outside-toplevel
+
         if "series" not in self._services:
             self._services["series"] = Series(session=self.edgar_session)
         return self._services["series"]
@@ -124,6 +220,8 @@ class EdgarClient:
             The `MutualFunds` services Object.
         """
 
+        from edgar.mutual_funds import MutualFunds  # pylint: disable=import-outside-toplevel
+
         if "mutual_funds" not in self._services:
             self._services["mutual_funds"] = MutualFunds(session=self.edgar_session)
         return self._services["mutual_funds"]
@@ -137,6 +235,8 @@ class EdgarClient:
             The `VariableInsuranceProducts` services Object.
         """
 
+        from edgar.variable_insurance_products import VariableInsuranceProducts  # pylint: disable=import-outside-toplevel
+
         if "variable_insurance_products" not in self._services:
             self._services["variable_insurance_products"] = VariableInsuranceProducts(
                 session=self.edgar_session
@@ -152,8 +252,12 @@ class EdgarClient:
             The `Datasets` services Object.
         """
 
+        from edgar.datasets import Datasets  # pylint: disable=import-outside-toplevel
+
         if "datasets" not in self._services:
-            self._services["datasets"] = Datasets(session=self.edgar_session)
+            self._services["datasets"] = Datasets(
+                session=self.edgar_session, warehouse_dir=self._warehouse_dir
+            )
         return self._services["datasets"]
 
     def filings(self) -> Filings:
@@ -165,6 +269,8 @@ class EdgarClient:
             The `Filings` services Object.
         """
 
+        from edgar.filings import Filings  # pylint: disable=import-outside-toplevel
+
         if "filings" not in self._services:
             self._services["filings"] = Filings(session=self.edgar_session)
         return self._services["filings"]
@@ -178,6 +284,8 @@ class EdgarClient:
             The `CurrentEvents` services Object.
         """
 
+        from edgar.current_events import CurrentEvents  # pylint: disable=import-outside-toplevel
+
         if "current_events" not in self._services:
             self._services["current_events"] = CurrentEvents(session=self.edgar_session)
         return self._services["current_events"]
@@ -191,6 +299,8 @@ class EdgarClient:
             The `Issuers` services Object.
         """
 
+        from edgar.issuers import Issuers  # pylint: disable=import-outside-toplevel
+
         if "issuers" not in self._services:
             self._services["issuers"] = Issuers(session=self.edgar_session)
         return self._services["issuers"]
@@ -204,6 +314,8 @@ class EdgarClient:
             The `OwnershipFilings` services Object.
         """
 
+        from edgar.ownership_filings import OwnershipFilings  # pylint: disable=import-outside-toplevel
+
         if "ownership_filings" not in self._services:
             self._services["ownership_filings"] = OwnershipFilings(
                 session=self.edgar_session
@@ -219,6 +331,8 @@ class EdgarClient:
             The `Submissions` services Object.
         """
 
+        from edgar.submissions import Submissions  # pylint: disable=import-outside-toplevel
+
         if "submissions" not in self._services:
             self._services["submissions"] = Submissions(session=self.edgar_session)
         return self._services["submissions"]
@@ -232,6 +346,8 @@ class EdgarClient:
             The `Xbrl` services Object.
         """
 
+        from edgar.xbrl import Xbrl  # pylint: disable=import-outside-toplevel
+
         if "xbrl" not in self._services:
             self._services["xbrl"] = Xbrl(session=self.edgar_session)
         return self._services["xbrl"]
@@ -245,6 +361,8 @@ class EdgarClient:
             The `Tickers` services Object.
         """
 
+        from edgar.tickers import Tickers  # pylint: disable=import-outside-toplevel
+
         if "tickers" not in self._services:
             self._services["tickers"] = Tickers(session=self.edgar_session)
         return self._services["tickers"]
@@ -268,6 +386,8 @@ class EdgarClient:
             >>> edgar_client.company("AAPL").filings(form="10-K")
         """
 
+        from edgar.company import Company  # pylint: disable=import-outside-toplevel
+
         return Company(
             identifier=identifier,
             session=self.edgar_session,
@@ -306,7 +426,13 @@ class EdgarClient:
 
         return self.tickers().resolve_cik(cik)
 
-    def download(self, url: str, path: str | None = None) -> str | bytes:
+    def download(
+        self,
+        url: str,
+        path: str | None = None,
+        stream: bool = False,
+        checksum: str | None = None,
+    ) -> str | bytes:
         """Downloads a filing document from a full SEC URL.
 
         ### Parameters
@@ -317,13 +443,30 @@ class EdgarClient:
         path : str | None (optional, Default=None)
             If provided, saves the content to this file path.
 
+        stream : bool (optional, Default=False)
+            Write the body to ``path`` chunk by chunk instead of holding
+            it in memory, resuming interrupted transfers. Use it for
+            full submission ``.txt`` files and feed archives.
+
+        checksum : str | None (optional, Default=None)
+            Expected ``"algorithm:hexdigest"`` of the file, verified
+            before it is moved into place. Implies ``stream``.
+
         ### Returns
         ----
         str | bytes:
             The document content, or the path if ``path`` was given.
+
+        ### Usage
+        ----
+            >>> edgar_client.download(
+                url="https://www.sec.gov/Archives/edgar/data/320193/000032019323000106/0000320193-23-000106.txt",
+                path="apple-10k.txt",
+                stream=True,
+            )
         """
 
-        return self.edgar_session.download(url=url, path=path)
+        return self.edgar_session.download(url=url, path=path, stream=stream, checksum=checksum)
 
     def full_text_search(self) -> Search:
         """Used to access the ``Search`` services (EDGAR Full-Text Search).
@@ -334,6 +477,8 @@ class EdgarClient:
             The ``Search`` services Object.
         """
 
+        from edgar.search import Search  # pylint: disable=import-outside-toplevel
+
         if "search" not in self._services:
             self._services["search"] = Search(session=self.edgar_session)
         return self._services["search"]
@@ -405,4 +550,133 @@ class EdgarClient:
             return []
 
         hits = raw.get("hits", {}).get("hits", [])
+        from edgar.models import SearchResult  # pylint: disable=import-outside-toplevel
+
         return [SearchResult(raw=hit) for hit in hits]
+
+    def iter_search(  # pylint: disable=too-many-positional-arguments
+        self,
+        q: str,
+        form_types: list[str] | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> Iterator[SearchResult]:
+        """Full-text search across SEC EDGAR filings, every page.
+
+        Unlike ``search``, which returns one page, this streams all
+        matching ``SearchResult`` objects. Pages are fetched
+        concurrently within the rate limit, hits are de-duplicated by
+        ``_id``, and date ranges matching more hits than EFTS can page
+        through are split until each fits. See ``Search.iter_search``.
+
+        ### Parameters
+        ----
+        q : str
+            The search query. Use double quotes for exact phrase
+            matching (e.g. ``'"revenue recognition"'``).
+
+        form_types : list[str] | None (optional, Default=None)
+            Filter by form types (e.g. ``["10-K", "10-Q"]``).
+
+        start_date : str | None (optional, Default=None)
+            Start of date range filter (``YYYY-MM-DD``).
+
+        end_date : str | None (optional, Default=None)
+            End of date range filter (``YYYY-MM-DD``).
+
+        max_workers : int (optional, Default=DEFAULT_MAX_WORKERS)
+            Number of pages in flight.
+
+        ### Returns
+        ----
+        Iterator[SearchResult]:
+            Every matching hit, once.
+
+        ### Usage
+        ----
+            >>> for result in edgar_client.iter_search(q='"going concern"', start_date="2024-01-01"):
+            ...     print(result.filing_date, result.company_name)
+        """
+
+        return self.full_text_search().iter_search(
+            q=q,
+            form_types=form_types,
+            start_date=start_date,
+            end_date=end_date,
+            max_workers=max_workers,
+        )
+
+
+class Bulk:
+    """
+    ## Overview
+    ----
+    Groups the whole-universe APIs of an ``EdgarClient``: concurrent
+    per-company fetches and the local nightly archives. Reached
+    through ``edgar_client.bulk``.
+    """
+
+    def __init__(self, client: EdgarClient) -> None:
+        self._client = client
+
+    def __repr__(self) -> str:
+        return "<EdgarClient.bulk (active=True, connected=True)>"
+
+    @property
+    def data(self) -> BulkData | None:
+        """The local ``submissions.zip`` / ``companyfacts.zip`` archives, if ``bulk_dir`` was given."""
+        return self._client.edgar_session.bulk_data
+
+    def fetch_many(
+        self,
+        ciks: Iterable[str | int],
+        endpoint: str = "submissions",
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> Iterator[BatchResult]:
+        """Fetches one endpoint for many companies concurrently.
+
+        Requests run on a thread pool over the session's pooled
+        connections, all drawing from the same rate limiter, so the
+        batch uses the whole request budget without exceeding it.
+        Results are yielded as they complete, not in input order, and
+        a failing CIK yields a ``BatchResult`` carrying the error
+        instead of aborting the batch. Responses go through the same
+        caches as ``submissions()`` and ``xbrl()``.
+
+        ### Parameters
+        ----
+        ciks : Iterable[str | int]
+            CIK numbers to fetch. Consumed lazily.
+
+        endpoint : str (optional, Default="submissions")
+            Either ``"submissions"`` or ``"company_facts"``.
+
+        max_workers : int (optional, Default=DEFAULT_MAX_WORKERS)
+            Number of requests in flight. Must be between 1 and
+            ``POOL_MAXSIZE``.
+
+        ### Returns
+        ----
+        Iterator[BatchResult]:
+            One result per CIK, with ``key`` set to the CIK as given.
+
+        ### Usage
+        ----
+            >>> for result in edgar_client.bulk.fetch_many(["320193", "789019"]):
+            ...     if result.ok:
+            ...         print(result.key, result.value["name"])
+        """
+
+        check_endpoint(endpoint)
+        if not 1 <= max_workers <= POOL_MAXSIZE:
+            raise ValueError(
+                f"max_workers must be between 1 and {POOL_MAXSIZE}, got {max_workers}"
+            )
+
+        if endpoint == "submissions":
+            fetch = self._client.submissions().get_submissions
+        else:
+            fetch = self._client.xbrl().company_facts
+
+        return run_threaded(fetch, (str(cik) for cik in ciks), max_workers=max_workers)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Union
 
+from edgar.parser import FeedStream
 from edgar.session import EdgarSession
 
 
@@ -414,18 +415,12 @@ class Companies():
         if all(locals().values()):
             raise ValueError("You need to pass through at least one argument.")
 
-        # Grab the enumeration value if an Enum object was passed through.
-        if isinstance(sic_code, Enum):
-            sic_code = sic_code.value
-
-        params = {
-            'action': 'getcompany',
-            'output': 'atom',
-            'SIC': sic_code.upper() if sic_code else '',
-            'State': state or '',
-            'Country': country or '',
-            'company': company_name or '',
-        }
+        params = self._query_params(
+            company_name=company_name,
+            sic_code=sic_code,
+            state=state,
+            country=country,
+        )
 
         response = self.edgar_session.make_request(
             method='get',
@@ -442,3 +437,89 @@ class Companies():
         )
 
         return entries
+
+    def iter_query(  # pylint: disable=too-many-positional-arguments
+        self,
+        company_name: str = None,
+        sic_code: str = None,
+        state: str = None,
+        country: str = None,
+        number_of_companies: int = None,
+        start: int = 0
+    ) -> FeedStream:
+        """Streams the results of ``query`` page by page.
+
+        Takes the same filters as ``query`` but returns a ``FeedStream``
+        that yields companies as each page arrives and downloads the
+        next page while you process the current one.
+
+        ### Parameters
+        ----
+        number_of_companies : int (optional, Default=None)
+            Maximum number of companies to yield. ``None`` streams every
+            matching company.
+
+        start : int (optional, Default=0)
+            Offset to begin at. Pass a previous stream's ``offset`` to
+            resume an interrupted job.
+
+        ### Returns
+        ----
+        FeedStream:
+            An iterator of `Company` resources with a resumable ``offset``.
+
+        ### Usage
+        ----
+            >>> edgar_client = EdgarClient(user_agent="Your Name your-email@example.com")
+            >>> company_services = edgar_client.companies()
+            >>> for company in company_services.iter_query(state='CA'):
+            ...     print(company)
+        """
+
+        if not any([company_name, sic_code, state, country]):
+            raise ValueError("You need to pass through at least one argument.")
+
+        params = self._query_params(
+            company_name=company_name,
+            sic_code=sic_code,
+            state=state,
+            country=country,
+        )
+        params['start'] = start
+
+        response = self.edgar_session.make_request(
+            method='get',
+            params=params,
+            endpoint=self.endpoint
+        )
+
+        return self.edgar_parser.iter_entries(
+            response_text=response,
+            fetch_page=self.edgar_session.fetch_page,
+            start=start,
+            limit=number_of_companies,
+        )
+
+    def _query_params(
+        self,
+        company_name: str = None,
+        sic_code: Union[str, Enum] = None,
+        state: str = None,
+        country: str = None,
+    ) -> dict:
+        """Builds the browse-edgar parameters shared by ``query`` and ``iter_query``."""
+
+        # Grab the enumeration value if an Enum object was passed through.
+        if isinstance(sic_code, Enum):
+            sic_code = sic_code.value
+
+        params = {
+            'action': 'getcompany',
+            'output': 'atom',
+            'SIC': sic_code.upper() if sic_code else '',
+            'State': state or '',
+            'Country': country or '',
+            'company': company_name or '',
+        }
+
+        return params
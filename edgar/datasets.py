@@ -5,14 +5,78 @@ from __future__ import annotations
 import csv
 import io
 import logging
+import tempfile
 import zipfile
+from datetime import date, datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, BinaryIO, Callable, Iterable, Iterator
 
 from edgar.session import EdgarSession
 
+if TYPE_CHECKING:
+    from edgar.warehouse import DatasetWarehouse
+
 logger = logging.getLogger(__name__)
 
 _DERA_BASE = "/files/dera/data/financial-statement-data-sets"
 
+# The four tables of every DERA quarterly archive.
+DERA_TABLES = ("sub", "num", "tag", "pre")
+
+# Rows per chunk yielded by ``iter_financial_statements``.
+DEFAULT_CHUNK_SIZE = 50_000
+
+
+def parse_date(value: str) -> date:
+    """Parses a DERA ``yyyymmdd`` date."""
+    return date(int(value[:4]), int(value[4:6]), int(value[6:8]))
+
+
+def parse_datetime(value: str) -> datetime:
+    """Parses a DERA ``yyyy-mm-dd hh:mm:ss.f`` timestamp (fraction dropped)."""
+    return datetime.fromisoformat(value[:19])
+
+
+def parse_flag(value: str) -> bool:
+    """Parses a DERA ``0``/``1`` flag."""
+    return value == "1"
+
+
+# Column types for the DERA Financial Statement Data Sets, per the SEC's
+# published field definitions. Columns not listed here stay ``str``; empty
+# fields become ``None`` whatever their type.
+DERA_SCHEMAS: dict[str, dict[str, Callable[[str], object]]] = {
+    "sub": {
+        "cik": int,
+        "sic": int,
+        "ein": int,
+        "changed": parse_date,
+        "wksi": parse_flag,
+        "period": parse_date,
+        "fy": int,
+        "filed": parse_date,
+        "accepted": parse_datetime,
+        "prevrpt": parse_flag,
+        "detail": parse_flag,
+        "nciks": int,
+    },
+    "num": {
+        "ddate": parse_date,
+        "qtrs": int,
+        "value": Decimal,
+    },
+    "tag": {
+        "custom": parse_flag,
+        "abstract": parse_flag,
+    },
+    "pre": {
+        "report": int,
+        "line": int,
+        "inpth": parse_flag,
+        "negating": parse_flag,
+    },
+}
+
 
 def _require_pandas():
     """Import and return the ``pandas`` module, raising a helpful error if missing."""
@@ -36,7 +100,7 @@ class Datasets():
     datasets.
     """
 
-    def __init__(self, session: EdgarSession) -> None:
+    def __init__(self, session: EdgarSession, warehouse_dir: str | None = None) -> None:
         """Initializes the `Datasets` object.
 
         ### Parameters
@@ -44,6 +108,12 @@ class Datasets():
         session : `EdgarSession`
             An initialized session of the `EdgarSession`.
 
+        warehouse_dir : str | None (optional, Default=None)
+            Root of a local Parquet warehouse (see ``DatasetWarehouse``).
+            When set, DERA quarters are converted once and
+            ``get_financial_statements_dataframes()`` reads from it.
+            Requires ``pyarrow``.
+
         ### Usage
         ----
             >>> edgar_client = EdgarClient(user_agent="Your Name your-email@example.com")
@@ -54,6 +124,11 @@ class Datasets():
         self.edgar_session: EdgarSession = session
         self.edgar_parser = session.edgar_parser
 
+        self.warehouse: DatasetWarehouse | None = None
+        if warehouse_dir:
+            from edgar.warehouse import DatasetWarehouse  # pylint: disable=import-outside-toplevel
+            self.warehouse = DatasetWarehouse(warehouse_dir, datasets=self)
+
     def __repr__(self) -> str:
         """String representation of the `EdgarClient.Datasets` object."""
 
@@ -156,19 +231,138 @@ class Datasets():
             >>> data["num"][0].keys()
             dict_keys(['adsh', 'tag', 'version', 'coreg', ...])
         """
+        archive = self.open_financial_statements(year, quarter)
+        if archive is None:
+            return {}
+
+        with archive:
+            return {
+                table: list(archive.iter_rows(table, typed=False))
+                for table in archive.tables
+            }
+
+    def open_financial_statements(
+        self,
+        year: int,
+        quarter: int,
+    ) -> FinancialStatementArchive | None:
+        """Streams a DERA quarterly archive to a temporary file and opens it.
+
+        The ZIP is written to disk chunk by chunk, so memory use doesn't
+        depend on the archive size. Read tables from the returned
+        ``FinancialStatementArchive``; closing it deletes the file.
+
+        ### Parameters
+        ----
+        year : int
+            The calendar year (e.g. ``2023``).
+
+        quarter : int
+            The calendar quarter (1-4).
+
+        ### Returns
+        ----
+        FinancialStatementArchive | None:
+            The opened archive, or ``None`` if SEC has no dataset for
+            the period.
+
+        ### Usage
+        ----
+            >>> with datasets.open_financial_statements(2023, 4) as archive:
+            ...     for row in archive.iter_rows("sub", columns=["adsh", "name"]):
+            ...         print(row)
+        """
         if not 1 <= quarter <= 4:
             raise ValueError(f"quarter must be between 1 and 4, got {quarter}")
 
         endpoint = f"{_DERA_BASE}/{year}q{quarter}.zip"
         logger.info("Downloading DERA dataset %dQ%d", year, quarter)
-        zip_bytes = self.edgar_session.fetch_page(
-            self.edgar_session.build_url(endpoint=endpoint)
-        )
 
-        if zip_bytes is None:
-            return {}
+        spool = tempfile.TemporaryFile(prefix="edgar-dera-", suffix=".zip")
+        try:
+            found = self.edgar_session.stream_to_file(
+                self.edgar_session.build_url(endpoint=endpoint), spool
+            )
+            if not found:
+                spool.close()
+                return None
+            spool.seek(0)
+            return FinancialStatementArchive(spool)
+        except BaseException:
+            spool.close()
+            raise
+
+    def iter_financial_statements(  # pylint: disable=too-many-positional-arguments
+        self,
+        year: int,
+        quarter: int,
+        table: str = "num",
+        columns: Iterable[str] | None = None,
+        where: dict[str, object] | Callable[[dict], bool] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[list[dict]]:
+        """Streams one DERA table in typed, filtered chunks.
+
+        Processes a whole quarter in bounded memory: the archive is
+        streamed to a temporary file, the table is decompressed and
+        parsed lazily, and rows are handed out ``chunk_size`` at a time.
+        Values are typed per ``DERA_SCHEMAS`` (``date``, ``datetime``,
+        ``Decimal``, ``int``, ``bool``).
+
+        ### Parameters
+        ----
+        year : int
+            The calendar year (e.g. ``2023``).
+
+        quarter : int
+            The calendar quarter (1-4).
+
+        table : str (optional, Default="num")
+            One of ``"sub"``, ``"num"``, ``"tag"``, ``"pre"``.
+
+        columns : Iterable[str] | None (optional, Default=None)
+            Columns to keep. ``None`` keeps every column.
+
+        where : dict | Callable[[dict], bool] | None (optional, Default=None)
+            Row filter. A dict maps column names to a required value or
+            to a set/list/tuple of accepted values (compared after
+            typing); filter columns needn't be in ``columns``. A callable
+            receives each projected row and returns whether to keep it.
+
+        chunk_size : int (optional, Default=DEFAULT_CHUNK_SIZE)
+            Maximum rows per yielded list.
 
-        return _extract_tsv_zip(zip_bytes)
+        ### Returns
+        ----
+        Iterator[list[dict]]:
+            Lists of row dictionaries.
+
+        ### Usage
+        ----
+            >>> chunks = datasets.iter_financial_statements(
+            ...     2023, 4, table="num",
+            ...     columns=["adsh", "tag", "ddate", "value"],
+            ...     where={"tag": {"Revenues", "NetIncomeLoss"}, "uom": "USD"},
+            ... )
+            >>> for chunk in chunks:
+            ...     process(chunk)
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+
+        archive = self.open_financial_statements(year, quarter)
+        if archive is None:
+            return
+
+        with archive:
+            chunk: list[dict] = []
+            for row in archive.iter_rows(table, columns=columns, where=where):
+                chunk.append(row)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
 
     def get_financial_statements_dataframes(
         self,
@@ -183,6 +377,10 @@ class Datasets():
         Requires the ``pandas`` optional dependency. Install with
         ``pip install python-sec[pandas]``.
 
+        With a ``warehouse`` configured the quarter is converted to
+        Parquet on first use and every later call reads typed columns
+        straight from disk, with no TSV parsing.
+
         ### Parameters
         ----
         year : int
@@ -204,6 +402,15 @@ class Datasets():
             >>> dfs["num"].head()
         """
         pd = _require_pandas()
+
+        if self.warehouse is not None:
+            if not self.warehouse.ingest(year, quarter):
+                return {}
+            return {
+                table: self.warehouse.read(table, quarters=[(year, quarter)]).to_pandas()
+                for table in DERA_TABLES
+            }
+
         data = self.get_financial_statements(year, quarter)
 
         if not data:
@@ -212,31 +419,210 @@ class Datasets():
         return {name: pd.DataFrame(rows) for name, rows in data.items()}
 
 
-def _extract_tsv_zip(zip_bytes: bytes) -> dict[str, list[dict]]:
-    """Extract all TSV (.txt) files from a ZIP archive into row dicts.
+class FinancialStatementArchive:
 
-    ### Parameters
+    """
+    ## Overview
     ----
-    zip_bytes : bytes
-        Raw bytes of a ZIP archive.
+    A DERA Financial Statement Data Sets ZIP opened for lazy reading.
+    Each table (``sub``, ``num``, ``tag``, ``pre``) is decompressed and
+    parsed row by row only while you iterate it.
 
-    ### Returns
+    ### Usage
     ----
-    dict[str, list[dict]]:
-        Mapping from filename stem to list of row dictionaries.
+        >>> with datasets.open_financial_statements(2023, 4) as archive:
+        ...     archive.tables
+        ['sub', 'num', 'tag', 'pre']
     """
-    result: dict[str, list[dict]] = {}
 
-    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zf:
-        for name in zf.namelist():
-            if not name.endswith(".txt"):
-                continue
+    def __init__(self, file: str | BinaryIO) -> None:
+        """Initializes the ``FinancialStatementArchive``.
+
+        ### Parameters
+        ----
+        file : str | BinaryIO
+            Path to, or seekable binary file object of, the ZIP archive.
+            The archive takes ownership and closes it on ``close()``.
+        """
+
+        self._file = file
+        self._zip = zipfile.ZipFile(file)  # pylint: disable=consider-using-with
+        self._members = {
+            name.rsplit(".", 1)[0]: name
+            for name in self._zip.namelist()
+            if name.endswith(".txt")
+        }
+
+    def __repr__(self) -> str:
+        return f"<FinancialStatementArchive tables={self.tables}>"
+
+    def __enter__(self) -> FinancialStatementArchive:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @property
+    def tables(self) -> list[str]:
+        """Table names in the archive (TSV member names without ``.txt``)."""
+        return list(self._members)
+
+    def close(self) -> None:
+        """Closes the archive and its underlying file."""
+
+        self._zip.close()
+        if hasattr(self._file, "close"):
+            self._file.close()
+
+    def open_table(self, table: str) -> BinaryIO:
+        """Opens the raw TSV bytes of one table for streaming reads."""
+
+        if table not in self._members:
+            raise ValueError(f"table must be one of {self.tables}, got {table!r}")
+        return self._zip.open(self._members[table])
+
+    def iter_rows(
+        self,
+        table: str,
+        columns: Iterable[str] | None = None,
+        where: dict[str, object] | Callable[[dict], bool] | None = None,
+        typed: bool = True,
+    ) -> Iterator[dict]:
+        """Yields the rows of one table, decompressing as it goes.
+
+        ### Parameters
+        ----
+        table : str
+            The table name (e.g. ``"num"``).
+
+        columns : Iterable[str] | None (optional, Default=None)
+            Columns to keep. ``None`` keeps every column.
+
+        where : dict | Callable[[dict], bool] | None (optional, Default=None)
+            Row filter; see ``Datasets.iter_financial_statements``.
+
+        typed : bool (optional, Default=True)
+            Convert values per ``DERA_SCHEMAS``. ``False`` keeps the raw
+            strings, as ``get_financial_statements`` returns them.
+
+        ### Returns
+        ----
+        Iterator[dict]:
+            One dictionary per row.
+        """
+
+        # A callable filters the built rows; a dict is checked against
+        # the raw fields first, so rejected rows are never built.
+        row_filter = where if callable(where) else None
+        field_filter = None if callable(where) else where
+
+        with self.open_table(table) as f:
+            text = io.TextIOWrapper(f, encoding="utf-8", newline="")
+            reader = csv.reader(text, delimiter="\t")
+            header = next(reader, None)
+            if header is None:
+                return
+
+            projection, checks = _row_plan(table, header, columns, field_filter, typed)
+            rows = 0
+            for row in _select_rows(reader, len(header), projection, checks, row_filter):
+                rows += 1
+                yield row
+
+        logger.debug("Read %s (%d rows)", table, rows)
+
+
+def _row_plan(
+    table: str,
+    header: list[str],
+    columns: Iterable[str] | None,
+    where: dict[str, object] | None,
+    typed: bool,
+) -> tuple[list[tuple[str, int, Callable]], list[tuple[int, Callable, Callable]]]:
+    """Resolves the columns to keep and the ``where`` dict against *header*.
+
+    Returns ``(name, index, convert)`` per kept column and ``(index,
+    convert, match)`` per ``where`` entry.
+    """
+
+    schema = DERA_SCHEMAS.get(table, {})
+    converter = _converter if typed else lambda _: _raw_field
+    position = {name: i for i, name in enumerate(header)}
+
+    keep = header if columns is None else list(columns)
+    unknown = [name for name in keep if name not in position]
+    if unknown:
+        raise ValueError(f"Unknown {table} columns: {unknown}")
+
+    projection = [(name, position[name], converter(schema.get(name))) for name in keep]
+    checks = [
+        (position[name], converter(schema.get(name)), _matcher(expected))
+        for name, expected in _where_items(where or {}, position, table)
+    ]
+    return projection, checks
+
+
+def _select_rows(
+    reader: Iterator[list[str]],
+    width: int,
+    projection: list[tuple[str, int, Callable]],
+    checks: list[tuple[int, Callable, Callable]],
+    row_filter: Callable[[dict], bool] | None,
+) -> Iterator[dict]:
+    """Builds the rows of *reader* that pass *checks* and *row_filter*.
+
+    As with ``csv.DictReader``, blank lines are skipped and fields
+    missing from a short row are ``None``.
+    """
+
+    for fields in reader:
+        if not fields:
+            continue
+        if len(fields) < width:
+            fields += [None] * (width - len(fields))
+        if checks and not all(match(convert(fields[i])) for i, convert, match in checks):
+            continue
+        row = {name: convert(fields[i]) for name, i, convert in projection}
+        if row_filter is not None and not row_filter(row):
+            continue
+        yield row
+
+
+def _converter(parse: Callable[[str], object] | None) -> Callable[[str], object]:
+    """Wraps a column parser so empty fields become ``None``."""
+
+    if parse is None:
+        return _or_none
+
+    def convert(value: str | None) -> object:
+        return parse(value) if value else None
+
+    return convert
+
+
+def _or_none(value: str | None) -> str | None:
+    """Returns a text field, or ``None`` if it's empty."""
+    return value or None
+
+
+def _raw_field(value: str | None) -> str | None:
+    """Returns a field as read, for untyped rows."""
+    return value
+
+
+def _matcher(expected: object) -> Callable[[object], bool]:
+    """Builds a predicate for one ``where`` entry."""
+
+    if isinstance(expected, (set, frozenset, list, tuple)):
+        accepted = frozenset(expected)
+        return accepted.__contains__
+    return lambda value: value == expected
+
 
-            key = name.rsplit(".", 1)[0]
-            with zf.open(name) as f:
-                text = io.TextIOWrapper(f, encoding="utf-8")
-                reader = csv.DictReader(text, delimiter="\t")
-                result[key] = list(reader)
-            logger.debug("Extracted %s (%d rows)", key, len(result[key]))
+def _where_items(where: dict, position: dict[str, int], table: str) -> list[tuple[str, object]]:
+    """Validates the columns of a ``where`` dict."""
 
-    return result
+    unknown = [name for name in where if name not in position]
+    if unknown:
+        raise ValueError(f"Unknown {table} columns in where: {unknown}")
+    return list(where.items())
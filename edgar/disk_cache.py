@@ -0,0 +1,318 @@
+"""Persistent on-disk HTTP response cache for SEC EDGAR requests."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from urllib.parse import urlencode
+
+from edgar.cache import TTL_SUBMISSIONS, TTL_TAXONOMY, TTL_TICKERS
+
+logger = logging.getLogger(__name__)
+
+DB_FILENAME = "http_cache.sqlite3"
+
+# Default TTL for responses that don't match a more specific rule.
+TTL_DEFAULT = TTL_SUBMISSIONS
+
+# URL fragment → TTL in seconds. First match wins, so keep specific
+# rules ahead of generic ones.
+_TTL_RULES: tuple[tuple[str, float], ...] = (
+    ("/files/company_tickers", TTL_TICKERS),
+    ("/submissions/", TTL_SUBMISSIONS),
+    ("/api/xbrl/", TTL_TAXONOMY),
+    ("/edgartaxonomies", TTL_TAXONOMY),
+)
+
+_JSON_TYPES = ("application/json",)
+_TEXT_TYPES = ("application/atom+xml", "application/xml", "text/xml", "text/html")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    body BLOB NOT NULL,
+    content_type TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+def ttl_for_url(url: str) -> float:
+    """Returns the cache TTL (seconds) for a SEC URL.
+
+    Shares the same policy as the in-memory ``TTLCache``:
+    ``TTL_TICKERS`` for ``company_tickers.json``, ``TTL_SUBMISSIONS``
+    for submissions, and ``TTL_TAXONOMY`` for XBRL/taxonomy data.
+    """
+
+    for fragment, ttl in _TTL_RULES:
+        if fragment in url:
+            return ttl
+    return TTL_DEFAULT
+
+
+def _header(headers, name: str) -> str | None:
+    """Case-tolerant header lookup that also works for plain dicts."""
+
+    value = headers.get(name)
+    if value is None:
+        value = headers.get(name.lower())
+    return value
+
+
+def charset_of(content_type: str) -> str:
+    """Extracts the ``charset`` parameter from a Content-Type header."""
+
+    for part in content_type.split(";")[1:]:
+        key, _, value = part.strip().partition("=")
+        if key.lower() == "charset" and value:
+            return value.strip("\"'")
+    return "utf-8"
+
+
+def decode_body(body: bytes, content_type: str) -> dict | str | None:
+    """Decodes a cached body using the same rules as ``make_request``.
+
+    JSON content is parsed into a ``dict``; Atom/XML/HTML content is
+    returned as text; anything else (or an empty body) gives ``None``.
+    """
+
+    if not body:
+        return None
+    if any(ct in content_type for ct in _JSON_TYPES):
+        return json.loads(body)
+    if any(ct in content_type for ct in _TEXT_TYPES):
+        return body.decode(charset_of(content_type), errors="replace")
+    return None
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A response body stored on disk along with its HTTP validators."""
+
+    body: bytes
+    content_type: str
+    etag: str | None
+    last_modified: str | None
+    expires_at: float
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the entry can be served without contacting SEC."""
+        return time.time() < self.expires_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Returns ``If-None-Match``/``If-Modified-Since`` revalidation headers."""
+
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class DiskCache:
+    """SQLite-backed HTTP response cache that survives process restarts.
+
+    Stores response bodies together with their ``ETag`` and
+    ``Last-Modified`` validators. Fresh entries are served with no
+    network traffic; stale entries are revalidated with a conditional
+    request so that a ``304 Not Modified`` costs no body transfer.
+
+    Uses wall-clock ``time.time()`` (not ``monotonic``) because entries
+    must stay meaningful across processes and reboots. Safe to share
+    between threads, and between processes pointing at the same
+    directory (SQLite handles the file locking).
+
+    ### Usage
+    ----
+        >>> cache = DiskCache("~/.cache/python-sec")
+        >>> edgar_client = EdgarClient(user_agent="...", cache_dir="~/.cache/python-sec")
+    """
+
+    def __init__(self, directory: str, ttl_for=ttl_for_url) -> None:
+        """Initializes the ``DiskCache``.
+
+        ### Parameters
+        ----
+        directory : str
+            Directory holding the cache database. Created if missing.
+
+        ttl_for : Callable[[str], float] (optional, Default=ttl_for_url)
+            Maps a URL to its time-to-live in seconds.
+        """
+
+        self.directory = os.path.expanduser(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.path = os.path.join(self.directory, DB_FILENAME)
+        self._ttl_for = ttl_for
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+
+    def __repr__(self) -> str:
+        return f"<DiskCache path={self.path!r} entries={len(self)}>"
+
+    @staticmethod
+    def make_key(url: str, params: dict | None = None) -> str:
+        """Builds a stable cache key from a URL and its query parameters."""
+
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()), doseq=True)}"
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Returns the stored entry for *key* (fresh or stale), or ``None``."""
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, content_type, etag, last_modified, expires_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+        if row is None:
+            logger.debug("Disk cache miss: %s", key)
+            return None
+        return CachedResponse(
+            body=bytes(row[0]),
+            content_type=row[1],
+            etag=row[2],
+            last_modified=row[3],
+            expires_at=row[4],
+        )
+
+    def set(
+        self,
+        key: str,
+        url: str,
+        body: bytes,
+        headers,
+    ) -> None:
+        """Stores a ``200 OK`` response body and its validators.
+
+        ### Parameters
+        ----
+        key : str
+            The cache key from ``make_key()``.
+
+        url : str
+            The request URL, used to pick the TTL.
+
+        body : bytes
+            The raw response body.
+
+        headers : Mapping[str, str]
+            The response headers.
+        """
+
+        ttl = self._ttl_for(url)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, body, content_type, etag, last_modified, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    url,
+                    sqlite3.Binary(body),
+                    _header(headers, "Content-Type") or "",
+                    _header(headers, "ETag"),
+                    _header(headers, "Last-Modified"),
+                    time.time() + ttl,
+                ),
+            )
+        logger.debug("Disk cache set: %s (ttl=%.0fs)", key, ttl)
+
+    def refresh(self, key: str, url: str, headers) -> None:
+        """Extends the lifetime of an entry after a ``304 Not Modified``.
+
+        Validators sent with the 304 replace the stored ones; missing
+        validators keep their previous value.
+        """
+
+        ttl = self._ttl_for(url)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE responses SET expires_at = ?, "
+                "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) "
+                "WHERE key = ?",
+                (
+                    time.time() + ttl,
+                    _header(headers, "ETag"),
+                    _header(headers, "Last-Modified"),
+                    key,
+                ),
+            )
+        logger.debug("Disk cache revalidated: %s (ttl=%.0fs)", key, ttl)
+
+    def record(self, key: str, url: str, response, cached: CachedResponse | None = None) -> bool:
+        """Updates the cache from a GET response.
+
+        A ``304 Not Modified`` answering *cached*'s validators refreshes
+        that entry, and a ``200 OK`` is stored; other statuses leave the
+        cache alone.
+
+        ### Parameters
+        ----
+        key : str
+            The cache key from ``make_key()``.
+
+        url : str
+            The request URL, used to pick the TTL.
+
+        response : requests.Response | httpx.Response
+            The response to record.
+
+        cached : CachedResponse | None (optional, Default=None)
+            The stale entry whose validators the request carried.
+
+        ### Returns
+        ----
+        bool:
+            ``True`` if the response revalidated *cached*, whose body
+            should then be served.
+        """
+
+        if response.status_code == 304 and cached is not None:
+            self.refresh(key, url, response.headers)
+            return True
+        if response.status_code == 200:
+            self.set(key, url, response.content, response.headers)
+        return False
+
+    def invalidate(self, key: str) -> None:
+        """Remove a single key from the cache."""
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+        logger.debug("Disk cache invalidated: %s", key)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Closes the underlying SQLite connection."""
+
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        """Return the count of stored entries (fresh or stale)."""
+
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
@@ -0,0 +1,285 @@
+"""Resumable, verified file downloads shared by the sync and async sessions."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+
+from edgar.exceptions import EdgarRequestError
+
+logger = logging.getLogger(__name__)
+
+# Suffix of the file a download is written to until it completes.
+PARTIAL_SUFFIX = ".part"
+
+# Suffix (after ``PARTIAL_SUFFIX``) of the file holding the ETag or
+# Last-Modified of the response a ``.part`` file was written from.
+VALIDATOR_SUFFIX = ".validator"
+
+# Bytes hashed per read when resuming a partial file.
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def parse_checksum(checksum: str | None) -> tuple[str, str] | tuple[None, None]:
+    """Splits ``"algorithm:hexdigest"`` into its parts.
+
+    ### Parameters
+    ----
+    checksum : str | None
+        For example ``"sha256:9f86d0..."`` or ``"md5:d41d8c..."``. Any
+        algorithm ``hashlib`` provides is accepted.
+
+    ### Returns
+    ----
+    tuple[str, str] | tuple[None, None]:
+        ``(algorithm, hexdigest)``, or ``(None, None)`` without a checksum.
+    """
+
+    if not checksum:
+        return None, None
+    algorithm, sep, digest = checksum.partition(":")
+    algorithm = algorithm.lower()
+    if not sep or not digest or algorithm not in hashlib.algorithms_available:
+        raise ValueError(f"checksum must look like 'sha256:<hexdigest>', got {checksum!r}")
+    return algorithm, digest.lower()
+
+
+def validator_of(headers) -> str | None:
+    """Returns the validator to send as ``If-Range`` for a response.
+
+    A strong ``ETag`` if there is one, otherwise ``Last-Modified``.
+    Weak ETags (``W/"..."``) can't be used with ``If-Range``.
+    """
+
+    etag = headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return headers.get("Last-Modified")
+
+
+def range_start(content_range: str | None) -> int | None:
+    """Returns the first byte of ``Content-Range: bytes <first>-<last>/<length>``."""
+
+    if not content_range:
+        return None
+    unit, _, byte_range = content_range.strip().partition(" ")
+    first = byte_range.partition("-")[0]
+    if unit != "bytes" or not first.isdigit():
+        return None
+    return int(first)
+
+
+def save_document(path: str, content: str | bytes) -> str:
+    """Writes a buffered document to ``path``, text as UTF-8, and returns ``path``."""
+
+    if isinstance(content, str):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+    else:
+        with open(path, "wb") as f:
+            f.write(content)
+    return path
+
+
+class PartialFile:
+    """
+    ## Overview
+    ----
+    The destination of one streamed download. The body is written to
+    ``<path>.part`` and moved to ``path`` with ``os.replace`` only after
+    it is complete and, when a checksum is given, verified — so ``path``
+    never holds a truncated or corrupt file. A ``.part`` file left by an
+    interrupted transfer is resumed with an HTTP ``Range`` request.
+
+    Resuming is only safe while the file on the server is the one the
+    ``.part`` file was written from. The response's ``ETag`` (or
+    ``Last-Modified``) is saved next to the ``.part`` file and sent as
+    ``If-Range``, and the download starts over when the server answers
+    with the whole file, with a range that doesn't start at the end of
+    the ``.part`` file, or with a different validator. A ``.part`` file
+    without a saved validator is never resumed.
+
+    The sessions drive it: ``range_headers()`` before the request,
+    ``begin()`` with the response status, ``write()`` per chunk, then
+    ``finish()``.
+    """
+
+    def __init__(self, path: str, checksum: str | None = None, resume: bool = True) -> None:
+        """Initializes the ``PartialFile``.
+
+        ### Parameters
+        ----
+        path : str
+            Final location of the downloaded file.
+
+        checksum : str | None (optional, Default=None)
+            Expected ``"algorithm:hexdigest"`` of the complete file.
+
+        resume : bool (optional, Default=True)
+            Continue an existing ``.part`` file instead of starting over.
+        """
+
+        if path is None:
+            raise ValueError("Streaming downloads need a path to write to")
+        self.path = os.fspath(path)
+        self.partial_path = self.path + PARTIAL_SUFFIX
+        self.validator_path = self.partial_path + VALIDATOR_SUFFIX
+        self.algorithm, self.expected_digest = parse_checksum(checksum)
+        self.validator = self._load_validator() if resume else None
+        if self.validator is None and os.path.exists(self.partial_path):
+            logger.debug("Discarding %s: no validator to resume it against", self.partial_path)
+            os.remove(self.partial_path)
+        self.offset = os.path.getsize(self.partial_path) if os.path.exists(self.partial_path) else 0
+        self.written = 0
+        self._file = None
+        self._hash = None
+
+    def __repr__(self) -> str:
+        return f"<PartialFile path={self.path!r} offset={self.offset} written={self.written}>"
+
+    def range_headers(self) -> dict | None:
+        """Headers asking for the bytes not yet on disk (``None`` from the start).
+
+        ``If-Range`` makes the server send the whole file instead when
+        it no longer matches the saved validator.
+        """
+
+        if not self.offset or self.validator is None:
+            return None
+        return {"Range": f"bytes={self.offset}-", "If-Range": self.validator}
+
+    def is_complete(self, status: int, content_range: str | None, validator: str | None = None) -> bool:
+        """Whether a ``416`` answer means the ``.part`` file already holds everything.
+
+        ``Content-Range: bytes */<length>`` on a ``416`` gives the full
+        size; when that equals what is on disk, and the response doesn't
+        carry a validator other than the saved one, there is nothing
+        left to fetch.
+        """
+
+        if status != 416 or not self.offset or not content_range:
+            return False
+        if validator is not None and validator != self.validator:
+            return False
+        total = content_range.rpartition("/")[2].strip()
+        return total.isdigit() and int(total) == self.offset
+
+    def begin(self, status: int, content_range: str | None = None, validator: str | None = None) -> bool:
+        """Opens the ``.part`` file for a ``200`` or ``206`` response.
+
+        A ``206`` appends to what is already on disk, provided its
+        ``Content-Range`` starts at the end of the ``.part`` file and
+        its validator matches the saved one. A ``200`` means the server
+        sent the whole body (it ignored the range, or the file changed
+        and ``If-Range`` didn't match), so the ``.part`` file is
+        truncated first and the new validator saved.
+
+        ### Returns
+        ----
+        bool:
+            ``False`` when the ``206`` can't be appended; the ``.part``
+            file is deleted and the caller should request the whole
+            file again.
+        """
+
+        if status == 206:
+            if range_start(content_range) != self.offset or (
+                validator is not None and validator != self.validator
+            ):
+                logger.debug("Discarding %s: the range doesn't continue it", self.partial_path)
+                self.restart()
+                return False
+            mode = "ab"
+        else:
+            mode, self.offset = "wb", 0
+            self._save_validator(validator)
+        self._hash = hashlib.new(self.algorithm) if self.algorithm else None
+        if self._hash is not None and mode == "ab":
+            self._hash_existing()
+        self._file = open(self.partial_path, mode)  # pylint: disable=consider-using-with
+        logger.debug("Writing %s from byte %d", self.partial_path, self.offset)
+        return True
+
+    def write(self, chunk: bytes) -> None:
+        """Appends one chunk of the body."""
+
+        self._file.write(chunk)
+        if self._hash is not None:
+            self._hash.update(chunk)
+        self.written += len(chunk)
+
+    def close(self) -> None:
+        """Closes the ``.part`` file, keeping it for a later resume."""
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.offset = os.path.getsize(self.partial_path) if os.path.exists(self.partial_path) else 0
+
+    def restart(self) -> None:
+        """Deletes the ``.part`` file so the next request fetches everything."""
+
+        self.close()
+        if os.path.exists(self.partial_path):
+            os.remove(self.partial_path)
+        self._save_validator(None)
+        self.offset = 0
+
+    def finish(self) -> str:
+        """Verifies the checksum and moves the file into place.
+
+        ### Returns
+        ----
+        str:
+            The final ``path``.
+
+        ### Raises
+        ----
+        EdgarRequestError:
+            If the checksum doesn't match. The ``.part`` file is
+            deleted so the next attempt starts from scratch.
+        """
+
+        self.close()
+        if self._hash is None and self.algorithm:
+            # Nothing was written in this call (the .part file was complete).
+            self._hash = hashlib.new(self.algorithm)
+            self._hash_existing()
+        if self._hash is not None:
+            digest = self._hash.hexdigest()
+            if digest != self.expected_digest:
+                self.restart()
+                raise EdgarRequestError(
+                    f"Checksum mismatch for {self.path}: expected {self.algorithm}:{self.expected_digest}, "
+                    f"got {self.algorithm}:{digest}"
+                )
+        os.replace(self.partial_path, self.path)
+        self._save_validator(None)
+        return self.path
+
+    def _load_validator(self) -> str | None:
+        """Reads the validator saved for the ``.part`` file, if any."""
+
+        if not os.path.exists(self.validator_path):
+            return None
+        with open(self.validator_path, encoding="utf-8") as f:
+            return f.read().strip() or None
+
+    def _save_validator(self, validator: str | None) -> None:
+        """Saves (or, for ``None``, forgets) the validator of the ``.part`` file."""
+
+        self.validator = validator
+        if validator is None:
+            if os.path.exists(self.validator_path):
+                os.remove(self.validator_path)
+            return
+        with open(self.validator_path, "w", encoding="utf-8") as f:
+            f.write(validator)
+
+    def _hash_existing(self) -> None:
+        """Feeds the bytes already in the ``.part`` file to the hash."""
+
+        with open(self.partial_path, "rb") as f:
+            for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+                self._hash.update(block)
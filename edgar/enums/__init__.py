@@ -1,10 +1,20 @@
-"""Enumerations for SEC state codes, country codes, filing types, and SIC codes."""
+"""Enumerations for SEC state codes, country codes, filing types, and SIC codes.
 
-from edgar.enums.country_codes import CountryCodes
-from edgar.enums.filing_type_codes import FilingTypeCodes
-from edgar.enums.other_filing_types import OtherFilingTypes
-from edgar.enums.sic_codes import StandardIndustrialClassificationCodes
-from edgar.enums.state_codes import StateCodes
+Each enum module is imported on first access (PEP 562), so using
+``StateCodes`` doesn't load the much larger SIC and filing type tables.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from edgar.enums.country_codes import CountryCodes
+    from edgar.enums.filing_type_codes import FilingTypeCodes
+    from edgar.enums.other_filing_types import OtherFilingTypes
+    from edgar.enums.sic_codes import StandardIndustrialClassificationCodes
+    from edgar.enums.state_codes import StateCodes
 
 __all__ = [
     "CountryCodes",
@@ -13,3 +23,25 @@ __all__ = [
     "StandardIndustrialClassificationCodes",
     "StateCodes",
 ]
+
+# Enum name → defining module.
+_LAZY_ATTRIBUTES = {
+    "CountryCodes": "edgar.enums.country_codes",
+    "FilingTypeCodes": "edgar.enums.filing_type_codes",
+    "OtherFilingTypes": "edgar.enums.other_filing_types",
+    "StandardIndustrialClassificationCodes": "edgar.enums.sic_codes",
+    "StateCodes": "edgar.enums.state_codes",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,429 @@
+"""Local SQLite index of SEC EDGAR full-index and daily-index files."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import logging
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import date, datetime
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from edgar.session import EdgarSession
+
+logger = logging.getLogger(__name__)
+
+DB_FILENAME = "filing_index.sqlite3"
+
+# Index files SEC publishes per quarter (full-index) and per day (daily-index).
+INDEX_KINDS = ("master", "form", "company")
+
+# Rows inserted per SQLite transaction while loading an index file.
+LOAD_BATCH_SIZE = 10_000
+
+_ARCHIVES_URL = "https://www.sec.gov/Archives/"
+_DAILY_FILE = re.compile(r"^(master|form|company)\.(\d{8})\.idx(\.gz)?$")
+_GZIP_MAGIC = b"\x1f\x8b"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS filings (
+    cik INTEGER NOT NULL,
+    company_name TEXT NOT NULL,
+    form_type TEXT NOT NULL,
+    date_filed TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    PRIMARY KEY (filename, cik)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS filings_form_date ON filings (form_type, date_filed);
+CREATE INDEX IF NOT EXISTS filings_cik_date ON filings (cik, date_filed);
+CREATE INDEX IF NOT EXISTS filings_date ON filings (date_filed);
+CREATE TABLE IF NOT EXISTS sources (
+    source TEXT PRIMARY KEY,
+    rows INTEGER NOT NULL,
+    loaded_at REAL NOT NULL
+);
+"""
+
+_COLUMNS = ("cik", "company_name", "form_type", "date_filed", "filename")
+
+
+def _iso_date(value: str) -> str:
+    """Normalizes ``yyyy-mm-dd`` and ``yyyymmdd`` index dates to ISO-8601."""
+
+    value = value.strip()
+    if len(value) == 8 and value.isdigit():
+        return f"{value[:4]}-{value[4:6]}-{value[6:]}"
+    return value
+
+
+def parse_index(lines: Iterable[str]) -> Iterator[tuple[int, str, str, str, str]]:
+    """Parses an EDGAR ``master``, ``form`` or ``company`` index file.
+
+    The layout is detected from the column header: ``master`` files
+    are pipe-delimited, ``form`` and ``company`` files are fixed-width
+    and sorted by form type or company name. Lines before the header
+    (the file description) are skipped.
+
+    ### Parameters
+    ----
+    lines : Iterable[str]
+        The decoded lines of the index file.
+
+    ### Returns
+    ----
+    Iterator[tuple[int, str, str, str, str]]:
+        ``(cik, company_name, form_type, date_filed, filename)`` tuples
+        with ISO-8601 dates.
+    """
+
+    lines = iter(lines)
+    header = None
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith(("CIK|", "Form Type", "Company Name")):
+            header = line.rstrip("\r\n")
+        elif header is not None and stripped and set(stripped) == {"-"}:
+            break
+    else:
+        return
+
+    if header.startswith("CIK|"):
+        for line in lines:
+            parts = line.rstrip("\r\n").split("|")
+            if len(parts) != 5 or not parts[0].isdigit():
+                continue
+            cik, company, form, filed, filename = parts
+            yield int(cik), company.strip(), form.strip(), _iso_date(filed), filename.strip()
+        return
+
+    # Fixed-width files: CIK, date and filename never contain spaces, so
+    # they are split off the right; the header tells where the first
+    # column (which may contain spaces, e.g. "SC 13G") ends.
+    by_form = header.startswith("Form Type")
+    split_at = header.index("Company Name" if by_form else "Form Type")
+    for line in lines:
+        line = line.rstrip("\r\n")
+        parts = line[split_at:].rsplit(None, 3)
+        if len(parts) != 4 or not parts[1].isdigit():
+            continue
+        second, cik, filed, filename = parts
+        first = line[:split_at].strip()
+        form, company = (first, second) if by_form else (second, first)
+        yield int(cik), company.strip(), form.strip(), _iso_date(filed), filename
+
+
+def _open_index(fileobj: BinaryIO) -> io.TextIOWrapper:
+    """Wraps a (possibly gzip-compressed) index file as text."""
+
+    if fileobj.read(2) == _GZIP_MAGIC:
+        fileobj.seek(0)
+        fileobj = gzip.GzipFile(fileobj=fileobj)
+    else:
+        fileobj.seek(0)
+    # Index files are ASCII in practice; latin-1 never fails on stray bytes.
+    return io.TextIOWrapper(fileobj, encoding="latin-1", newline="")
+
+
+class FilingIndex:
+
+    """
+    ## Overview
+    ----
+    A local, queryable index of every EDGAR filing, built from SEC's
+    ``full-index`` (quarterly) and ``daily-index`` files and stored in
+    SQLite.
+
+    Once a quarter is loaded, questions like "every 10-K filed between
+    two dates" are answered from indexed local tables with no HTTP
+    requests. ``update()`` keeps the current quarter fresh by loading
+    only the daily-index files it hasn't seen yet.
+
+    ### Usage
+    ----
+        >>> index = edgar_client.archives().filing_index("~/.cache/python-sec")
+        >>> index.load_quarter(2023, 4)
+        >>> index.query(form_type="10-K", start="2023-11-01", end="2023-11-30")
+    """
+
+    def __init__(self, directory: str, session: EdgarSession | None = None) -> None:
+        """Initializes the ``FilingIndex``.
+
+        ### Parameters
+        ----
+        directory : str
+            Directory holding the index database. Created if missing.
+
+        session : EdgarSession | None (optional, Default=None)
+            Session used to download index files. Without one the index
+            can only be queried and fed with ``load_file()``.
+        """
+
+        self.directory = os.path.expanduser(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.path = os.path.join(self.directory, DB_FILENAME)
+        self.edgar_session = session
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def __repr__(self) -> str:
+        return f"<FilingIndex path={self.path!r} filings={len(self)}>"
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM filings").fetchone()[0]
+
+    def close(self) -> None:
+        """Closes the database connection."""
+
+        with self._lock:
+            self._conn.close()
+
+    def sources(self) -> list[str]:
+        """Returns the index files loaded so far (e.g. ``"full-index/2023/QTR4/master.idx"``)."""
+
+        with self._lock:
+            rows = self._conn.execute("SELECT source FROM sources ORDER BY source").fetchall()
+        return [row[0] for row in rows]
+
+    def load_file(self, fileobj: BinaryIO, source: str) -> int:
+        """Loads an index file that is already on hand.
+
+        ### Parameters
+        ----
+        fileobj : BinaryIO
+            A seekable binary file holding a ``master``, ``form`` or
+            ``company`` index, optionally gzip-compressed.
+
+        source : str
+            A name recorded with the rows so the file isn't loaded
+            twice by ``load_quarter()`` / ``update()``.
+
+        ### Returns
+        ----
+        int:
+            The number of index rows read.
+        """
+
+        rows = 0
+        text = _open_index(fileobj)
+        entries = parse_index(text)
+        with self._lock:
+            while True:
+                batch = [entry for _, entry in zip(range(LOAD_BATCH_SIZE), entries)]
+                if not batch:
+                    break
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO filings "
+                        "(cik, company_name, form_type, date_filed, filename) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        batch,
+                    )
+                rows += len(batch)
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sources (source, rows, loaded_at) VALUES (?, ?, ?)",
+                    (source, rows, time.time()),
+                )
+        logger.debug("Loaded %s into filing index (%d rows)", source, rows)
+        return rows
+
+    def load_quarter(
+        self,
+        year: int,
+        quarter: int,
+        kind: str = "master",
+        reload: bool = False,
+    ) -> int:
+        """Downloads and loads one quarter's full-index file.
+
+        ### Parameters
+        ----
+        year : int
+            The calendar year (1993 onwards).
+
+        quarter : int
+            The calendar quarter (1-4).
+
+        kind : str (optional, Default="master")
+            Which index to load: ``"master"``, ``"form"`` or
+            ``"company"``. All three list the same filings.
+
+        reload : bool (optional, Default=False)
+            Download the file again even if it was loaded before. Use
+            for the current quarter, whose full index grows daily.
+
+        ### Returns
+        ----
+        int:
+            The number of rows loaded, ``0`` if the file was already
+            loaded or SEC has no index for the period.
+        """
+
+        if not 1 <= quarter <= 4:
+            raise ValueError(f"quarter must be between 1 and 4, got {quarter}")
+        if kind not in INDEX_KINDS:
+            raise ValueError(f"kind must be one of {list(INDEX_KINDS)}, got {kind!r}")
+
+        source = f"full-index/{year}/QTR{quarter}/{kind}.gz"
+        if not reload and source in self.sources():
+            return 0
+        return self._download(source)
+
+    def update(self, year: int | None = None, quarter: int | None = None) -> int:
+        """Loads the daily-index files of a quarter not yet in the index.
+
+        ### Parameters
+        ----
+        year : int | None (optional, Default=None)
+            The calendar year. Defaults to the current year.
+
+        quarter : int | None (optional, Default=None)
+            The calendar quarter (1-4). Defaults to the current quarter.
+
+        ### Returns
+        ----
+        int:
+            The number of rows loaded.
+        """
+
+        today = date.today()
+        year = year or today.year
+        quarter = quarter or (today.month - 1) // 3 + 1
+
+        response = self._session().make_request(
+            method="get",
+            endpoint=f"/Archives/edgar/daily-index/{year}/QTR{quarter}/index.json",
+        )
+        names = [item["name"] for item in (response or {}).get("directory", {}).get("item", [])]
+
+        # Prefer the plain file when SEC publishes both .idx and .idx.gz.
+        wanted: dict[str, str] = {}
+        for name in sorted(names):
+            match = _DAILY_FILE.match(name)
+            if match and match.group(1) == "master":
+                wanted.setdefault(match.group(2), name)
+
+        loaded = set(self.sources())
+        rows = 0
+        for day in sorted(wanted):
+            source = f"daily-index/{year}/QTR{quarter}/{wanted[day]}"
+            if source not in loaded:
+                rows += self._download(source)
+        return rows
+
+    def query(  # pylint: disable=too-many-positional-arguments
+        self,
+        form_type: str | Iterable[str] | None = None,
+        cik: str | int | None = None,
+        start: str | date | datetime | None = None,
+        end: str | date | datetime | None = None,
+        company_name: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """Finds filings in the local index. Makes no HTTP requests.
+
+        ### Parameters
+        ----
+        form_type : str | Iterable[str] | None (optional, Default=None)
+            A form type (e.g. ``"10-K"``) or several.
+
+        cik : str | int | None (optional, Default=None)
+            The filer's CIK, with or without leading zeros.
+
+        start : str | date | datetime | None (optional, Default=None)
+            Earliest filing date, inclusive.
+
+        end : str | date | datetime | None (optional, Default=None)
+            Latest filing date, inclusive.
+
+        company_name : str | None (optional, Default=None)
+            Case-insensitive substring of the company name.
+
+        limit : int | None (optional, Default=None)
+            Maximum number of rows to return.
+
+        ### Returns
+        ----
+        list[dict]:
+            Filings ordered by date, each with ``cik``, ``company_name``,
+            ``form_type``, ``date_filed``, ``filename`` and ``url``.
+
+        ### Usage
+        ----
+            >>> index.query(form_type=["10-K", "10-K/A"], start="2023-10-01", end="2023-12-31")
+        """
+
+        clauses = []
+        params: list = []
+        if form_type is not None:
+            forms = [form_type] if isinstance(form_type, str) else list(form_type)
+            clauses.append(f"form_type IN ({', '.join('?' * len(forms))})")
+            params.extend(forms)
+        if cik is not None:
+            clauses.append("cik = ?")
+            params.append(int(cik))
+        if start is not None:
+            clauses.append("date_filed >= ?")
+            params.append(_date_param(start))
+        if end is not None:
+            clauses.append("date_filed <= ?")
+            params.append(_date_param(end))
+        if company_name:
+            clauses.append("company_name LIKE ?")
+            params.append(f"%{company_name}%")
+
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM filings"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY date_filed, filename"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        return [
+            {**dict(row), "cik": str(row["cik"]), "url": _ARCHIVES_URL + row["filename"]}
+            for row in rows
+        ]
+
+    def _session(self) -> EdgarSession:
+        """Returns the session, or explains why downloads aren't possible."""
+
+        if self.edgar_session is None:
+            raise ValueError("This FilingIndex has no session; use load_file() instead")
+        return self.edgar_session
+
+    def _download(self, source: str) -> int:
+        """Streams ``/Archives/edgar/{source}`` to a temp file and loads it."""
+
+        session = self._session()
+        url = f"{_ARCHIVES_URL}edgar/{source}"
+        logger.info("Loading %s into filing index", url)
+        with tempfile.TemporaryFile(prefix="edgar-index-") as spool:
+            if not session.stream_to_file(url, spool):
+                return 0
+            spool.seek(0)
+            return self.load_file(spool, source)
+
+
+def _date_param(value: str | date | datetime) -> str:
+    """Formats a query date bound as ``yyyy-mm-dd``."""
+
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return value.isoformat()
+    return _iso_date(value)
@@ -7,6 +7,7 @@ from typing import Union
 from datetime import date
 from datetime import datetime
 
+from edgar.parser import FeedStream
 from edgar.session import EdgarSession
 
 
@@ -240,6 +241,110 @@ class Filings:
             )
         """
 
+        params = self._query_params(
+            cik=cik,
+            sic=sic,
+            filing_type=filing_type,
+            company_name=company_name,
+            start=start,
+            after_date=after_date,
+            before_date=before_date,
+        )
+
+        # Grab the Data.
+        response = self.edgar_session.make_request(
+            method='get',
+            endpoint=self.browse_endpoint,
+            params=params,
+        )
+
+        # Parse the entries.
+        entries = self.edgar_parser.parse_entries(
+            response_text=response,
+            num_of_items=number_of_filings,
+            start=start,
+            fetch_page=self.edgar_session.fetch_page,
+        )
+
+        return entries
+
+    def iter_query(  # pylint: disable=too-many-positional-arguments
+        self,
+        cik: str = None,
+        sic: str = None,
+        filing_type: Union[str, Enum] = None,
+        company_name: str = None,
+        start: int = 0,
+        number_of_filings: int = None,
+        after_date: Union[str, datetime, date] = None,
+        before_date: Union[str, datetime, date] = None,
+    ) -> FeedStream:
+        """Streams the results of ``query`` page by page.
+
+        Takes the same arguments as ``query`` but returns a
+        ``FeedStream`` that yields filings as each page arrives and
+        downloads the next page while you process the current one,
+        so memory use stays flat however many filings match.
+
+        ### Parameters
+        ----
+        start : int (optional, Default=0)
+            Offset to begin at. Pass a previous stream's ``offset`` to
+            resume an interrupted job.
+
+        number_of_filings : int (optional, Default=None)
+            Maximum number of filings to yield. ``None`` streams every
+            matching filing.
+
+        ### Returns
+        ----
+        FeedStream:
+            An iterator of `Filing` resources with a resumable ``offset``.
+
+        ### Usage
+        ----
+            >>> edgar_client = EdgarClient(user_agent="Your Name your-email@example.com")
+            >>> filings_services = edgar_client.filings()
+            >>> stream = filings_services.iter_query(cik='320193', filing_type='10-K')
+            >>> for filing in stream:
+            ...     print(filing['title'], stream.offset)
+        """
+
+        params = self._query_params(
+            cik=cik,
+            sic=sic,
+            filing_type=filing_type,
+            company_name=company_name,
+            start=start,
+            after_date=after_date,
+            before_date=before_date,
+        )
+
+        response = self.edgar_session.make_request(
+            method='get',
+            endpoint=self.browse_endpoint,
+            params=params,
+        )
+
+        return self.edgar_parser.iter_entries(
+            response_text=response,
+            fetch_page=self.edgar_session.fetch_page,
+            start=start,
+            limit=number_of_filings,
+        )
+
+    def _query_params(  # pylint: disable=too-many-positional-arguments
+        self,
+        cik: str = None,
+        sic: str = None,
+        filing_type: Union[str, Enum] = None,
+        company_name: str = None,
+        start: int = 0,
+        after_date: Union[str, datetime, date] = None,
+        before_date: Union[str, datetime, date] = None,
+    ) -> dict:
+        """Builds the browse-edgar parameters shared by ``query`` and ``iter_query``."""
+
         if isinstance(filing_type, Enum):
             filing_type = filing_type.value
 
@@ -262,22 +367,7 @@ class Filings:
             'dateb': before_date or '',
         }
 
-        # Grab the Data.
-        response = self.edgar_session.make_request(
-            method='get',
-            endpoint=self.browse_endpoint,
-            params=params,
-        )
-
-        # Parse the entries.
-        entries = self.edgar_parser.parse_entries(
-            response_text=response,
-            num_of_items=number_of_filings,
-            start=start,
-            fetch_page=self.edgar_session.fetch_page,
-        )
-
-        return entries
+        return params
 
     def get_filings_by_company_name(
         self, company_name: str, number_of_filings: int = 100, start: int = 0
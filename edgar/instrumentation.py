@@ -0,0 +1,337 @@
+"""Request instrumentation hooks and an in-memory metrics collector."""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Hook names, in the order a request emits them.
+HOOK_EVENTS = ("on_request_start", "on_throttle_wait", "on_response", "on_retry", "on_cache_hit")
+
+# Upper bounds (seconds) of the latency histogram buckets; the last
+# bucket is unbounded.
+DEFAULT_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Path segments kept when grouping URLs into endpoint families.
+_FAMILY_DEPTH = 3
+
+
+def endpoint_family(url: str) -> str:
+    """Groups a URL with the other URLs of the same endpoint.
+
+    Keeps the leading path segments up to the first one that names a
+    specific resource (contains a digit or a file extension), at most
+    ``_FAMILY_DEPTH`` of them, so ``/submissions/CIK0000320193.json``
+    becomes ``"submissions"`` and
+    ``/api/xbrl/companyfacts/CIK0000320193.json`` becomes
+    ``"api/xbrl/companyfacts"``.
+    """
+
+    parts = urlsplit(url)
+    family = []
+    for segment in parts.path.split("/"):
+        if not segment:
+            continue
+        if len(family) == _FAMILY_DEPTH or "." in segment or any(c.isdigit() for c in segment):
+            break
+        family.append(segment)
+    return "/".join(family) or parts.netloc
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """What a session reports to its hooks.
+
+    Every event carries the request's ``method``, ``url`` and
+    ``family``; the remaining fields are filled in by the events they
+    apply to.
+    """
+
+    method: str
+    url: str
+    family: str
+    # on_response / on_retry: the HTTP status, if a response arrived.
+    status: int | None = None
+    # on_response: seconds from sending the request to reading the body.
+    elapsed: float = 0.0
+    # on_response: body bytes received.
+    size: int = 0
+    # on_throttle_wait: seconds slept; on_retry: seconds until the retry.
+    wait: float = 0.0
+    # on_retry: the retry number, starting at 1.
+    attempt: int = 0
+    # on_retry: the transport error that triggered it, if any.
+    error: Exception | None = None
+    # on_cache_hit: ``"memory"``, ``"disk"``, ``"bulk"``, ``"snapshot"``, ``"coalesced"``
+    # (shared an identical request already in flight) or ``"revalidated"``.
+    cache: str | None = None
+
+
+class RequestHooks:
+    """Subscribers notified of every request a session makes.
+
+    ``on_request_start`` fires when a request is about to go to the
+    network (after cache lookups), ``on_throttle_wait`` when the rate
+    limiter makes it sleep, ``on_response`` for every HTTP response
+    (retries included), ``on_retry`` before a retry and
+    ``on_cache_hit`` when a cache answers instead of SEC.
+
+    Callbacks run synchronously on the requesting thread (or event
+    loop), so they should be quick. A callback that raises is logged
+    and otherwise ignored.
+
+    ### Usage
+    ----
+        >>> metrics = MetricsCollector()
+        >>> edgar_client.hooks.subscribe(metrics)
+        >>> edgar_client.hooks.subscribe(on_retry=lambda event: print(event.url, event.status))
+    """
+
+    def __init__(self) -> None:
+        self._callbacks: dict[str, tuple[Callable[[RequestEvent], None], ...]] = {
+            name: () for name in HOOK_EVENTS
+        }
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        count = sum(len(callbacks) for callbacks in self._callbacks.values())
+        return f"<RequestHooks callbacks={count}>"
+
+    def subscribe(
+        self,
+        subscriber: object | None = None,
+        **callbacks: Callable[[RequestEvent], None],
+    ) -> Callable[[], None]:
+        """Registers callbacks and returns a function that removes them.
+
+        ### Parameters
+        ----
+        subscriber : object | None (optional, Default=None)
+            An object whose ``on_*`` methods (any of ``HOOK_EVENTS``)
+            are registered, such as a ``MetricsCollector``.
+
+        **callbacks : Callable[[RequestEvent], None]
+            Individual callbacks by hook name, e.g. ``on_response=...``.
+
+        ### Returns
+        ----
+        Callable[[], None]:
+            Unsubscribes everything registered by this call.
+        """
+
+        unknown = set(callbacks) - set(HOOK_EVENTS)
+        if unknown:
+            raise ValueError(f"Unknown hooks {sorted(unknown)}; expected some of {list(HOOK_EVENTS)}")
+
+        registered = dict(callbacks)
+        if subscriber is not None:
+            for name in HOOK_EVENTS:
+                method = getattr(subscriber, name, None)
+                if callable(method):
+                    registered.setdefault(name, method)
+        if not registered:
+            raise ValueError(f"Nothing to subscribe; expected callables for some of {list(HOOK_EVENTS)}")
+
+        with self._lock:
+            for name, callback in registered.items():
+                self._callbacks[name] += (callback,)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                for name, callback in registered.items():
+                    self._callbacks[name] = tuple(c for c in self._callbacks[name] if c is not callback)
+
+        return unsubscribe
+
+    def clear(self) -> None:
+        """Removes every registered callback."""
+
+        with self._lock:
+            self._callbacks = {name: () for name in HOOK_EVENTS}
+
+    def emit(self, name: str, event: RequestEvent) -> None:
+        """Calls every callback registered for hook *name*."""
+
+        for callback in self._callbacks[name]:
+            try:
+                callback(event)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Request hook %s failed", name)
+
+    def notify(self, name: str, method: str, url: str, **fields) -> None:
+        """Builds a ``RequestEvent`` and emits it to hook *name*.
+
+        Does nothing, not even building the event, while no callback
+        is registered for *name*, so uninstrumented sessions pay for
+        one dictionary lookup per event.
+        """
+
+        if self._callbacks[name]:
+            event = RequestEvent(method=method.upper(), url=url, family=endpoint_family(url), **fields)
+            self.emit(name, event)
+
+    def __bool__(self) -> bool:
+        """Whether any callback is registered."""
+        return any(self._callbacks.values())
+
+
+@dataclass(frozen=True)
+class LatencyHistogram:
+    """Response latencies of one endpoint family.
+
+    ``buckets`` maps each upper bound (seconds) to the number of
+    responses at or below it, cumulatively, like a Prometheus
+    histogram; ``float("inf")`` holds every response.
+    """
+
+    count: int
+    total: float
+    buckets: dict[float, int] = field(default_factory=dict)
+
+    @property
+    def mean(self) -> float:
+        """Average latency in seconds (``0.0`` when empty)."""
+        return self.total / self.count if self.count else 0.0
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Point-in-time counters from a ``MetricsCollector``."""
+
+    requests: int
+    responses: int
+    retries: dict[str, int]
+    statuses: dict[int, int]
+    bytes_received: dict[str, int]
+    throttle_waits: int
+    throttle_seconds: float
+    cache_hits: dict[str, int]
+    latency: dict[str, LatencyHistogram]
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Fraction of lookups answered without a request to SEC.
+
+        Revalidated (``304``) responses still cost a round trip, so
+        they count as requests rather than hits.
+        """
+        hits = sum(self.cache_hits.get(kind, 0) for kind in ("memory", "disk", "bulk", "snapshot", "coalesced"))
+        lookups = hits + self.requests
+        return hits / lookups if lookups else 0.0
+
+
+class MetricsCollector:
+    """
+    ## Overview
+    ----
+    Aggregates session hook events in memory: per-family latency
+    histograms and retry counts, bytes received, HTTP statuses, time
+    spent throttled and cache hits. Subscribe it to one or more
+    sessions and read ``snapshot()`` whenever you want to export.
+
+    ### Usage
+    ----
+        >>> metrics = MetricsCollector()
+        >>> edgar_client.hooks.subscribe(metrics)
+        >>> edgar_client.submissions().get_submissions(cik="320193")
+        >>> metrics.snapshot().latency["submissions"].mean
+        0.183
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """Initializes the ``MetricsCollector``.
+
+        ### Parameters
+        ----
+        buckets : tuple[float, ...] (optional, Default=DEFAULT_LATENCY_BUCKETS)
+            Ascending upper bounds, in seconds, of the latency buckets.
+        """
+
+        if list(buckets) != sorted(set(buckets)):
+            raise ValueError("buckets must be strictly increasing")
+
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __repr__(self) -> str:
+        return f"<MetricsCollector requests={self._requests} responses={self._responses}>"
+
+    def reset(self) -> None:
+        """Clears every counter."""
+
+        with self._lock:
+            self._requests = 0
+            self._responses = 0
+            self._retries: Counter[str] = Counter()
+            self._statuses: Counter[int] = Counter()
+            self._bytes: Counter[str] = Counter()
+            self._throttle_waits = 0
+            self._throttle_seconds = 0.0
+            self._cache_hits: Counter[str] = Counter()
+            # family → (per-bucket counts incl. overflow, count, total seconds)
+            self._latency: dict[str, tuple[list[int], int, float]] = {}
+
+    def on_request_start(self, event: RequestEvent) -> None:  # pylint: disable=unused-argument
+        """Counts a request sent to SEC."""
+        with self._lock:
+            self._requests += 1
+
+    def on_throttle_wait(self, event: RequestEvent) -> None:
+        """Adds the time a request waited for the rate limiter."""
+        with self._lock:
+            self._throttle_waits += 1
+            self._throttle_seconds += event.wait
+
+    def on_response(self, event: RequestEvent) -> None:
+        """Records a response's latency, size and status."""
+
+        index = bisect.bisect_left(self.buckets, event.elapsed)
+        with self._lock:
+            self._responses += 1
+            self._statuses[event.status] += 1
+            self._bytes[event.family] += event.size
+            counts, count, total = self._latency.get(event.family) or ([0] * (len(self.buckets) + 1), 0, 0.0)
+            counts[index] += 1
+            self._latency[event.family] = (counts, count + 1, total + event.elapsed)
+
+    def on_retry(self, event: RequestEvent) -> None:
+        """Counts a retry for the request's family."""
+        with self._lock:
+            self._retries[event.family] += 1
+
+    def on_cache_hit(self, event: RequestEvent) -> None:
+        """Counts a cache hit by cache kind."""
+        with self._lock:
+            self._cache_hits[event.cache] += 1
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Returns a consistent copy of every counter."""
+
+        with self._lock:
+            latency = {}
+            for family, (counts, count, total) in self._latency.items():
+                cumulative, running = {}, 0
+                for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                    running += bucket_count
+                    cumulative[bound] = running
+                latency[family] = LatencyHistogram(count=count, total=total, buckets=cumulative)
+
+            return MetricsSnapshot(
+                requests=self._requests,
+                responses=self._responses,
+                retries=dict(self._retries),
+                statuses=dict(self._statuses),
+                bytes_received=dict(self._bytes),
+                throttle_waits=self._throttle_waits,
+                throttle_seconds=self._throttle_seconds,
+                cache_hits=dict(self._cache_hits),
+                latency=latency,
+            )
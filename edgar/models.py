@@ -6,9 +6,14 @@ import csv
 import io
 import json
 from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING
 from html import escape as _html_escape
 from pathlib import Path
 
+if TYPE_CHECKING:
+    from edgar.tables import FactTable, SubmissionTable
+
 
 _TABLE_STYLE = (
     "border-collapse:collapse;font-family:monospace;font-size:13px;"
@@ -95,7 +100,7 @@ def _model_to_dict(obj) -> dict:
     return result
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Filing:
     """A single SEC filing entry returned by the EDGAR search/browse feeds.
 
@@ -279,14 +284,27 @@ class CompanyInfo:
         num_rows = len(recent[keys[0]])
         return [{key: recent[key][i] for key in keys} for i in range(num_rows)]
 
+    @cached_property
+    def recent_table(self) -> SubmissionTable:
+        """The recent filings as a columnar ``SubmissionTable``.
+
+        Shares the SEC's ``filings.recent`` arrays instead of building
+        a dict per filing; rows are ``Submission`` proxies created on
+        access.
+        """
+        # edgar.tables builds on Submission, so it's imported on first use.
+        from edgar.tables import SubmissionTable  # pylint: disable=import-outside-toplevel
+
+        return SubmissionTable(self.raw.get("filings", {}).get("recent", {}))
+
     @property
     def recent_submissions(self) -> list[Submission]:
         """The recent filings as structured ``Submission`` model objects.
 
-        Same data as ``recent_filings`` but wrapped in ``Submission``
-        dataclass instances for typed property access.
+        Same data as ``recent_filings``, as ``Submission`` rows of
+        ``recent_table`` that read the shared columns.
         """
-        return [Submission(raw=row) for row in self.recent_filings]
+        return list(self.recent_table)
 
     def __repr__(self) -> str:
         ticker_str = ", ".join(self.tickers[:3]) if self.tickers else "N/A"
@@ -361,12 +379,13 @@ class CompanyInfo:
         return _to_csv_impl([self], path=path)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Submission:
     """A single filing record from the submissions API ``recent`` array.
 
-    Wraps one row from the column-oriented ``filings.recent`` structure
-    after it has been converted into a flat dictionary.
+    Wraps one row dict. Rows of a ``SubmissionTable`` are handed out as
+    a lightweight subclass that reads each property straight from the
+    shared column arrays instead.
 
     ### Usage
     ----
@@ -380,50 +399,54 @@ class Submission:
 
     raw: dict = field(repr=False)
 
+    def _get(self, key: str, default):
+        """Reads one field of the row."""
+        return self.raw.get(key, default)
+
     @property
     def accession_number(self) -> str:
         """The SEC accession number."""
-        return self.raw.get("accessionNumber", "")
+        return self._get("accessionNumber", "")
 
     @property
     def form(self) -> str:
         """The filing form type (e.g. ``'10-K'``, ``'10-Q'``)."""
-        return self.raw.get("form", "")
+        return self._get("form", "")
 
     @property
     def filing_date(self) -> str:
         """The date the filing was submitted."""
-        return self.raw.get("filingDate", "")
+        return self._get("filingDate", "")
 
     @property
     def report_date(self) -> str:
         """The reporting period end date."""
-        return self.raw.get("reportDate", "")
+        return self._get("reportDate", "")
 
     @property
     def primary_document(self) -> str:
         """The filename of the primary document."""
-        return self.raw.get("primaryDocument", "")
+        return self._get("primaryDocument", "")
 
     @property
     def primary_doc_description(self) -> str:
         """Description of the primary document."""
-        return self.raw.get("primaryDocDescription", "")
+        return self._get("primaryDocDescription", "")
 
     @property
     def is_xbrl(self) -> bool:
         """Whether the filing contains XBRL data."""
-        return bool(self.raw.get("isXBRL", 0))
+        return bool(self._get("isXBRL", 0))
 
     @property
     def is_inline_xbrl(self) -> bool:
         """Whether the filing uses inline XBRL."""
-        return bool(self.raw.get("isInlineXBRL", 0))
+        return bool(self._get("isInlineXBRL", 0))
 
     @property
     def size(self) -> int:
         """The filing size in bytes."""
-        return self.raw.get("size", 0)
+        return self._get("size", 0)
 
     def __repr__(self) -> str:
         return f"<Submission form={self.form!r} date={self.filing_date!r} accession={self.accession_number!r}>"
@@ -478,7 +501,7 @@ class Submission:
         return _to_csv_impl([self], path=path)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Fact:
     """A single XBRL fact data point.
 
@@ -677,21 +700,8 @@ class Facts:
         list[Fact]:
             A flat list of ``Fact`` objects, sorted by end date.
         """
-        concept_data = self.raw.get("facts", {}).get(taxonomy, {}).get(concept, {})
-        if not concept_data:
-            return []
-
-        units_data = concept_data.get("units", {})
-
-        results: list[dict] = []
-        if unit is not None:
-            results = units_data.get(unit, [])
-        else:
-            for entries in units_data.values():
-                results.extend(entries)
-
-        results.sort(key=lambda d: d.get("end", ""))
-        return [Fact(raw=entry) for entry in results]
+        table = self._table
+        return [Fact(raw=entry) for entry in table.take(table.rows, table.select(taxonomy, concept, unit))]
 
     def label(self, taxonomy: str, concept: str) -> str:
         """Returns the human-readable label for a concept.
@@ -765,8 +775,8 @@ class Facts:
 
     def to_dataframe(
         self,
-        taxonomy: str,
-        concept: str,
+        taxonomy: str | None = None,
+        concept: str | None = None,
         unit: str | None = None,
     ):
         """Returns fact data points as a pandas DataFrame.
@@ -774,13 +784,19 @@ class Facts:
         Requires the ``pandas`` optional dependency. Install with
         ``pip install python-sec[pandas]``.
 
+        Built straight from the columnar fact table, so no ``Fact``
+        objects are created. Leave ``concept`` (and ``taxonomy``) unset
+        to export a whole taxonomy (or every fact) as one panel.
+
         ### Parameters
         ----
-        taxonomy : str
-            The taxonomy namespace (e.g. ``"us-gaap"``).
+        taxonomy : str | None (optional, Default=None)
+            The taxonomy namespace (e.g. ``"us-gaap"``). ``None``
+            exports every taxonomy.
 
-        concept : str
-            The concept tag name (e.g. ``"Revenues"``).
+        concept : str | None (optional, Default=None)
+            The concept tag name (e.g. ``"Revenues"``). ``None``
+            exports every concept in ``taxonomy``.
 
         unit : str | None (optional, Default=None)
             If provided, filter to a specific unit of measure.
@@ -788,13 +804,40 @@ class Facts:
         ### Returns
         ----
         pandas.DataFrame:
-            DataFrame with columns: ``end``, ``start``, ``value``,
-            ``form``, ``filed``, ``fiscal_year``, ``fiscal_period``,
-            ``accession_number``, ``frame``.
+            DataFrame with columns: ``accession_number``, ``end``,
+            ``filed``, ``fiscal_period``, ``fiscal_year``, ``form``,
+            ``frame``, ``start``, ``value``. Panels (no ``concept``)
+            are prefixed with ``taxonomy``, ``concept`` and ``unit``.
+
+        ### Usage
+        ----
+            >>> facts.to_dataframe("us-gaap", "Revenues", unit="USD")
+            >>> panel = facts.to_dataframe("us-gaap")
         """
         pd = _require_pandas()
-        facts = self.get(taxonomy, concept, unit=unit)
-        return to_dataframe(facts) if facts else pd.DataFrame()
+        if taxonomy is None and concept is not None:
+            raise ValueError("taxonomy is required when concept is given.")
+
+        table = self._table
+        positions = table.select(taxonomy, concept, unit)
+        if not positions:
+            return pd.DataFrame()
+
+        data = {}
+        if concept is None:
+            data["taxonomy"] = table.take(table.taxonomy, positions)
+            data["concept"] = table.take(table.concept, positions)
+            data["unit"] = table.take(table.unit, positions)
+        for name, column in table.columns.items():
+            data[name] = table.take(column, positions)
+        return pd.DataFrame(data)
+
+    @cached_property
+    def _table(self) -> FactTable:
+        """Columnar index of all facts, built on first use."""
+        from edgar.tables import FactTable  # pylint: disable=import-outside-toplevel
+
+        return FactTable(self.raw.get("facts", {}))
 
     def __repr__(self) -> str:
         tax_count = len(self.taxonomies)
@@ -859,7 +902,7 @@ class Facts:
         return _to_csv_impl([self], path=path)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SearchResult:
     """A single EDGAR full-text search (EFTS) hit.
 
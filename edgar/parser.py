@@ -2,20 +2,237 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import xml.etree.ElementTree as ET
 
-from typing import Callable, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Iterator, Union
 
 import defusedxml.ElementTree as DefusedET
 
-from bs4 import Tag
-from bs4 import BeautifulSoup
-
 from edgar.exceptions import EdgarParseError
 
+# bs4 is only needed by the HTML scrapers; it's imported on first use.
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, SoupStrainer, Tag
+
 logger = logging.getLogger(__name__)
 
+# XML parser backends accepted by ``EdgarParser``.
+PARSER_BACKENDS = ("auto", "etree", "lxml")
+
+# Characters (or bytes) of a feed page fed to the lxml pull parser at a time.
+FEED_CHUNK_SIZE = 64 * 1024
+
+_ATOM_NAMESPACE = "{http://www.w3.org/2005/Atom}"
+_ATOM_ENTRY = _ATOM_NAMESPACE + "entry"
+_ATOM_LINK = _ATOM_NAMESPACE + "link"
+
+# Marks a page whose next link hasn't been read yet.
+_NO_LINK = object()
+
+# The elements each HTML scraper reads; the rest of the page is skipped
+# while parsing. Matched elements keep their whole subtree, so nested
+# tables stay in document order for ``find_all("table")[n]``.
+_ISSUER_ELEMENTS = ("table", "input")
+_VARIABLE_PRODUCTS_ELEMENTS = ("center", "table")
+_CURRENT_EVENT_ELEMENTS = ("pre",)
+_SERIES_ELEMENTS = ("table",)
+
+
+def _require_lxml():
+    """Import and return ``lxml.etree``, raising a helpful error if missing."""
+    try:
+        from lxml import etree  # pylint: disable=import-outside-toplevel
+        return etree
+    except ImportError as exc:
+        raise ImportError(
+            "lxml is required for the fast parser backend. "
+            "Install it with: pip install python-sec[fast]"
+        ) from exc
+
+
+def _resolve_backend(backend: str):
+    """Returns ``lxml.etree`` for the lxml backend, ``None`` for ElementTree."""
+
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"backend must be one of {list(PARSER_BACKENDS)}, got {backend!r}")
+    if backend == "etree":
+        return None
+    if backend == "lxml":
+        return _require_lxml()
+    try:
+        return _require_lxml()
+    except ImportError:
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _tag_keys(tag: str) -> tuple[str, str]:
+    """Dict keys for an element tag: ``(without text, with text)``.
+
+    Elements with text have hyphens turned into underscores; elements
+    without text keep the bare tag name, which their attribute keys
+    are built from.
+    """
+
+    name = tag.replace(_ATOM_NAMESPACE, "")
+    return name, name.replace("-", "_")
+
+
+@functools.lru_cache(maxsize=4096)
+def _attribute_key(name: str, attribute: str) -> str:
+    """Dict key for an attribute of the element keyed *name*."""
+    return name + "_" + attribute.replace("-", "_")
+
+
+def _flatten_entry(elements) -> dict:
+    """Flattens the elements of an entry into one dict.
+
+    Shared by both backends so their output is identical.
+    """
+
+    entry_element_dict = {}
+    for element in elements:
+        name, text_name = _tag_keys(element.tag)
+        text = element.text
+
+        if text:
+            name = text_name
+            entry_element_dict[name] = text.strip()
+
+        attributes = element.attrib
+        if attributes:
+            for key, value in attributes.items():
+                entry_element_dict[_attribute_key(name, key)] = value
+
+    return entry_element_dict
+
+
+class FeedStream:
+
+    """
+    ## Overview
+    ----
+    Iterates the entries of a paginated browse-edgar Atom feed without
+    holding the whole result set in memory. While the caller consumes
+    one page, the next page is already being downloaded on a
+    background thread.
+
+    ``offset`` is the ``start`` value that resumes the query right
+    after the last entry the caller finished with: it advances when the
+    *next* entry is requested, so an entry interrupted mid-processing
+    is delivered again on resume.
+
+    ### Usage
+    ----
+        >>> stream = edgar_client.filings().iter_query(cik="320193")
+        >>> for filing in stream:
+        ...     save(filing)
+        ...     checkpoint(stream.offset)
+    """
+
+    def __init__(
+        self,
+        parser: EdgarParser,
+        response_text: str | bytes | None,
+        fetch_page: Callable[[str], bytes | None] | None = None,
+        start: int = 0,
+        limit: int | None = None,
+        path: str = "atom:entry",
+    ) -> None:
+        self.offset = start or 0
+        self._parser = parser
+        self._fetch_page = fetch_page
+        self._stop_at = None if limit is None else self.offset + limit
+        self._path = path
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: Future | None = None
+        self._entries = self._generate(response_text)
+
+    def __repr__(self) -> str:
+        return f"<FeedStream offset={self.offset}>"
+
+    def __iter__(self) -> Iterator[dict]:
+        return self
+
+    def __next__(self) -> dict:
+        return next(self._entries)
+
+    def __enter__(self) -> FeedStream:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stops the stream and cancels any page still being prefetched."""
+
+        self._entries.close()
+        self._shutdown()
+
+    def _generate(self, response_text: str | bytes | None) -> Iterator[dict]:
+        """Yields entries page by page, prefetching each next page."""
+
+        if not response_text:
+            return
+
+        try:
+            page = self._parser.parse_page(page_content=response_text, path=self._path)
+            while page is not None:
+                entries, next_page = page
+
+                # Start downloading the next page before handing out this one.
+                page_end = self.offset + len(entries)
+                wants_more = self._stop_at is None or page_end < self._stop_at
+                if next_page and self._fetch_page and wants_more:
+                    self._prefetch(next_page)
+
+                for entry in entries:
+                    if self._stop_at is not None and self.offset >= self._stop_at:
+                        return
+                    yield entry
+                    self.offset += 1
+
+                page = self._next_page()
+        finally:
+            self._shutdown()
+
+    def _prefetch(self, url: str) -> None:
+        """Fetches and parses *url* on the background thread."""
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="edgar-feed")
+        logger.debug("Prefetching next URL: %s", url)
+        self._pending = self._executor.submit(self._load_page, url)
+
+    def _load_page(self, url: str) -> tuple[list[dict], str | None] | None:
+        """Downloads and parses one page; ``None`` when it's empty."""
+
+        page_content = self._fetch_page(url)
+        if not page_content:
+            return None
+        return self._parser.parse_page(page_content=page_content, path=self._path)
+
+    def _next_page(self) -> tuple[list[dict], str | None] | None:
+        """Waits for the prefetched page, if one was requested."""
+
+        if self._pending is None:
+            return None
+        pending, self._pending = self._pending, None
+        return pending.result()
+
+    def _shutdown(self) -> None:
+        """Releases the prefetch thread."""
+
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
 
 class EdgarParser:
 
@@ -26,7 +243,7 @@ class EdgarParser:
     and will reorganize data into more structured formats.
     """
 
-    def __init__(self):
+    def __init__(self, backend: str = "auto"):
         """Initalizes the `EdgarParser` Object.
 
         Parsing filings, can change depending on the filing you're working with
@@ -37,14 +254,36 @@ class EdgarParser:
         In cases, where the user needs to parse RSS feeds for the company search, then the
         parser will grab all the XML content and convert it to a Python dictionary. Additionally,
         it will grab all the next pages and parse thoses if specified.
+
+        ### Parameters
+        ----
+        backend : str (optional, Default="auto")
+            The parser backend. ``"lxml"`` parses Atom feeds incrementally
+            with ``lxml`` and builds BeautifulSoup trees with its HTML
+            parser (``pip install python-sec[fast]``). ``"etree"`` uses
+            ``defusedxml`` and ``html.parser``, and ``"auto"`` picks
+            ``lxml`` when it's installed. Both produce identical results.
         """
 
+        self.backend = backend
+        if backend != "auto":
+            self._lxml = _resolve_backend(backend)
         self.entries_namespace = {
             "atom": "http://www.w3.org/2005/Atom",
             "atom_with_quote": "{http://www.w3.org/2005/Atom}",
             "": "",
         }
 
+    @functools.cached_property
+    def _lxml(self):
+        """``lxml.etree`` if the backend uses it, else ``None``. ``"auto"`` resolves it on first use."""
+        return _resolve_backend(self.backend)
+
+    @property
+    def html_features(self) -> str:
+        """The BeautifulSoup tree builder matching the backend."""
+        return "html.parser" if self._lxml is None else "lxml"
+
     def parse_entries(
         self,
         response_text: str,
@@ -67,23 +306,15 @@ class EdgarParser:
             original entry element.
         """
 
-        # Parse the text (using defusedxml to prevent XXE attacks).
-        try:
-            root = DefusedET.fromstring(response_text)
-        except ET.ParseError as exc:
-            raise EdgarParseError(f"Failed to parse XML response: {exc}") from exc
+        page_entries, next_page = self.parse_page(page_content=response_text, path=path)
         entries = []
-        keep_going = True
 
         if start:
             current_count = start
         else:
             current_count = 0
 
-        while keep_going:
-
-            # Check for the next page Link, if there is one.
-            next_page = self.check_for_next_page(root_document=root)
+        while True:
 
             # Grab the next page.
             if next_page and start:
@@ -91,35 +322,156 @@ class EdgarParser:
             elif next_page:
                 current_count = int(next_page.split("&start=")[1])
 
-            # Find all the entries.
-            for entry in root.findall(path=path, namespaces=self.entries_namespace):
-
-                # Parse the individual entry.
-                entry_dict = self.parse_entry_element(entry=entry)
-                entries.append(entry_dict)
+            entries.extend(page_entries)
 
             # If there is a next page continue.
-            if not next_page:
-                keep_going = False
-            elif fetch_page:
-                page_content = fetch_page(next_page)
-                logger.debug("Grabbed next URL: %s", next_page)
+            if not next_page or not fetch_page:
+                break
 
-                if page_content:
-                    try:
-                        root = DefusedET.fromstring(page_content)
-                    except ET.ParseError as exc:
-                        raise EdgarParseError(f"Failed to parse next page XML: {exc}") from exc
-                else:
-                    keep_going = False
+            page_content = fetch_page(next_page)
+            logger.debug("Grabbed next URL: %s", next_page)
+            if not page_content:
+                break
 
-                if num_of_items and num_of_items < current_count:
-                    keep_going = False
-            else:
-                keep_going = False
+            page_entries, next_page = self.parse_page(page_content=page_content, path=path)
+
+            if num_of_items and num_of_items < current_count:
+                break
 
         return entries
 
+    def iter_entries(
+        self,
+        response_text: str | bytes | None,
+        fetch_page: Callable[[str], bytes | None] | None = None,
+        start: int = 0,
+        limit: int | None = None,
+        path: str = "atom:entry",
+    ) -> FeedStream:
+        """Streams entries from an Atom feed, one page at a time.
+
+        The generator counterpart of ``parse_entries``: entries are
+        yielded as each page is parsed, and the next page is fetched in
+        the background while the caller works through the current one.
+
+        ### Parameters
+        ----
+        response_text : str | bytes | None
+            The first page of the feed. ``None`` gives an empty stream.
+
+        fetch_page : Callable[[str], bytes | None] | None (optional, Default=None)
+            Fetches a next-page URL. ``None`` stops after the first page.
+
+        start : int (optional, Default=0)
+            The ``start`` offset the first page was requested with.
+
+        limit : int | None (optional, Default=None)
+            Maximum number of entries to yield. ``None`` means all.
+
+        ### Returns
+        ----
+        FeedStream:
+            An iterator of entry dicts with a resumable ``offset``.
+        """
+
+        return FeedStream(
+            parser=self,
+            response_text=response_text,
+            fetch_page=fetch_page,
+            start=start,
+            limit=limit,
+            path=path,
+        )
+
+    def parse_page(self, page_content: str | bytes, path: str = "atom:entry") -> tuple[list[dict], str | None]:
+        """Parses one page of an Atom feed.
+
+        With the lxml backend the page is parsed incrementally: each
+        entry is converted as soon as its closing tag is read and then
+        cleared, so the page's tree is never held in full.
+
+        ### Parameters
+        ----
+        page_content : str | bytes
+            The raw feed page.
+
+        path : str (optional, Default="atom:entry")
+            The path of the entry elements, relative to the feed.
+
+        ### Returns
+        ----
+        tuple[list[dict], str | None]:
+            The page's entries, as ``parse_entry_element`` dicts, and
+            the URL of the next page, if there is one.
+        """
+
+        if self._lxml is not None and path == "atom:entry":
+            return self._iterparse_page(page_content)
+
+        # Parse the text (using defusedxml to prevent XXE attacks).
+        try:
+            root = DefusedET.fromstring(page_content)
+        except ET.ParseError as exc:
+            raise EdgarParseError(f"Failed to parse XML response: {exc}") from exc
+
+        entries = [
+            self.parse_entry_element(entry=entry)
+            for entry in root.findall(path=path, namespaces=self.entries_namespace)
+        ]
+        return entries, self.check_for_next_page(root_document=root)
+
+    def _iterparse_page(self, page_content: str | bytes) -> tuple[list[dict], str | None]:
+        """Parses a feed page with the lxml pull parser."""
+
+        etree = self._lxml
+        # No DTDs, entity expansion or network access, like defusedxml.
+        pull_parser = etree.XMLPullParser(
+            events=("end",),
+            tag=(_ATOM_ENTRY, _ATOM_LINK),
+            resolve_entities=False,
+            load_dtd=False,
+            no_network=True,
+        )
+        entries = []
+        next_page = _NO_LINK
+
+        try:
+            for offset in range(0, len(page_content), FEED_CHUNK_SIZE):
+                pull_parser.feed(page_content[offset:offset + FEED_CHUNK_SIZE])
+                next_page = self._read_events(pull_parser, entries, next_page)
+            pull_parser.close()
+            next_page = self._read_events(pull_parser, entries, next_page)
+        except etree.XMLSyntaxError as exc:
+            raise EdgarParseError(f"Failed to parse XML response: {exc}") from exc
+
+        return entries, None if next_page is _NO_LINK else next_page
+
+    def _read_events(self, pull_parser, entries: list[dict], next_page: object) -> object:
+        """Converts the entries the pull parser has finished so far."""
+
+        etree = self._lxml
+        for _, element in pull_parser.read_events():
+            parent = element.getparent()
+
+            # Only direct children of the feed count, as with ``findall``.
+            if parent is None or parent.getparent() is not None:
+                continue
+
+            if element.tag == _ATOM_LINK:
+                # Like ``check_for_next_page``, only the first one counts.
+                if next_page is _NO_LINK and element.get("rel") == "next":
+                    next_page = element.get("href")
+                continue
+
+            entries.append(_flatten_entry(element.iterdescendants(etree.Element)))
+
+            # Drop the finished entry and everything before it.
+            element.clear()
+            while element.getprevious() is not None:
+                del parent[0]
+
+        return next_page
+
     def parse_entry_element(self, entry: ET.ElementTree, path: str = "./") -> dict:
         """Converts the XML entry element into a python dictionary.
 
@@ -134,24 +486,11 @@ class EdgarParser:
             A dictionary version of the entry element.
         """
 
-        entry_element_dict = {}
-        replace_tag = self.entries_namespace["atom_with_quote"]
-
-        for entry_itm in entry.findall(path=path, namespaces=self.entries_namespace):
-
-            for element in entry_itm.iter():
-                name = element.tag.replace(replace_tag, "")
-
-                if element.text:
-                    name = name.replace("-", "_")
-                    entry_element_dict[name] = element.text.strip()
-
-                if element.attrib:
-                    for key, value in element.attrib.items():
-                        key = key.replace("-", "_")
-                        entry_element_dict[name + f"_{key}"] = value
-
-        return entry_element_dict
+        return _flatten_entry(
+            element
+            for entry_itm in entry.findall(path=path, namespaces=self.entries_namespace)
+            for element in entry_itm.iter()
+        )
 
     def check_for_next_page(self, root_document: ET.Element) -> Union[str, None]:
         """Checks if the RSS Feed has a next page.
@@ -183,6 +522,11 @@ class EdgarParser:
 
         return next_page_url
 
+    def _make_soup(self, markup: str | bytes, parse_only: tuple[str, ...]) -> BeautifulSoup:
+        """Parses only the *parse_only* elements of an HTML page (with their subtrees)."""
+        from bs4 import BeautifulSoup, SoupStrainer  # pylint: disable=import-outside-toplevel,redefined-outer-name
+        return BeautifulSoup(markup, self.html_features, parse_only=SoupStrainer(list(parse_only)))
+
     def _parse_issuer_next_button(self, button_soup: Tag) -> str | None:
         """Parses the next button in the issuer report.
 
@@ -239,7 +583,7 @@ class EdgarParser:
         master_list = []
         ownership_report_for_issuers = []
 
-        soup = BeautifulSoup(response_text, "html.parser")
+        soup = self._make_soup(response_text, parse_only=_ISSUER_ELEMENTS)
         next_page_link = self._parse_issuer_next_button(button_soup=soup)
 
         while soup is not None:
@@ -291,7 +635,7 @@ class EdgarParser:
             if next_page_link and fetch_page:
                 page_content = fetch_page(next_page_link)
                 if page_content:
-                    soup = BeautifulSoup(page_content, "html.parser")
+                    soup = self._make_soup(page_content, parse_only=_ISSUER_ELEMENTS)
                     next_page_link = self._parse_issuer_next_button(button_soup=soup)
                 else:
                     soup = None
@@ -398,7 +742,7 @@ class EdgarParser:
             A list of variable products.
         """
         # Parse the Page.
-        product_page_soup = BeautifulSoup(response_text, "html.parser")
+        product_page_soup = self._make_soup(response_text, parse_only=_VARIABLE_PRODUCTS_ELEMENTS)
 
         # Check for the other links.
         href_links = self._check_center_tag(product_table_soup=product_page_soup)
@@ -414,8 +758,8 @@ class EdgarParser:
             if fetch_page:
                 page_content = fetch_page(link)
                 if page_content:
-                    product_page_soup = BeautifulSoup(
-                        markup=page_content, features="html.parser"
+                    product_page_soup = self._make_soup(
+                        page_content, parse_only=_VARIABLE_PRODUCTS_ELEMENTS
                     )
                 else:
                     continue
@@ -543,7 +887,7 @@ class EdgarParser:
         master_list = []
 
         # Parse the Page.
-        current_event_soup = BeautifulSoup(response_text, "html.parser")
+        current_event_soup = self._make_soup(response_text, parse_only=_CURRENT_EVENT_ELEMENTS)
 
         # Grab the <Pre> tag.
         current_event_pre: Tag = current_event_soup.find("pre")
@@ -610,7 +954,7 @@ class EdgarParser:
             A list of variable products.
         """
         # Parse the Page.
-        series_page_soup = BeautifulSoup(response_text, "html.parser")
+        series_page_soup = self._make_soup(response_text, parse_only=_SERIES_ELEMENTS)
         series_table: Tag = series_page_soup.find_all(name="table")[5]
 
         # Find all the rows.
@@ -0,0 +1,292 @@
+"""Pluggable rate limiters shared by the sync and async SEC EDGAR sessions."""
+
+from __future__ import annotations
+
+import logging
+import os
+import struct
+import threading
+import time
+from abc import ABC, abstractmethod
+
+logger = logging.getLogger(__name__)
+
+# On-disk layout for ``FileRateLimiter``: (tokens, updated_at) as two doubles.
+_STATE = struct.Struct("<dd")
+
+if os.name == "nt":  # pragma: no cover - Windows
+    import msvcrt
+
+    def _lock_fd(fd: int) -> None:
+        """Takes an exclusive lock on the state record of *fd*."""
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, _STATE.size)
+
+    def _unlock_fd(fd: int) -> None:
+        """Releases the lock taken by ``_lock_fd``."""
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, _STATE.size)
+
+else:
+    import fcntl
+
+    def _lock_fd(fd: int) -> None:
+        """Takes an exclusive lock on *fd*."""
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock_fd(fd: int) -> None:
+        """Releases the lock taken by ``_lock_fd``."""
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def _refill(
+    tokens: float,
+    updated: float,
+    now: float,
+    rate: float,
+    burst: int,
+) -> tuple[float, float]:
+    """Takes one token from a bucket and returns ``(tokens, wait)``.
+
+    ``tokens`` may go negative: a negative balance is a reservation
+    queue, and ``wait`` is how long the caller must sleep before its
+    reserved slot comes up.
+    """
+
+    tokens = _level(tokens, updated, now, rate, burst) - 1.0
+    wait = -tokens / rate if tokens < 0 else 0.0
+    return tokens, wait
+
+
+def _level(tokens: float, updated: float, now: float, rate: float, burst: int) -> float:
+    """Returns the bucket balance at ``now``, refilled since ``updated``."""
+    return min(float(burst), tokens + max(0.0, now - updated) * rate)
+
+
+class RateLimiter(ABC):
+    """Interface for request rate limiters.
+
+    Implementations hand out *reservations*: ``reserve()`` claims the
+    next request slot and returns how long to wait before using it,
+    without sleeping itself. That keeps the critical section short and
+    lets the same limiter drive both blocking (``acquire``) and
+    ``asyncio`` (``acquire_async``) callers.
+    """
+
+    @abstractmethod
+    def reserve(self) -> float:
+        """Claims the next request slot and returns the seconds to wait."""
+
+    def pause(self, seconds: float) -> None:
+        """Holds back every user of the limiter for ``seconds``.
+
+        The sessions call this when SEC answers ``429 Too Many
+        Requests``, so all threads (or processes) sharing the limiter
+        back off together instead of each retrying on its own. The
+        default implementation does nothing.
+        """
+
+    async def reserve_async(self) -> float:
+        """``reserve`` for ``asyncio`` callers.
+
+        The default calls ``reserve`` directly, which is fine for
+        in-memory limiters. Limiters whose ``reserve`` can block (e.g.
+        on a file lock) run it in a worker thread instead.
+        """
+
+        return self.reserve()
+
+    async def pause_async(self, seconds: float) -> None:
+        """``pause`` for ``asyncio`` callers. See ``reserve_async``."""
+
+        self.pause(seconds)
+
+    def acquire(self) -> float:
+        """Blocks until a request may be sent. Returns the time slept."""
+
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Awaits until a request may be sent. Returns the time slept."""
+
+        # Imported here so sync-only programs don't load asyncio.
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        wait = await self.reserve_async()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """Thread-safe token bucket for sharing one budget across threads.
+
+    With the default ``burst=1`` requests are spaced evenly at
+    ``1 / rate`` seconds, so no one-second window ever holds more than
+    ``rate`` requests no matter how many threads share the limiter.
+
+    ### Usage
+    ----
+        >>> limiter = TokenBucketRateLimiter(rate=10)
+        >>> edgar_client = EdgarClient(user_agent="...", rate_limiter=limiter)
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """Initializes the ``TokenBucketRateLimiter``.
+
+        ### Parameters
+        ----
+        rate : float
+            Sustained requests per second.
+
+        burst : int (optional, Default=1)
+            Bucket capacity — how many requests may be sent back to
+            back after an idle period.
+        """
+
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<TokenBucketRateLimiter rate={self.rate} burst={self.burst}>"
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, wait = _refill(
+                self._tokens, self._updated, now, self.rate, self.burst,
+            )
+            self._updated = now
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        # Drop (never raise) the balance to ``-seconds * rate``: the next
+        # slot is ``seconds`` away and queued reservations stay behind it.
+        with self._lock:
+            now = time.monotonic()
+            tokens = _level(self._tokens, self._updated, now, self.rate, self.burst)
+            self._tokens = min(tokens, -seconds * self.rate)
+            self._updated = now
+
+
+class FileRateLimiter(RateLimiter):
+    """Token bucket stored in a lock-protected file shared across processes.
+
+    Every process (and thread) pointing at the same ``path`` draws from
+    one budget, so N workers on a host share exactly ``rate`` requests
+    per second. The bucket state is two doubles guarded by an exclusive
+    ``flock`` (``msvcrt.locking`` on Windows); timestamps use wall-clock
+    ``time.time()`` because ``monotonic`` isn't comparable across
+    processes.
+
+    ### Usage
+    ----
+        >>> limiter = FileRateLimiter("/tmp/sec-edgar.ratelimit", rate=10)
+        >>> edgar_client = EdgarClient(user_agent="...", rate_limiter=limiter)
+    """
+
+    def __init__(self, path: str, rate: float, burst: int = 1) -> None:
+        """Initializes the ``FileRateLimiter``.
+
+        ### Parameters
+        ----
+        path : str
+            State file shared by all cooperating processes. Created
+            if missing.
+
+        rate : float
+            Sustained requests per second for the whole host.
+
+        burst : int (optional, Default=1)
+            Bucket capacity after an idle period.
+        """
+
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+
+        self.path = os.path.expanduser(path)
+        self.rate = rate
+        self.burst = burst
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        # flock is per open file description, so threads sharing this
+        # instance need their own mutex on top of the file lock.
+        self._thread_lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<FileRateLimiter path={self.path!r} rate={self.rate} burst={self.burst}>"
+
+    def reserve(self) -> float:
+        with self._thread_lock:
+            self._lock_file()
+            try:
+                now = time.time()
+                tokens, updated = self._read_state(now)
+                tokens, wait = _refill(tokens, updated, now, self.rate, self.burst)
+                self._write_state(tokens, now)
+            finally:
+                self._unlock_file()
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        with self._thread_lock:
+            self._lock_file()
+            try:
+                now = time.time()
+                tokens = _level(*self._read_state(now), now, self.rate, self.burst)
+                self._write_state(min(tokens, -seconds * self.rate), now)
+            finally:
+                self._unlock_file()
+
+    async def reserve_async(self) -> float:
+        # Taking the file lock waits for other processes; keep that off the event loop.
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        return await asyncio.to_thread(self.reserve)
+
+    async def pause_async(self, seconds: float) -> None:
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        await asyncio.to_thread(self.pause, seconds)
+
+    def close(self) -> None:
+        """Closes the state file descriptor."""
+
+        os.close(self._fd)
+
+    def _read_state(self, now: float) -> tuple[float, float]:
+        """Reads ``(tokens, updated_at)``; a new file starts full."""
+
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        raw = os.read(self._fd, _STATE.size)
+        if len(raw) == _STATE.size:
+            return _STATE.unpack(raw)
+        return float(self.burst), now
+
+    def _write_state(self, tokens: float, updated: float) -> None:
+        """Writes ``(tokens, updated_at)`` back to the state file."""
+
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        os.write(self._fd, _STATE.pack(tokens, updated))
+
+    def _lock_file(self) -> None:
+        """Takes an exclusive lock on the state file."""
+
+        _lock_fd(self._fd)
+
+    def _unlock_file(self) -> None:
+        """Releases the lock taken by ``_lock_file``."""
+
+        _unlock_fd(self._fd)
@@ -0,0 +1,207 @@
+"""Retry policy shared by the sync and async SEC EDGAR sessions."""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from edgar.instrumentation import RequestHooks
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying: SEC throttling (429) and transient server or
+# gateway errors. Anything else (404, 403, ...) fails immediately.
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+MAX_RETRIES = 5
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """Parses a ``Retry-After`` header into seconds from now.
+
+    ### Parameters
+    ----
+    value : str | None
+        The header value: either delay-seconds (``"120"``) or an
+        HTTP-date (``"Wed, 21 Oct 2015 07:28:00 GMT"``).
+
+    now : float | None (optional, Default=None)
+        Current Unix time, for HTTP-dates. Defaults to ``time.time()``.
+
+    ### Returns
+    ----
+    float | None:
+        Non-negative seconds to wait, or ``None`` if the header is
+        missing or unparseable.
+    """
+
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at - (time.time() if now is None else now))
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long the sessions wait before retrying a request.
+
+    A request is retried when the transport fails (connection errors,
+    timeouts) or SEC answers with one of ``retry_statuses``. The delay
+    before retry *n* is jittered exponential backoff, between half and
+    all of ``min(backoff_cap, backoff_base * 2 ** (n - 1))``, raised to
+    the server's ``Retry-After`` when that asks for longer. Retrying
+    stops after ``max_retries`` retries or once the next attempt would
+    start more than ``deadline`` seconds after the first one.
+
+    ### Usage
+    ----
+        >>> edgar_client = EdgarClient(user_agent="...", retry_policy=RetryPolicy(max_retries=2, deadline=10))
+        >>> edgar_client = EdgarClient(user_agent="...", retry_policy=RetryPolicy(max_retries=0))
+    """
+
+    max_retries: int = MAX_RETRIES
+    backoff_base: float = 0.5
+    backoff_cap: float = 8.0
+    deadline: float = 60.0
+    retry_statuses: frozenset[int] = RETRYABLE_STATUSES
+
+    def __post_init__(self) -> None:
+        if self.max_retries < 0:
+            raise ValueError(f"max_retries must be non-negative, got {self.max_retries}")
+        if self.backoff_base <= 0 or self.backoff_cap < self.backoff_base:
+            raise ValueError("backoff_base must be positive and no larger than backoff_cap")
+        if self.deadline <= 0:
+            raise ValueError(f"deadline must be positive, got {self.deadline}")
+
+    def is_retryable(self, status: int) -> bool:
+        """Whether a response with HTTP ``status`` should be retried."""
+        return status in self.retry_statuses
+
+    def backoff(self, attempt: int) -> float:
+        """Jittered exponential delay, in seconds, before retry ``attempt`` (1-based)."""
+
+        ceiling = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        return ceiling * random.uniform(0.5, 1.0)
+
+    def next_delay(self, attempt: int, elapsed: float, retry_after: str | None = None) -> float | None:
+        """Returns the wait before retry ``attempt``, or ``None`` to give up.
+
+        ### Parameters
+        ----
+        attempt : int
+            The retry about to be made, starting at 1.
+
+        elapsed : float
+            Seconds since the first attempt was sent.
+
+        retry_after : str | None (optional, Default=None)
+            The failed response's ``Retry-After`` header, if any.
+
+        ### Returns
+        ----
+        float | None:
+            Seconds to wait, or ``None`` when the retry budget or the
+            deadline is exhausted.
+        """
+
+        if attempt > self.max_retries:
+            return None
+        delay = max(self.backoff(attempt), parse_retry_after(retry_after) or 0.0)
+        if elapsed + delay > self.deadline:
+            return None
+        return delay
+
+
+class RetryAttempts:
+    """Classifies the attempts of one request for the sessions' ``_send``.
+
+    Both sessions send, then hand the response (or transport error) to
+    ``next_delay()``, which reports it to ``hooks`` and decides whether
+    the request is finished or should be retried after a delay. The
+    sessions only do the I/O: sending, sleeping, pausing the rate
+    limiter and closing discarded responses.
+    """
+
+    def __init__(
+        self,
+        policy: RetryPolicy,
+        hooks: RequestHooks,
+        method: str,
+        url: str,
+        *,
+        stream: bool = False,
+    ) -> None:
+        self.policy = policy
+        self.hooks = hooks
+        self.method = method
+        self.url = url
+        self.stream = stream
+        self.attempt = 0
+        self._first_sent = time.monotonic()
+        hooks.notify("on_request_start", method, url)
+
+    def next_delay(self, response: Any, error: Exception | None, started: float) -> float | None:
+        """Returns the wait before retrying, or ``None`` once *response* is final.
+
+        ### Parameters
+        ----
+        response : requests.Response | httpx.Response | None
+            The attempt's response, or ``None`` if the transport failed.
+
+        error : Exception | None
+            The transport error, when there is no response.
+
+        started : float
+            ``time.perf_counter()`` when the attempt was sent.
+
+        ### Returns
+        ----
+        float | None:
+            Seconds to wait before the next attempt, or ``None`` when
+            the caller should return *response*: it succeeded, failed
+            with a status that isn't retried, or the policy gave up.
+
+        ### Raises
+        ----
+        Exception:
+            *error*, once the policy gives up on a transport failure.
+        """
+
+        status = None if response is None else response.status_code
+        if response is not None:
+            retryable = self.policy.is_retryable(status)
+            if retryable or not self.stream:
+                self.hooks.notify(
+                    "on_response", self.method, self.url, status=status,
+                    elapsed=time.perf_counter() - started, size=0 if self.stream else len(response.content),
+                )
+            if not retryable:
+                return None
+
+        self.attempt += 1
+        retry_after = None if response is None else response.headers.get("Retry-After")
+        delay = self.policy.next_delay(self.attempt, time.monotonic() - self._first_sent, retry_after)
+        if delay is None:
+            if error is not None:
+                raise error
+            return None
+
+        logger.warning(
+            "%s %s failed (%s), retry %d/%d in %.2fs",
+            self.method.upper(), self.url, status or error, self.attempt, self.policy.max_retries, delay,
+        )
+        self.hooks.notify(
+            "on_retry", self.method, self.url, status=status, attempt=self.attempt, wait=delay, error=error,
+        )
+        return delay
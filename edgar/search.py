@@ -3,13 +3,50 @@
 from __future__ import annotations
 
 import logging
+from datetime import date, timedelta
+from typing import Iterator
 
-from edgar.session import EdgarSession
+from edgar.batch import DEFAULT_MAX_WORKERS, run_threaded
+from edgar.exceptions import EdgarRequestError
+from edgar.models import SearchResult
+from edgar.session import POOL_MAXSIZE, EdgarSession
 
 logger = logging.getLogger(__name__)
 
 EFTS_BASE_URL = "https://efts.sec.gov"
 
+# EFTS pages hold at most 100 hits, and only the first 10,000 hits of a
+# query can be paged to (``from + size`` must stay within the window).
+EFTS_PAGE_SIZE = 100
+EFTS_MAX_RESULTS = 10_000
+
+# Full-text search covers filings from 2001 onwards.
+EFTS_EARLIEST_DATE = "2001-01-01"
+
+
+def plan_offsets(total: int) -> range:
+    """The ``from`` offsets of the pages after the first for *total* hits."""
+
+    return range(EFTS_PAGE_SIZE, min(total, EFTS_MAX_RESULTS), EFTS_PAGE_SIZE)
+
+
+def split_date_range(start_date: str | None, end_date: str | None) -> list[tuple[str, str]] | None:
+    """Splits a ``YYYY-MM-DD`` range into two halves.
+
+    Open ends default to ``EFTS_EARLIEST_DATE`` and today. Returns
+    ``None`` when the range is a single day and can't be split.
+    """
+
+    start = date.fromisoformat(start_date or EFTS_EARLIEST_DATE)
+    end = date.fromisoformat(end_date) if end_date else date.today()
+    if start >= end:
+        return None
+    middle = start + (end - start) // 2
+    return [
+        (start.isoformat(), middle.isoformat()),
+        ((middle + timedelta(days=1)).isoformat(), end.isoformat()),
+    ]
+
 
 class Search:
     """
@@ -113,3 +150,138 @@ class Search:
             params=params,
             base_url=EFTS_BASE_URL,
         )
+
+    def iter_search(  # pylint: disable=too-many-positional-arguments
+        self,
+        q: str,
+        form_types: list[str] | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> Iterator[SearchResult]:
+        """Streams every hit of a search, across as many pages as needed.
+
+        The first page gives ``hits.total``; the offsets of the other
+        pages are planned from it and fetched concurrently on a thread
+        pool, all drawing from the session's rate limiter. Hits are
+        yielded in page order and de-duplicated by ``_id``.
+
+        EFTS only pages through the first ``EFTS_MAX_RESULTS`` hits of a
+        query. When a date range matches more, it is split in half and
+        each half is searched on its own, until every range fits.
+
+        ### Parameters
+        ----
+        q : str
+            The search query. Use double quotes for exact
+            phrase matching (e.g. ``'"revenue recognition"'``).
+
+        form_types : list[str] | None (optional, Default=None)
+            Filter by form types (e.g. ``["10-K", "10-Q"]``).
+
+        start_date : str | None (optional, Default=None)
+            Start of date range filter (``YYYY-MM-DD``).
+
+        end_date : str | None (optional, Default=None)
+            End of date range filter (``YYYY-MM-DD``).
+
+        max_workers : int (optional, Default=DEFAULT_MAX_WORKERS)
+            Number of pages in flight. Must be between 1 and
+            ``POOL_MAXSIZE``.
+
+        ### Returns
+        ----
+        Iterator[SearchResult]:
+            Every matching hit, once.
+
+        ### Raises
+        ----
+        EdgarRequestError:
+            If a page can't be fetched.
+
+        ### Usage
+        ----
+            >>> search_service = edgar_client.full_text_search()
+            >>> for result in search_service.iter_search(q='"going concern"', form_types=["10-K"]):
+            ...     print(result.filing_date, result.company_name)
+        """
+
+        if not 1 <= max_workers <= POOL_MAXSIZE:
+            raise ValueError(
+                f"max_workers must be between 1 and {POOL_MAXSIZE}, got {max_workers}"
+            )
+
+        return self._iter_search(q, form_types, start_date, end_date, max_workers)
+
+    def _iter_search(  # pylint: disable=too-many-positional-arguments,too-many-locals
+        self,
+        q: str,
+        form_types: list[str] | None,
+        start_date: str | None,
+        end_date: str | None,
+        max_workers: int,
+    ) -> Iterator[SearchResult]:
+        """Implements ``iter_search``, one date range at a time."""
+
+        seen: set[str] = set()
+        # Ranges still to search, the earliest on top.
+        ranges = [(start_date, end_date)]
+
+        while ranges:
+            start_date, end_date = ranges.pop()
+
+            def search_page(offset: int, start_date=start_date, end_date=end_date) -> dict:
+                raw = self.full_text_search(
+                    q=q,
+                    form_types=form_types,
+                    start_date=start_date,
+                    end_date=end_date,
+                    start=offset,
+                    size=EFTS_PAGE_SIZE,
+                )
+                if raw is None:
+                    raise EdgarRequestError(f"EFTS returned no results page at offset {offset}")
+                return raw
+
+            def fetch(offset: int, search_page=search_page) -> list[dict]:
+                return search_page(offset).get("hits", {}).get("hits", [])
+
+            first = search_page(0)
+            total = first.get("hits", {}).get("total", {})
+            count = total.get("value", 0)
+
+            if count > EFTS_MAX_RESULTS or (count == EFTS_MAX_RESULTS and total.get("relation") == "gte"):
+                halves = split_date_range(start_date, end_date)
+                if halves is not None:
+                    logger.debug("EFTS query matches %d+ hits, splitting %s", count, halves)
+                    ranges.extend(reversed(halves))
+                    continue
+                logger.warning(
+                    "EFTS query matches more than %d hits on %s; only the first %d are returned",
+                    EFTS_MAX_RESULTS, start_date, EFTS_MAX_RESULTS,
+                )
+
+            yield from _unseen(first.get("hits", {}).get("hits", []), seen)
+
+            # Pages complete out of order; hold them until their turn.
+            pages: dict[int, list[dict]] = {}
+            next_offset = EFTS_PAGE_SIZE
+            for result in run_threaded(fetch, plan_offsets(count), max_workers=max_workers):
+                if not result.ok:
+                    raise result.error
+                pages[result.key] = result.value
+                while next_offset in pages:
+                    yield from _unseen(pages.pop(next_offset), seen)
+                    next_offset += EFTS_PAGE_SIZE
+
+
+def _unseen(hits: list[dict], seen: set[str]) -> Iterator[SearchResult]:
+    """Wraps the *hits* whose ``_id`` isn't in *seen*, adding theirs."""
+
+    for hit in hits:
+        hit_id = hit.get("_id")
+        if hit_id:
+            if hit_id in seen:
+                continue
+            seen.add(hit_id)
+        yield SearchResult(raw=hit)
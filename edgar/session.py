@@ -2,26 +2,39 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import logging
 import time
-from collections import deque
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Callable, Union
 
 import requests
-from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
 
+from edgar.disk_cache import DiskCache, charset_of, decode_body
+from edgar.downloads import PartialFile, save_document, validator_of
 from edgar.exceptions import EdgarRequestError
+from edgar.instrumentation import RequestHooks
 from edgar.parser import EdgarParser
+from edgar.rate_limiter import TokenBucketRateLimiter
+from edgar.retry import RetryAttempts, RetryPolicy
+from edgar.single_flight import SingleFlight
 from edgar.utils import EdgarUtilities
 
 if TYPE_CHECKING:
+    from edgar.bulk_data import BulkData
     from edgar.client import EdgarClient
+    from edgar.disk_cache import CachedResponse
+    from edgar.snapshot import TickerSnapshot
+    from edgar.rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
-MAX_RETRIES = 5
 MAX_REQUESTS_PER_SECOND = 10
+# Connections kept alive per host; sized for ``EdgarClient.fetch_many`` workers.
+POOL_MAXSIZE = 32
+# Bytes read per iteration when streaming large downloads to disk.
+STREAM_CHUNK_SIZE = 1024 * 1024
 
 
 class EdgarSession:
@@ -33,12 +46,16 @@ class EdgarSession:
     handles all the requests made to EDGAR.
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-positional-arguments
         self,
         client: EdgarClient,
         user_agent: str,
         rate_limit: int = MAX_REQUESTS_PER_SECOND,
         cache: object | None = None,
+        disk_cache: DiskCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        hooks: RequestHooks | None = None,
+        retry_policy: RetryPolicy | None = None,
     ) -> None:
         """Initializes the `EdgarSession` client.
 
@@ -56,6 +73,25 @@ class EdgarSession:
         cache : TTLCache | None (optional, Default=None)
             Shared TTL cache instance. ``None`` disables caching.
 
+        disk_cache : DiskCache | None (optional, Default=None)
+            Persistent HTTP response cache. When set, ``GET`` requests
+            are served from disk while fresh and revalidated with
+            ``If-None-Match``/``If-Modified-Since`` once stale.
+
+        rate_limiter : RateLimiter | None (optional, Default=None)
+            Limiter shared with other sessions, threads or processes.
+            ``None`` creates a private ``TokenBucketRateLimiter`` at
+            ``rate_limit`` requests per second.
+
+        hooks : RequestHooks | None (optional, Default=None)
+            Instrumentation callbacks notified of every request,
+            response, retry, throttle wait and cache hit. ``None``
+            creates an empty ``RequestHooks`` to subscribe to later.
+
+        retry_policy : RetryPolicy | None (optional, Default=None)
+            Which failures are retried and how long to back off.
+            ``None`` uses ``RetryPolicy()``.
+
         ### Usage
         ----
             >>> edgar_client = EdgarClient(user_agent="Your Name your-email@example.com")
@@ -73,23 +109,30 @@ class EdgarSession:
         self.api_resource = "https://data.sec.gov"
         self.user_agent = user_agent
         self.cache = cache
+        self.disk_cache = disk_cache
 
-        # Sliding-window rate limiter: track timestamps of recent requests.
-        self._request_times: deque[float] = deque()
         self._rate_limit = rate_limit
+        self.rate_limiter: RateLimiter = rate_limiter or TokenBucketRateLimiter(rate=rate_limit)
+        self.hooks = hooks if hooks is not None else RequestHooks()
+        self.retry_policy = retry_policy or RetryPolicy()
+
+        # Local bulk archives (``BulkData``), set by ``EdgarClient(bulk_dir=...)``.
+        self.bulk_data: BulkData | None = None
+
+        # Memory-mapped ticker indexes, set by ``EdgarClient(cache_dir=...)``.
+        self.ticker_snapshot: TickerSnapshot | None = None
+
+        # GET requests in flight, so concurrent identical ones are sent once.
+        self.in_flight = SingleFlight()
 
         # Create a single reusable session with connection pooling.
         self.http_session = requests.Session()
         self.http_session.verify = True
         self.http_session.headers.update({"user-agent": self.user_agent})
 
-        # Mount retry adapter for resilience.
-        retry_strategy = Retry(
-            total=MAX_RETRIES,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Retries are handled by ``_send`` under ``retry_policy``, so the
+        # adapter itself never retries.
+        adapter = HTTPAdapter(max_retries=0, pool_maxsize=POOL_MAXSIZE)
         self.http_session.mount("https://", adapter)
         self.http_session.mount("http://", adapter)
 
@@ -189,6 +232,30 @@ class EdgarSession:
         # Build the URL.
         url = self.build_url(endpoint=endpoint, use_api=use_api, base_url=base_url)
 
+        send = functools.partial(self._request, method, url, params, data, json_payload)
+        if method.upper() != "GET":
+            return send()
+
+        # Identical GETs already in flight on another thread share its response.
+        result, shared = self.in_flight.do(DiskCache.make_key(url, params), send)
+        if shared:
+            logger.debug("Coalesced with in-flight request: %s", url)
+            self.hooks.notify("on_cache_hit", method, url, cache="coalesced")
+            # Each caller gets its own copy, so one mutating the parsed
+            # JSON can't change what the others see.
+            return copy.deepcopy(result)
+        return result
+
+    def _request(  # pylint: disable=too-many-positional-arguments
+        self,
+        method: str,
+        url: str,
+        params: dict | None,
+        data: dict | None,
+        json_payload: dict | None,
+    ) -> Union[dict, str, None]:
+        """Sends one request to *url* for ``make_request``."""
+
         logger.debug("URL: %s", url)
         logger.debug("Parameters: %s", params)
 
@@ -201,39 +268,27 @@ class EdgarSession:
             "json": json_payload,
         }
 
-        # Enforce SEC rate limit before sending.
-        self._throttle()
-
-        # Send the request with retry logic.
+        # Serve fresh GET responses from the disk cache, revalidate stale ones.
+        cache_key, cached = None, None
+        if method.upper() == "GET":
+            cache_key, cached = self._disk_cache_lookup(url=url, params=params)
+            if cached is not None and cached.is_fresh:
+                self.hooks.notify("on_cache_hit", method, url, cache="disk")
+                return decode_body(cached.body, cached.content_type)
+            if cached is not None:
+                request_kwargs["headers"] = cached.conditional_headers()
+
+        # Send the request, retrying transient failures.
         try:
-            response: requests.Response = self.http_session.request(**request_kwargs)
+            response: requests.Response = self._send(
+                method, url, functools.partial(self.http_session.request, **request_kwargs)
+            )
         except requests.RequestException as exc:
             logger.error("Request failed: %s", exc)
             raise EdgarRequestError(f"Request to {url} failed: {exc}") from exc
 
-        # Retry on non-200 with backoff, up to MAX_RETRIES.
-        retries = 0
-        while response.status_code != 200 and retries < MAX_RETRIES:
-            retries += 1
-            sleep_time = 2**retries
-            logger.warning(
-                "Non-200 status %s, retry %s/%s in %ss",
-                response.status_code,
-                retries,
-                MAX_RETRIES,
-                sleep_time,
-            )
-            time.sleep(sleep_time)
-
-            try:
-                response = self.http_session.request(**request_kwargs)
-            except requests.RequestException as exc:
-                logger.error("Retry %s failed: %s", retries, exc)
-                if retries >= MAX_RETRIES:
-                    raise EdgarRequestError(
-                        f"Request to {url} failed after {MAX_RETRIES} retries: {exc}"
-                    ) from exc
-                continue
+        if self._record(cache_key, url, response, cached, method=method):
+            return decode_body(cached.body, cached.content_type)
 
         if response.status_code != 200:
             try:
@@ -265,37 +320,96 @@ class EdgarSession:
 
         return None
 
-    def _throttle(self) -> None:
-        """Enforces the SEC rate limit using a sliding-window algorithm.
+    def _throttle(self, method: str = "GET", url: str = "") -> None:
+        """Blocks until ``rate_limiter`` grants the next request slot.
 
-        Tracks the timestamp of each outgoing request in a deque.
-        If ``MAX_REQUESTS_PER_SECOND`` requests have been made within
-        the last 1-second window, sleeps until the oldest one falls
-        outside the window.
+        The limiter only hands out a reservation; the sleep happens
+        here, outside its lock, so other threads can queue behind us.
         """
 
-        now = time.monotonic()
+        wait = self.rate_limiter.reserve()
+        if wait > 0:
+            logger.debug("Rate limit: sleeping %.3fs", wait)
+            self.hooks.notify("on_throttle_wait", method, url, wait=wait)
+            time.sleep(wait)
 
-        # Discard timestamps older than 1 second.
-        while self._request_times and (now - self._request_times[0]) >= 1.0:
-            self._request_times.popleft()
+    def _send(
+        self,
+        method: str,
+        url: str,
+        send: Callable[[], requests.Response],
+        stream: bool = False,
+    ) -> requests.Response:
+        """Sends a request through ``send()``, retrying as ``retry_policy`` allows.
+
+        Every attempt waits for the rate limiter and is reported to
+        ``hooks``. Connection errors, timeouts and the policy's retry
+        statuses are retried after a jittered backoff that honors
+        ``Retry-After``; a ``429`` also pauses the rate limiter, so
+        every request sharing it backs off together. Once the policy
+        gives up, the last response is returned (or the last transport
+        error raised) for the caller to handle as before.
+
+        With ``stream=True`` the body of the returned response is left
+        unread for the caller, which reports it to ``hooks`` itself.
+        """
 
-        # If at capacity, wait until the oldest request exits the window.
-        if len(self._request_times) >= self._rate_limit:
-            sleep_duration = 1.0 - (now - self._request_times[0])
-            if sleep_duration > 0:
-                logger.debug(
-                    "Rate limit: %d requests in window, sleeping %.3fs",
-                    len(self._request_times),
-                    sleep_duration,
-                )
-                time.sleep(sleep_duration)
-            # After sleeping, discard expired timestamps again.
-            now = time.monotonic()
-            while self._request_times and (now - self._request_times[0]) >= 1.0:
-                self._request_times.popleft()
+        attempts = RetryAttempts(self.retry_policy, self.hooks, method, url, stream=stream)
+        while True:
+            self._throttle(method, url)
+            started = time.perf_counter()
+            try:
+                response, error = send(), None
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                response, error = None, exc
+
+            delay = attempts.next_delay(response, error, started)
+            if delay is None:
+                return response
+            if response is not None:
+                if response.status_code == 429:
+                    self.rate_limiter.pause(delay)
+                response.close()
+            time.sleep(delay)
+
+    def _disk_cache_lookup(
+        self,
+        url: str,
+        params: dict | None = None,
+    ) -> tuple[str | None, CachedResponse | None]:
+        """Returns the disk cache key and stored entry (if any) for a GET."""
 
-        self._request_times.append(time.monotonic())
+        if self.disk_cache is None:
+            return None, None
+        cache_key = self.disk_cache.make_key(url, params)
+        return cache_key, self.disk_cache.get(cache_key)
+
+    def _record(
+        self,
+        cache_key: str | None,
+        url: str,
+        response: requests.Response,
+        cached: CachedResponse | None,
+        *,
+        method: str = "GET",
+    ) -> bool:
+        """Records a GET response in the disk cache; ``True`` if it revalidated ``cached``."""
+
+        if cache_key is None:
+            return False
+        revalidated = self.disk_cache.record(cache_key, url, response, cached)
+        if revalidated:
+            self.hooks.notify("on_cache_hit", method, url, cache="revalidated")
+        return revalidated
+
+    def _conditional_get(self, url: str, cached: CachedResponse | None) -> requests.Response:
+        """Sends a GET, adding revalidation headers when a stale entry exists."""
+
+        if cached is None:
+            send = functools.partial(self.http_session.get, url)
+        else:
+            send = functools.partial(self.http_session.get, url, headers=cached.conditional_headers())
+        return self._send("GET", url, send)
 
     def fetch_page(self, url: str) -> bytes | None:
         """Fetches a raw page by URL, returning bytes or None on failure.
@@ -304,18 +418,185 @@ class EdgarSession:
         does not need its own HTTP session.
         """
 
-        self._throttle()
+        cache_key, cached = self._disk_cache_lookup(url=url)
+        if cached is not None and cached.is_fresh:
+            self.hooks.notify("on_cache_hit", "GET", url, cache="disk")
+            return cached.body
 
         try:
-            response = self.http_session.get(url)
+            response = self._conditional_get(url, cached)
         except requests.RequestException as exc:
             raise EdgarRequestError(f"Failed to fetch page {url}: {exc}") from exc
 
+        if self._record(cache_key, url, response, cached):
+            return cached.body
+
         if response.status_code == 200:
             return response.content
         return None
 
-    def download(self, url: str, path: str | None = None) -> str | bytes:
+    def stream_to_file(self, url: str, fileobj, chunk_size: int = STREAM_CHUNK_SIZE) -> bool:
+        """Streams a (large) response body into an open binary file.
+
+        Unlike ``fetch_page`` the body is never held in memory and the
+        disk cache is bypassed, which suits multi-hundred-megabyte bulk
+        archives.
+
+        ### Parameters
+        ----
+        url : str
+            The full URL to download.
+
+        fileobj : BinaryIO
+            A writable binary file object.
+
+        chunk_size : int (optional, Default=STREAM_CHUNK_SIZE)
+            Bytes read from the socket per iteration.
+
+        ### Returns
+        ----
+        bool:
+            ``True`` if the body was written, ``False`` if SEC answered
+            with a non-200 status (mirroring ``fetch_page`` returning
+            ``None``).
+        """
+
+        started, written = time.perf_counter(), 0
+        try:
+            send = functools.partial(self.http_session.get, url, stream=True)
+            with self._send("GET", url, send, stream=True) as response:
+                if response.status_code == 200:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        fileobj.write(chunk)
+                        written += len(chunk)
+        except requests.RequestException as exc:
+            raise EdgarRequestError(f"Failed to stream {url}: {exc}") from exc
+
+        self.hooks.notify(
+            "on_response", "GET", url, status=response.status_code,
+            elapsed=time.perf_counter() - started, size=written,
+        )
+        if response.status_code != 200:
+            logger.debug("Streaming %s returned status %d", url, response.status_code)
+            return False
+        return True
+
+    def download_to_file(  # pylint: disable=too-many-positional-arguments
+        self,
+        url: str,
+        path: str,
+        checksum: str | None = None,
+        resume: bool = True,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> str:
+        """Streams a (large) file to disk, resuming interrupted transfers.
+
+        The body is written chunk by chunk to ``<path>.part`` and never
+        held in memory or decoded. A connection dropped mid-body is
+        resumed with an HTTP ``Range`` request (up to
+        ``retry_policy.max_retries`` times), and so is a ``.part`` file
+        left behind by an earlier call. Once complete and verified the
+        file is renamed to ``path`` atomically. The disk cache is
+        bypassed.
+
+        ### Parameters
+        ----
+        url : str
+            The full URL to download.
+
+        path : str
+            Where to save the file.
+
+        checksum : str | None (optional, Default=None)
+            Expected ``"algorithm:hexdigest"`` (e.g. ``"sha256:..."``).
+            On a mismatch the partial file is deleted and
+            ``EdgarRequestError`` is raised.
+
+        resume : bool (optional, Default=True)
+            Continue an existing ``<path>.part``; ``False`` starts over.
+
+        chunk_size : int (optional, Default=STREAM_CHUNK_SIZE)
+            Bytes read from the socket per iteration.
+
+        ### Returns
+        ----
+        str:
+            The ``path`` written.
+
+        ### Usage
+        ----
+            >>> edgar_session.download_to_file(
+                url="https://www.sec.gov/Archives/edgar/Feed/2024/QTR1/20240102.nc.tar.gz",
+                path="20240102.nc.tar.gz",
+            )
+        """
+
+        target = PartialFile(path, checksum=checksum, resume=resume)
+        interruptions = 0
+        while True:
+            try:
+                if self._stream_into(url, target, chunk_size):
+                    return target.finish()
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as exc:
+                interruptions += 1
+                if interruptions > self.retry_policy.max_retries:
+                    raise EdgarRequestError(f"Failed to download {url}: {exc}") from exc
+                delay = self.retry_policy.backoff(interruptions)
+                logger.warning(
+                    "Download of %s interrupted at byte %d (%s), resuming in %.2fs",
+                    url, target.offset, exc, delay,
+                )
+                time.sleep(delay)
+
+    def _stream_into(self, url: str, target: PartialFile, chunk_size: int) -> bool:
+        """Sends one (ranged) GET and appends its body to ``target``.
+
+        Returns ``False`` when the ``.part`` file had to be discarded and
+        the download should start over. Transport errors while reading
+        the body propagate so ``download_to_file`` can resume.
+        """
+
+        send = functools.partial(self.http_session.get, url, stream=True, headers=target.range_headers())
+        started = time.perf_counter()
+        try:
+            sent = self._send("GET", url, send, stream=True)
+        except requests.RequestException as exc:
+            raise EdgarRequestError(f"Failed to download {url}: {exc}") from exc
+
+        with sent as response:
+            status = response.status_code
+            content_range = response.headers.get("Content-Range")
+            validator = validator_of(response.headers)
+            if target.is_complete(status, content_range, validator):
+                return True
+            if status == 416 and target.offset:
+                logger.debug("Discarding %s: server rejected its range", target.partial_path)
+                target.restart()
+                return False
+            if status not in (200, 206):
+                raise EdgarRequestError(f"Download from {url} returned status {status}")
+
+            if not target.begin(status, content_range, validator):
+                return False
+            written = target.written
+            try:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    target.write(chunk)
+            finally:
+                target.close()
+                self.hooks.notify(
+                    "on_response", "GET", url, status=status,
+                    elapsed=time.perf_counter() - started, size=target.written - written,
+                )
+        return True
+
+    def download(
+        self,
+        url: str,
+        path: str | None = None,
+        stream: bool = False,
+        checksum: str | None = None,
+    ) -> str | bytes:
         """Downloads a filing document from a full SEC URL.
 
         ### Parameters
@@ -327,6 +608,15 @@ class EdgarSession:
             If provided, saves the content to this file path
             and returns the path. Otherwise returns the content.
 
+        stream : bool (optional, Default=False)
+            Stream the body straight to ``path`` with
+            ``download_to_file`` instead of buffering it in memory.
+            Requires ``path``; implied by ``checksum``.
+
+        checksum : str | None (optional, Default=None)
+            Expected ``"algorithm:hexdigest"`` of the file, verified
+            before it is moved into place.
+
         ### Returns
         ----
         str | bytes:
@@ -335,29 +625,46 @@ class EdgarSession:
             If ``path`` is given, returns the path string.
         """
 
-        self._throttle()
+        if stream or checksum:
+            return self.download_to_file(url, path, checksum=checksum)
 
-        try:
-            response = self.http_session.get(url)
-        except requests.RequestException as exc:
-            raise EdgarRequestError(f"Failed to download {url}: {exc}") from exc
+        content = self._fetch_document(url)
+        if path is not None:
+            return save_document(path, content)
+        return content
 
-        if response.status_code != 200:
-            raise EdgarRequestError(
-                f"Download from {url} returned status {response.status_code}"
-            )
+    def _fetch_document(self, url: str) -> str | bytes:
+        """Fetches a document for ``download``, through the disk cache when there is one.
+
+        Text content types are decoded to ``str``; anything else is
+        returned as ``bytes``.
+        """
+
+        cache_key, cached = self._disk_cache_lookup(url=url)
+
+        if cached is not None and cached.is_fresh:
+            self.hooks.notify("on_cache_hit", "GET", url, cache="disk")
+            content_type = cached.content_type
+            body = cached.body
+        else:
+            try:
+                response = self._conditional_get(url, cached)
+            except requests.RequestException as exc:
+                raise EdgarRequestError(f"Failed to download {url}: {exc}") from exc
+
+            if self._record(cache_key, url, response, cached):
+                content_type, body = cached.content_type, cached.body
+            elif response.status_code != 200:
+                raise EdgarRequestError(f"Download from {url} returned status {response.status_code}")
+            else:
+                content_type = response.headers.get("Content-Type", "")
+                body = None
 
-        content_type = response.headers.get("Content-Type", "")
         is_text = any(
             ct in content_type for ct in ["text/", "application/json", "application/xml"]
         )
-        content = response.text if is_text else response.content
-
-        if path is not None:
-            mode = "w" if is_text else "wb"
-            encoding = "utf-8" if is_text else None
-            with open(path, mode, encoding=encoding) as f:
-                f.write(content)
-            return path
-
-        return content
+        if body is None:
+            return response.text if is_text else response.content
+        if is_text:
+            return body.decode(charset_of(content_type), errors="replace")
+        return body
@@ -0,0 +1,103 @@
+"""In-flight request coalescing: concurrent callers for one key share one call."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Awaitable, Callable, Hashable, TypeVar
+
+if TYPE_CHECKING:
+    import asyncio
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time across threads.
+
+    The first caller for a key (the leader) runs the call; callers that
+    arrive while it is running wait for it and get the same result, or
+    the same exception. Once it finishes, the next caller starts a new
+    call, so results are never reused beyond the calls they overlapped.
+
+    ### Usage
+    ----
+        >>> flights = SingleFlight()
+        >>> value, shared = flights.do("CIK0000320193", fetch)
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}
+
+    def __len__(self) -> int:
+        """The number of calls in flight."""
+
+        with self._lock:
+            return len(self._calls)
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> tuple[T, bool]:
+        """Runs ``func()`` unless a call for *key* is already running.
+
+        ### Returns
+        ----
+        tuple[T, bool]:
+            The result, and whether it came from another caller's call.
+        """
+
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result(), True
+
+        try:
+            result = func()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """``asyncio`` counterpart of ``SingleFlight``.
+
+    The leader's coroutine runs as a task that every caller awaits
+    through ``asyncio.shield``, so one caller being cancelled doesn't
+    cancel the request for the others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        """The number of calls in flight."""
+
+        return len(self._calls)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """Awaits ``func()`` unless a call for *key* is already running.
+
+        ### Returns
+        ----
+        tuple[T, bool]:
+            The result, and whether it came from another caller's call.
+        """
+
+        # Imported here so sync-only programs don't load asyncio.
+        import asyncio  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+        task = self._calls.get(key)
+        shared = task is not None
+        if not shared:
+            task = self._calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task), shared
@@ -0,0 +1,355 @@
+"""Memory-mapped snapshots of SEC's ``company_tickers.json`` for fast cold starts."""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterator, Mapping, Sequence
+
+from edgar.cache import TTL_TICKERS
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILENAME = "company_tickers.snapshot"
+
+_MAGIC = b"EDGARTKR"
+_VERSION = 1
+
+# magic, version, created_at (epoch seconds), entry count.
+_HEADER = struct.Struct("<8sIdI")
+# cik, ticker offset, title offset, ticker length, title length.
+_ENTRY = struct.Struct("<IIIHH")
+_POSITION = struct.Struct("<I")
+
+
+def write_snapshot(path: str, entries: list[dict], created_at: float | None = None) -> None:
+    """Writes ticker *entries* to a snapshot file at *path*.
+
+    The layout is a fixed header, one fixed-width record per entry (in
+    SEC's order), the entry positions sorted by ticker and by CIK, and
+    a UTF-8 string pool. Lookups bisect the sorted positions in place,
+    so a reader never parses or copies the whole file.
+
+    The file is written next to *path* and renamed over it, so readers
+    (including other processes) see the old snapshot or the new one,
+    never a partial write; processes that mapped the old file keep
+    reading it until they reopen.
+    """
+
+    pool = bytearray()
+    records = []
+    for entry in entries:
+        ticker = entry["ticker"].encode("utf-8")
+        title = entry["title"].encode("utf-8")
+        ticker_offset = len(pool)
+        pool += ticker
+        title_offset = len(pool)
+        pool += title
+        records.append(_ENTRY.pack(int(entry["cik_str"]), ticker_offset, title_offset, len(ticker), len(title)))
+
+    # Sorting is stable, so the first entry listing a ticker (or CIK) comes first.
+    by_ticker = sorted(range(len(entries)), key=lambda i: entries[i]["ticker"].upper())
+    by_cik = sorted(range(len(entries)), key=lambda i: int(entries[i]["cik_str"]))
+
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(_HEADER.pack(_MAGIC, _VERSION, time.time() if created_at is None else created_at, len(entries)))
+        file.write(b"".join(records))
+        file.write(b"".join(_POSITION.pack(i) for i in by_ticker))
+        file.write(b"".join(_POSITION.pack(i) for i in by_cik))
+        file.write(pool)
+    os.replace(temp_path, path)
+
+
+class TickerTable(Sequence):
+    """Read-only view of a ticker snapshot file.
+
+    Indexing yields the same ``{"cik_str", "ticker", "title"}`` dicts as
+    ``company_tickers.json``, built on access. ``ticker_to_cik`` and
+    ``cik_to_entries`` are mappings answered by binary search over the
+    mapped file, so opening a table costs a header read regardless of
+    its size, and the pages are shared by every process mapping it.
+    """
+
+    __slots__ = ("path", "created_at", "_buffer", "_count", "_ticker_order", "_cik_order", "_pool")
+
+    def __init__(self, path: str) -> None:
+        """Maps the snapshot at *path*.
+
+        ### Raises
+        ----
+        ValueError:
+            If the file isn't a snapshot this version can read.
+        """
+
+        self.path = path
+        with open(path, "rb") as file:
+            self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._buffer) < _HEADER.size:
+            raise ValueError(f"{path} is not a ticker snapshot")
+        magic, version, self.created_at, self._count = _HEADER.unpack_from(self._buffer)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{path} is not a version {_VERSION} ticker snapshot")
+
+        self._ticker_order = _HEADER.size + self._count * _ENTRY.size
+        self._cik_order = self._ticker_order + self._count * _POSITION.size
+        self._pool = self._cik_order + self._count * _POSITION.size
+        if len(self._buffer) < self._pool:
+            raise ValueError(f"{path} is truncated")
+
+    def __repr__(self) -> str:
+        return f"<TickerTable path={self.path!r} entries={self._count}>"
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._entry(i) for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("ticker table index out of range")
+        return self._entry(index)
+
+    def __iter__(self) -> Iterator[dict]:
+        return (self._entry(i) for i in range(self._count))
+
+    @property
+    def ticker_to_cik(self) -> Mapping[str, int]:
+        """Upper-case ticker → CIK of the first entry listing it."""
+
+        # Built per access rather than stored, so the table and its views
+        # never form a cycle and the file unmaps with its last reference.
+        return _TickerToCik(self)
+
+    @property
+    def cik_to_entries(self) -> Mapping[int, list[dict]]:
+        """CIK → its entries, in SEC's order."""
+
+        return _CikToEntries(self)
+
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was written."""
+
+        return time.time() - self.created_at
+
+    def close(self) -> None:
+        """Unmaps the file. The table can't be read afterwards."""
+
+        self._buffer.close()
+
+    def _record(self, index: int) -> tuple[int, int, int, int, int]:
+        """The raw ``(cik, ticker offset, title offset, ticker length, title length)`` of entry *index*."""
+
+        return _ENTRY.unpack_from(self._buffer, _HEADER.size + index * _ENTRY.size)
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._pool + offset
+        return self._buffer[start:start + length].decode("utf-8")
+
+    def _entry(self, index: int) -> dict:
+        cik, ticker_offset, title_offset, ticker_length, title_length = self._record(index)
+        return {
+            "cik_str": cik,
+            "ticker": self._string(ticker_offset, ticker_length),
+            "title": self._string(title_offset, title_length),
+        }
+
+    def _position(self, order: int, rank: int) -> int:
+        """The entry position at *rank* of a sorted position array."""
+
+        return _POSITION.unpack_from(self._buffer, order + rank * _POSITION.size)[0]
+
+    def _ticker_at(self, rank: int) -> str:
+        _, offset, _, length, _ = self._record(self._position(self._ticker_order, rank))
+        return self._string(offset, length).upper()
+
+    def _cik_at(self, rank: int) -> int:
+        return self._record(self._position(self._cik_order, rank))[0]
+
+    def _find_ticker(self, ticker: str) -> int | None:
+        """The CIK of the first entry listing *ticker* (upper-case), if any."""
+
+        rank = bisect_left(range(self._count), ticker, key=self._ticker_at)
+        if rank < self._count and self._ticker_at(rank) == ticker:
+            return self._record(self._position(self._ticker_order, rank))[0]
+        return None
+
+    def _find_cik(self, cik: int) -> list[dict]:
+        """The entries of *cik*, in SEC's order."""
+
+        entries = []
+        for rank in range(bisect_left(range(self._count), cik, key=self._cik_at), self._count):
+            position = self._position(self._cik_order, rank)
+            if self._record(position)[0] != cik:
+                break
+            entries.append(self._entry(position))
+        return entries
+
+
+class _TickerToCik(Mapping):
+    """Upper-case ticker → CIK, read from a ``TickerTable``."""
+
+    __slots__ = ("_table",)
+
+    def __init__(self, table: TickerTable) -> None:
+        self._table = table
+
+    def __getitem__(self, ticker: str) -> int:
+        cik = self._table._find_ticker(ticker)  # pylint: disable=protected-access
+        if cik is None:
+            raise KeyError(ticker)
+        return cik
+
+    def __iter__(self) -> Iterator[str]:
+        seen = set()
+        for entry in self._table:
+            ticker = entry["ticker"].upper()
+            if ticker not in seen:
+                seen.add(ticker)
+                yield ticker
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class _CikToEntries(Mapping):
+    """CIK → its entries, read from a ``TickerTable``."""
+
+    __slots__ = ("_table",)
+
+    def __init__(self, table: TickerTable) -> None:
+        self._table = table
+
+    def __getitem__(self, cik: int) -> list[dict]:
+        entries = self._table._find_cik(cik)  # pylint: disable=protected-access
+        if not entries:
+            raise KeyError(cik)
+        return entries
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(dict.fromkeys(entry["cik_str"] for entry in self._table))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class TickerSnapshot:
+
+    """
+    ## Overview
+    ----
+    Keeps the ticker ↔ CIK indexes in a memory-mapped file so a new
+    process resolves tickers without fetching and re-indexing
+    ``company_tickers.json``.
+
+    ``EdgarClient`` and ``EdgarAsyncClient`` keep one in ``cache_dir``,
+    so clients (and processes) pointing at the same directory share it.
+    A snapshot older than ``max_age`` is still served; callers refresh
+    it in the background and the next process maps the new file.
+
+    ### Usage
+    ----
+        >>> snapshot = TickerSnapshot("~/.cache/python-sec")
+        >>> table = snapshot.load()
+        >>> table.ticker_to_cik["AAPL"]
+        320193
+    """
+
+    def __init__(self, directory: str, max_age: float = TTL_TICKERS) -> None:
+        """Initializes the ``TickerSnapshot``.
+
+        ### Parameters
+        ----
+        directory : str
+            Directory holding the snapshot file. Created if missing.
+
+        max_age : float (optional, Default=TTL_TICKERS)
+            Seconds after which ``stale`` reports the snapshot as due
+            for a refresh.
+        """
+
+        self.directory = os.path.expanduser(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.path = os.path.join(self.directory, SNAPSHOT_FILENAME)
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._table: TickerTable | None = None
+        self._stat: tuple[int, int] | None = None
+        self._refreshing = False
+
+    def __repr__(self) -> str:
+        return f"<TickerSnapshot path={self.path!r}>"
+
+    def load(self) -> TickerTable | None:
+        """Returns the mapped snapshot, or ``None`` if there is no usable one.
+
+        The file is mapped once and remapped only after another writer
+        replaced it. Unreadable files are logged and treated as absent.
+
+        A replaced table isn't closed here, since clients may still be
+        reading it; it is unmapped as soon as the last of them drops it.
+        """
+
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+
+        with self._lock:
+            key = (stat.st_ino, stat.st_mtime_ns)
+            if self._table is None or self._stat != key:
+                try:
+                    self._table = TickerTable(self.path)
+                except (OSError, ValueError) as exc:
+                    logger.warning("Ignoring ticker snapshot %s: %s", self.path, exc)
+                    return None
+                self._stat = key
+                logger.debug("Mapped ticker snapshot %s (%d entries)", self.path, len(self._table))
+            return self._table
+
+    def stale(self, table: TickerTable) -> bool:
+        """Whether *table* is older than ``max_age``."""
+
+        return table.age > self.max_age
+
+    def save(self, entries: list[dict]) -> None:
+        """Writes *entries* as the new snapshot. Failures are logged, not raised."""
+
+        try:
+            write_snapshot(self.path, entries)
+        except OSError as exc:
+            logger.warning("Could not write ticker snapshot %s: %s", self.path, exc)
+            return
+        logger.debug("Wrote ticker snapshot %s (%d entries)", self.path, len(entries))
+
+    def refresh(self, fetch: Callable[[], list[dict]]) -> None:
+        """Saves the entries returned by *fetch*, unless another refresh is running."""
+
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        try:
+            self.save(fetch())
+        except Exception as exc:  # pylint: disable=broad-except
+            # A failed refresh keeps serving the old snapshot.
+            logger.warning("Ticker snapshot refresh failed: %s", exc)
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def refresh_in_background(self, fetch: Callable[[], list[dict]]) -> threading.Thread:
+        """Runs ``refresh(fetch)`` on a daemon thread and returns the thread."""
+
+        thread = threading.Thread(target=self.refresh, args=(fetch,), name="ticker-snapshot-refresh", daemon=True)
+        thread.start()
+        return thread
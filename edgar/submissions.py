@@ -74,6 +74,8 @@ class Submissions():
             num_of_zeros = 10 - len(cik)
             cik = num_of_zeros*"0" + cik
 
+        endpoint = f'/submissions/CIK{cik}.json'
+
         # Check TTL cache.
         cache = self.edgar_session.cache
         cache_key = f"submissions:{cik}"
@@ -81,14 +83,28 @@ class Submissions():
             cached = cache.get(cache_key)
             if cached is not None:
                 logger.debug("Submissions cache hit for CIK %s", cik)
+                self.edgar_session.hooks.notify(
+                    "on_cache_hit", "GET", self.edgar_session.build_url(endpoint, use_api=True), cache="memory"
+                )
                 return cached
 
+        # Read from the local bulk archive, if there is a fresh one.
+        response = None
+        bulk_data = self.edgar_session.bulk_data
+        if bulk_data is not None:
+            response = bulk_data.lookup("submissions", cik)
+            if response is not None:
+                self.edgar_session.hooks.notify(
+                    "on_cache_hit", "GET", self.edgar_session.build_url(endpoint, use_api=True), cache="bulk"
+                )
+
         # Grab the Data.
-        response = self.edgar_session.make_request(
-            method='get',
-            endpoint=f'/submissions/CIK{cik}.json',
-            use_api=True
-        )
+        if response is None:
+            response = self.edgar_session.make_request(
+                method='get',
+                endpoint=endpoint,
+                use_api=True
+            )
 
         # Store in TTL cache.
         if cache is not None and response is not None:
@@ -0,0 +1,284 @@
+"""Columnar tables behind ``Facts`` and ``CompanyInfo.recent_table``.
+
+Both keep one list (or typed array) per column instead of a dict per
+row and hand out lightweight views of single rows on demand.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+from dataclasses import FrozenInstanceError
+from operator import itemgetter
+from typing import overload
+
+from edgar.models import Submission, _require_pandas
+
+
+# Column name → (raw key, default) for ``FactTable``. Names and defaults
+# mirror the ``Fact`` properties so a table export has the same columns
+# as ``to_dataframe(list[Fact])``.
+_FACT_COLUMNS: tuple[tuple[str, str, object], ...] = (
+    ("accession_number", "accn", ""),
+    ("end", "end", ""),
+    ("filed", "filed", ""),
+    ("fiscal_period", "fp", ""),
+    ("fiscal_year", "fy", 0),
+    ("form", "form", ""),
+    ("frame", "frame", ""),
+    ("start", "start", ""),
+    ("value", "val", None),
+)
+
+
+class FactTable:
+    """Columnar index over every data point in a company_facts response.
+
+    Rows are grouped by taxonomy, then concept, and sorted by ``end``
+    within each concept, so a taxonomy or a concept is a contiguous
+    ``range`` of row positions. A unit is the same range when the
+    concept has a single unit (the common case), otherwise a
+    precomputed array of positions. Each unit also keeps the sorted
+    positions of all its rows, so a unit within a taxonomy is a slice
+    found by ``bisect``. Column values are extracted once, so exports
+    are list slices handed to pandas in one call.
+    """
+
+    __slots__ = (
+        "rows", "taxonomy", "concept", "unit", "columns", "_taxonomies", "_concepts", "_units", "_unit_rows",
+    )
+
+    def __init__(self, facts_data: dict) -> None:
+        self.rows: list[dict] = []
+        self.taxonomy: list[str] = []
+        self.concept: list[str] = []
+        self.unit: list[str] = []
+        self._taxonomies: dict[str, range] = {}
+        self._concepts: dict[tuple[str, str], range] = {}
+        self._units: dict[tuple[str, str, str], Sequence[int]] = {}
+        self._unit_rows: dict[str, array] = {}
+
+        for taxonomy, concepts in facts_data.items():
+            taxonomy_start = len(self.rows)
+            for concept, concept_data in concepts.items():
+                self._add_concept(taxonomy, concept, concept_data.get("units", {}))
+            self._taxonomies[taxonomy] = range(taxonomy_start, len(self.rows))
+
+        self.columns: dict[str, list] = {
+            name: [row.get(key, default) for row in self.rows]
+            for name, key, default in _FACT_COLUMNS
+        }
+
+    def _add_concept(self, taxonomy: str, concept: str, units: dict) -> None:
+        """Appends one concept's rows in ``end`` order and indexes them."""
+
+        tagged = [(unit, entry) for unit, entries in units.items() for entry in entries]
+        tagged.sort(key=lambda pair: pair[1].get("end", ""))
+
+        start = len(self.rows)
+        positions: dict[str, array] = {unit: array("q") for unit in units}
+        for offset, (unit, entry) in enumerate(tagged):
+            positions[unit].append(start + offset)
+            self._unit_rows.setdefault(unit, array("q")).append(start + offset)
+            self.rows.append(entry)
+            self.taxonomy.append(taxonomy)
+            self.concept.append(concept)
+            self.unit.append(unit)
+
+        span = range(start, len(self.rows))
+        self._concepts[(taxonomy, concept)] = span
+        for unit, unit_positions in positions.items():
+            self._units[(taxonomy, concept, unit)] = span if len(units) == 1 else unit_positions
+
+    def select(
+        self,
+        taxonomy: str | None = None,
+        concept: str | None = None,
+        unit: str | None = None,
+    ) -> Sequence[int]:
+        """Returns the row positions matching the given keys, in row order."""
+
+        if concept is not None and taxonomy is not None:
+            if unit is None:
+                return self._concepts.get((taxonomy, concept), range(0))
+            return self._units.get((taxonomy, concept, unit), range(0))
+
+        span = range(len(self.rows)) if taxonomy is None else self._taxonomies.get(taxonomy, range(0))
+        if unit is None:
+            return span
+        positions = self._unit_rows.get(unit)
+        if positions is None:
+            return range(0)
+        return positions[bisect_left(positions, span.start):bisect_left(positions, span.stop)]
+
+    def take(self, column: list, positions: Sequence[int]) -> list:
+        """Gathers ``column`` values at ``positions`` without a Python loop."""
+
+        if isinstance(positions, range):
+            return column[positions.start:positions.stop]
+        if len(positions) == 1:
+            return [column[positions[0]]]
+        return list(itemgetter(*positions)(column))
+
+
+class _SubmissionRow(Submission):
+    """``Submission`` for row ``index`` of a ``SubmissionTable``.
+
+    Reads each property from the table's shared column arrays; ``raw``
+    is assembled from the columns on access. Compares equal to, and
+    pickles as, a plain ``Submission`` holding the same row.
+    """
+
+    __slots__ = ("_columns", "_index")
+
+    _columns: Mapping[str, Sequence]
+    _index: int
+
+    def __new__(cls, columns: Mapping[str, Sequence] | None = None, index: int = 0, *, raw: dict | None = None):
+        # ``dataclasses.replace()`` rebuilds rows as ``type(row)(raw=...)``;
+        # the result is a plain ``Submission``, since it no longer comes
+        # from the table.
+        if raw is not None:
+            return Submission(raw=raw)
+        return super().__new__(cls)
+
+    def __init__(self, columns: Mapping[str, Sequence], index: int) -> None:  # pylint: disable=super-init-not-called
+        object.__setattr__(self, "_columns", columns)
+        object.__setattr__(self, "_index", index)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Submission):
+            return NotImplemented
+        return self.raw == other.raw
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return (Submission, (self.raw,))
+
+    @property
+    def raw(self) -> dict:
+        """The filing as a ``{column: value}`` dict."""
+        return {key: column[self._index] for key, column in self._columns.items()}
+
+    def _get(self, key: str, default):
+        """Reads one field from the shared column."""
+        column = self._columns.get(key)
+        return default if column is None else column[self._index]
+
+
+# Submission property → (raw column, default). Names and defaults mirror
+# the ``Submission`` properties so a table export has the same columns
+# as ``to_dataframe(list[Submission])``.
+_SUBMISSION_COLUMNS: tuple[tuple[str, str, object], ...] = (
+    ("accession_number", "accessionNumber", ""),
+    ("filing_date", "filingDate", ""),
+    ("form", "form", ""),
+    ("is_inline_xbrl", "isInlineXBRL", 0),
+    ("is_xbrl", "isXBRL", 0),
+    ("primary_doc_description", "primaryDocDescription", ""),
+    ("primary_document", "primaryDocument", ""),
+    ("report_date", "reportDate", ""),
+    ("size", "size", 0),
+)
+
+# Integer columns stored as typed arrays (8 or 1 bytes per row) rather
+# than lists of int objects.
+_TYPED_SUBMISSION_COLUMNS = {"size": "q", "isXBRL": "b", "isInlineXBRL": "b"}
+
+
+class SubmissionTable(Sequence):
+    """Columnar view of a submissions ``filings.recent`` block.
+
+    Keeps SEC's column arrays as they are (integer columns become
+    typed arrays) and hands out ``Submission`` proxies that index
+    into them, so holding thousands of filings costs one small object
+    per row accessed instead of a dict per row.
+
+    ### Usage
+    ----
+        >>> table = edgar_client.company("AAPL").get_info().recent_table
+        >>> len(table)
+        1000
+        >>> table[0].form
+        '10-K'
+        >>> table.column("form")[:3]
+        ['10-K', '8-K', '10-Q']
+    """
+
+    __slots__ = ("columns", "_length")
+
+    def __init__(self, recent: Mapping[str, Sequence]) -> None:
+        self.columns: dict[str, Sequence] = {}
+        for key, values in recent.items():
+            code = _TYPED_SUBMISSION_COLUMNS.get(key)
+            if code is not None:
+                try:
+                    values = array(code, values)
+                except (TypeError, OverflowError):
+                    pass
+            self.columns[key] = values
+        self._length = min((len(values) for values in self.columns.values()), default=0)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> Submission: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Submission]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [_SubmissionRow(self.columns, i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("SubmissionTable index out of range")
+        return _SubmissionRow(self.columns, index)
+
+    def __iter__(self):
+        columns = self.columns
+        return (_SubmissionRow(columns, i) for i in range(self._length))
+
+    def __repr__(self) -> str:
+        return f"<SubmissionTable rows={self._length} columns={len(self.columns)}>"
+
+    def column(self, name: str) -> Sequence:
+        """Returns one column, by raw key (``"filingDate"``) or property name (``"filing_date"``)."""
+
+        for prop, key, _ in _SUBMISSION_COLUMNS:
+            if name == prop:
+                name = key
+                break
+        try:
+            values = self.columns[name]
+        except KeyError:
+            raise KeyError(f"No column {name!r} in submissions") from None
+        return values[:self._length]
+
+    def to_dataframe(self):
+        """Returns the filings as a pandas DataFrame, built from the columns.
+
+        Requires the ``pandas`` optional dependency. Columns match
+        ``to_dataframe(list[Submission])``.
+        """
+        pd = _require_pandas()
+        data = {}
+        for prop, key, default in _SUBMISSION_COLUMNS:
+            values = self.columns.get(key)
+            if values is None:
+                data[prop] = [default] * self._length
+            elif prop.startswith("is_"):
+                data[prop] = [bool(value) for value in values[:self._length]]
+            else:
+                data[prop] = values[:self._length]
+        return pd.DataFrame(data)
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import logging
+from array import array
+from collections import Counter
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING
 
 from edgar.cache import TTL_TICKERS
@@ -15,6 +18,154 @@ logger = logging.getLogger(__name__)
 
 TICKERS_ENDPOINT = "/files/company_tickers.json"
 _CACHE_KEY = "tickers"
+_INDEX_CACHE_KEY = "tickers:index"
+
+# Share of a query's trigrams a name must contain to be a fuzzy match.
+FUZZY_THRESHOLD = 0.5
+
+# Match ranks, best first.
+_EXACT_TICKER, _TICKER_PREFIX, _WORD_PREFIX, _SUBSTRING, _FUZZY = range(5)
+
+
+def _trigrams(text: str) -> set[str]:
+    """The distinct three-character substrings of *text*."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TickerIndex:
+    """Search index over the ``company_tickers.json`` entries.
+
+    Built once per ticker file, it answers ``Tickers.search`` without
+    scanning every entry: every trigram of ``"<ticker>\\0<title>"``
+    (lowercased) maps to the positions containing it, so a substring
+    query only checks the entries listed under its rarest trigram, and
+    fuzzy matching counts shared trigrams. Queries shorter than a
+    trigram scan the precomputed lowercased names, so they still match
+    anywhere in a ticker or title, as a plain substring search would.
+
+    Results are ranked exact ticker, ticker prefix, word prefix,
+    substring, then fuzzy; ties keep SEC's file order, which lists
+    the largest companies first.
+    """
+
+    __slots__ = ("entries", "_names", "_postings")
+
+    def __init__(self, entries: Sequence[dict]) -> None:
+        self.entries = entries
+        self._names: list[tuple[str, str]] = []
+        postings: dict[str, array] = {}
+
+        for position, entry in enumerate(entries):
+            ticker = entry["ticker"].lower()
+            title = entry["title"].lower()
+            key = f"{ticker}\0{title}"
+            self._names.append((ticker, title))
+            for gram in _trigrams(key):
+                bucket = postings.get(gram)
+                if bucket is None:
+                    bucket = postings[gram] = array("i")
+                bucket.append(position)
+
+        self._postings = postings
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def search(self, query: str, limit: int | None = None, fuzzy: bool = False) -> list[dict]:
+        """Returns the entries matching *query*, best first.
+
+        ### Parameters
+        ----
+        query : str
+            Case-insensitive ticker or company name fragment.
+
+        limit : int | None (optional, Default=None)
+            Maximum number of entries to return.
+
+        fuzzy : bool (optional, Default=False)
+            Also return names sharing most of the query's trigrams
+            (``FUZZY_THRESHOLD``), to tolerate typos. Needs at least
+            three characters.
+
+        ### Returns
+        ----
+        list[dict]:
+            Matching entries with keys: cik_str, ticker, title.
+        """
+
+        query = query.lower()
+        if not query:
+            return self.entries[:limit]
+
+        # position -> (rank, -shared trigrams); sorting on it plus the
+        # position keeps SEC's order within a rank.
+        ranks: dict[int, tuple[int, int]] = {}
+        for position in self._candidates(query):
+            rank = self._rank(query, position)
+            if rank is not None:
+                ranks[position] = (rank, 0)
+
+        if fuzzy and len(query) >= 3 and (limit is None or len(ranks) < limit):
+            for position, shared in self._fuzzy(query):
+                ranks.setdefault(position, (_FUZZY, -shared))
+
+        best = sorted(ranks, key=lambda position: (ranks[position], position))
+        return [self.entries[position] for position in best[:limit]]
+
+    def _candidates(self, query: str):
+        """Positions that may contain *query*, a superset of the matches."""
+
+        if len(query) >= 3:
+            buckets = [self._postings.get(gram) for gram in _trigrams(query)]
+            if not all(buckets):
+                return ()
+            return min(buckets, key=len)
+        return range(len(self._names))
+
+    def _rank(self, query: str, position: int) -> int | None:
+        """How well entry *position* matches, or ``None`` if it doesn't contain *query*."""
+
+        ticker, title = self._names[position]
+        if ticker == query:
+            return _EXACT_TICKER
+        if ticker.startswith(query):
+            return _TICKER_PREFIX
+        if title.startswith(query) or f" {query}" in title:
+            return _WORD_PREFIX
+        if query in ticker or query in title:
+            return _SUBSTRING
+        return None
+
+    def _fuzzy(self, query: str) -> list[tuple[int, int]]:
+        """``(position, shared trigrams)`` of entries sharing at least ``FUZZY_THRESHOLD`` of the query's."""
+
+        grams = _trigrams(query)
+        shared: Counter[int] = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+        needed = FUZZY_THRESHOLD * len(grams)
+        return [(position, count) for position, count in shared.items() if count >= needed]
+
+
+def index_entries(entries: list[dict]) -> tuple[dict[str, int], dict[int, list[dict]]]:
+    """Builds the upper-case ticker → CIK and CIK → entries lookups.
+
+    When several entries share a ticker, the first one wins.
+    """
+
+    ticker_to_cik: dict[str, int] = {}
+    cik_to_entries: dict[int, list[dict]] = {}
+
+    for entry in entries:
+        ticker = entry["ticker"].upper()
+        cik = int(entry["cik_str"])
+
+        if ticker not in ticker_to_cik:
+            ticker_to_cik[ticker] = cik
+
+        cik_to_entries.setdefault(cik, []).append(entry)
+
+    return ticker_to_cik, cik_to_entries
 
 
 class Tickers:
@@ -22,12 +173,19 @@ class Tickers:
 
     def __init__(self, session: EdgarSession) -> None:
         self._session = session
-        self._data: list[dict] | None = None
-        self._ticker_to_cik: dict[str, int] | None = None
-        self._cik_to_entries: dict[int, list[dict]] | None = None
+        self._data: Sequence[dict] | None = None
+        self._ticker_to_cik: Mapping[str, int] | None = None
+        self._cik_to_entries: Mapping[int, list[dict]] | None = None
+        self._index: TickerIndex | None = None
 
     def _load(self) -> None:
-        """Fetches and indexes the company tickers data from SEC."""
+        """Loads and indexes the company tickers data.
+
+        Tried in order: the in-memory TTL cache, the session's
+        ``TickerSnapshot`` (refreshed in the background once older than
+        ``TTL_TICKERS``), then SEC, whose response is written back to
+        the snapshot for the next process.
+        """
 
         if self._data is not None:
             return
@@ -39,8 +197,39 @@ class Tickers:
             if cached is not None:
                 self._data, self._ticker_to_cik, self._cik_to_entries = cached
                 logger.debug("Tickers loaded from cache (%d entries)", len(self._data))
+                self._session.hooks.notify(
+                    "on_cache_hit", "GET", self._session.build_url(TICKERS_ENDPOINT), cache="memory"
+                )
                 return
 
+        snapshot = self._session.ticker_snapshot
+        table = snapshot.load() if snapshot is not None else None
+        if table is not None:
+            self._data, self._ticker_to_cik, self._cik_to_entries = table, table.ticker_to_cik, table.cik_to_entries
+            logger.debug("Tickers loaded from snapshot (%d entries)", len(table))
+            self._session.hooks.notify(
+                "on_cache_hit", "GET", self._session.build_url(TICKERS_ENDPOINT), cache="snapshot"
+            )
+            if snapshot.stale(table):
+                snapshot.refresh_in_background(self._fetch)
+        else:
+            self._data = self._fetch()
+            logger.debug("Tickers fetched from SEC (%d entries)", len(self._data))
+            self._ticker_to_cik, self._cik_to_entries = index_entries(self._data)
+            if snapshot is not None:
+                snapshot.save(self._data)
+
+        # Store in TTL cache for reuse across service re-instantiations.
+        if cache is not None:
+            cache.set(
+                _CACHE_KEY,
+                (self._data, self._ticker_to_cik, self._cik_to_entries),
+                TTL_TICKERS,
+            )
+
+    def _fetch(self) -> list[dict]:
+        """Fetches the entries of ``company_tickers.json`` from SEC."""
+
         raw = self._session.make_request(
             method="GET",
             endpoint=TICKERS_ENDPOINT,
@@ -50,28 +239,7 @@ class Tickers:
         if not isinstance(raw, dict):
             raise EdgarRequestError("Failed to fetch company tickers data from SEC.")
 
-        self._data = list(raw.values())
-        logger.debug("Tickers fetched from SEC (%d entries)", len(self._data))
-
-        self._ticker_to_cik = {}
-        self._cik_to_entries = {}
-
-        for entry in self._data:
-            ticker = entry["ticker"].upper()
-            cik = entry["cik_str"]
-
-            if ticker not in self._ticker_to_cik:
-                self._ticker_to_cik[ticker] = cik
-
-            self._cik_to_entries.setdefault(cik, []).append(entry)
-
-        # Store in TTL cache for reuse across service re-instantiations.
-        if cache is not None:
-            cache.set(
-                _CACHE_KEY,
-                (self._data, self._ticker_to_cik, self._cik_to_entries),
-                TTL_TICKERS,
-            )
+        return list(raw.values())
 
     def resolve_ticker(self, ticker: str) -> str:
         """Resolves a ticker symbol to a zero-padded CIK string.
@@ -133,26 +301,54 @@ class Tickers:
 
         return entries
 
-    def search(self, query: str) -> list[dict]:
+    def search(self, query: str, limit: int | None = None, fuzzy: bool = False) -> list[dict]:
         """Searches company names and tickers for a query string.
 
+        Served from a ``TickerIndex`` built on the first search, so a
+        lookup touches only the entries that can match. Results are
+        ranked: exact ticker, ticker prefix, word prefix in the name,
+        then any substring.
+
         ### Parameters
         ----
         query : str
-            A case-insensitive search string.
+            A case-insensitive search string. Queries of one or two
+            characters match ticker and word prefixes only.
+
+        limit : int | None (optional, Default=None)
+            Maximum number of results.
+
+        fuzzy : bool (optional, Default=False)
+            Append close matches (shared trigrams) to tolerate typos.
 
         ### Returns
         ----
         list[dict]:
             Matching entries with keys: cik_str, ticker, title.
+
+        ### Usage
+        ----
+            >>> tickers.search("micro", limit=5)
+            >>> tickers.search("microsfot", fuzzy=True)
         """
 
+        return self._search_index().search(query, limit=limit, fuzzy=fuzzy)
+
+    def _search_index(self) -> TickerIndex:
+        """Returns the ``TickerIndex`` over the loaded entries, building it once."""
+
         self._load()
-        query_lower = query.lower()
-
-        return [
-            entry
-            for entry in self._data
-            if query_lower in entry["title"].lower()
-            or query_lower in entry["ticker"].lower()
-        ]
+        if self._index is not None and self._index.entries is self._data:
+            return self._index
+
+        cache = self._session.cache
+        cached = cache.get(_INDEX_CACHE_KEY) if cache is not None else None
+        if cached is not None and cached.entries is self._data:
+            self._index = cached
+            return cached
+
+        self._index = TickerIndex(self._data)
+        logger.debug("Built ticker search index (%d entries)", len(self._index))
+        if cache is not None:
+            cache.set(_INDEX_CACHE_KEY, self._index, TTL_TICKERS)
+        return self._index
@@ -0,0 +1,379 @@
+"""Local Parquet warehouse of SEC DERA Financial Statement Data Sets."""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+from decimal import Decimal
+from typing import TYPE_CHECKING, Iterable
+
+from edgar.datasets import DERA_SCHEMAS, DERA_TABLES, parse_date, parse_datetime, parse_flag
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    from edgar.datasets import Datasets
+
+logger = logging.getLogger(__name__)
+
+# Bytes of TSV parsed per Arrow record batch during ingestion.
+INGEST_BLOCK_SIZE = 16 * 1024 * 1024
+
+_PARTITION = "quarter"
+_DATA_FILE = "part-0.parquet"
+
+
+def _require_pyarrow():
+    """Import and return the ``pyarrow`` module, raising a helpful error if missing."""
+    try:
+        import pyarrow  # pylint: disable=import-outside-toplevel
+        return pyarrow
+    except ImportError as exc:
+        raise ImportError(
+            "pyarrow is required for the dataset warehouse. "
+            "Install it with: pip install python-sec[warehouse]"
+        ) from exc
+
+
+def _require_pandas():
+    """Import and return the ``pandas`` module, raising a helpful error if missing."""
+    try:
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+        return pd
+    except ImportError as exc:
+        raise ImportError(
+            "pandas is required for DataFrame conversion. "
+            "Install it with: pip install python-sec[pandas]"
+        ) from exc
+
+
+def quarter_key(year: int, quarter: int) -> str:
+    """Returns the partition key for a quarter, e.g. ``"2023q4"``."""
+
+    if not 1 <= quarter <= 4:
+        raise ValueError(f"quarter must be between 1 and 4, got {quarter}")
+    return f"{year}q{quarter}"
+
+
+class DatasetWarehouse:
+
+    """
+    ## Overview
+    ----
+    Converts DERA Financial Statement Data Sets into a local Parquet
+    warehouse, once per quarter, and serves later queries from it.
+
+    Each table is stored as ``{path}/{table}/quarter={year}q{quarter}/``
+    so a query only opens the partitions (quarters) and columns it
+    asks for. Files are memory-mapped on read, and columns keep the
+    types from ``DERA_SCHEMAS`` — there's no TSV parsing after the first
+    download.
+
+    Requires the ``pyarrow`` optional dependency. Install with
+    ``pip install python-sec[warehouse]``.
+
+    ### Usage
+    ----
+        >>> edgar_client = EdgarClient(user_agent="...", warehouse_dir="~/sec-warehouse")
+        >>> warehouse = edgar_client.datasets().warehouse
+        >>> warehouse.to_dataframe(
+        ...     "num",
+        ...     quarters=[(2023, q) for q in range(1, 5)],
+        ...     columns=["adsh", "ddate", "value"],
+        ...     where={"tag": "Revenues", "uom": "USD"},
+        ...     ingest=True,
+        ... )
+    """
+
+    def __init__(self, path: str, datasets: Datasets) -> None:
+        """Initializes the ``DatasetWarehouse``.
+
+        ### Parameters
+        ----
+        path : str
+            Root directory of the warehouse. Created if missing.
+
+        datasets : Datasets
+            The service used to download quarters that aren't in the
+            warehouse yet.
+        """
+
+        self._pa = _require_pyarrow()
+        self.path = os.path.expanduser(path)
+        self.datasets = datasets
+        os.makedirs(self.path, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return f"<DatasetWarehouse path={self.path!r} quarters={len(self.quarters())}>"
+
+    def quarters(self) -> list[str]:
+        """Returns the sorted keys (e.g. ``"2023q4"``) of ingested quarters."""
+
+        keys = set.intersection(*(set(self._partitions(table)) for table in DERA_TABLES))
+        return sorted(keys)
+
+    def has_quarter(self, year: int, quarter: int) -> bool:
+        """Whether every table of a quarter is in the warehouse."""
+
+        key = quarter_key(year, quarter)
+        return all(os.path.exists(self._file(table, key)) for table in DERA_TABLES)
+
+    def ingest(self, year: int, quarter: int, overwrite: bool = False) -> bool:
+        """Downloads a quarter and converts it to Parquet.
+
+        The archive is streamed to a temporary file and each table is
+        converted in ``INGEST_BLOCK_SIZE`` batches, so memory use stays
+        flat. Every file is written next to its final location and
+        renamed into place, so an interrupted ingest never leaves a
+        partial partition behind.
+
+        ### Parameters
+        ----
+        year : int
+            The calendar year (e.g. ``2023``).
+
+        quarter : int
+            The calendar quarter (1-4).
+
+        overwrite : bool (optional, Default=False)
+            Re-download a quarter that is already in the warehouse.
+
+        ### Returns
+        ----
+        bool:
+            ``True`` if the quarter is in the warehouse afterwards,
+            ``False`` if SEC has no dataset for the period.
+        """
+
+        key = quarter_key(year, quarter)
+        if not overwrite and self.has_quarter(year, quarter):
+            return True
+
+        archive = self.datasets.open_financial_statements(year, quarter)
+        if archive is None:
+            return False
+
+        logger.info("Ingesting DERA dataset %s into %s", key, self.path)
+        with archive:
+            for table in DERA_TABLES:
+                if table not in archive.tables:
+                    raise ValueError(f"DERA archive {key} has no {table} table")
+                self._write_table(table, key, archive.open_table(table))
+        return True
+
+    def read(
+        self,
+        table: str,
+        quarters: Iterable[tuple[int, int]] | None = None,
+        columns: Iterable[str] | None = None,
+        where: dict[str, object] | pc.Expression | None = None,
+        ingest: bool = False,
+    ) -> pa.Table:
+        """Reads one table across quarters as a ``pyarrow.Table``.
+
+        Only the requested quarters' files are opened, only the
+        requested columns are read, and ``where`` is pushed down to the
+        Parquet row-group statistics.
+
+        ### Parameters
+        ----
+        table : str
+            One of ``"sub"``, ``"num"``, ``"tag"``, ``"pre"``.
+
+        quarters : Iterable[tuple[int, int]] | None (optional, Default=None)
+            ``(year, quarter)`` pairs to read. ``None`` reads every
+            ingested quarter.
+
+        columns : Iterable[str] | None (optional, Default=None)
+            Columns to keep. ``None`` keeps every column. The
+            ``quarter`` partition column can be requested too.
+
+        where : dict | pyarrow.compute.Expression | None (optional, Default=None)
+            Row filter. A dict maps column names to a required value or
+            to a set/list/tuple of accepted values, as in
+            ``Datasets.iter_financial_statements``.
+
+        ingest : bool (optional, Default=False)
+            Download and convert requested quarters that aren't in the
+            warehouse yet. Quarters SEC doesn't publish are skipped.
+
+        ### Returns
+        ----
+        pyarrow.Table:
+            The matching rows.
+
+        ### Raises
+        ----
+        ValueError:
+            If a requested quarter isn't in the warehouse and ``ingest``
+            is ``False``.
+        """
+
+        import pyarrow.dataset as ds  # pylint: disable=import-outside-toplevel
+        from pyarrow import fs  # pylint: disable=import-outside-toplevel
+
+        if table not in DERA_TABLES:
+            raise ValueError(f"table must be one of {list(DERA_TABLES)}, got {table!r}")
+
+        if quarters is None:
+            keys = self.quarters()
+        else:
+            keys = self._quarter_keys(quarters, ingest)
+
+        files = [self._file(table, key) for key in keys]
+        if not files:
+            return self._pa.table({name: [] for name in columns or []})
+
+        dataset = ds.dataset(
+            files,
+            format="parquet",
+            partitioning=ds.partitioning(
+                self._pa.schema([(_PARTITION, self._pa.string())]), flavor="hive",
+            ),
+            partition_base_dir=os.path.join(self.path, table),
+            filesystem=fs.LocalFileSystem(use_mmap=True),
+        )
+        return dataset.to_table(
+            columns=list(columns) if columns is not None else None,
+            filter=_to_expression(where),
+        )
+
+    def to_dataframe(
+        self,
+        table: str,
+        quarters: Iterable[tuple[int, int]] | None = None,
+        columns: Iterable[str] | None = None,
+        where: dict[str, object] | pc.Expression | None = None,
+        ingest: bool = False,
+    ):
+        """Same as ``read()`` but returns a ``pandas.DataFrame``.
+
+        Requires the ``pandas`` optional dependency.
+        """
+
+        _require_pandas()
+        return self.read(table, quarters=quarters, columns=columns, where=where, ingest=ingest).to_pandas()
+
+    def _quarter_keys(self, quarters: Iterable[tuple[int, int]], ingest: bool) -> list[str]:
+        """Partition keys of *quarters*, ingesting missing ones if *ingest*."""
+
+        keys = []
+        for year, quarter in quarters:
+            if ingest:
+                if self.ingest(year, quarter):
+                    keys.append(quarter_key(year, quarter))
+            elif self.has_quarter(year, quarter):
+                keys.append(quarter_key(year, quarter))
+            else:
+                raise ValueError(
+                    f"Quarter {quarter_key(year, quarter)} isn't in the warehouse; "
+                    "call ingest() first or pass ingest=True"
+                )
+        return keys
+
+    def _partitions(self, table: str) -> list[str]:
+        """Lists the quarter keys stored for *table*."""
+
+        prefix = f"{_PARTITION}="
+        try:
+            names = os.listdir(os.path.join(self.path, table))
+        except FileNotFoundError:
+            return []
+        return [
+            name[len(prefix):] for name in names
+            if name.startswith(prefix) and os.path.exists(self._file(table, name[len(prefix):]))
+        ]
+
+    def _file(self, table: str, key: str) -> str:
+        """Path of the Parquet file for one table and quarter."""
+        return os.path.join(self.path, table, f"{_PARTITION}={key}", _DATA_FILE)
+
+    def _write_table(self, table: str, key: str, source) -> None:  # pylint: disable=too-many-locals
+        """Converts one TSV member into a Parquet file, batch by batch."""
+
+        import pyarrow.csv as pa_csv  # pylint: disable=import-outside-toplevel
+        import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+
+        pa = self._pa
+        with source:
+            header = source.readline().decode("utf-8").rstrip("\r\n").split("\t")
+            schema = _arrow_schema(table, header)
+            reader = pa_csv.open_csv(
+                source,
+                read_options=pa_csv.ReadOptions(
+                    column_names=header, block_size=INGEST_BLOCK_SIZE,
+                ),
+                parse_options=pa_csv.ParseOptions(delimiter="\t", quote_char=False),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={
+                        # Dates are parsed as timestamps, then cast below.
+                        field.name: pa.timestamp("s") if field.type == pa.date32() else field.type
+                        for field in schema
+                    },
+                    null_values=[""],
+                    strings_can_be_null=True,
+                    true_values=["1"],
+                    false_values=["0"],
+                    timestamp_parsers=[pa_csv.ISO8601, "%Y%m%d"],
+                ),
+            )
+
+            target = self._file(table, key)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(target), suffix=".tmp")
+            os.close(fd)
+            rows = 0
+            try:
+                with pq.ParquetWriter(tmp, schema) as writer:
+                    for batch in reader:
+                        batch = pa.RecordBatch.from_arrays(
+                            [column.cast(field.type) for column, field in zip(batch.columns, schema)],
+                            schema=schema,
+                        )
+                        writer.write_batch(batch)
+                        rows += batch.num_rows
+                os.replace(tmp, target)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+
+        logger.debug("Wrote %s/%s (%d rows)", table, key, rows)
+
+
+def _arrow_schema(table: str, header: list[str]):
+    """Arrow schema for a DERA table, derived from ``DERA_SCHEMAS``."""
+
+    pa = _require_pyarrow()
+    arrow_types = {
+        parse_date: pa.date32(),
+        parse_datetime: pa.timestamp("ms"),
+        parse_flag: pa.bool_(),
+        int: pa.int64(),
+        # DERA publishes num.value as DECIMAL(28,4).
+        Decimal: pa.decimal128(28, 4),
+    }
+    types = DERA_SCHEMAS.get(table, {})
+    return pa.schema([
+        (name, arrow_types[types[name]] if name in types else pa.string())
+        for name in header
+    ])
+
+
+def _to_expression(where: dict[str, object] | pc.Expression | None):
+    """Turns a ``where`` dict into a ``pyarrow.compute`` filter expression."""
+
+    if where is None or not isinstance(where, dict):
+        return where
+
+    import pyarrow.compute as pc  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+    expression = None
+    for name, expected in where.items():
+        if isinstance(expected, (set, frozenset, list, tuple)):
+            term = pc.field(name).isin(list(expected))
+        else:
+            term = pc.field(name) == expected
+        expression = term if expression is None else expression & term
+    return expression
@@ -138,6 +138,8 @@ class Xbrl():
             num_of_zeros = 10 - len(cik)
             cik = num_of_zeros*"0" + cik
 
+        endpoint = f'/api/xbrl/companyfacts/CIK{cik}.json'
+
         # Check TTL cache.
         cache = self.edgar_session.cache
         cache_key = f"company_facts:{cik}"
@@ -145,16 +147,28 @@ class Xbrl():
             cached = cache.get(cache_key)
             if cached is not None:
                 logger.debug("XBRL company_facts cache hit for CIK %s", cik)
+                self.edgar_session.hooks.notify(
+                    "on_cache_hit", "GET", self.edgar_session.build_url(endpoint, use_api=True), cache="memory"
+                )
                 return cached
 
-        endpoint = f'/api/xbrl/companyfacts/CIK{cik}.json'
+        # Read from the local bulk archive, if there is a fresh one.
+        response = None
+        bulk_data = self.edgar_session.bulk_data
+        if bulk_data is not None:
+            response = bulk_data.lookup("companyfacts", cik)
+            if response is not None:
+                self.edgar_session.hooks.notify(
+                    "on_cache_hit", "GET", self.edgar_session.build_url(endpoint, use_api=True), cache="bulk"
+                )
 
         # Grab the Data.
-        response = self.edgar_session.make_request(
-            method='get',
-            endpoint=endpoint,
-            use_api=True
-        )
+        if response is None:
+            response = self.edgar_session.make_request(
+                method='get',
+                endpoint=endpoint,
+                use_api=True
+            )
 
         # Store in TTL cache.
         if cache is not None and response is not None:
@@ -44,3 +44,34 @@ pprint(archive_services.get_full_indexes())
 
 # Grab the Full Indexes for QTR4 of 2002.
 pprint(archive_services.get_full_index(year=2002))
+
+# Build a local index of every filing in 2023 Q4 (one download), then
+# keep it current from the daily index files.
+filing_index = archive_services.filing_index(directory="~/.cache/python-sec")
+filing_index.load_quarter(year=2023, quarter=4)
+filing_index.update()
+
+# Query it locally, with no further HTTP requests.
+pprint(
+    filing_index.query(form_type="10-K", start="2023-11-01", end="2023-11-30", limit=5)
+)
+
+# Download the HTML documents and exhibits of every 10-K in the index,
+# four at a time. Re-running the same job skips what is already on
+# disk; retry_failed() fetches only the documents that failed.
+downloader = archive_services.bulk_downloader(
+    directory="~/sec-data",
+    max_workers=4,
+    patterns=["*.htm"],
+)
+filings = filing_index.query(form_type="10-K", start="2023-11-01", end="2023-11-30")
+# Index filenames end in the accession number: edgar/data/<cik>/<accession>.txt.
+# Pass (cik, accession) pairs: filings made by filing agents have the
+# agent's CIK in their accession number, not the company's.
+filings = [
+    (filing["cik"], filing["filename"].rsplit("/", 1)[-1].removesuffix(".txt"))
+    for filing in filings
+]
+report = downloader.run(filings)
+print(len(report.downloaded), len(report.skipped), len(report.failed))
+downloader.retry_failed()
@@ -67,6 +67,36 @@ async def main():
         for company in companies:
             print(f"  {company}")
 
+        # -------------------------------------------------------------------
+        # Async services (same methods as EdgarClient's services)
+        # -------------------------------------------------------------------
+
+        # Every EdgarClient service has an async twin under client.services
+        # whose requests share this client's rate limiter; parsing runs in
+        # worker threads.
+        frames, directories, tx_companies = await asyncio.gather(
+            client.services.xbrl().frames(concept="Revenues", unit_of_measure="USD", period="CY2023"),
+            client.services.archives().get_company_directories(cik="320193"),
+            client.services.companies().get_companies_by_state(state_code="TX"),
+        )
+        print(f"Frames: {len(frames['data'])} companies, "
+              f"{len(directories)} Apple directories, {len(tx_companies)} Texas companies")
+
+        # Streaming methods return async iterators.
+        stream = await client.services.filings().iter_query(cik="320193", number_of_filings=20)
+        async for entry in stream:
+            print(f"  {entry.get('category_term')} {entry.get('updated')}")
+
+        # -------------------------------------------------------------------
+        # Deep filing history (concurrent pagination)
+        # -------------------------------------------------------------------
+
+        # Pages are requested several at a time and yielded in order.
+        count = 0
+        async for filing in client.iter_filings("AAPL", form="8-K", concurrency=4):
+            count += 1
+        print(f"Apple has filed {count} 8-Ks")
+
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,76 @@
+"""Example usage of the concurrent bulk fetch API."""
+
+import asyncio
+
+from edgar.async_client import EdgarAsyncClient
+from edgar.client import EdgarClient
+
+USER_AGENT = "Your Name your-email@example.com"
+
+# Initialize the client.
+# SEC EDGAR requires a User-Agent in the format "Company/Name email@example.com".
+edgar_client = EdgarClient(user_agent=USER_AGENT)
+
+# A handful of CIKs — pass the whole ticker universe (~10k) the same way.
+ciks = ["320193", "789019", "1652044", "1018724", "1045810", "1326801", "1318605"]
+
+# ---------------------------------------------------------------------------
+# Submissions for many companies
+# ---------------------------------------------------------------------------
+
+# Requests run on a thread pool and share the client's rate limiter, so
+# the batch uses the full 10 req/s budget without going over it. Results
+# arrive as they complete, not in input order.
+for result in edgar_client.bulk.fetch_many(ciks, endpoint="submissions", max_workers=8):
+    if result.ok:
+        print(result.key, result.value["name"])
+    else:
+        # A failing CIK doesn't stop the batch — the error is attached.
+        print(result.key, "failed:", result.error)
+
+# ---------------------------------------------------------------------------
+# Company facts, collected into a dict
+# ---------------------------------------------------------------------------
+
+facts = {
+    result.key: result.value
+    for result in edgar_client.bulk.fetch_many(ciks, endpoint="company_facts")
+    if result.ok
+}
+print(f"Fetched facts for {len(facts)} companies")
+
+# ---------------------------------------------------------------------------
+# The whole universe from SEC's nightly bulk archives
+# ---------------------------------------------------------------------------
+
+# Download submissions.zip and companyfacts.zip once (a few GB, streamed
+# to disk). Afterwards get_submissions(), company_facts() and get_facts()
+# read each company straight from the archives, with no requests at all.
+bulk_client = EdgarClient(user_agent=USER_AGENT, bulk_dir="~/sec-bulk")
+# Lookups only use an archive younger than its max_age (by default one
+# day, since SEC rebuilds the archives nightly) and ask the API once it
+# is older, so refresh a stale copy before relying on it.
+if not bulk_client.bulk.data.is_fresh("submissions"):
+    bulk_client.bulk.data.download()
+
+print(bulk_client.submissions().get_submissions(cik="320193")["name"])
+print(bulk_client.xbrl().get_facts(cik="320193").entity_name)
+
+# Walk every company without extracting the archive.
+names = {cik: document["name"] for cik, document in bulk_client.bulk.data.iter_companies("submissions")}
+print(f"{len(names)} companies")
+
+# ---------------------------------------------------------------------------
+# Async bulk fetch
+# ---------------------------------------------------------------------------
+
+
+async def main():
+    """Fetch submissions for many CIKs with the async client."""
+
+    async with EdgarAsyncClient(user_agent=USER_AGENT) as client:
+        async for result in client.bulk.fetch_many(ciks, concurrency=8):
+            print(result.key, result.ok)
+
+
+asyncio.run(main())
@@ -0,0 +1,74 @@
+"""Example usage of the in-memory and persistent on-disk response caches."""
+
+from edgar.cache import TTLCache
+from edgar.client import EdgarClient
+
+# Initialize the client with a persistent on-disk HTTP cache.
+# SEC EDGAR requires a User-Agent in the format "Company/Name email@example.com".
+edgar_client = EdgarClient(
+    user_agent="Your Name your-email@example.com",
+    cache_dir=".edgar-cache",
+)
+
+# ---------------------------------------------------------------------------
+# Persistent disk cache — survives process restarts
+# ---------------------------------------------------------------------------
+
+# The first call downloads from SEC and stores the body plus its
+# ETag / Last-Modified validators in .edgar-cache/http_cache.sqlite3.
+info = edgar_client.submissions().get_submissions(cik="320193")
+print(info["name"])
+# Output: Apple Inc.
+
+# Later runs (even in a new process) are served straight from disk while
+# the entry is fresh. TTLs follow the same policy as the in-memory cache:
+# company_tickers.json → TTL_TICKERS, submissions → TTL_SUBMISSIONS,
+# XBRL data → TTL_TAXONOMY.
+print(edgar_client.edgar_session.disk_cache)
+# Output: <DiskCache path='.edgar-cache/http_cache.sqlite3' entries=1>
+
+# Once stale, entries are revalidated with If-None-Match / If-Modified-Since.
+# A "304 Not Modified" reply reuses the stored body without re-downloading it.
+
+# ---------------------------------------------------------------------------
+# Ticker snapshot — warm starts for short-lived workers
+# ---------------------------------------------------------------------------
+
+# The first ticker lookup also writes .edgar-cache/company_tickers.snapshot.
+# New processes memory-map it instead of fetching and re-indexing
+# company_tickers.json, so their first resolve_ticker() takes milliseconds.
+# Once older than TTL_TICKERS it is still served, and rewritten in the
+# background for the next process.
+print(edgar_client.tickers().resolve_ticker("AAPL"))
+# Output: 0000320193
+print(edgar_client.edgar_session.ticker_snapshot)
+# Output: <TickerSnapshot path='.edgar-cache/company_tickers.snapshot'>
+
+# ---------------------------------------------------------------------------
+# Sharing the cache with the async client
+# ---------------------------------------------------------------------------
+
+# EdgarAsyncClient accepts the same cache_dir, so sync and async workers
+# on one host can share a single cache directory and ticker snapshot.
+#
+#     async with EdgarAsyncClient(user_agent="...", cache_dir=".edgar-cache") as client:
+#         info = await client.get_company_info("AAPL")
+
+# ---------------------------------------------------------------------------
+# Bounded in-memory cache — LRU eviction and counters
+# ---------------------------------------------------------------------------
+
+# The default in-memory cache is bounded (DEFAULT_MAX_ENTRIES entries and
+# DEFAULT_MAX_BYTES bytes). Pass your own TTLCache to pick the bounds.
+small_cache = TTLCache(max_entries=100, max_bytes=64 * 1024 * 1024)
+bounded_client = EdgarClient(
+    user_agent="Your Name your-email@example.com",
+    cache=small_cache,
+)
+
+bounded_client.xbrl().company_facts(cik="320193")
+bounded_client.xbrl().company_facts(cik="320193")
+print(small_cache.stats)
+# Output: CacheStats(hits=1, misses=1, evictions=0, expirations=0, entries=1, bytes=...)
+print(f"Hit ratio: {small_cache.stats.hit_ratio:.0%}")
+# Output: Hit ratio: 50%
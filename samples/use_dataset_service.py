@@ -53,3 +53,47 @@ if data.get("num"):
 # dfs = datasets_service.get_financial_statements_dataframes(year=2023, quarter=4)
 # print(dfs["sub"].head())
 # print(dfs["num"].describe())
+
+
+# ---------------------------------------------------------------------------
+# Streaming Financial Statements (bounded memory, typed columns)
+# ---------------------------------------------------------------------------
+
+# Stream one table in chunks instead of loading the whole quarter. Values
+# are typed (dates, Decimal, int, bool) and rows can be projected and
+# filtered while the archive is being read.
+revenue = 0
+for chunk in datasets_service.iter_financial_statements(
+    year=2023,
+    quarter=4,
+    table="num",
+    columns=["adsh", "ddate", "value"],
+    where={"tag": "Revenues", "uom": "USD", "qtrs": 4},
+):
+    revenue += sum(row["value"] for row in chunk if row["value"] is not None)
+print(f"\nTotal annual revenue reported in 2023 Q4: {revenue:,}")
+
+# Or open the archive once and read several tables from it.
+with datasets_service.open_financial_statements(year=2023, quarter=4) as archive:
+    filers = {row["adsh"]: row["name"] for row in archive.iter_rows("sub", columns=["adsh", "name"])}
+    print(f"Tables: {archive.tables}, filers: {len(filers)}")
+
+
+# ---------------------------------------------------------------------------
+# Local Parquet Warehouse (requires pyarrow: pip install python-sec[warehouse])
+# ---------------------------------------------------------------------------
+
+# Each quarter is downloaded and converted to Parquet once; later queries
+# read only the quarters and columns they need, straight from disk.
+# warehouse_client = EdgarClient(
+#     user_agent="Your Name your-email@example.com", warehouse_dir="~/sec-warehouse"
+# )
+# warehouse = warehouse_client.datasets().warehouse
+# revenues = warehouse.to_dataframe(
+#     "num",
+#     quarters=[(2023, q) for q in range(1, 5)],
+#     columns=["adsh", "ddate", "value", "quarter"],
+#     where={"tag": "Revenues", "uom": "USD", "qtrs": 4},
+#     ingest=True,  # Download quarters that aren't in the warehouse yet.
+# )
+# print(revenues.groupby("quarter")["value"].count())
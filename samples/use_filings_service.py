@@ -31,3 +31,17 @@ pprint(
         filing_type='10-k'
     )
 )
+
+# Stream every 8-K for Facebook page by page. The next page downloads in
+# the background while you work through the current one, and `offset`
+# tells you where to resume if the job is interrupted.
+stream = filings_service.iter_query(
+    cik='1326801',
+    filing_type='8-K',
+)
+for filing in stream:
+    print(filing['title'])
+
+# Resume a previous run from its saved offset.
+for filing in filings_service.iter_query(cik='1326801', filing_type='8-K', start=stream.offset):
+    print(filing['title'])
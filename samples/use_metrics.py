@@ -0,0 +1,52 @@
+"""Example usage of request hooks and the in-memory metrics collector."""
+
+import logging
+
+from edgar.client import EdgarClient
+from edgar.instrumentation import MetricsCollector
+
+USER_AGENT = "Your Name your-email@example.com"
+
+logging.basicConfig(level=logging.INFO)
+
+edgar_client = EdgarClient(user_agent=USER_AGENT)
+
+# ---------------------------------------------------------------------------
+# Built-in metrics
+# ---------------------------------------------------------------------------
+
+# Subscribe a MetricsCollector; it aggregates every request the client
+# sends, per endpoint family ("submissions", "api/xbrl/companyfacts", ...).
+metrics = MetricsCollector()
+edgar_client.hooks.subscribe(metrics)
+
+for cik in ["320193", "789019", "320193"]:
+    edgar_client.submissions().get_submissions(cik=cik)
+edgar_client.xbrl().company_facts(cik="320193")
+
+snapshot = metrics.snapshot()
+print(snapshot.requests, snapshot.cache_hits)
+# Output: 3 {'memory': 1}
+
+print(f"{snapshot.cache_hit_ratio:.0%}")
+# Output: 25%
+
+for family, histogram in snapshot.latency.items():
+    print(family, histogram.count, f"{histogram.mean * 1000:.0f}ms", snapshot.bytes_received[family])
+# Output:
+# submissions 2 180ms 291304
+# api/xbrl/companyfacts 1 640ms 4381022
+
+# ---------------------------------------------------------------------------
+# Custom exporters
+# ---------------------------------------------------------------------------
+
+# Any callable can subscribe to a single hook. subscribe() returns a
+# function that removes the subscription again.
+log = logging.getLogger("sec-metrics")
+unsubscribe = edgar_client.hooks.subscribe(
+    on_retry=lambda event: log.warning("retry %d of %s (%s)", event.attempt, event.url, event.status),
+    on_throttle_wait=lambda event: log.info("throttled %.3fs before %s", event.wait, event.family),
+)
+edgar_client.submissions().get_submissions(cik="1652044")
+unsubscribe()
@@ -0,0 +1,75 @@
+"""Example usage of shared rate limiters across threads and processes."""
+
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool
+
+from edgar.client import EdgarClient
+from edgar.rate_limiter import FileRateLimiter, TokenBucketRateLimiter
+from edgar.retry import RetryPolicy
+
+USER_AGENT = "Your Name your-email@example.com"
+CIKS = ["320193", "789019", "1652044", "1018724", "1045810"]
+
+# ---------------------------------------------------------------------------
+# Many threads, one client
+# ---------------------------------------------------------------------------
+
+# Every EdgarClient already has its own thread-safe token bucket, so a
+# single client can be used from a thread pool without going over SEC's
+# 10 requests per second. Requests are spaced evenly, 100ms apart.
+edgar_client = EdgarClient(user_agent=USER_AGENT)
+
+with ThreadPoolExecutor(max_workers=8) as pool:
+    names = list(
+        pool.map(lambda cik: edgar_client.submissions().get_submissions(cik=cik)["name"], CIKS)
+    )
+print(names)
+# Output: ['Apple Inc.', 'MICROSOFT CORP', 'Alphabet Inc.', 'AMAZON COM INC', 'NVIDIA CORP']
+
+# ---------------------------------------------------------------------------
+# Several clients, one budget
+# ---------------------------------------------------------------------------
+
+# Pass the same limiter to several clients (e.g. with different caches)
+# and they split one budget instead of each getting 10 req/s.
+shared = TokenBucketRateLimiter(rate=10)
+fresh_client = EdgarClient(user_agent=USER_AGENT, cache=False, rate_limiter=shared)
+cached_client = EdgarClient(user_agent=USER_AGENT, rate_limiter=shared)
+
+# ---------------------------------------------------------------------------
+# Retries and backoff
+# ---------------------------------------------------------------------------
+
+# 429 and 5xx responses and connection errors are retried with jittered
+# exponential backoff, honoring Retry-After. A 429 also pauses the shared
+# limiter, so every thread and client using it backs off together.
+# Tighten the policy for latency-sensitive code, or turn retries off.
+impatient_client = EdgarClient(
+    user_agent=USER_AGENT,
+    rate_limiter=shared,
+    retry_policy=RetryPolicy(max_retries=2, backoff_cap=2.0, deadline=5.0),
+)
+no_retry_client = EdgarClient(user_agent=USER_AGENT, retry_policy=RetryPolicy(max_retries=0))
+
+# ---------------------------------------------------------------------------
+# Several processes, one budget
+# ---------------------------------------------------------------------------
+
+# FileRateLimiter keeps the bucket in a locked file, so every worker
+# process pointing at the same path shares exactly 10 req/s in total.
+RATE_LIMIT_FILE = "/tmp/python-sec.ratelimit"
+
+
+def company_name(cik: str) -> str:
+    """Worker: fetch one company's name under the host-wide limit."""
+
+    client = EdgarClient(
+        user_agent=USER_AGENT,
+        rate_limiter=FileRateLimiter(RATE_LIMIT_FILE, rate=10),
+    )
+    return client.submissions().get_submissions(cik=cik)["name"]
+
+
+if __name__ == "__main__":
+    with Pool(processes=4) as processes:
+        print(processes.map(company_name, CIKS))
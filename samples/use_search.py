@@ -64,3 +64,22 @@ if results:
 
 page2 = edgar_client.search(q="climate risk", start=100, size=50)
 print(f"\nPage 2 results: {len(page2)}")
+
+
+# ---------------------------------------------------------------------------
+# Every result — concurrent pages, de-duplicated, split past the 10,000 cap
+# ---------------------------------------------------------------------------
+
+# iter_search() reads hits.total from the first page, fetches the remaining
+# pages concurrently (within the rate limit) and yields each hit once.
+# EFTS only pages through the first 10,000 hits of a query, so ranges that
+# match more are split by date until every part fits.
+count = 0
+for result in edgar_client.iter_search(
+    q='"going concern"',
+    form_types=["10-K"],
+    start_date="2024-01-01",
+    end_date="2024-12-31",
+):
+    count += 1
+print(f"\nAll going-concern 10-K hits in 2024: {count}")
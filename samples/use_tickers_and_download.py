@@ -75,5 +75,10 @@ print(f"\nDownloaded {len(content)} characters")
 edgar_client.download(FILING_URL, path="aapl-10k.html")
 print("Saved to aapl-10k.html")
 
+# Stream a large document straight to disk. An interrupted transfer is
+# resumed where it stopped, and the file only appears once it is complete
+# and matches the checksum.
+edgar_client.download(FILING_URL, path="aapl-10k.html", stream=True)
+
 # NOTE: The download lines above are commented out to avoid making live
 # requests when running this sample. Uncomment them to test with real data.
@@ -108,3 +108,20 @@ if dei_shares:
     print(f"\nDEI shares outstanding ({len(dei_shares)} data points):")
     for fact in dei_shares[-3:]:
         print(f"  {fact.end}  {fact.value}  {fact.form}")
+
+
+# ---------------------------------------------------------------------------
+# Panels — every concept in one DataFrame (requires pandas)
+# ---------------------------------------------------------------------------
+
+# Facts builds a columnar table of all data points the first time it's
+# queried; after that, concept/unit lookups are index slices and
+# DataFrame exports need no per-row Python work.
+print("\n=== us-gaap panel ===")
+panel = facts.to_dataframe("us-gaap")
+print(panel[["concept", "unit", "end", "value"]].tail())
+
+# Pivot a few concepts into a wide table of annual values.
+annual = panel[(panel["form"] == "10-K") & (panel["fiscal_period"] == "FY")]
+wide = annual.pivot_table(index="end", columns="concept", values="value", aggfunc="last")
+print(wide[["Revenues", "NetIncomeLoss"]].dropna(how="all").tail())
@@ -131,6 +131,139 @@ SAMPLE_ISSUER_HTML = """\
 </html>
 """
 
+SAMPLE_ISSUER_HTML_WITH_NEXT = """\
+<html>
+<head><title>EDGAR Ownership</title><script>var x = "<table>";</script></head>
+<body>
+<div id="header"><a href="/">Home</a></div>
+<table><tr><td><img src="/images/logo.gif"></td></tr></table>
+<table><tr><td><b>Owner:</b> DOE JOHN</td></tr></table>
+<table><tr><td><input type="button" value="Next 80" onClick="parent.location='/cgi-bin/own-disp?action=getowner&CIK=0001214128&type=&dateb=&owner=include&start=80'"></td></tr></table>
+<table></table>
+<table>
+<tr>
+<td><a href="/cgi-bin/browse-edgar?action=getcompany&CIK=0000320193">Apple Inc.</a></td>
+<td><a href="/cgi-bin/own-disp?action=getissuer&CIK=0000320193">12 filings</a></td>
+<td>2021-04-01</td>
+<td>officer: SVP</td>
+</tr>
+<tr>
+<td><a href="/cgi-bin/browse-edgar?action=getcompany&CIK=0001326801">Facebook Inc</a></td>
+<td><a href="/cgi-bin/own-disp?action=getissuer&CIK=0001326801">3 filings</a></td>
+<td>2020-11-30</td>
+<td>director</td>
+</tr>
+</table>
+<table id="transaction-report">
+<tr>
+<td>Date</td>
+<td>Reporting Owner</td>
+<td>Form</td>
+<td>Transaction Type</td>
+<td>Shares</td>
+<td>Link</td>
+<td>Price</td>
+</tr>
+<tr>
+<td>2021-04-01</td>
+<td><a href="/Archives/edgar/data/320193/000032019321000045/xslF345X03/wf-form4.xml">DOE JOHN</a></td>
+<td>4</td>
+<td>S-Sale</td>
+<td>2500</td>
+<td>$123.00</td>
+</tr>
+</table>
+<p>Footer &copy; SEC</p>
+</body>
+</html>
+"""
+
+SAMPLE_VIP_HTML = """\
+<html>
+<body>
+<form action="/cgi-bin/series" method="get"><input type="text" name="company"></form>
+<center>
+<a href="/cgi-bin/series?company=fidelity&CIK=&type=N-PX&start=0">1</a>
+<a href="/cgi-bin/series?company=fidelity&amp;sc=companyseries&CIK=x&start=100">2</a>
+<a href="/cgi-bin/series?company=fidelity&amp;sc=companyseries&CIK=x&start=100">Next</a>
+</center>
+<table summary=".">
+<tr><td><input type="submit" value="Search"></td></tr>
+</table>
+<table summary=".">
+<tr valign="top">
+<td><a href="/cgi-bin/browse-edgar?action=getcompany&CIK=0000035341">0000035341</a></td>
+<td>FIDELITY MAGELLAN FUND</td>
+</tr>
+<tr valign="top">
+<td><a href="/cgi-bin/browse-edgar?action=getcompany&CIK=S000006037&scd=series">S000006037</a></td>
+<td>Fidelity Magellan Fund</td>
+</tr>
+<tr valign="top">
+<td><a href="/cgi-bin/browse-edgar?action=getcompany&CIK=C000016671">C000016671</a></td>
+<td>Fidelity Magellan Fund</td>
+<td>FMAGX</td>
+</tr>
+<tr valign="bottom"><td>ignored</td></tr>
+</table>
+</body>
+</html>
+"""
+
+SAMPLE_VIP_HTML_PAGE_2 = """\
+<html>
+<body>
+<table summary=".">
+<tr valign="top">
+<td><a href="/cgi-bin/browse-edgar?action=getcompany&CIK=C000016672">C000016672</a></td>
+<td>Fidelity Magellan Fund Class K</td>
+<td>FMGKX</td>
+</tr>
+</table>
+</body>
+</html>
+"""
+
+SAMPLE_SERIES_HTML = """\
+<html>
+<body>
+<table><tr><td>SEC Home</td></tr></table>
+<table><tr><td>Search</td></tr></table>
+<table><tr><td><table><tr><td>Nested</td></tr></table></td></tr></table>
+<table><tr><td>Series S000006037</td></tr></table>
+<table summary="Results">
+<tr valign="top" align="left">
+<td><a href="/cgi-bin/browse-edgar?action=getcompany&CIK=0000061397&scd=series">FIDELITY MAGELLAN FUND</a></td>
+<td></td>
+</tr>
+<tr valign="top" align="left">
+<td><a href="/cgi-bin/browse-edgar?action=getcompany&CIK=0000035341">0000035341</a></td>
+<td>FIDELITY MAGELLAN FUND INC</td>
+</tr>
+<tr valign="top" align="left">
+<td></td>
+<td><a href="/cgi-bin/browse-edgar?action=getcompany&CIK=S000006037">S000006037</a></td>
+<td>Fidelity Magellan Fund</td>
+</tr>
+<tr valign="top"><td>not a result row</td></tr>
+</table>
+</body>
+</html>
+"""
+
+SAMPLE_CURRENT_EVENTS_HTML = """\
+<html>
+<head><title>EDGAR Current Events</title></head>
+<body>
+<table><tr><td>Current Events Analysis</td></tr></table>
+<pre><b>Date Filed   Form        CIK Code     Company Name</b><hr>04-29-2021   10-Q        <a href="/cgi-bin/browse-edgar?action=getcompany&CIK=0000320193">0000320193</a>   Apple Inc.
+04-29-2021   10-Q        <a href="/cgi-bin/browse-edgar?action=getcompany&CIK=0001018724">0001018724</a>   AMAZON COM INC
+04-28-2021   10-Q/A      <a href="/cgi-bin/browse-edgar?action=getcompany&CIK=0001326801">0001326801</a>   Facebook Inc
+</pre>
+</body>
+</html>
+"""
+
 SAMPLE_XBRL_COMPANY_FACTS = {
     "cik": 1326801,
     "entityName": "Facebook, Inc.",
@@ -11,8 +11,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from edgar.async_session import EdgarAsyncSession, MAX_REQUESTS_PER_SECOND, _require_httpx
-from edgar.async_client import EdgarAsyncClient
+from edgar.async_client import EdgarAsyncClient, page_offsets
 from edgar.exceptions import EdgarRequestError
+from edgar.rate_limiter import TokenBucketRateLimiter
 
 
 # ---------------------------------------------------------------------------
@@ -92,27 +93,27 @@ class TestAsyncSessionThrottle:
     """Tests for the async rate limiter."""
 
     @pytest.mark.asyncio
-    async def test_throttle_allows_within_limit(self, async_session):
-        """Requests within the rate limit should not sleep."""
-        async_session._rate_limit = 10
-        async_session._request_times.clear()
-        # Should complete without error.
-        await async_session._throttle()
-        assert len(async_session._request_times) == 1
+    async def test_throttle_allows_first_request(self, async_session):
+        """The first request should not sleep."""
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await async_session._throttle()
+            mock_sleep.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_throttle_sleeps_at_capacity(self, async_session):
-        """Should sleep when at rate limit capacity."""
-        async_session._rate_limit = 2
-        loop = asyncio.get_event_loop()
-        now = loop.time()
-        async_session._request_times.clear()
-        async_session._request_times.append(now)
-        async_session._request_times.append(now)
+    async def test_throttle_sleeps_for_reservation(self, async_session):
+        """Should sleep for the wait handed out by the limiter."""
+        async_session.rate_limiter = MagicMock()
+        async_session.rate_limiter.reserve_async = AsyncMock(return_value=0.1)
 
         with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
             await async_session._throttle()
-            mock_sleep.assert_called_once()
+            mock_sleep.assert_called_once_with(0.1)
+
+    def test_client_passes_rate_limiter(self):
+        """EdgarAsyncClient should forward a shared limiter to its session."""
+        limiter = TokenBucketRateLimiter(rate=5)
+        client = EdgarAsyncClient(user_agent="Test test@example.com", rate_limiter=limiter)
+        assert client.edgar_session.rate_limiter is limiter
 
 
 class TestAsyncSessionMakeRequest:
@@ -451,6 +452,119 @@ class TestAsyncClientGetFacts:
         assert isinstance(result, Facts)
 
 
+def _atom_page(offset: int, size: int) -> str:
+    """Build a browse-edgar Atom page holding entries offset..offset+size-1."""
+    entries = "".join(
+        f"<entry><title>8-K - Current report {i}</title>"
+        f"<category term=\"8-K\"/><id>accession-number={i:010d}</id></entry>"
+        for i in range(offset, offset + size)
+    )
+    return f'<feed xmlns="http://www.w3.org/2005/Atom">{entries}</feed>'
+
+
+def _paged_feed(total: int):
+    """Fake make_request serving ``total`` filings in browse-edgar pages."""
+    requested = []
+
+    async def make_request(method, endpoint, params=None, **_):  # pylint: disable=unused-argument
+        requested.append(params["start"])
+        await asyncio.sleep(0)
+        size = max(0, min(params["count"], total - params["start"]))
+        return _atom_page(params["start"], size)
+
+    return make_request, requested
+
+
+class TestAsyncClientIterFilings:
+    """Tests for concurrent async filings pagination."""
+
+    @pytest.mark.asyncio
+    async def test_streams_every_page_in_order(self, async_client):
+        """Filings from all pages should arrive in feed order, ending at the short page."""
+        inner, requested = _paged_feed(total=250)
+
+        async def make_request(**kwargs):
+            # A page past the short one is served full; it must not be yielded.
+            if kwargs["params"]["start"] >= 300:
+                requested.append(kwargs["params"]["start"])
+                return _atom_page(kwargs["params"]["start"], 100)
+            return await inner(**kwargs)
+
+        async_client.edgar_session.make_request = make_request
+
+        filings = [f async for f in async_client.iter_filings("320193", concurrency=2)]
+
+        assert [f.accession_number for f in filings] == [f"{i:010d}" for i in range(250)]
+        assert {0, 100, 200} <= set(requested)
+
+    def test_page_offsets(self):
+        """Offsets should cover the limit, or run on without one."""
+        assert list(page_offsets(50, 250, 100)) == [50, 150, 250]
+        assert not list(page_offsets(0, 0, 100))
+        unbounded = page_offsets(0, None, 40)
+        assert [next(unbounded) for _ in range(3)] == [0, 40, 80]
+
+    @pytest.mark.asyncio
+    async def test_pages_are_fetched_concurrently(self, async_client):
+        """Up to ``concurrency`` pages should be in flight at once."""
+        active = [0]
+        peak = [0]
+        inner, _ = _paged_feed(total=1000)
+
+        async def make_request(**kwargs):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            try:
+                return await inner(**kwargs)
+            finally:
+                active[0] -= 1
+
+        async_client.edgar_session.make_request = make_request
+        filings = [f async for f in async_client.iter_filings("320193", concurrency=4)]
+
+        assert len(filings) == 1000
+        assert 1 < peak[0] <= 4
+
+    @pytest.mark.asyncio
+    async def test_limit_and_start(self, async_client):
+        """limit should stop the stream and avoid fetching unneeded pages."""
+        make_request, requested = _paged_feed(total=1000)
+        async_client.edgar_session.make_request = make_request
+
+        filings = [
+            f async for f in async_client.iter_filings(
+                "320193", start=40, limit=30, page_size=20, concurrency=8,
+            )
+        ]
+
+        assert [f.accession_number for f in filings] == [f"{i:010d}" for i in range(40, 70)]
+        assert sorted(requested) == [40, 60]
+
+    @pytest.mark.asyncio
+    async def test_get_filings_paginates(self, async_client):
+        """get_filings should no longer stop after the first page."""
+        make_request, _ = _paged_feed(total=1000)
+        async_client.edgar_session.make_request = make_request
+
+        filings = await async_client.get_filings("320193", count=250)
+
+        assert len(filings) == 250
+        assert filings[-1].accession_number == f"{249:010d}"
+
+    @pytest.mark.asyncio
+    async def test_empty_feed(self, async_client):
+        """A company with no filings should yield nothing."""
+        async_client.edgar_session.make_request = AsyncMock(return_value=None)
+        assert not [f async for f in async_client.iter_filings("320193")]
+
+    def test_invalid_arguments_raise(self, async_client):
+        """page_size and concurrency should be validated eagerly."""
+        with pytest.raises(ValueError, match="page_size must be between 1 and 100"):
+            async_client.iter_filings("320193", page_size=101)
+        with pytest.raises(ValueError, match="concurrency must be at least 1"):
+            async_client.iter_filings("320193", concurrency=0)
+
+
 class TestRequireHttpx:
     """Tests for the _require_httpx helper."""
 
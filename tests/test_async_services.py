@@ -0,0 +1,222 @@
+"""Parity tests for the async services against the sync services."""
+
+# pylint: disable=redefined-outer-name
+# pylint: disable=protected-access
+
+import asyncio
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from edgar.async_client import EdgarAsyncClient
+from edgar.async_services import AsyncService, AsyncXbrl
+from edgar.client import EdgarClient
+from edgar.enums import FilingTypeCodes
+from edgar.rate_limiter import FileRateLimiter
+from tests.conftest import (
+    SAMPLE_ATOM_FEED,
+    SAMPLE_DIRECTORY_JSON,
+    SAMPLE_FILING_DIRECTORY_JSON,
+    SAMPLE_SUBMISSIONS_JSON,
+    SAMPLE_XBRL_COMPANY_FACTS,
+    TEST_USER_AGENT,
+)
+
+httpx = pytest.importorskip("httpx")
+
+SAMPLE_FRAMES_JSON = {"taxonomy": "us-gaap", "tag": "Revenues", "data": [{"cik": 320193}]}
+SAMPLE_CONCEPT_JSON = {"cik": 1326801, "units": {"USD": []}}
+
+
+def _fake_request(method, endpoint, **_):
+    """Routes a make_request call to (fresh copies of) canned SEC responses."""
+    return copy.deepcopy(_route(method, endpoint))
+
+
+def _route(method, endpoint):
+    """Picks the canned response for an endpoint."""
+    assert method.lower() == "get"
+    if "browse-edgar" in endpoint:
+        return SAMPLE_ATOM_FEED
+    if endpoint.startswith("/submissions/"):
+        return SAMPLE_SUBMISSIONS_JSON
+    if "/companyfacts/" in endpoint:
+        return SAMPLE_XBRL_COMPANY_FACTS
+    if "/companyconcept/" in endpoint:
+        return SAMPLE_CONCEPT_JSON
+    if "/frames/" in endpoint:
+        return SAMPLE_FRAMES_JSON
+    if endpoint.endswith("/000132680121000003/index.json"):
+        return SAMPLE_FILING_DIRECTORY_JSON
+    if endpoint.endswith("index.json"):
+        return SAMPLE_DIRECTORY_JSON
+    raise AssertionError(f"unexpected endpoint {endpoint}")
+
+
+# (service accessor, method, kwargs) triples run against both clients.
+PARITY_CALLS = [
+    ("archives", "get_company_directories", {"cik": "1326801"}),
+    ("archives", "get_company_directory", {"cik": "1326801", "filing_id": "000132680121000003"}),
+    ("companies", "get_companies_by_state", {"state_code": "TX"}),
+    ("companies", "get_company_by_cik", {"cik": "1326801"}),
+    ("filings", "get_filings_by_cik", {"cik": "1326801"}),
+    ("filings", "query", {"cik": "1326801", "filing_type": FilingTypeCodes.FILING_10K}),
+    ("submissions", "get_submissions", {"cik": "1326801"}),
+    ("xbrl", "company_facts", {"cik": "1326801"}),
+    ("xbrl", "company_concepts", {"cik": "1326801", "concept": "AccountsPayableCurrent"}),
+    ("xbrl", "frames", {"concept": "Revenues", "unit_of_measure": "USD", "period": "CY2023"}),
+]
+
+
+@pytest.fixture
+def sync_client():
+    """Return an EdgarClient answering from canned responses."""
+    client = EdgarClient(user_agent=TEST_USER_AGENT, cache=False)
+    client.edgar_session.make_request = MagicMock(side_effect=_fake_request)
+    client.edgar_session.fetch_page = MagicMock(return_value=None)
+    return client
+
+
+@pytest.fixture
+def async_client():
+    """Return an EdgarAsyncClient answering from the same canned responses."""
+    client = EdgarAsyncClient(user_agent=TEST_USER_AGENT)
+    client.edgar_session.make_request = AsyncMock(side_effect=_fake_request)
+    client.edgar_session.fetch_page = AsyncMock(return_value=None)
+    return client
+
+
+class TestAsyncServiceParity:
+    """Async services must return exactly what the sync services return."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("service, method, kwargs", PARITY_CALLS)
+    async def test_same_result(self, sync_client, async_client, service, method, kwargs):
+        """Verify each async method matches its sync counterpart."""
+        expected = getattr(getattr(sync_client, service)(), method)(**kwargs)
+        actual = await getattr(getattr(async_client.services, service)(), method)(**kwargs)
+
+        assert actual == expected
+        assert (
+            async_client.edgar_session.make_request.call_args
+            == sync_client.edgar_session.make_request.call_args
+        )
+        await async_client.close()
+
+    def test_every_service_has_an_async_accessor(self, sync_client, async_client):
+        """Verify EdgarAsyncClient.services exposes every EdgarClient service."""
+        accessors = [
+            "archives", "companies", "series", "mutual_funds",
+            "variable_insurance_products", "datasets", "filings", "current_events",
+            "issuers", "ownership_filings", "submissions", "xbrl", "tickers",
+            "full_text_search",
+        ]
+        for name in accessors:
+            sync_service = getattr(sync_client, name)()
+            async_service = getattr(async_client.services, name)()
+            assert isinstance(async_service, AsyncService)
+            assert async_service.service_class is type(sync_service)
+            assert getattr(async_client.services, name)() is async_service
+
+    def test_methods_mirror_sync_service(self, async_client):
+        """Verify wrapped methods keep their names and docstrings."""
+        xbrl = async_client.services.xbrl()
+        assert isinstance(xbrl, AsyncXbrl)
+        assert "frames" in dir(xbrl)
+        assert xbrl.frames.__doc__ == xbrl.service_class.frames.__doc__
+        assert asyncio.iscoroutinefunction(xbrl.frames)
+        with pytest.raises(AttributeError):
+            _ = xbrl.not_a_method
+
+
+class TestAsyncServiceExecution:
+    """Tests for where async service work runs."""
+
+    @pytest.mark.asyncio
+    async def test_parsing_runs_off_the_event_loop(self, async_client):
+        """Verify parsing happens in a worker thread, not the loop thread."""
+        parser = async_client.edgar_session.edgar_parser
+        original = parser.parse_entries
+        threads = []
+
+        def spy(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return original(*args, **kwargs)
+
+        parser.parse_entries = spy
+        await async_client.services.filings().get_filings_by_cik(cik="1326801")
+
+        assert threads and threading.get_ident() not in threads
+        await async_client.close()
+
+    @pytest.mark.asyncio
+    async def test_requests_use_async_session_and_limiter(self):
+        """Verify HTTP goes through httpx and the async rate limiter."""
+        client = EdgarAsyncClient(user_agent=TEST_USER_AGENT)
+        session = client.edgar_session
+        session.rate_limiter = MagicMock()
+        session.rate_limiter.reserve_async = AsyncMock(return_value=0.0)
+        requested = []
+
+        def handler(request):
+            requested.append(str(request.url))
+            return httpx.Response(200, json=SAMPLE_SUBMISSIONS_JSON)
+
+        session.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        result = await client.services.submissions().get_submissions(cik="1326801")
+
+        assert result == SAMPLE_SUBMISSIONS_JSON
+        assert requested == ["https://data.sec.gov/submissions/CIK0001326801.json"]
+        session.rate_limiter.reserve_async.assert_awaited_once()
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_more_calls_than_default_executor_threads(self, tmp_path):
+        """Verify bridged calls don't starve a limiter that needs the default executor."""
+        loop = asyncio.get_running_loop()
+        default_executor = ThreadPoolExecutor(max_workers=2)
+        loop.set_default_executor(default_executor)
+        client = EdgarAsyncClient(
+            user_agent=TEST_USER_AGENT,
+            rate_limiter=FileRateLimiter(str(tmp_path / "edgar.ratelimit"), rate=1000, burst=100),
+        )
+        client.edgar_session.http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json=SAMPLE_FRAMES_JSON))
+        )
+        xbrl = client.services.xbrl()
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(
+                xbrl.frames(concept="Revenues", unit_of_measure="USD", period=f"CY{2000 + i}")
+                for i in range(8)
+            )),
+            timeout=10,
+        )
+
+        assert results == [SAMPLE_FRAMES_JSON] * 8
+        await client.close()
+        default_executor.shutdown(wait=False)
+
+    @pytest.mark.asyncio
+    async def test_iterators_become_async_iterators(self, async_client):
+        """Verify streaming methods return async iterators."""
+        stream = await async_client.services.filings().iter_query(cik="1326801")
+        entries = [entry async for entry in stream]
+
+        sync = EdgarClient(user_agent=TEST_USER_AGENT, cache=False)
+        sync.edgar_session.make_request = MagicMock(side_effect=_fake_request)
+        assert entries == sync.filings().query(cik="1326801")
+        assert stream.offset == len(entries)
+        await async_client.close()
+
+    @pytest.mark.asyncio
+    async def test_bridge_refuses_calls_from_loop_thread(self, async_client):
+        """Verify blocking on the loop thread raises instead of deadlocking."""
+        service = async_client.services.submissions()._bind(asyncio.get_running_loop())
+        with pytest.raises(RuntimeError, match="event loop thread"):
+            service.get_submissions(cik="1326801")
+        await async_client.close()
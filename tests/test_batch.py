@@ -0,0 +1,240 @@
+"""Tests for concurrent bulk fetching (edgar.batch and fetch_many)."""
+
+# pylint: disable=redefined-outer-name
+# pylint: disable=import-outside-toplevel
+
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from edgar.batch import BatchResult, run_threaded
+from edgar.client import EdgarClient
+from edgar.exceptions import EdgarRequestError
+from edgar.session import POOL_MAXSIZE
+
+
+@pytest.fixture
+def client():
+    """Return an EdgarClient whose limiter never sleeps."""
+    edgar_client = EdgarClient(user_agent="Test test@example.com")
+    edgar_client.edgar_session.rate_limiter = MagicMock()
+    edgar_client.edgar_session.rate_limiter.reserve.return_value = 0.0
+    return edgar_client
+
+
+def _fake_submissions(method, endpoint, **_):
+    """Stand-in for make_request that fails for one CIK."""
+    assert method == "get"
+    if "0000000002" in endpoint:
+        raise EdgarRequestError("HTTP 404")
+    return {"cik": endpoint}
+
+
+# ---------------------------------------------------------------------------
+# run_threaded tests
+# ---------------------------------------------------------------------------
+
+
+class TestRunThreaded:
+    """Tests for the thread-pool batch runner."""
+
+    def test_yields_every_key(self):
+        """Every key should produce exactly one result."""
+        results = list(run_threaded(str.upper, ["a", "b", "c"], max_workers=2))
+        assert sorted(r.value for r in results) == ["A", "B", "C"]
+        assert all(r.ok for r in results)
+
+    def test_errors_do_not_abort_batch(self):
+        """A failing item should be reported, not raised."""
+
+        def func(key):
+            if key == "bad":
+                raise ValueError("boom")
+            return key
+
+        results = {r.key: r for r in run_threaded(func, ["ok", "bad", "fine"])}
+        assert not results["bad"].ok
+        assert isinstance(results["bad"].error, ValueError)
+        assert results["ok"].value == "ok"
+        assert results["fine"].value == "fine"
+
+    def test_concurrency_is_bounded(self):
+        """No more than max_workers calls should run at once."""
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def func(key):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return key
+
+        results = list(run_threaded(func, [str(i) for i in range(20)], max_workers=3))
+        assert len(results) == 20
+        assert peak[0] <= 3
+
+    def test_keys_are_consumed_lazily(self):
+        """The runner should not drain the input before yielding."""
+        consumed = []
+
+        def keys():
+            for i in range(1000):
+                consumed.append(i)
+                yield str(i)
+
+        results = run_threaded(str, keys(), max_workers=2)
+        next(results)
+        results.close()
+        assert len(consumed) < 1000
+
+    def test_invalid_max_workers_raises(self):
+        """Verify max_workers is validated."""
+        with pytest.raises(ValueError, match="max_workers must be at least 1"):
+            list(run_threaded(str, ["a"], max_workers=0))
+
+    def test_batch_result_ok(self):
+        """Verify ok reflects the presence of an error."""
+        assert BatchResult(key="1", value={}).ok
+        assert not BatchResult(key="1", error=RuntimeError()).ok
+
+
+# ---------------------------------------------------------------------------
+# EdgarClient.bulk.fetch_many tests
+# ---------------------------------------------------------------------------
+
+
+class TestClientFetchMany:
+    """Tests for EdgarClient.bulk.fetch_many."""
+
+    def test_submissions_batch(self, client):
+        """Verify submissions are fetched for each CIK and errors captured."""
+        with patch.object(
+            client.edgar_session, "make_request", side_effect=_fake_submissions
+        ):
+            results = {r.key: r for r in client.bulk.fetch_many([1, "2", "3"])}
+
+        assert results["1"].value == {"cik": "/submissions/CIK0000000001.json"}
+        assert isinstance(results["2"].error, EdgarRequestError)
+        assert results["3"].ok
+
+    def test_company_facts_batch(self, client):
+        """Verify endpoint='company_facts' hits the XBRL API."""
+        with patch.object(
+            client.edgar_session, "make_request", return_value={"facts": {}}
+        ) as mock_request:
+            results = list(client.bulk.fetch_many(["320193"], endpoint="company_facts"))
+
+        assert results[0].value == {"facts": {}}
+        endpoint = mock_request.call_args.kwargs["endpoint"]
+        assert endpoint == "/api/xbrl/companyfacts/CIK0000320193.json"
+
+    def test_batch_populates_cache(self, client):
+        """Results should land in the TTL cache like single calls do."""
+        with patch.object(
+            client.edgar_session, "make_request", return_value={"name": "Apple Inc."}
+        ) as mock_request:
+            list(client.bulk.fetch_many(["320193"]))
+            client.submissions().get_submissions(cik="320193")
+
+        mock_request.assert_called_once()
+
+    def test_invalid_cik_is_captured(self, client):
+        """A malformed CIK should become a per-item ValueError."""
+        with patch.object(client.edgar_session, "make_request", return_value={}):
+            results = list(client.bulk.fetch_many(["AAPL"]))
+        assert isinstance(results[0].error, ValueError)
+
+    def test_unknown_endpoint_raises(self, client):
+        """Verify unknown endpoints are rejected eagerly."""
+        with pytest.raises(ValueError, match="endpoint must be one of"):
+            client.bulk.fetch_many(["320193"], endpoint="filings")
+
+    def test_max_workers_bounded_by_pool(self, client):
+        """Verify max_workers can't exceed the connection pool."""
+        with pytest.raises(ValueError, match="max_workers must be between 1 and"):
+            client.bulk.fetch_many(["320193"], max_workers=POOL_MAXSIZE + 1)
+
+    def test_client_fetch_many_delegates(self, client):
+        """Verify EdgarClient.fetch_many still works and matches bulk.fetch_many."""
+        with patch.object(client.edgar_session, "make_request", return_value={"facts": {}}):
+            results = list(client.fetch_many(["320193"], endpoint="company_facts"))
+        assert results[0].value == {"facts": {}}
+        assert client.fetch_many == client.bulk.fetch_many
+
+
+# ---------------------------------------------------------------------------
+# EdgarAsyncClient.bulk.fetch_many tests
+# ---------------------------------------------------------------------------
+
+
+class TestAsyncClientFetchMany:
+    """Tests for EdgarAsyncClient.bulk.fetch_many."""
+
+    @pytest.mark.asyncio
+    async def test_async_batch_captures_errors(self):
+        """Verify the async batch yields every CIK and captures errors."""
+        pytest.importorskip("httpx")
+        from edgar.async_client import EdgarAsyncClient
+
+        async def fake_request(method, endpoint, **kwargs):
+            return _fake_submissions(method, endpoint, **kwargs)
+
+        client = EdgarAsyncClient(user_agent="Test test@example.com")
+        client.edgar_session.make_request = AsyncMock(side_effect=fake_request)
+
+        results = {r.key: r async for r in client.bulk.fetch_many(["1", "2", "x"], concurrency=2)}
+
+        assert results["1"].value == {"cik": "/submissions/CIK0000000001.json"}
+        assert isinstance(results["2"].error, EdgarRequestError)
+        assert isinstance(results["x"].error, ValueError)
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_client_fetch_many_delegates(self):
+        """Verify EdgarAsyncClient.fetch_many still works and matches bulk.fetch_many."""
+        pytest.importorskip("httpx")
+        from edgar.async_client import EdgarAsyncClient
+
+        client = EdgarAsyncClient(user_agent="Test test@example.com")
+        client.edgar_session.make_request = AsyncMock(return_value={"facts": {}})
+
+        results = [r async for r in client.fetch_many(["320193"], endpoint="company_facts")]
+
+        assert results[0].value == {"facts": {}}
+        assert client.fetch_many == client.bulk.fetch_many
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_async_concurrency_is_bounded(self):
+        """No more than `concurrency` requests should be in flight."""
+        pytest.importorskip("httpx")
+        import asyncio
+
+        from edgar.async_client import EdgarAsyncClient
+
+        active = [0]
+        peak = [0]
+
+        async def fake_request(**_):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0)
+            active[0] -= 1
+            return {}
+
+        client = EdgarAsyncClient(user_agent="Test test@example.com")
+        client.edgar_session.make_request = fake_request
+
+        results = [r async for r in client.bulk.fetch_many(
+            [str(i) for i in range(1, 21)], endpoint="company_facts", concurrency=4,
+        )]
+
+        assert len(results) == 20
+        assert peak[0] <= 4
+        await client.close()
@@ -0,0 +1,167 @@
+"""Tests for serving submissions and company facts from local bulk archives."""
+
+# pylint: disable=redefined-outer-name
+
+import json
+import os
+import time
+import zipfile
+from unittest.mock import MagicMock
+
+import pytest
+
+from edgar.bulk_data import BULK_ARCHIVES, BULK_MAX_AGE, BulkData
+from edgar.client import EdgarClient
+from edgar.instrumentation import MetricsCollector
+from edgar.models import Facts
+
+APPLE_SUBMISSIONS = {"cik": "320193", "name": "Apple Inc.", "filings": {"recent": {}, "files": []}}
+APPLE_FACTS = {"cik": 320193, "entityName": "Apple Inc.", "facts": {"dei": {}}}
+
+
+def _write_archive(path, members: dict[str, dict]) -> None:
+    """Writes a ZIP of JSON members like SEC's bulk archives."""
+
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, document in members.items():
+            archive.writestr(name, json.dumps(document))
+
+
+@pytest.fixture
+def bulk_dir(tmp_path):
+    """Return a directory holding both archives."""
+    _write_archive(tmp_path / "submissions.zip", {
+        "CIK0000320193.json": APPLE_SUBMISSIONS,
+        "CIK0000320193-submissions-001.json": {"accessionNumber": []},
+        "CIK0000789019.json": {"cik": "789019", "name": "MICROSOFT CORP"},
+    })
+    _write_archive(tmp_path / "companyfacts.zip", {"CIK0000320193.json": APPLE_FACTS})
+    return tmp_path
+
+
+@pytest.fixture
+def bulk_client(bulk_dir):
+    """Return an EdgarClient reading from bulk_dir, with a mocked request path."""
+    edgar_client = EdgarClient(user_agent="Test test@example.com", bulk_dir=str(bulk_dir))
+    edgar_client.edgar_session.make_request = MagicMock(return_value={"cik": "1018724", "name": "AMAZON COM INC"})
+    yield edgar_client
+    edgar_client.bulk.data.close()
+
+
+class TestBulkData:
+    """Tests for reading archive members."""
+
+    def test_reads_member_by_cik(self, bulk_dir):
+        """Verify a company's document is read with or without leading zeros."""
+        bulk_data = BulkData(str(bulk_dir))
+        assert bulk_data.submissions("320193") == APPLE_SUBMISSIONS
+        assert bulk_data.submissions(320193) == APPLE_SUBMISSIONS
+        assert bulk_data.company_facts("0000320193") == APPLE_FACTS
+        bulk_data.close()
+
+    def test_missing_company_or_archive(self, tmp_path):
+        """Verify unknown CIKs and archives not downloaded yet return None."""
+        _write_archive(tmp_path / "submissions.zip", {"CIK0000320193.json": APPLE_SUBMISSIONS})
+        bulk_data = BulkData(str(tmp_path))
+        assert bulk_data.submissions("1018724") is None
+        assert bulk_data.company_facts("320193") is None
+        assert not bulk_data.has("companyfacts")
+        assert bulk_data.age("companyfacts") is None
+        bulk_data.close()
+
+    def test_ciks_skip_older_filing_pages(self, bulk_dir):
+        """Verify only one entry per company is listed."""
+        bulk_data = BulkData(str(bulk_dir))
+        assert bulk_data.ciks("submissions") == ["0000320193", "0000789019"]
+        assert dict(bulk_data.iter_companies("submissions"))["0000789019"]["name"] == "MICROSOFT CORP"
+        bulk_data.close()
+
+    def test_unknown_archive(self, tmp_path):
+        """Verify archive names are validated."""
+        with pytest.raises(ValueError, match="archive must be one of"):
+            BulkData(str(tmp_path)).path("frames")
+
+    def test_download_streams_and_reopens(self, bulk_dir):
+        """Verify download() streams each archive and later reads see the new file."""
+        session = MagicMock()
+
+        def download_to_file(url, path):
+            assert url == BULK_ARCHIVES["submissions"]
+            _write_archive(path, {"CIK0000320193.json": {"name": "Apple Inc. (new)"}})
+            return path
+
+        session.download_to_file = MagicMock(side_effect=download_to_file)
+        bulk_data = BulkData(str(bulk_dir), session=session)
+        assert bulk_data.submissions("320193") == APPLE_SUBMISSIONS
+
+        assert bulk_data.download("submissions") == [str(bulk_dir / "submissions.zip")]
+        assert bulk_data.submissions("320193") == {"name": "Apple Inc. (new)"}
+        bulk_data.close()
+
+    def test_download_needs_session(self, tmp_path):
+        """Verify a read-only BulkData refuses to download."""
+        with pytest.raises(ValueError, match="session"):
+            BulkData(str(tmp_path)).download()
+
+
+class TestBulkLookups:
+    """Tests for services answering from the archives."""
+
+    def test_submissions_from_archive(self, bulk_client):
+        """Verify get_submissions reads the archive without a request."""
+        metrics = MetricsCollector()
+        bulk_client.hooks.subscribe(metrics)
+
+        assert bulk_client.submissions().get_submissions(cik="320193") == APPLE_SUBMISSIONS
+
+        bulk_client.edgar_session.make_request.assert_not_called()
+        assert metrics.snapshot().cache_hits == {"bulk": 1}
+        assert metrics.snapshot().cache_hit_ratio == 1.0
+
+    def test_company_facts_from_archive(self, bulk_client):
+        """Verify company_facts and get_facts read companyfacts.zip."""
+        facts = bulk_client.xbrl().get_facts(cik="320193")
+        assert isinstance(facts, Facts)
+        assert facts.entity_name == "Apple Inc."
+        bulk_client.edgar_session.make_request.assert_not_called()
+
+    def test_missing_company_falls_back_to_api(self, bulk_client):
+        """Verify CIKs absent from the archive are fetched from the API."""
+        response = bulk_client.submissions().get_submissions(cik="1018724")
+        assert response["name"] == "AMAZON COM INC"
+        bulk_client.edgar_session.make_request.assert_called_once()
+
+    def test_stale_archive_falls_back_to_api(self, bulk_client, bulk_dir):
+        """Verify an archive older than its max_age is no longer served."""
+        stale = time.time() - BULK_MAX_AGE["submissions"] - 60
+        os.utime(bulk_dir / "submissions.zip", (stale, stale))
+
+        assert not bulk_client.bulk.data.is_fresh("submissions")
+        assert bulk_client.bulk.data.is_fresh("companyfacts")
+        response = bulk_client.submissions().get_submissions(cik="320193")
+        assert response["name"] == "AMAZON COM INC"
+        bulk_client.edgar_session.make_request.assert_called_once()
+        # Direct reads still see the archive.
+        assert bulk_client.bulk.data.submissions("320193") == APPLE_SUBMISSIONS
+
+    def test_archive_serves_until_next_rebuild(self, bulk_client, bulk_dir):
+        """Verify a nightly archive keeps serving lookups for hours after its download."""
+        earlier = time.time() - 6 * 3600
+        os.utime(bulk_dir / "submissions.zip", (earlier, earlier))
+
+        assert bulk_client.submissions().get_submissions(cik="320193") == APPLE_SUBMISSIONS
+        bulk_client.edgar_session.make_request.assert_not_called()
+
+    def test_max_age_is_configurable(self, bulk_dir):
+        """Verify a longer max_age keeps serving an older archive."""
+        stale = time.time() - 2 * 86400
+        os.utime(bulk_dir / "submissions.zip", (stale, stale))
+        bulk_data = BulkData(str(bulk_dir), max_age={"submissions": 7 * 86400})
+
+        assert bulk_data.lookup("submissions", "320193") == APPLE_SUBMISSIONS
+        assert bulk_data.max_age["companyfacts"] == BULK_MAX_AGE["companyfacts"]
+        bulk_data.close()
+
+    def test_without_bulk_dir(self):
+        """Verify clients without bulk_dir have no archives."""
+        assert EdgarClient(user_agent="Test test@example.com").bulk.data is None
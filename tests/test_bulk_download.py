@@ -0,0 +1,221 @@
+"""Tests for the concurrent bulk filing downloader and its manifest."""
+
+# pylint: disable=redefined-outer-name
+
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from edgar.bulk_download import (
+    DONE,
+    FAILED,
+    BulkDownloader,
+    DownloadManifest,
+    filing_directory,
+    local_path,
+)
+from edgar.client import EdgarClient
+from edgar.exceptions import EdgarRequestError
+
+FILING_URL = "https://www.sec.gov/Archives/edgar/data/320193/000032019323000106/"
+
+INDEX_JSON = {
+    "directory": {
+        "name": "/Archives/edgar/data/320193/000032019323000106",
+        "item": [
+            {"name": "0000320193-23-000106-index.htm", "type": "text.gif"},
+            {"name": "aapl-20230930.htm", "type": "text.gif"},
+            {"name": "a10-kexhibit2111.htm", "type": "text.gif"},
+            {"name": "R1.xml", "type": "text.gif"},
+            {"name": "Financial_Report.xlsx", "type": "text.gif"},
+            {"name": "old", "type": "folder.gif"},
+        ],
+    }
+}
+
+
+def _session(fail: set[str] | None = None) -> MagicMock:
+    """Mock EdgarSession serving INDEX_JSON and writing each URL to disk."""
+
+    fail = fail if fail is not None else set()
+    session = MagicMock()
+    session.make_request.return_value = INDEX_JSON
+
+    def download_to_file(url, path):
+        if url in fail:
+            raise EdgarRequestError(f"Download from {url} returned status 503")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(url)
+        return path
+
+    session.download_to_file = MagicMock(side_effect=download_to_file)
+    return session
+
+
+@pytest.fixture
+def downloader(tmp_path):
+    """Return a BulkDownloader over a mocked session."""
+    bulk_downloader = BulkDownloader(_session(), str(tmp_path), max_workers=2, patterns=["*.htm"])
+    yield bulk_downloader
+    bulk_downloader.close()
+
+
+class TestFilingDirectory:
+    """Tests for recognizing filings among download items."""
+
+    @pytest.mark.parametrize("item", [
+        "0000320193-23-000106",
+        "000032019323000106",
+        FILING_URL,
+        FILING_URL + "0000320193-23-000106-index.htm",
+        FILING_URL + "index.json",
+    ])
+    def test_filings(self, item):
+        """Verify accession numbers and index pages resolve to the filing directory."""
+        assert filing_directory(item) == FILING_URL
+
+    def test_cik_accession_pair(self):
+        """Verify a (cik, accession) pair uses the given CIK, not the accession prefix."""
+        url = "https://www.sec.gov/Archives/edgar/data/320193/000119312523012345/"
+        assert filing_directory(("320193", "0001193125-23-012345")) == url
+        assert filing_directory((320193, "000119312523012345")) == url
+        with pytest.raises(ValueError, match="pair"):
+            filing_directory(("AAPL", "0001193125-23-012345"))
+
+    def test_document_url(self):
+        """Verify a document URL is not treated as a filing."""
+        assert filing_directory(FILING_URL + "aapl-20230930.htm") is None
+
+    def test_local_path_layout(self, tmp_path):
+        """Verify archive documents keep the cik/accession/file layout."""
+        path = local_path(str(tmp_path), FILING_URL + "aapl-20230930.htm")
+        assert path == os.path.join(str(tmp_path), "320193", "000032019323000106", "aapl-20230930.htm")
+        other = local_path(str(tmp_path), "https://www.sec.gov/files/company_tickers.json")
+        assert other == os.path.join(str(tmp_path), "www.sec.gov", "files", "company_tickers.json")
+
+    def test_local_path_stays_in_directory(self, tmp_path):
+        """Verify URLs can't escape the download directory."""
+        with pytest.raises(ValueError):
+            local_path(str(tmp_path), "https://www.sec.gov/../../etc/passwd")
+
+
+class TestBulkDownloader:
+    """Tests for BulkDownloader runs, re-runs and retries."""
+
+    def test_downloads_matching_documents(self, downloader):
+        """Verify a filing expands to its matching documents, saved in the layout."""
+        report = downloader.run(["0000320193-23-000106"])
+
+        assert report.ok
+        assert sorted(report.downloaded) == [
+            FILING_URL + "0000320193-23-000106-index.htm",
+            FILING_URL + "a10-kexhibit2111.htm",
+            FILING_URL + "aapl-20230930.htm",
+        ]
+        downloader.edgar_session.make_request.assert_called_once_with(
+            method="get", endpoint="/Archives/edgar/data/320193/000032019323000106/index.json"
+        )
+        assert os.path.exists(downloader.path_for(FILING_URL + "aapl-20230930.htm"))
+        assert downloader.manifest.counts() == {DONE: 3}
+
+    def test_rerun_skips_completed(self, downloader):
+        """Verify a second run neither lists the filing nor downloads again."""
+        downloader.run([FILING_URL])
+        downloader.edgar_session.reset_mock()
+
+        report = downloader.run([FILING_URL])
+
+        assert len(report.skipped) == 3
+        assert not report.downloaded
+        downloader.edgar_session.make_request.assert_not_called()
+        downloader.edgar_session.download_to_file.assert_not_called()
+
+    def test_missing_file_is_downloaded_again(self, downloader):
+        """Verify a document deleted from disk is fetched on the next run."""
+        url = FILING_URL + "aapl-20230930.htm"
+        downloader.run([url])
+        os.remove(downloader.path_for(url))
+
+        assert downloader.run([url]).downloaded == [url]
+
+    def test_failures_are_recorded_and_retried(self, tmp_path):
+        """Verify a failing document doesn't stop the run and is retried alone later."""
+        bad = FILING_URL + "a10-kexhibit2111.htm"
+        session = _session(fail={bad})
+        bulk_downloader = BulkDownloader(session, str(tmp_path), patterns=["*.htm"])
+
+        report = bulk_downloader.run([FILING_URL])
+        assert not report.ok
+        assert "503" in report.failed[bad]
+        assert len(report.downloaded) == 2
+        assert bulk_downloader.manifest.failed() == [bad]
+
+        session.download_to_file.reset_mock()
+        session.download_to_file.side_effect = _session().download_to_file.side_effect
+        report = bulk_downloader.retry_failed()
+
+        assert report.downloaded == [bad]
+        session.download_to_file.assert_called_once()
+        assert bulk_downloader.manifest.status(bad) == DONE
+        bulk_downloader.close()
+
+    def test_unresolvable_filing_is_reported(self, downloader):
+        """Verify a filing whose index can't be fetched is reported, not raised."""
+        downloader.edgar_session.make_request.side_effect = EdgarRequestError("404 Not Found")
+
+        report = downloader.run([FILING_URL, FILING_URL + "R1.xml"])
+
+        assert report.failed == {FILING_URL: "404 Not Found"}
+        assert report.downloaded == [FILING_URL + "R1.xml"]
+
+    def test_bare_accession_failure_suggests_the_cik(self, downloader):
+        """Verify a bare accession number that can't be listed asks for the filer's CIK."""
+        downloader.edgar_session.make_request.side_effect = EdgarRequestError("404 Not Found")
+
+        report = downloader.run(["0001193125-23-012345"])
+
+        [error] = report.failed.values()
+        assert error.startswith("404 Not Found")
+        assert "pass (cik, accession)" in error
+
+    def test_cik_accession_pairs(self, downloader):
+        """Verify a (cik, accession) pair lists the filing under the company's CIK."""
+        report = downloader.run([(320193, "0001193125-23-012345")])
+
+        assert report.ok
+        downloader.edgar_session.make_request.assert_called_once_with(
+            method="get", endpoint="/Archives/edgar/data/320193/000119312523012345/index.json"
+        )
+
+    def test_invalid_max_workers(self, tmp_path):
+        """Verify the worker count is bounded by the connection pool."""
+        with pytest.raises(ValueError):
+            BulkDownloader(_session(), str(tmp_path), max_workers=0)
+
+    def test_archives_factory(self, tmp_path):
+        """Verify Archives.bulk_downloader shares the client's session."""
+        edgar_client = EdgarClient(user_agent="Test test@example.com")
+        bulk_downloader = edgar_client.archives().bulk_downloader(str(tmp_path), max_workers=3)
+        assert bulk_downloader.edgar_session is edgar_client.edgar_session
+        assert bulk_downloader.max_workers == 3
+        bulk_downloader.close()
+
+
+class TestDownloadManifest:
+    """Tests for the SQLite manifest."""
+
+    def test_attempts_accumulate(self, tmp_path):
+        """Verify repeated records update the row and count attempts."""
+        manifest = DownloadManifest(str(tmp_path / "manifest.sqlite3"))
+        manifest.record("https://example.com/a", "/tmp/a", FAILED, error="timeout")
+        manifest.record("https://example.com/a", "/tmp/a", DONE, size=10)
+        assert manifest.status("https://example.com/a") == DONE
+        assert manifest.status("https://example.com/b") is None
+        assert len(manifest) == 1
+        manifest.close()
+
+        reopened = DownloadManifest(str(tmp_path / "manifest.sqlite3"))
+        attempts = reopened._conn.execute("SELECT attempts FROM files").fetchone()[0]  # pylint: disable=protected-access
+        assert attempts == 2
+        reopened.close()
@@ -6,7 +6,17 @@
 
 from unittest.mock import MagicMock, patch
 
-from edgar.cache import TTLCache, TTL_TICKERS, TTL_TAXONOMY, TTL_SUBMISSIONS
+import pytest
+
+from edgar.cache import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_ENTRIES,
+    TTLCache,
+    TTL_TICKERS,
+    TTL_TAXONOMY,
+    TTL_SUBMISSIONS,
+    approximate_size,
+)
 from edgar.tickers import Tickers
 from edgar.submissions import Submissions
 from edgar.xbrl import Xbrl
@@ -149,6 +159,105 @@ class TestTTLCacheLenRepr:
         assert "entries=1" in repr(cache)
 
 
+# ---------------------------------------------------------------------------
+# TTLCache bounds and eviction tests
+# ---------------------------------------------------------------------------
+
+
+class TestTTLCacheBounds:
+    """Tests for max_entries / max_bytes LRU eviction."""
+
+    def test_max_entries_evicts_least_recently_used(self):
+        """Verify the oldest entry is evicted when max_entries is exceeded."""
+        cache = TTLCache(max_entries=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.set("c", 3, ttl=60)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_get_refreshes_recency(self):
+        """Verify a read moves the entry to the most-recently-used end."""
+        cache = TTLCache(max_entries=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.get("a")
+        cache.set("c", 3, ttl=60)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+    def test_max_bytes_evicts_until_within_budget(self):
+        """Verify entries are evicted once the byte budget is exceeded."""
+        cache = TTLCache(max_bytes=100, sizeof=lambda value: 40)
+        cache.set("a", "x", ttl=60)
+        cache.set("b", "y", ttl=60)
+        cache.set("c", "z", ttl=60)
+        assert cache.get("a") is None
+        assert cache.stats.bytes == 80
+
+    def test_oversized_value_is_not_stored(self):
+        """Verify a value larger than the whole budget is skipped."""
+        cache = TTLCache(max_bytes=10, sizeof=lambda value: 50)
+        cache.set("big", "payload", ttl=60)
+        assert cache.get("big") is None
+        assert cache.stats.bytes == 0
+
+    def test_overwrite_releases_previous_size(self):
+        """Verify overwriting a key doesn't double-count its bytes."""
+        cache = TTLCache(max_bytes=1000, sizeof=lambda value: 100)
+        cache.set("a", 1, ttl=60)
+        cache.set("a", 2, ttl=60)
+        assert cache.stats.bytes == 100
+
+    def test_expired_entries_swept_on_write(self):
+        """Verify expired entries are dropped on set() without being read."""
+        cache = TTLCache()
+        with patch("edgar.cache.time.monotonic", return_value=1000.0):
+            cache.set("stale", "v", ttl=5)
+        with patch("edgar.cache.time.monotonic", return_value=1010.0):
+            cache.set("fresh", "v", ttl=60)
+        assert "stale" not in cache._store
+        assert cache.stats.expirations == 1
+
+    def test_invalid_bounds_raise(self):
+        """Verify non-positive bounds raise ValueError."""
+        with pytest.raises(ValueError, match="max_entries"):
+            TTLCache(max_entries=0)
+        with pytest.raises(ValueError, match="max_bytes"):
+            TTLCache(max_bytes=0)
+
+
+class TestTTLCacheStats:
+    """Tests for hit/miss/eviction counters."""
+
+    def test_counts_hits_misses_and_evictions(self):
+        """Verify counters track every lookup outcome."""
+        cache = TTLCache(max_entries=1)
+        cache.set("a", 1, ttl=60)
+        cache.get("a")
+        cache.get("missing")
+        cache.set("b", 2, ttl=60)
+        stats = cache.stats
+        assert (stats.hits, stats.misses, stats.evictions) == (1, 1, 1)
+        assert stats.entries == 1
+
+    def test_hit_ratio(self):
+        """Verify hit_ratio is hits over total lookups."""
+        cache = TTLCache()
+        assert cache.stats.hit_ratio == 0.0
+        cache.set("a", 1, ttl=60)
+        cache.get("a")
+        cache.get("b")
+        assert cache.stats.hit_ratio == 0.5
+
+    def test_approximate_size_counts_nested_values(self):
+        """Verify nested payloads report a larger size than empty ones."""
+        small = approximate_size({})
+        large = approximate_size({"facts": {"us-gaap": [{"val": i} for i in range(100)]}})
+        assert large > small * 10
+
+
 # ---------------------------------------------------------------------------
 # TTL constants tests
 # ---------------------------------------------------------------------------
@@ -192,6 +301,22 @@ class TestEdgarClientCacheParam:
         client = EdgarClient(user_agent="Test test@test.com", cache=False)
         assert client._ttl_cache is None
 
+    def test_cache_true_uses_default_bounds(self):
+        """Verify EdgarClient(cache=True) creates a bounded cache."""
+        from edgar.client import EdgarClient
+
+        client = EdgarClient(user_agent="Test test@test.com")
+        assert client._ttl_cache.max_entries == DEFAULT_MAX_ENTRIES
+        assert client._ttl_cache.max_bytes == DEFAULT_MAX_BYTES
+
+    def test_cache_accepts_instance(self):
+        """Verify a caller-supplied TTLCache is used as-is."""
+        from edgar.client import EdgarClient
+
+        custom = TTLCache(max_entries=5)
+        client = EdgarClient(user_agent="Test test@test.com", cache=custom)
+        assert client.edgar_session.cache is custom
+
 
 # ---------------------------------------------------------------------------
 # Tickers cache integration tests
@@ -214,6 +339,7 @@ class TestTickersCaching:
 
         session = MagicMock()
         session.cache = cache
+        session.ticker_snapshot = None
         service = Tickers(session=session)
         result = service.resolve_ticker("AAPL")
 
@@ -225,6 +351,7 @@ class TestTickersCaching:
         cache = TTLCache()
         session = MagicMock()
         session.cache = cache
+        session.ticker_snapshot = None
         session.make_request.return_value = SAMPLE_TICKERS_JSON
 
         service = Tickers(session=session)
@@ -237,6 +364,7 @@ class TestTickersCaching:
         """Verify tickers work normally when cache is None."""
         session = MagicMock()
         session.cache = None
+        session.ticker_snapshot = None
         session.make_request.return_value = SAMPLE_TICKERS_JSON
 
         service = Tickers(session=session)
@@ -263,6 +391,7 @@ class TestSubmissionsCaching:
         session = MagicMock()
         session.cache = cache
         session.edgar_utilities = MagicMock()
+        session.bulk_data = None
 
         service = Submissions(session=session)
         result = service.get_submissions(cik="320193")
@@ -277,6 +406,7 @@ class TestSubmissionsCaching:
         session.cache = cache
         session.make_request.return_value = SAMPLE_SUBMISSIONS_RESPONSE
         session.edgar_utilities = MagicMock()
+        session.bulk_data = None
 
         service = Submissions(session=session)
         service.get_submissions(cik="320193")
@@ -290,6 +420,7 @@ class TestSubmissionsCaching:
         session.cache = None
         session.make_request.return_value = SAMPLE_SUBMISSIONS_RESPONSE
         session.edgar_utilities = MagicMock()
+        session.bulk_data = None
 
         service = Submissions(session=session)
         result = service.get_submissions(cik="320193")
@@ -304,6 +435,7 @@ class TestSubmissionsCaching:
         session.cache = cache
         session.make_request.return_value = None
         session.edgar_utilities = MagicMock()
+        session.bulk_data = None
 
         service = Submissions(session=session)
         service.get_submissions(cik="320193")
@@ -328,6 +460,7 @@ class TestXbrlCaching:
         session = MagicMock()
         session.cache = cache
         session.edgar_utilities = MagicMock()
+        session.bulk_data = None
 
         xbrl = Xbrl(session=session)
         result = xbrl.company_facts(cik="320193")
@@ -342,6 +475,7 @@ class TestXbrlCaching:
         session.cache = cache
         session.make_request.return_value = SAMPLE_COMPANY_FACTS
         session.edgar_utilities = MagicMock()
+        session.bulk_data = None
 
         xbrl = Xbrl(session=session)
         xbrl.company_facts(cik="320193")
@@ -355,6 +489,7 @@ class TestXbrlCaching:
         session.cache = None
         session.make_request.return_value = SAMPLE_COMPANY_FACTS
         session.edgar_utilities = MagicMock()
+        session.bulk_data = None
 
         xbrl = Xbrl(session=session)
         result = xbrl.company_facts(cik="320193")
@@ -369,6 +504,7 @@ class TestXbrlCaching:
         session.cache = cache
         session.make_request.return_value = None
         session.edgar_utilities = MagicMock()
+        session.bulk_data = None
 
         xbrl = Xbrl(session=session)
         xbrl.company_facts(cik="320193")
@@ -382,6 +518,7 @@ class TestXbrlCaching:
         session.cache = cache
         session.make_request.return_value = SAMPLE_COMPANY_FACTS
         session.edgar_utilities = MagicMock()
+        session.bulk_data = None
 
         xbrl = Xbrl(session=session)
         xbrl.company_facts(cik="320193")
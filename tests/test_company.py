@@ -56,6 +56,7 @@ def mock_session():
     """Return a mock EdgarSession."""
     session = MagicMock()
     session.cache = None
+    session.bulk_data = None
     return session
 
 
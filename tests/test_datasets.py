@@ -4,11 +4,13 @@
 
 import io
 import zipfile
+from datetime import date, datetime
+from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from edgar.datasets import _extract_tsv_zip
+from edgar.datasets import FinancialStatementArchive
 
 
 # ---------------------------------------------------------------------------
@@ -59,22 +61,38 @@ def _build_zip_bytes(
 SAMPLE_ZIP_BYTES = _build_zip_bytes()
 
 
+def _stream_zip(zip_bytes: bytes = SAMPLE_ZIP_BYTES) -> MagicMock:
+    """Mock for EdgarSession.stream_to_file that writes a ZIP archive."""
+
+    def write(_url, fileobj):
+        fileobj.write(zip_bytes)
+        return True
+
+    return MagicMock(side_effect=write)
+
+
+def _read_tables(zip_bytes: bytes) -> dict[str, list[dict]]:
+    """Reads every table of a ZIP archive as untyped row dicts."""
+    with FinancialStatementArchive(io.BytesIO(zip_bytes)) as archive:
+        return {table: list(archive.iter_rows(table, typed=False)) for table in archive.tables}
+
+
 # ---------------------------------------------------------------------------
-# _extract_tsv_zip tests
+# Untyped table reading tests
 # ---------------------------------------------------------------------------
 
 
-class TestExtractTsvZip:
-    """Tests for the _extract_tsv_zip helper function."""
+class TestReadTables:
+    """Tests for reading whole tables as raw strings."""
 
     def test_extracts_all_txt_files(self):
         """Verify all .txt files in ZIP are extracted."""
-        result = _extract_tsv_zip(SAMPLE_ZIP_BYTES)
+        result = _read_tables(SAMPLE_ZIP_BYTES)
         assert set(result.keys()) == {"sub", "num", "tag", "pre"}
 
     def test_sub_file_parsed_correctly(self):
         """Verify sub.txt rows are parsed as dicts with correct keys."""
-        result = _extract_tsv_zip(SAMPLE_ZIP_BYTES)
+        result = _read_tables(SAMPLE_ZIP_BYTES)
         subs = result["sub"]
         assert len(subs) == 2
         assert subs[0]["adsh"] == "0001193125-24-047930"
@@ -84,7 +102,7 @@ class TestExtractTsvZip:
 
     def test_num_file_parsed_correctly(self):
         """Verify num.txt rows are parsed as dicts with correct values."""
-        result = _extract_tsv_zip(SAMPLE_ZIP_BYTES)
+        result = _read_tables(SAMPLE_ZIP_BYTES)
         nums = result["num"]
         assert len(nums) == 2
         assert nums[0]["tag"] == "Revenues"
@@ -97,20 +115,29 @@ class TestExtractTsvZip:
             "readme.md": "# README\nThis is not data.",
             "metadata.json": '{"version": 1}',
         }
-        result = _extract_tsv_zip(_build_zip_bytes(files))
+        result = _read_tables(_build_zip_bytes(files))
         assert set(result.keys()) == {"sub"}
 
     def test_empty_zip(self):
         """Verify empty ZIP returns empty dict."""
-        result = _extract_tsv_zip(_build_zip_bytes({}))
+        result = _read_tables(_build_zip_bytes({}))
         assert not result
 
     def test_single_row_file(self):
         """Verify single-row TSV files are handled correctly."""
-        result = _extract_tsv_zip(SAMPLE_ZIP_BYTES)
+        result = _read_tables(SAMPLE_ZIP_BYTES)
         assert len(result["tag"]) == 1
         assert result["tag"][0]["tag"] == "Revenues"
 
+    def test_short_rows_and_blank_lines(self):
+        """Verify missing trailing fields are None and blank lines are skipped, as with csv.DictReader."""
+        tsv = "adsh\ttag\tvalue\n0001\tRevenues\n\n0002\tAssets\t\n"
+        rows = _read_tables(_build_zip_bytes({"num.txt": tsv}))["num"]
+        assert rows == [
+            {"adsh": "0001", "tag": "Revenues", "value": None},
+            {"adsh": "0002", "tag": "Assets", "value": ""},
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Datasets.get_financial_statements tests
@@ -127,9 +154,7 @@ class TestGetFinancialStatements:
 
     def test_returns_parsed_data(self, datasets_service):
         """Verify get_financial_statements returns parsed TSV dicts."""
-        datasets_service.edgar_session.fetch_page = MagicMock(
-            return_value=SAMPLE_ZIP_BYTES
-        )
+        datasets_service.edgar_session.stream_to_file = _stream_zip()
         result = datasets_service.get_financial_statements(2023, 4)
 
         assert "sub" in result
@@ -139,23 +164,19 @@ class TestGetFinancialStatements:
 
     def test_calls_correct_url(self, datasets_service):
         """Verify the correct DERA URL is constructed."""
-        datasets_service.edgar_session.fetch_page = MagicMock(
-            return_value=SAMPLE_ZIP_BYTES
-        )
+        datasets_service.edgar_session.stream_to_file = _stream_zip()
         datasets_service.get_financial_statements(2023, 4)
 
-        call_url = datasets_service.edgar_session.fetch_page.call_args[0][0]
+        call_url = datasets_service.edgar_session.stream_to_file.call_args[0][0]
         assert "2023q4.zip" in call_url
         assert "financial-statement-data-sets" in call_url
 
     def test_different_year_quarter(self, datasets_service):
         """Verify different year/quarter combinations build correct URLs."""
-        datasets_service.edgar_session.fetch_page = MagicMock(
-            return_value=SAMPLE_ZIP_BYTES
-        )
+        datasets_service.edgar_session.stream_to_file = _stream_zip()
         datasets_service.get_financial_statements(2021, 1)
 
-        call_url = datasets_service.edgar_session.fetch_page.call_args[0][0]
+        call_url = datasets_service.edgar_session.stream_to_file.call_args[0][0]
         assert "2021q1.zip" in call_url
 
     def test_invalid_quarter_raises(self, datasets_service):
@@ -166,12 +187,132 @@ class TestGetFinancialStatements:
             datasets_service.get_financial_statements(2023, 5)
 
     def test_returns_empty_dict_on_none(self, datasets_service):
-        """Verify empty dict returned when fetch_page returns None."""
-        datasets_service.edgar_session.fetch_page = MagicMock(return_value=None)
+        """Verify empty dict returned when the archive is not found."""
+        datasets_service.edgar_session.stream_to_file = MagicMock(return_value=False)
         result = datasets_service.get_financial_statements(2023, 4)
         assert result == {}
 
 
+# ---------------------------------------------------------------------------
+# FinancialStatementArchive / iter_financial_statements tests
+# ---------------------------------------------------------------------------
+
+
+class TestFinancialStatementArchive:
+    """Tests for lazy, typed reading of DERA archives."""
+
+    @pytest.fixture
+    def archive(self):
+        """Return an archive over the sample ZIP."""
+        with FinancialStatementArchive(io.BytesIO(SAMPLE_ZIP_BYTES)) as opened:
+            yield opened
+
+    def test_tables(self, archive):
+        """Verify the TSV members are exposed as tables."""
+        assert archive.tables == ["sub", "num", "tag", "pre"]
+
+    def test_typed_columns(self, archive):
+        """Verify dates, integers, decimals and flags are converted."""
+        sub = next(archive.iter_rows("sub"))
+        assert sub["cik"] == 320193
+        assert sub["period"] == date(2023, 9, 30)
+        assert sub["fy"] == 2023
+        assert sub["name"] == "Apple Inc."
+
+        num = next(archive.iter_rows("num"))
+        assert num["value"] == Decimal("383285000000")
+        assert num["ddate"] == date(2023, 9, 30)
+        assert num["qtrs"] == 4
+        assert num["coreg"] is None
+
+        tag = next(archive.iter_rows("tag"))
+        assert tag["custom"] is False
+
+    def test_accepted_timestamp(self):
+        """Verify the sub.accepted timestamp becomes a datetime."""
+        zip_bytes = _build_zip_bytes({
+            "sub.txt": "adsh\taccepted\n0001\t2024-02-02 18:03:00.0\n",
+        })
+        with FinancialStatementArchive(io.BytesIO(zip_bytes)) as archive:
+            row = next(archive.iter_rows("sub"))
+        assert row["accepted"] == datetime(2024, 2, 2, 18, 3)
+
+    def test_untyped_rows_keep_strings(self, archive):
+        """Verify typed=False returns the raw strings."""
+        num = next(archive.iter_rows("num", typed=False))
+        assert num["value"] == "383285000000"
+        assert num["coreg"] == ""
+
+    def test_column_projection(self, archive):
+        """Verify only the requested columns are returned, in order."""
+        rows = list(archive.iter_rows("num", columns=["tag", "value"]))
+        assert list(rows[0]) == ["tag", "value"]
+        assert len(rows) == 2
+
+    def test_unknown_column_raises(self, archive):
+        """Verify projecting a missing column raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown num columns"):
+            list(archive.iter_rows("num", columns=["nope"]))
+
+    def test_where_filters_on_typed_values(self, archive):
+        """Verify dict filters match typed values, outside the projection too."""
+        rows = list(archive.iter_rows(
+            "num", columns=["value"], where={"adsh": "0001193125-24-048000", "qtrs": 4},
+        ))
+        assert rows == [{"value": Decimal("211915000000")}]
+
+    def test_where_accepts_collections(self, archive):
+        """Verify a set of values matches any of them."""
+        rows = list(archive.iter_rows("sub", where={"cik": {320193, 1}}))
+        assert [row["name"] for row in rows] == ["Apple Inc."]
+
+    def test_where_accepts_callable(self, archive):
+        """Verify a callable filter sees the projected row."""
+        rows = list(archive.iter_rows(
+            "num", columns=["value"], where=lambda row: row["value"] > 300_000_000_000,
+        ))
+        assert len(rows) == 1
+
+    def test_unknown_table_raises(self, archive):
+        """Verify an unknown table name raises ValueError."""
+        with pytest.raises(ValueError, match="table must be one of"):
+            list(archive.iter_rows("cal"))
+
+
+class TestIterFinancialStatements:
+    """Tests for Datasets.iter_financial_statements()."""
+
+    @pytest.fixture
+    def datasets_service(self, edgar_client):
+        """Return a Datasets service with a mocked streaming download."""
+        service = edgar_client.datasets()
+        service.edgar_session.stream_to_file = _stream_zip()
+        return service
+
+    def test_yields_chunks(self, datasets_service):
+        """Verify rows arrive in chunks of at most chunk_size."""
+        chunks = list(datasets_service.iter_financial_statements(2023, 4, chunk_size=1))
+        assert [len(chunk) for chunk in chunks] == [1, 1]
+        assert chunks[0][0]["value"] == Decimal("383285000000")
+
+    def test_table_columns_and_where(self, datasets_service):
+        """Verify table, columns and where are passed through."""
+        chunks = list(datasets_service.iter_financial_statements(
+            2023, 4, table="sub", columns=["name"], where={"cik": 789019},
+        ))
+        assert chunks == [[{"name": "Microsoft Corp"}]]
+
+    def test_missing_archive_yields_nothing(self, datasets_service):
+        """Verify nothing is yielded when the archive is not found."""
+        datasets_service.edgar_session.stream_to_file = MagicMock(return_value=False)
+        assert not list(datasets_service.iter_financial_statements(2023, 4))
+
+    def test_invalid_chunk_size_raises(self, datasets_service):
+        """Verify chunk_size is validated."""
+        with pytest.raises(ValueError, match="chunk_size must be at least 1"):
+            list(datasets_service.iter_financial_statements(2023, 4, chunk_size=0))
+
+
 # ---------------------------------------------------------------------------
 # Datasets.get_financial_statements_dataframes tests
 # ---------------------------------------------------------------------------
@@ -188,9 +329,7 @@ class TestGetFinancialStatementsDataframes:
     def test_returns_dataframes(self, datasets_service):
         """Verify the method returns pandas DataFrames."""
         pd = pytest.importorskip("pandas", reason="pandas required")
-        datasets_service.edgar_session.fetch_page = MagicMock(
-            return_value=SAMPLE_ZIP_BYTES
-        )
+        datasets_service.edgar_session.stream_to_file = _stream_zip()
         result = datasets_service.get_financial_statements_dataframes(2023, 4)
 
         assert "sub" in result
@@ -202,9 +341,7 @@ class TestGetFinancialStatementsDataframes:
     def test_dataframe_columns(self, datasets_service):
         """Verify DataFrames have the expected columns."""
         pytest.importorskip("pandas", reason="pandas required")
-        datasets_service.edgar_session.fetch_page = MagicMock(
-            return_value=SAMPLE_ZIP_BYTES
-        )
+        datasets_service.edgar_session.stream_to_file = _stream_zip()
         result = datasets_service.get_financial_statements_dataframes(2023, 4)
 
         assert "adsh" in result["sub"].columns
@@ -213,17 +350,15 @@ class TestGetFinancialStatementsDataframes:
         assert "value" in result["num"].columns
 
     def test_returns_empty_dict_on_none(self, datasets_service):
-        """Verify empty dict returned when fetch_page returns None."""
+        """Verify empty dict returned when the archive is not found."""
         pytest.importorskip("pandas", reason="pandas required")
-        datasets_service.edgar_session.fetch_page = MagicMock(return_value=None)
+        datasets_service.edgar_session.stream_to_file = MagicMock(return_value=False)
         result = datasets_service.get_financial_statements_dataframes(2023, 4)
         assert result == {}
 
     def test_raises_without_pandas(self, datasets_service):
         """Verify ImportError is raised when pandas is not installed."""
-        datasets_service.edgar_session.fetch_page = MagicMock(
-            return_value=SAMPLE_ZIP_BYTES
-        )
+        datasets_service.edgar_session.stream_to_file = _stream_zip()
         with patch.dict("sys.modules", {"pandas": None}):
             with pytest.raises(ImportError, match="pandas"):
                 datasets_service.get_financial_statements_dataframes(2023, 4)
@@ -0,0 +1,300 @@
+"""Tests for the persistent on-disk HTTP cache and its session integration."""
+
+# pylint: disable=redefined-outer-name
+# pylint: disable=import-outside-toplevel
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from edgar.cache import TTL_SUBMISSIONS, TTL_TAXONOMY, TTL_TICKERS
+from edgar.client import EdgarClient
+from edgar.disk_cache import DiskCache, decode_body, ttl_for_url
+
+
+# ---------------------------------------------------------------------------
+# Sample data fixtures
+# ---------------------------------------------------------------------------
+
+SUBMISSIONS_URL = "https://data.sec.gov/submissions/CIK0000320193.json"
+
+SAMPLE_JSON_BODY = b'{"cik": "320193", "name": "Apple Inc."}'
+
+SAMPLE_HEADERS = {
+    "Content-Type": "application/json",
+    "ETag": '"abc123"',
+    "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+}
+
+
+def _mock_response(status_code=200, content=SAMPLE_JSON_BODY, headers=None):
+    """Build a mock requests/httpx response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.ok = status_code < 400
+    response.content = content
+    response.text = content.decode()
+    response.headers = SAMPLE_HEADERS if headers is None else headers
+    response.json.return_value = {"cik": "320193", "name": "Apple Inc."}
+    return response
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    """Return a DiskCache in a temporary directory."""
+    cache = DiskCache(str(tmp_path))
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def cached_client(tmp_path):
+    """Return an EdgarClient with a disk cache and no in-memory cache."""
+    return EdgarClient(
+        user_agent="Test test@example.com", cache=False, cache_dir=str(tmp_path)
+    )
+
+
+# ---------------------------------------------------------------------------
+# TTL policy tests
+# ---------------------------------------------------------------------------
+
+
+class TestTtlForUrl:
+    """Tests for the shared TTL policy."""
+
+    def test_tickers_url_uses_tickers_ttl(self):
+        """Verify company_tickers.json uses TTL_TICKERS."""
+        assert ttl_for_url("https://www.sec.gov/files/company_tickers.json") == TTL_TICKERS
+
+    def test_submissions_url_uses_submissions_ttl(self):
+        """Verify submissions use TTL_SUBMISSIONS."""
+        assert ttl_for_url(SUBMISSIONS_URL) == TTL_SUBMISSIONS
+
+    def test_xbrl_url_uses_taxonomy_ttl(self):
+        """Verify XBRL API URLs use TTL_TAXONOMY."""
+        url = "https://data.sec.gov/api/xbrl/companyfacts/CIK0000320193.json"
+        assert ttl_for_url(url) == TTL_TAXONOMY
+
+
+# ---------------------------------------------------------------------------
+# DiskCache unit tests
+# ---------------------------------------------------------------------------
+
+
+class TestDiskCache:
+    """Tests for DiskCache storage and validators."""
+
+    def test_get_missing_returns_none(self, disk_cache):
+        """Verify get() returns None for an unknown key."""
+        assert disk_cache.get("missing") is None
+
+    def test_set_and_get_round_trip(self, disk_cache):
+        """Verify body and validators are stored."""
+        disk_cache.set("k", SUBMISSIONS_URL, SAMPLE_JSON_BODY, SAMPLE_HEADERS)
+        entry = disk_cache.get("k")
+        assert entry.body == SAMPLE_JSON_BODY
+        assert entry.etag == '"abc123"'
+        assert entry.last_modified == "Wed, 01 Jan 2025 00:00:00 GMT"
+        assert entry.is_fresh
+
+    def test_lowercase_headers_are_read(self, disk_cache):
+        """Verify httpx-style lowercase header keys are understood."""
+        disk_cache.set("k", SUBMISSIONS_URL, b"{}", {"content-type": "application/json", "etag": "x"})
+        entry = disk_cache.get("k")
+        assert entry.content_type == "application/json"
+        assert entry.etag == "x"
+
+    def test_entry_goes_stale_after_ttl(self, disk_cache):
+        """Verify entries become stale after the URL's TTL."""
+        with patch("edgar.disk_cache.time.time", return_value=1000.0):
+            disk_cache.set("k", SUBMISSIONS_URL, b"{}", SAMPLE_HEADERS)
+        with patch("edgar.disk_cache.time.time", return_value=1000.0 + TTL_SUBMISSIONS):
+            assert not disk_cache.get("k").is_fresh
+
+    def test_conditional_headers(self, disk_cache):
+        """Verify revalidation headers come from the stored validators."""
+        disk_cache.set("k", SUBMISSIONS_URL, b"{}", SAMPLE_HEADERS)
+        headers = disk_cache.get("k").conditional_headers()
+        assert headers == {
+            "If-None-Match": '"abc123"',
+            "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+        }
+
+    def test_refresh_extends_expiry_and_keeps_validators(self, disk_cache):
+        """Verify refresh() after a 304 renews the entry."""
+        with patch("edgar.disk_cache.time.time", return_value=1000.0):
+            disk_cache.set("k", SUBMISSIONS_URL, b"{}", SAMPLE_HEADERS)
+        with patch("edgar.disk_cache.time.time", return_value=5000.0):
+            disk_cache.refresh("k", SUBMISSIONS_URL, {})
+        entry = disk_cache.get("k")
+        assert entry.expires_at == 5000.0 + TTL_SUBMISSIONS
+        assert entry.etag == '"abc123"'
+
+    def test_record_stores_ok_and_revalidates_not_modified(self, disk_cache):
+        """Verify record() stores a 200, refreshes on a 304 and skips errors."""
+        assert not disk_cache.record("k", SUBMISSIONS_URL, _mock_response(status_code=500))
+        assert disk_cache.get("k") is None
+        assert not disk_cache.record("k", SUBMISSIONS_URL, _mock_response())
+        cached = disk_cache.get("k")
+        assert cached.body == SAMPLE_JSON_BODY
+        assert not disk_cache.record("k", SUBMISSIONS_URL, _mock_response(status_code=304, headers={}))
+        with patch("edgar.disk_cache.time.time", return_value=5000.0):
+            assert disk_cache.record("k", SUBMISSIONS_URL, _mock_response(status_code=304, headers={}), cached)
+        assert disk_cache.get("k").expires_at == 5000.0 + TTL_SUBMISSIONS
+
+    def test_persists_across_instances(self, tmp_path):
+        """Verify entries survive re-opening the cache directory."""
+        first = DiskCache(str(tmp_path))
+        first.set("k", SUBMISSIONS_URL, SAMPLE_JSON_BODY, SAMPLE_HEADERS)
+        first.close()
+        second = DiskCache(str(tmp_path))
+        assert second.get("k").body == SAMPLE_JSON_BODY
+        second.close()
+
+    def test_invalidate_and_clear(self, disk_cache):
+        """Verify invalidate() and clear() remove entries."""
+        disk_cache.set("a", SUBMISSIONS_URL, b"{}", SAMPLE_HEADERS)
+        disk_cache.set("b", SUBMISSIONS_URL, b"{}", SAMPLE_HEADERS)
+        disk_cache.invalidate("a")
+        assert disk_cache.get("a") is None
+        assert len(disk_cache) == 1
+        disk_cache.clear()
+        assert len(disk_cache) == 0
+
+    def test_make_key_is_order_independent(self):
+        """Verify query parameter order doesn't change the key."""
+        assert DiskCache.make_key("u", {"a": 1, "b": 2}) == DiskCache.make_key("u", {"b": 2, "a": 1})
+
+    def test_decode_body(self):
+        """Verify decode_body mirrors make_request content handling."""
+        assert decode_body(SAMPLE_JSON_BODY, "application/json")["name"] == "Apple Inc."
+        assert decode_body(b"<feed/>", "application/atom+xml") == "<feed/>"
+        assert decode_body(b"%PDF", "application/pdf") is None
+        assert decode_body(b"", "application/json") is None
+
+
+# ---------------------------------------------------------------------------
+# EdgarSession integration tests
+# ---------------------------------------------------------------------------
+
+
+class TestSessionDiskCache:
+    """Tests for disk cache use in EdgarSession request paths."""
+
+    def test_fresh_entry_skips_network(self, cached_client):
+        """Verify a fresh entry is served without an HTTP request."""
+        session = cached_client.edgar_session
+        session.http_session.request = MagicMock(return_value=_mock_response())
+
+        first = session.make_request("get", "/submissions/CIK0000320193.json", use_api=True)
+        second = session.make_request("get", "/submissions/CIK0000320193.json", use_api=True)
+
+        assert first == second == {"cik": "320193", "name": "Apple Inc."}
+        session.http_session.request.assert_called_once()
+
+    def test_stale_entry_sends_conditional_request(self, cached_client):
+        """Verify a stale entry is revalidated and a 304 reuses the body."""
+        session = cached_client.edgar_session
+        session.disk_cache.set(SUBMISSIONS_URL, SUBMISSIONS_URL, SAMPLE_JSON_BODY, SAMPLE_HEADERS)
+        with patch("edgar.disk_cache.time.time", return_value=0.0):
+            session.disk_cache.refresh(SUBMISSIONS_URL, SUBMISSIONS_URL, {})
+
+        session.http_session.request = MagicMock(
+            return_value=_mock_response(status_code=304, content=b"", headers={})
+        )
+        result = session.make_request("get", "/submissions/CIK0000320193.json", use_api=True)
+
+        assert result == {"cik": "320193", "name": "Apple Inc."}
+        sent_headers = session.http_session.request.call_args.kwargs["headers"]
+        assert sent_headers["If-None-Match"] == '"abc123"'
+        assert session.disk_cache.get(SUBMISSIONS_URL).is_fresh
+
+    def test_post_requests_bypass_cache(self, cached_client):
+        """Verify non-GET requests are never cached."""
+        session = cached_client.edgar_session
+        session.http_session.request = MagicMock(return_value=_mock_response())
+        session.make_request("post", "/test")
+        assert len(session.disk_cache) == 0
+
+    def test_fetch_page_uses_cache(self, cached_client):
+        """Verify fetch_page() stores and reuses page bytes."""
+        session = cached_client.edgar_session
+        session.http_session.get = MagicMock(return_value=_mock_response(content=b"<feed/>"))
+
+        assert session.fetch_page("https://www.sec.gov/page") == b"<feed/>"
+        assert session.fetch_page("https://www.sec.gov/page") == b"<feed/>"
+        session.http_session.get.assert_called_once_with("https://www.sec.gov/page")
+
+    def test_download_serves_cached_text(self, cached_client):
+        """Verify download() decodes cached text bodies."""
+        session = cached_client.edgar_session
+        session.http_session.get = MagicMock(
+            return_value=_mock_response(content=b"<html/>", headers={"Content-Type": "text/html"})
+        )
+        session.download("https://www.sec.gov/doc.htm")
+        assert session.download("https://www.sec.gov/doc.htm") == "<html/>"
+        session.http_session.get.assert_called_once()
+
+    def test_client_without_cache_dir_has_no_disk_cache(self):
+        """Verify the disk cache is opt-in."""
+        client = EdgarClient(user_agent="Test test@example.com")
+        assert client.edgar_session.disk_cache is None
+
+
+# ---------------------------------------------------------------------------
+# EdgarAsyncSession integration tests
+# ---------------------------------------------------------------------------
+
+
+class TestAsyncSessionDiskCache:
+    """Tests for disk cache use in EdgarAsyncSession."""
+
+    @pytest.mark.asyncio
+    async def test_async_revalidation_uses_cached_body(self, tmp_path):
+        """Verify the async session revalidates and serves 304s from disk."""
+        pytest.importorskip("httpx")
+        from edgar.async_client import EdgarAsyncClient
+
+        client = EdgarAsyncClient(user_agent="Test test@example.com", cache_dir=str(tmp_path))
+        session = client.edgar_session
+        session._throttle = AsyncMock()  # pylint: disable=protected-access
+        session.disk_cache.set(SUBMISSIONS_URL, SUBMISSIONS_URL, SAMPLE_JSON_BODY, SAMPLE_HEADERS)
+        with patch("edgar.disk_cache.time.time", return_value=0.0):
+            session.disk_cache.refresh(SUBMISSIONS_URL, SUBMISSIONS_URL, {})
+
+        session.http_client.request = AsyncMock(
+            return_value=_mock_response(status_code=304, content=b"", headers={})
+        )
+        result = await session.make_request("get", "/submissions/CIK0000320193.json", use_api=True)
+
+        assert result["name"] == "Apple Inc."
+        assert session.http_client.request.call_args.kwargs["headers"]["If-None-Match"] == '"abc123"'
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_async_cache_io_runs_off_the_loop(self, tmp_path):
+        """Verify SQLite reads and writes happen in worker threads, not on the event loop."""
+        pytest.importorskip("httpx")
+        import threading
+
+        from edgar.async_client import EdgarAsyncClient
+
+        client = EdgarAsyncClient(user_agent="Test test@example.com", cache_dir=str(tmp_path))
+        session = client.edgar_session
+        session._throttle = AsyncMock()  # pylint: disable=protected-access
+        threads = []
+        for name in ("get", "set"):
+            original = getattr(session.disk_cache, name)
+
+            def spy(*args, _original=original, **kwargs):
+                threads.append(threading.get_ident())
+                return _original(*args, **kwargs)
+
+            setattr(session.disk_cache, name, spy)
+        session.http_client.request = AsyncMock(return_value=_mock_response(headers=SAMPLE_HEADERS))
+
+        await session.make_request("get", "/submissions/CIK0000320193.json", use_api=True)
+
+        assert len(threads) == 2 and threading.get_ident() not in threads
+        await client.close()
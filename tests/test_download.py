@@ -2,8 +2,10 @@
 
 # pylint: disable=redefined-outer-name
 
+import hashlib
+import io
 import os
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
@@ -109,6 +111,306 @@ class TestSessionDownload:
             edgar_session.download("https://www.sec.gov/broken")
 
 
+# ---------------------------------------------------------------------------
+# EdgarSession.stream_to_file tests
+# ---------------------------------------------------------------------------
+
+
+class TestSessionStreamToFile:
+    """Tests for EdgarSession.stream_to_file."""
+
+    def test_streams_chunks_to_file(self, edgar_session):
+        """Verify every chunk is written and the request is streamed."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [b"PK", b"\x03\x04", b"data"]
+        mock_response.__enter__.return_value = mock_response
+        edgar_session.http_session.get = MagicMock(return_value=mock_response)
+
+        buf = io.BytesIO()
+        assert edgar_session.stream_to_file("https://www.sec.gov/big.zip", buf) is True
+        assert buf.getvalue() == b"PK\x03\x04data"
+        assert edgar_session.http_session.get.call_args.kwargs["stream"] is True
+
+    def test_non_200_returns_false(self, edgar_session):
+        """Verify a missing file writes nothing and returns False."""
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        mock_response.__enter__.return_value = mock_response
+        edgar_session.http_session.get = MagicMock(return_value=mock_response)
+
+        buf = io.BytesIO()
+        assert edgar_session.stream_to_file("https://www.sec.gov/missing.zip", buf) is False
+        assert buf.getvalue() == b""
+
+    def test_request_exception_raises(self, edgar_session):
+        """Verify network errors are wrapped in EdgarRequestError."""
+        edgar_session.http_session.get = MagicMock(
+            side_effect=requests.ConnectionError("reset")
+        )
+        with patch("edgar.session.time.sleep"), \
+                pytest.raises(EdgarRequestError, match="Failed to stream"):
+            edgar_session.stream_to_file("https://www.sec.gov/big.zip", io.BytesIO())
+
+
+# ---------------------------------------------------------------------------
+# EdgarSession.download_to_file tests
+# ---------------------------------------------------------------------------
+
+
+BIG_BODY = bytes(range(256)) * 40
+BIG_SHA256 = "sha256:" + hashlib.sha256(BIG_BODY).hexdigest()
+ETAG = '"v1"'
+
+
+def _write_partial(path, data, validator=ETAG):
+    """Leave a ``.part`` file (and its saved validator) as an interrupted download would."""
+    with open(path + ".part", "wb") as f:
+        f.write(data)
+    if validator is not None:
+        with open(path + ".part.validator", "w", encoding="utf-8") as f:
+            f.write(validator)
+
+
+def _ranged_server(body=BIG_BODY, drop_after=None, ignore_range=False, etag=ETAG, range_offset=0):
+    """Fake ``http_session.get`` serving ``body`` and honoring ``Range``/``If-Range`` headers.
+
+    With ``drop_after`` set, the first response breaks off after that many
+    bytes, like a connection reset mid-transfer. ``range_offset`` shifts
+    the ranges served, like a server answering a different range.
+    """
+
+    calls = []
+
+    def get(url, stream=False, headers=None):  # pylint: disable=unused-argument
+        calls.append(headers)
+        start = 0
+        if headers and not ignore_range and headers.get("If-Range") in (None, etag):
+            start = int(headers["Range"].removeprefix("bytes=").rstrip("-")) + range_offset
+        response = MagicMock()
+        response.__enter__.return_value = response
+        if start >= len(body) and start:
+            response.status_code = 416
+            response.headers = {"Content-Range": f"bytes */{len(body)}", "ETag": etag}
+            return response
+        response.status_code = 206 if start else 200
+        response.headers = {"ETag": etag}
+        if start:
+            response.headers["Content-Range"] = f"bytes {start}-{len(body) - 1}/{len(body)}"
+        payload = body[start:]
+
+        def iter_content(chunk_size):
+            if drop_after is not None and len(calls) == 1:
+                yield payload[:drop_after]
+                raise requests.ConnectionError("connection reset")
+            for i in range(0, len(payload), chunk_size):
+                yield payload[i:i + chunk_size]
+
+        response.iter_content = iter_content
+        return response
+
+    get.calls = calls
+    return get
+
+
+class TestSessionDownloadToFile:
+    """Tests for streamed, resumable downloads."""
+
+    def test_streams_to_path(self, edgar_session, tmp_path):
+        """Verify the body is written in chunks and moved into place."""
+        edgar_session.http_session.get = _ranged_server()
+        path = str(tmp_path / "feed.tar.gz")
+
+        assert edgar_session.download_to_file("https://www.sec.gov/feed.tar.gz", path, chunk_size=1000) == path
+
+        with open(path, "rb") as f:
+            assert f.read() == BIG_BODY
+        assert not os.path.exists(path + ".part")
+
+    def test_resumes_partial_file(self, edgar_session, tmp_path):
+        """Verify a leftover .part file is continued with a Range request."""
+        edgar_session.http_session.get = _ranged_server()
+        path = str(tmp_path / "feed.tar.gz")
+        _write_partial(path, BIG_BODY[:4000])
+
+        edgar_session.download_to_file("https://www.sec.gov/feed.tar.gz", path, checksum=BIG_SHA256)
+
+        assert edgar_session.http_session.get.calls == [{"Range": "bytes=4000-", "If-Range": ETAG}]
+        with open(path, "rb") as f:
+            assert f.read() == BIG_BODY
+        assert not os.path.exists(path + ".part.validator")
+
+    def test_changed_file_restarts(self, edgar_session, tmp_path):
+        """Verify a .part file of an older version is replaced, not spliced."""
+        edgar_session.http_session.get = _ranged_server(etag='"v2"')
+        path = str(tmp_path / "feed.tar.gz")
+        _write_partial(path, b"x" * 4000)
+
+        edgar_session.download_to_file("https://www.sec.gov/feed.tar.gz", path, checksum=BIG_SHA256)
+
+        assert edgar_session.http_session.get.calls == [{"Range": "bytes=4000-", "If-Range": ETAG}]
+        with open(path, "rb") as f:
+            assert f.read() == BIG_BODY
+
+    def test_validator_mismatch_on_partial_response_restarts(self, edgar_session, tmp_path):
+        """Verify a 206 from a server ignoring If-Range is discarded when the ETag changed."""
+        server = _ranged_server(etag='"v2"')
+        edgar_session.http_session.get = lambda url, stream=False, headers=None: server(
+            url, stream, headers and {"Range": headers["Range"]}
+        )
+        path = str(tmp_path / "feed.tar.gz")
+        _write_partial(path, b"x" * 4000)
+
+        edgar_session.download_to_file("https://www.sec.gov/feed.tar.gz", path, checksum=BIG_SHA256)
+
+        assert server.calls == [{"Range": "bytes=4000-"}, None]
+        with open(path, "rb") as f:
+            assert f.read() == BIG_BODY
+
+    def test_misplaced_range_restarts(self, edgar_session, tmp_path):
+        """Verify a 206 that doesn't start at the end of the .part file is discarded."""
+        edgar_session.http_session.get = _ranged_server(range_offset=10)
+        path = str(tmp_path / "feed.tar.gz")
+        _write_partial(path, BIG_BODY[:4000])
+
+        edgar_session.download_to_file("https://www.sec.gov/feed.tar.gz", path, checksum=BIG_SHA256)
+
+        assert edgar_session.http_session.get.calls[-1] is None
+        with open(path, "rb") as f:
+            assert f.read() == BIG_BODY
+
+    def test_partial_file_without_validator_is_not_resumed(self, edgar_session, tmp_path):
+        """Verify a .part file that can't be checked against the server starts over."""
+        edgar_session.http_session.get = _ranged_server()
+        path = str(tmp_path / "feed.tar.gz")
+        _write_partial(path, BIG_BODY[:4000], validator=None)
+
+        edgar_session.download_to_file("https://www.sec.gov/feed.tar.gz", path, checksum=BIG_SHA256)
+
+        assert edgar_session.http_session.get.calls == [None]
+
+    def test_server_ignoring_range_restarts(self, edgar_session, tmp_path):
+        """Verify a 200 answer to a Range request overwrites the partial file."""
+        edgar_session.http_session.get = _ranged_server(ignore_range=True)
+        path = str(tmp_path / "feed.tar.gz")
+        _write_partial(path, b"stale bytes")
+
+        edgar_session.download_to_file("https://www.sec.gov/feed.tar.gz", path)
+
+        with open(path, "rb") as f:
+            assert f.read() == BIG_BODY
+
+    def test_interrupted_transfer_resumes(self, edgar_session, tmp_path):
+        """Verify a connection dropped mid-body is resumed from the last byte written."""
+        edgar_session.http_session.get = _ranged_server(drop_after=3000)
+        path = str(tmp_path / "feed.tar.gz")
+
+        with patch("edgar.session.time.sleep"):
+            edgar_session.download_to_file("https://www.sec.gov/feed.tar.gz", path, checksum=BIG_SHA256)
+
+        assert edgar_session.http_session.get.calls == [None, {"Range": "bytes=3000-", "If-Range": ETAG}]
+        with open(path, "rb") as f:
+            assert f.read() == BIG_BODY
+
+    def test_complete_partial_file_is_finished(self, edgar_session, tmp_path):
+        """Verify a 416 for an already complete .part file just renames it."""
+        edgar_session.http_session.get = _ranged_server()
+        path = str(tmp_path / "feed.tar.gz")
+        _write_partial(path, BIG_BODY)
+
+        edgar_session.download_to_file("https://www.sec.gov/feed.tar.gz", path, checksum=BIG_SHA256)
+
+        assert len(edgar_session.http_session.get.calls) == 1
+        with open(path, "rb") as f:
+            assert f.read() == BIG_BODY
+
+    def test_complete_size_of_another_version_restarts(self, edgar_session, tmp_path):
+        """Verify a 416 carrying a different validator isn't taken as complete."""
+        server = _ranged_server(etag='"v2"', body=b"y" * len(BIG_BODY))
+        edgar_session.http_session.get = lambda url, stream=False, headers=None: server(
+            url, stream, headers and {"Range": headers["Range"]}
+        )
+        path = str(tmp_path / "feed.tar.gz")
+        _write_partial(path, BIG_BODY)
+
+        edgar_session.download_to_file("https://www.sec.gov/feed.tar.gz", path)
+
+        assert server.calls == [{"Range": f"bytes={len(BIG_BODY)}-"}, None]
+        with open(path, "rb") as f:
+            assert f.read() == b"y" * len(BIG_BODY)
+
+    def test_checksum_mismatch_discards_file(self, edgar_session, tmp_path):
+        """Verify a bad checksum raises and leaves neither file behind."""
+        edgar_session.http_session.get = _ranged_server()
+        path = str(tmp_path / "feed.tar.gz")
+
+        with pytest.raises(EdgarRequestError, match="Checksum mismatch"):
+            edgar_session.download_to_file("https://www.sec.gov/feed.tar.gz", path, checksum="sha256:00")
+
+        assert not os.path.exists(path)
+        assert not os.path.exists(path + ".part")
+
+    def test_invalid_checksum_format(self, edgar_session, tmp_path):
+        """Verify malformed checksums are rejected before any request."""
+        with pytest.raises(ValueError, match="checksum"):
+            edgar_session.download_to_file("https://www.sec.gov/a", str(tmp_path / "a"), checksum="abc")
+
+    def test_not_found_raises(self, edgar_session, tmp_path):
+        """Verify a 404 raises without creating the file."""
+        response = MagicMock(status_code=404, headers={})
+        response.__enter__.return_value = response
+        edgar_session.http_session.get = MagicMock(return_value=response)
+        path = str(tmp_path / "missing.txt")
+
+        with pytest.raises(EdgarRequestError, match="status 404"):
+            edgar_session.download_to_file("https://www.sec.gov/missing.txt", path)
+        assert not os.path.exists(path)
+
+    def test_download_stream_flag(self, edgar_session, tmp_path):
+        """Verify download(stream=True) writes raw bytes without decoding."""
+        edgar_session.http_session.get = _ranged_server(body="héllo".encode("latin-1"))
+        path = str(tmp_path / "filing.txt")
+
+        assert edgar_session.download("https://www.sec.gov/filing.txt", path=path, stream=True) == path
+        with open(path, "rb") as f:
+            assert f.read() == "héllo".encode("latin-1")
+
+    def test_stream_without_path_raises(self, edgar_session):
+        """Verify streaming requires a destination path."""
+        with pytest.raises(ValueError, match="path"):
+            edgar_session.download("https://www.sec.gov/filing.txt", stream=True)
+
+
+class TestAsyncSessionDownloadToFile:
+    """Tests for EdgarAsyncSession.download_to_file against a mock transport."""
+
+    @pytest.mark.asyncio
+    async def test_resumes_partial_file(self, tmp_path):
+        """Verify the async session resumes with Range and verifies the checksum."""
+        httpx = pytest.importorskip("httpx")
+        from edgar.async_client import EdgarAsyncClient  # pylint: disable=import-outside-toplevel
+
+        ranges = []
+
+        def handler(request):
+            ranges.append((request.headers.get("range"), request.headers.get("if-range")))
+            start = int(request.headers["range"].removeprefix("bytes=").rstrip("-"))
+            headers = {"ETag": ETAG, "Content-Range": f"bytes {start}-{len(BIG_BODY) - 1}/{len(BIG_BODY)}"}
+            return httpx.Response(206, content=BIG_BODY[start:], headers=headers)
+
+        session = EdgarAsyncClient(user_agent="Test test@example.com").edgar_session
+        session.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        path = str(tmp_path / "feed.tar.gz")
+        _write_partial(path, BIG_BODY[:1000])
+
+        assert await session.download_to_file("https://www.sec.gov/feed.tar.gz", path, checksum=BIG_SHA256) == path
+        await session.close()
+
+        assert ranges == [("bytes=1000-", ETAG)]
+        with open(path, "rb") as f:
+            assert f.read() == BIG_BODY
+
+
 # ---------------------------------------------------------------------------
 # EdgarClient.download convenience method tests
 # ---------------------------------------------------------------------------
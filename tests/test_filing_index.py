@@ -0,0 +1,197 @@
+"""Tests for the local full-index / daily-index filing index."""
+
+# pylint: disable=redefined-outer-name
+
+import gzip
+import io
+from unittest.mock import MagicMock
+
+import pytest
+
+from edgar.filing_index import FilingIndex, parse_index
+
+
+SAMPLE_MASTER_IDX = """Description:           Master Index of EDGAR Dissemination Feed
+Last Data Received:    December 31, 2023
+Comments:              webmaster@sec.gov
+Anonymous FTP:         ftp://ftp.sec.gov/edgar/
+
+
+
+
+CIK|Company Name|Form Type|Date Filed|Filename
+--------------------------------------------------------------------------------
+320193|Apple Inc.|10-K|2023-11-03|edgar/data/320193/0000320193-23-000106.txt
+320193|Apple Inc.|8-K|2023-11-02|edgar/data/320193/0000320193-23-000104.txt
+789019|MICROSOFT CORP|10-Q|2023-10-24|edgar/data/789019/0000950170-23-054855.txt
+1018724|AMAZON COM INC|SC 13G/A|2023-12-15|edgar/data/1018724/0001104659-23-127000.txt
+"""
+
+SAMPLE_FORM_IDX = """Description:           Daily Index of EDGAR Dissemination Feed by Form Type
+Last Data Received:    November 3, 2023
+
+Form Type   Company Name                                                  CIK         Date Filed  File Name
+---------------------------------------------------------------------------------------------------------------------------------------------
+10-K        Apple Inc.                                                    320193      20231103    edgar/data/320193/0000320193-23-000106.txt
+SC 13G/A    AMAZON COM INC                                                1018724     20231103    edgar/data/1018724/0001104659-23-127000.txt
+"""
+
+SAMPLE_COMPANY_IDX = """Description:           Daily Index of EDGAR Dissemination Feed by Company Name
+
+Company Name                                                  Form Type   CIK         Date Filed  File Name
+---------------------------------------------------------------------------------------------------------------------------------------------
+AMAZON COM INC                                                SC 13G/A    1018724     20231103    edgar/data/1018724/0001104659-23-127000.txt
+Apple Inc.                                                    10-K        320193      20231103    edgar/data/320193/0000320193-23-000106.txt
+"""
+
+SAMPLE_DAILY_MASTER_IDX = """Description:           Daily Index of EDGAR Dissemination Feed
+
+CIK|Company Name|Form Type|Date Filed|Filename
+--------------------------------------------------------------------------------
+1045810|NVIDIA CORP|10-K|20240221|edgar/data/1045810/0001045810-24-000029.txt
+"""
+
+
+def _streamer(files: dict[str, bytes]) -> MagicMock:
+    """Mock for EdgarSession.stream_to_file serving the given URLs."""
+
+    def write(url, fileobj):
+        for suffix, body in files.items():
+            if url.endswith(suffix):
+                fileobj.write(body)
+                return True
+        return False
+
+    return MagicMock(side_effect=write)
+
+
+@pytest.fixture
+def index(tmp_path):
+    """Return a FilingIndex with a mocked session."""
+    session = MagicMock()
+    session.stream_to_file = _streamer({
+        "full-index/2023/QTR4/master.gz": gzip.compress(SAMPLE_MASTER_IDX.encode()),
+    })
+    filing_index = FilingIndex(str(tmp_path), session=session)
+    yield filing_index
+    filing_index.close()
+
+
+# ---------------------------------------------------------------------------
+# parse_index tests
+# ---------------------------------------------------------------------------
+
+
+class TestParseIndex:
+    """Tests for parsing the three index layouts."""
+
+    def test_master(self):
+        """Verify pipe-delimited master files are parsed."""
+        rows = list(parse_index(io.StringIO(SAMPLE_MASTER_IDX)))
+        assert len(rows) == 4
+        assert rows[0] == (
+            320193, "Apple Inc.", "10-K", "2023-11-03",
+            "edgar/data/320193/0000320193-23-000106.txt",
+        )
+
+    def test_form_fixed_width(self):
+        """Verify form.idx rows, including form types with spaces."""
+        rows = list(parse_index(io.StringIO(SAMPLE_FORM_IDX)))
+        assert rows[1] == (
+            1018724, "AMAZON COM INC", "SC 13G/A", "2023-11-03",
+            "edgar/data/1018724/0001104659-23-127000.txt",
+        )
+
+    def test_company_fixed_width(self):
+        """Verify company.idx gives the same rows as form.idx."""
+        by_company = sorted(parse_index(io.StringIO(SAMPLE_COMPANY_IDX)))
+        by_form = sorted(parse_index(io.StringIO(SAMPLE_FORM_IDX)))
+        assert by_company == by_form
+
+    def test_no_header_yields_nothing(self):
+        """Verify a file without a header gives no rows."""
+        assert not list(parse_index(io.StringIO("not an index\n")))
+
+
+# ---------------------------------------------------------------------------
+# FilingIndex tests
+# ---------------------------------------------------------------------------
+
+
+class TestFilingIndex:
+    """Tests for loading and querying the SQLite filing index."""
+
+    def test_load_quarter_gz(self, index):
+        """Verify the gzipped quarterly master index is loaded once."""
+        assert index.load_quarter(2023, 4) == 4
+        assert index.load_quarter(2023, 4) == 0
+        assert len(index) == 4
+        assert index.sources() == ["full-index/2023/QTR4/master.gz"]
+        index.edgar_session.stream_to_file.assert_called_once()
+
+    def test_reload_is_idempotent(self, index):
+        """Verify reloading a quarter doesn't duplicate rows."""
+        index.load_quarter(2023, 4)
+        index.load_quarter(2023, 4, reload=True)
+        assert len(index) == 4
+
+    def test_query_form_and_dates(self, index):
+        """Verify filters on form type and date range."""
+        index.load_quarter(2023, 4)
+        index.edgar_session.reset_mock()
+
+        rows = index.query(form_type="10-K", start="2023-11-01", end="2023-11-30")
+
+        assert [row["cik"] for row in rows] == ["320193"]
+        assert rows[0]["url"] == (
+            "https://www.sec.gov/Archives/edgar/data/320193/0000320193-23-000106.txt"
+        )
+        index.edgar_session.assert_not_called()
+        index.edgar_session.stream_to_file.assert_not_called()
+
+    def test_query_other_filters(self, index):
+        """Verify cik, several forms, company name and limit."""
+        index.load_quarter(2023, 4)
+        assert len(index.query(cik="0000320193")) == 2
+        assert len(index.query(form_type=["10-K", "10-Q"])) == 2
+        assert index.query(company_name="microsoft")[0]["form_type"] == "10-Q"
+        assert [row["date_filed"] for row in index.query(limit=2)] == ["2023-10-24", "2023-11-02"]
+
+    def test_update_loads_new_daily_files(self, index):
+        """Verify update() only fetches daily files it hasn't loaded."""
+        index.edgar_session.make_request.return_value = {
+            "directory": {"item": [
+                {"name": "company.20240221.idx"},
+                {"name": "master.20240221.idx"},
+                {"name": "master.20240221.idx.gz"},
+            ]},
+        }
+        index.edgar_session.stream_to_file = _streamer({
+            "daily-index/2024/QTR1/master.20240221.idx": SAMPLE_DAILY_MASTER_IDX.encode(),
+        })
+
+        assert index.update(2024, 1) == 1
+        assert index.update(2024, 1) == 0
+        assert index.edgar_session.stream_to_file.call_count == 1
+        assert index.query(form_type="10-K")[0]["date_filed"] == "2024-02-21"
+
+    def test_load_file_without_session(self, tmp_path):
+        """Verify a session-less index can load local files but not download."""
+        index = FilingIndex(str(tmp_path))
+        assert index.load_file(io.BytesIO(SAMPLE_FORM_IDX.encode()), source="form.idx") == 2
+        with pytest.raises(ValueError, match="no session"):
+            index.load_quarter(2023, 4)
+        index.close()
+
+    def test_invalid_arguments(self, index):
+        """Verify quarter and kind are validated."""
+        with pytest.raises(ValueError, match="quarter must be between 1 and 4"):
+            index.load_quarter(2023, 5)
+        with pytest.raises(ValueError, match="kind must be one of"):
+            index.load_quarter(2023, 4, kind="xbrl")
+
+    def test_archives_factory(self, edgar_client, tmp_path):
+        """Verify Archives.filing_index binds the client's session."""
+        index = edgar_client.archives().filing_index(str(tmp_path))
+        assert index.edgar_session is edgar_client.edgar_session
+        index.close()
@@ -0,0 +1,94 @@
+"""Import-time regression tests: ``import edgar`` must not load heavy dependencies."""
+
+import subprocess
+import sys
+
+import pytest
+
+import edgar
+
+# Loaded by ``import edgar`` before the lazy imports; none is needed to
+# create a client or resolve a ticker.
+HEAVY_MODULES = (
+    "asyncio",
+    "bs4",
+    "httpx",
+    "lxml.etree",
+    "pandas",
+    "pyarrow",
+    "requests",
+)
+
+
+def run_imports(code: str) -> tuple[set[str], dict[str, int]]:
+    """Runs *code* in a fresh interpreter under ``-X importtime``.
+
+    Returns the modules loaded afterwards and the cumulative import
+    time, in microseconds, of each module ``importtime`` reported.
+    (``importlib.import_module`` calls, as used by the lazy
+    attributes, aren't reported, so loaded modules come from
+    ``sys.modules``.)
+    """
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{code}\nimport sys; print(*sys.modules)"],
+        capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return set(result.stdout.split()), times
+
+
+class TestLazyImports:
+    """Tests for what each entry point loads."""
+
+    def test_import_edgar_is_light(self):
+        """Verify ``import edgar`` loads no client, service, enum or heavy dependency."""
+        modules, times = run_imports("import edgar")
+        loaded = sorted(name for name in modules if name.startswith("edgar."))
+        assert loaded == ["edgar.exceptions"], f"import edgar took {times['edgar'] / 1000:.1f} ms"
+        assert not [name for name in HEAVY_MODULES if name in modules]
+
+    def test_client_loads_only_requests(self):
+        """Verify creating a client imports ``requests`` but no parser backend, asyncio or service."""
+        modules, _ = run_imports("import edgar; edgar.EdgarClient(user_agent='Test test@example.com')")
+        assert "requests" in modules
+        assert not [name for name in HEAVY_MODULES if name != "requests" and name in modules]
+        assert "edgar.xbrl" not in modules
+        assert "edgar.async_client" not in modules
+
+    def test_enums_load_one_module(self):
+        """Verify one enum doesn't import the others."""
+        modules, _ = run_imports("from edgar.enums import StateCodes")
+        assert "edgar.enums.state_codes" in modules
+        assert "edgar.enums.sic_codes" not in modules
+        assert "edgar.enums.other_filing_types" not in modules
+
+    def test_lazy_attributes(self):
+        """Verify lazily imported names resolve to the real objects."""
+        from edgar.async_client import EdgarAsyncClient  # pylint: disable=import-outside-toplevel
+        from edgar.client import EdgarClient  # pylint: disable=import-outside-toplevel
+        from edgar.enums import StandardIndustrialClassificationCodes  # pylint: disable=import-outside-toplevel
+        from edgar.enums.sic_codes import (  # pylint: disable=import-outside-toplevel
+            StandardIndustrialClassificationCodes as SicCodes,
+        )
+
+        assert edgar.EdgarClient is EdgarClient
+        assert edgar.EdgarAsyncClient is EdgarAsyncClient
+        assert StandardIndustrialClassificationCodes is SicCodes
+        assert "EdgarClient" in dir(edgar)
+        with pytest.raises(AttributeError, match="NoSuchThing"):
+            _ = edgar.NoSuchThing
+
+    def test_convenience_functions_survive_submodule_imports(self):
+        """Verify importing ``edgar.company`` / ``edgar.search`` doesn't replace the functions."""
+        import edgar.company  # pylint: disable=import-outside-toplevel,redefined-outer-name
+        import edgar.search  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+        assert callable(edgar.company)
+        assert callable(edgar.search)
+        assert edgar.company.__module__ == "edgar"
@@ -0,0 +1,344 @@
+"""Tests for request instrumentation hooks and the metrics collector."""
+
+# pylint: disable=redefined-outer-name
+# pylint: disable=protected-access
+
+import io
+import logging
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from edgar.client import EdgarClient
+from edgar.instrumentation import (
+    HOOK_EVENTS,
+    MetricsCollector,
+    RequestEvent,
+    RequestHooks,
+    endpoint_family,
+)
+from edgar.rate_limiter import TokenBucketRateLimiter
+
+
+SUBMISSIONS_URL = "https://data.sec.gov/submissions/CIK0000320193.json"
+
+
+def _mock_response(status_code=200, content=b'{"cik": "320193"}', headers=None):
+    """Build a mock requests/httpx response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.ok = status_code < 400
+    response.content = content
+    response.headers = headers if headers is not None else {"Content-Type": "application/json"}
+    response.json.return_value = {"cik": "320193"}
+    return response
+
+
+def _event(url=SUBMISSIONS_URL, **fields):
+    """Build a RequestEvent for ``url``."""
+    return RequestEvent(method="GET", url=url, family=endpoint_family(url), **fields)
+
+
+class _Recorder:
+    """Subscriber that records every event it receives."""
+
+    def __init__(self):
+        self.events = []
+
+    def __getattr__(self, name):
+        if name not in HOOK_EVENTS:
+            raise AttributeError(name)
+        return lambda event: self.events.append((name, event))
+
+    def names(self):
+        """The hook names received, in order."""
+        return [name for name, _ in self.events]
+
+
+@pytest.fixture
+def client():
+    """Return an EdgarClient with an unthrottled session and a recorder subscribed."""
+    edgar_client = EdgarClient(user_agent="Test test@example.com")
+    edgar_client.edgar_session.rate_limiter = TokenBucketRateLimiter(rate=10, burst=100)
+    edgar_client.recorder = _Recorder()
+    edgar_client.hooks.subscribe(edgar_client.recorder)
+    return edgar_client
+
+
+# ---------------------------------------------------------------------------
+# endpoint_family / RequestHooks
+# ---------------------------------------------------------------------------
+
+
+class TestEndpointFamily:
+    """Tests for grouping URLs into endpoint families."""
+
+    @pytest.mark.parametrize(
+        ("url", "family"),
+        [
+            (SUBMISSIONS_URL, "submissions"),
+            ("https://data.sec.gov/api/xbrl/companyfacts/CIK0000320193.json", "api/xbrl/companyfacts"),
+            ("https://data.sec.gov/api/xbrl/frames/us-gaap/Revenues/USD/CY2019.json", "api/xbrl/frames"),
+            ("https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&CIK=320193", "cgi-bin/browse-edgar"),
+            ("https://www.sec.gov/Archives/edgar/data/320193/000032019321000065/index.json",
+             "Archives/edgar/data"),
+            ("https://www.sec.gov/files/company_tickers.json", "files"),
+            ("https://www.sec.gov/", "www.sec.gov"),
+        ],
+    )
+    def test_families(self, url, family):
+        """Verify resource-specific path segments are dropped."""
+        assert endpoint_family(url) == family
+
+
+class TestRequestHooks:
+    """Tests for subscribing to and emitting hook events."""
+
+    def test_subscribe_object_and_keywords(self):
+        """Verify on_* methods and keyword callbacks are both registered."""
+        hooks = RequestHooks()
+        recorder = _Recorder()
+        retries = []
+        hooks.subscribe(recorder)
+        hooks.subscribe(on_retry=retries.append)
+
+        hooks.notify("on_retry", "get", SUBMISSIONS_URL, attempt=1, status=503)
+
+        assert recorder.names() == ["on_retry"]
+        assert retries[0] == _event(attempt=1, status=503)
+
+    def test_unsubscribe(self):
+        """Verify the returned callable removes only that subscription."""
+        hooks = RequestHooks()
+        first, second = [], []
+        unsubscribe = hooks.subscribe(on_response=first.append)
+        hooks.subscribe(on_response=second.append)
+
+        unsubscribe()
+        hooks.notify("on_response", "GET", SUBMISSIONS_URL)
+
+        assert not first
+        assert len(second) == 1
+
+    def test_unknown_hook_rejected(self):
+        """Verify misspelled hook names fail loudly."""
+        with pytest.raises(ValueError, match="on_reponse"):
+            RequestHooks().subscribe(on_reponse=print)
+
+    def test_subscriber_without_hooks_rejected(self):
+        """Verify subscribing an object with no on_* methods fails."""
+        with pytest.raises(ValueError, match="Nothing to subscribe"):
+            RequestHooks().subscribe(object())
+
+    def test_failing_callback_is_logged(self, caplog):
+        """Verify a raising callback neither breaks the request nor other callbacks."""
+        hooks = RequestHooks()
+        received = []
+        hooks.subscribe(on_response=lambda event: 1 / 0)
+        hooks.subscribe(on_response=received.append)
+
+        with caplog.at_level(logging.ERROR, logger="edgar.instrumentation"):
+            hooks.notify("on_response", "GET", SUBMISSIONS_URL)
+
+        assert len(received) == 1
+        assert "on_response failed" in caplog.text
+
+    def test_notify_without_subscribers_builds_nothing(self):
+        """Verify notify() skips building the event when nobody listens."""
+        hooks = RequestHooks()
+        with patch("edgar.instrumentation.RequestEvent") as event_class:
+            hooks.notify("on_response", "GET", SUBMISSIONS_URL)
+        event_class.assert_not_called()
+        assert not hooks
+
+
+# ---------------------------------------------------------------------------
+# MetricsCollector
+# ---------------------------------------------------------------------------
+
+
+class TestMetricsCollector:
+    """Tests for aggregating hook events."""
+
+    def test_latency_histogram_is_cumulative(self):
+        """Verify responses land in the right cumulative buckets per family."""
+        metrics = MetricsCollector(buckets=(0.1, 1.0))
+        for elapsed in (0.05, 0.1, 0.5, 3.0):
+            metrics.on_response(_event(status=200, elapsed=elapsed, size=10))
+
+        histogram = metrics.snapshot().latency["submissions"]
+
+        assert histogram.buckets == {0.1: 2, 1.0: 3, float("inf"): 4}
+        assert histogram.count == 4
+        assert histogram.mean == pytest.approx(3.65 / 4)
+
+    def test_counters(self):
+        """Verify bytes, statuses, retries, throttling and cache hits are counted."""
+        metrics = MetricsCollector()
+        facts_url = "https://data.sec.gov/api/xbrl/companyfacts/CIK0000320193.json"
+        metrics.on_request_start(_event())
+        metrics.on_throttle_wait(_event(wait=0.25))
+        metrics.on_response(_event(status=503, size=0))
+        metrics.on_retry(_event(status=503, attempt=1))
+        metrics.on_response(_event(status=200, size=100))
+        metrics.on_response(_event(url=facts_url, status=200, size=50))
+        metrics.on_cache_hit(_event(cache="memory"))
+
+        snapshot = metrics.snapshot()
+
+        assert snapshot.requests == 1
+        assert snapshot.responses == 3
+        assert snapshot.statuses == {503: 1, 200: 2}
+        assert snapshot.bytes_received == {"submissions": 100, "api/xbrl/companyfacts": 50}
+        assert snapshot.retries == {"submissions": 1}
+        assert snapshot.throttle_waits == 1
+        assert snapshot.throttle_seconds == pytest.approx(0.25)
+        assert snapshot.cache_hits == {"memory": 1}
+
+    def test_cache_hit_ratio(self):
+        """Verify revalidations count as requests, memory and disk hits as hits."""
+        metrics = MetricsCollector()
+        assert metrics.snapshot().cache_hit_ratio == 0.0
+
+        metrics.on_cache_hit(_event(cache="memory"))
+        metrics.on_cache_hit(_event(cache="disk"))
+        metrics.on_request_start(_event())
+        metrics.on_request_start(_event())
+        metrics.on_cache_hit(_event(cache="revalidated"))
+
+        assert metrics.snapshot().cache_hit_ratio == pytest.approx(0.5)
+
+    def test_reset(self):
+        """Verify reset() clears every counter."""
+        metrics = MetricsCollector()
+        metrics.on_response(_event(status=200, elapsed=0.1, size=5))
+        metrics.reset()
+        snapshot = metrics.snapshot()
+        assert snapshot.responses == 0
+        assert not snapshot.latency
+
+    def test_buckets_must_increase(self):
+        """Verify unsorted bucket bounds are rejected."""
+        with pytest.raises(ValueError):
+            MetricsCollector(buckets=(1.0, 0.5))
+
+
+# ---------------------------------------------------------------------------
+# Session integration
+# ---------------------------------------------------------------------------
+
+
+class TestSessionHooks:
+    """Tests for the events EdgarSession emits."""
+
+    def test_successful_request(self, client):
+        """Verify a request emits start then response with size and status."""
+        session = client.edgar_session
+        session.http_session.request = MagicMock(return_value=_mock_response())
+
+        session.make_request("get", "/submissions/CIK0000320193.json", use_api=True)
+
+        assert client.recorder.names() == ["on_request_start", "on_response"]
+        response = client.recorder.events[1][1]
+        assert response.family == "submissions"
+        assert response.status == 200
+        assert response.size == len(b'{"cik": "320193"}')
+        assert response.elapsed >= 0
+
+    def test_retry_events(self, client):
+        """Verify each retry is reported between the responses."""
+        session = client.edgar_session
+        session.http_session.request = MagicMock(
+            side_effect=[_mock_response(status_code=503), _mock_response()]
+        )
+
+        with patch("edgar.session.time.sleep"):
+            session.make_request("get", "/submissions/CIK0000320193.json", use_api=True)
+
+        assert client.recorder.names() == ["on_request_start", "on_response", "on_retry", "on_response"]
+        retry = client.recorder.events[2][1]
+        assert (retry.attempt, retry.status) == (1, 503)
+
+    def test_throttle_wait(self, client):
+        """Verify sleeping for the rate limiter is reported."""
+        session = client.edgar_session
+        session.rate_limiter = MagicMock()
+        session.rate_limiter.reserve.return_value = 0.3
+
+        with patch("edgar.session.time.sleep"):
+            session._throttle("GET", SUBMISSIONS_URL)
+
+        assert client.recorder.events == [("on_throttle_wait", _event(wait=0.3))]
+
+    def test_memory_cache_hit(self, client):
+        """Verify TTL cache hits in services are reported as memory hits."""
+        session = client.edgar_session
+        session.http_session.request = MagicMock(return_value=_mock_response())
+
+        client.submissions().get_submissions(cik="320193")
+        client.submissions().get_submissions(cik="320193")
+
+        assert client.recorder.names() == ["on_request_start", "on_response", "on_cache_hit"]
+        assert client.recorder.events[2][1] == _event(cache="memory")
+
+    def test_disk_cache_hit(self, tmp_path):
+        """Verify fresh disk cache entries are reported as disk hits."""
+        edgar_client = EdgarClient(user_agent="Test test@example.com", cache=False, cache_dir=str(tmp_path))
+        metrics = MetricsCollector()
+        edgar_client.hooks.subscribe(metrics)
+        session = edgar_client.edgar_session
+        session.http_session.get = MagicMock(return_value=_mock_response(content=b"<feed/>"))
+
+        session.fetch_page("https://www.sec.gov/page")
+        session.fetch_page("https://www.sec.gov/page")
+
+        snapshot = metrics.snapshot()
+        assert snapshot.requests == 1
+        assert snapshot.cache_hits == {"disk": 1}
+        assert snapshot.cache_hit_ratio == pytest.approx(0.5)
+        session.disk_cache.close()
+
+    def test_stream_counts_written_bytes(self, client):
+        """Verify streamed downloads report the bytes written."""
+        session = client.edgar_session
+        response = _mock_response()
+        response.iter_content.return_value = [b"abc", b"de"]
+        session.http_session.get = MagicMock()
+        session.http_session.get.return_value.__enter__.return_value = response
+
+        assert session.stream_to_file("https://www.sec.gov/files/big.zip", io.BytesIO())
+
+        assert client.recorder.events[-1][1].size == 5
+
+    def test_hooks_passed_to_client(self):
+        """Verify a RequestHooks instance can be shared between clients."""
+        hooks = RequestHooks()
+        first = EdgarClient(user_agent="Test test@example.com", hooks=hooks)
+        second = EdgarClient(user_agent="Test test@example.com", hooks=hooks)
+        assert first.hooks is second.hooks is hooks
+
+
+class TestAsyncSessionHooks:
+    """Tests for the events EdgarAsyncSession emits."""
+
+    @pytest.mark.asyncio
+    async def test_async_request(self):
+        """Verify the async session reports the same events."""
+        pytest.importorskip("httpx")
+        from edgar.async_client import EdgarAsyncClient  # pylint: disable=import-outside-toplevel
+
+        async_client = EdgarAsyncClient(user_agent="Test test@example.com")
+        recorder = _Recorder()
+        async_client.hooks.subscribe(recorder)
+        session = async_client.edgar_session
+        session._throttle = AsyncMock()
+        session.http_client.request = AsyncMock(
+            side_effect=[_mock_response(status_code=429), _mock_response()]
+        )
+
+        with patch("edgar.async_session.asyncio.sleep", new=AsyncMock()):
+            await session.make_request("get", "/submissions/CIK0000320193.json", use_api=True)
+        await async_client.close()
+
+        assert recorder.names() == ["on_request_start", "on_response", "on_retry", "on_response"]
+        assert recorder.events[-1][1].status == 200
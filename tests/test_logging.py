@@ -98,16 +98,11 @@ class TestRateLimitLogging:
 
     def test_throttle_logs_debug_when_sleeping(self, session, caplog):
         """Verify rate-limit sleep emits a debug log."""
-        import time
-
-        # Fill the request window to trigger a sleep.
-        now = time.monotonic()
-        for _ in range(session._rate_limit):
-            session._request_times.append(now)
-
+        # Back-to-back requests force the second one to wait.
         with caplog.at_level(logging.DEBUG, logger="edgar.session"):
             with patch("edgar.session.time.sleep"):
                 session._throttle()
+                session._throttle()
 
         assert any("Rate limit" in m and "sleeping" in m for m in caplog.messages)
 
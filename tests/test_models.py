@@ -2,11 +2,16 @@
 
 # pylint: disable=redefined-outer-name
 
+import dataclasses
+import pickle
+from array import array
+from dataclasses import FrozenInstanceError
 from unittest.mock import MagicMock
 
 import pytest
 
 from edgar.models import Filing, CompanyInfo, Submission
+from edgar.tables import SubmissionTable
 from edgar.company import Company
 
 
@@ -159,7 +164,7 @@ class TestCompanyInfo:
         """Verify empty filings return empty lists."""
         info = CompanyInfo(raw=SAMPLE_SUBMISSIONS_EMPTY_FILINGS)
         assert info.recent_filings == []
-        assert info.recent_submissions == []
+        assert not info.recent_submissions
 
     def test_missing_filings_key(self):
         """Verify missing 'filings' key returns empty lists."""
@@ -247,6 +252,100 @@ class TestSubmission:
         assert "10-Q" in result
         assert "2021-07-28" in result
 
+    def test_frozen(self):
+        """Verify submissions are immutable and carry no instance dict."""
+        sub = Submission(raw={"form": "8-K"})
+        with pytest.raises(FrozenInstanceError):
+            sub.raw = {}
+        assert not hasattr(sub, "__dict__")
+
+    def test_equality_and_pickle(self):
+        """Verify proxies compare and pickle by their row data."""
+        row = CompanyInfo(raw=SAMPLE_SUBMISSIONS_RAW).recent_table[1]
+        assert row == Submission(raw=row.raw)
+        assert pickle.loads(pickle.dumps(row)) == row
+
+    def test_rows_are_dataclasses(self):
+        """Verify table rows work with the dataclasses helpers."""
+        row = CompanyInfo(raw=SAMPLE_SUBMISSIONS_RAW).recent_table[0]
+        assert isinstance(row, Submission)
+        assert dataclasses.is_dataclass(row)
+        assert [f.name for f in dataclasses.fields(row)] == ["raw"]
+        assert dataclasses.asdict(row) == {"raw": row.raw}
+        assert dataclasses.asdict(Submission(raw={"form": "8-K"})) == {"raw": {"form": "8-K"}}
+        with pytest.raises(FrozenInstanceError):
+            row.raw = {}
+
+    def test_replace_returns_plain_submission(self):
+        """Verify dataclasses.replace works on table rows and detaches them from the table."""
+        table = CompanyInfo(raw=SAMPLE_SUBMISSIONS_RAW).recent_table
+        row = table[0]
+        changed = dataclasses.replace(row, raw={**row.raw, "form": "10-K/A"})
+
+        assert type(changed) is Submission  # pylint: disable=unidiomatic-typecheck
+        assert changed.form == "10-K/A"
+        assert row.form == table[0].form == "10-K"
+        assert dataclasses.replace(row) == row
+
+
+# ---------------------------------------------------------------------------
+# SubmissionTable tests
+# ---------------------------------------------------------------------------
+
+
+class TestSubmissionTable:
+    """Tests for the columnar view of filings.recent."""
+
+    @pytest.fixture
+    def table(self):
+        """Return the recent table of the sample company."""
+        return CompanyInfo(raw=SAMPLE_SUBMISSIONS_RAW).recent_table
+
+    def test_rows_read_shared_columns(self, table):
+        """Verify rows are proxies over the original column lists."""
+        recent = SAMPLE_SUBMISSIONS_RAW["filings"]["recent"]
+        assert len(table) == 2
+        assert table.columns["form"] is recent["form"]
+        assert table[1].form == "10-Q"
+        assert table[-1].accession_number == "0000320193-21-000088"
+        assert table[0].is_xbrl is True
+
+    def test_integer_columns_are_typed(self, table):
+        """Verify size and XBRL flags are stored as typed arrays."""
+        assert isinstance(table.columns["size"], array)
+        assert table.columns["isXBRL"].typecode == "b"
+        assert list(table.column("size")) == [15000000, 12000000]
+
+    def test_row_raw_matches_recent_filings(self, table):
+        """Verify a row's raw dict equals the row-dict view."""
+        info = CompanyInfo(raw=SAMPLE_SUBMISSIONS_RAW)
+        assert [row.raw for row in table] == info.recent_filings
+
+    def test_column_by_property_name(self, table):
+        """Verify columns can be fetched by raw key or property name."""
+        assert table.column("filing_date") == table.column("filingDate") == ["2021-10-29", "2021-07-28"]
+        with pytest.raises(KeyError):
+            table.column("nope")
+
+    def test_slicing_and_bounds(self, table):
+        """Verify slices return lists and out-of-range indexes raise."""
+        assert [row.form for row in table[:1]] == ["10-K"]
+        with pytest.raises(IndexError):
+            table[2]  # pylint: disable=pointless-statement
+
+    def test_ragged_columns_use_shortest(self):
+        """Verify a truncated column doesn't produce out-of-range rows."""
+        table = SubmissionTable({"form": ["10-K", "10-Q"], "filingDate": ["2021-10-29"]})
+        assert len(table) == 1
+
+    def test_to_dataframe_matches_models(self, table):
+        """Verify the columnar export equals the generic model export."""
+        pd = pytest.importorskip("pandas")
+        from edgar.models import to_dataframe  # pylint: disable=import-outside-toplevel
+
+        expected = to_dataframe(list(table))
+        pd.testing.assert_frame_equal(table.to_dataframe(), expected[list(table.to_dataframe().columns)])
+
 
 # ---------------------------------------------------------------------------
 # Company.get_filings() / get_info() integration tests
@@ -312,6 +411,7 @@ class TestCompanyGetInfo:
         session.cache = None
         session.make_request.return_value = SAMPLE_SUBMISSIONS_RAW
         session.edgar_utilities = MagicMock()
+        session.bulk_data = None
 
         company = Company(identifier="AAPL", session=session, tickers_service=mock_tickers)
         info = company.get_info()
@@ -326,6 +426,7 @@ class TestCompanyGetInfo:
         session.cache = None
         session.make_request.return_value = None
         session.edgar_utilities = MagicMock()
+        session.bulk_data = None
 
         company = Company(identifier="AAPL", session=session, tickers_service=mock_tickers)
         info = company.get_info()
@@ -1,14 +1,24 @@
 """Unit tests for EdgarParser XML and HTML parsing."""
 
+import threading
+
 import defusedxml.ElementTree as DefusedET
 import pytest
+from bs4 import BeautifulSoup
 
 from edgar.exceptions import EdgarParseError
+from edgar.parser import FEED_CHUNK_SIZE, EdgarParser
 from tests.conftest import (
     SAMPLE_ATOM_FEED,
     SAMPLE_ATOM_FEED_NO_NEXT,
     SAMPLE_ATOM_FEED_WITH_NEXT,
+    SAMPLE_CURRENT_EVENTS_HTML,
+    SAMPLE_ISSUER_HTML,
+    SAMPLE_ISSUER_HTML_WITH_NEXT,
     SAMPLE_MALFORMED_XML,
+    SAMPLE_SERIES_HTML,
+    SAMPLE_VIP_HTML,
+    SAMPLE_VIP_HTML_PAGE_2,
 )
 
 
@@ -115,3 +125,271 @@ class TestParseEntryElement:
         result = edgar_parser.parse_entry_element(entry=entry)
         assert isinstance(result, dict)
         assert "title" in result
+
+
+class TestFeedStream:
+    """Tests for EdgarParser.iter_entries / FeedStream."""
+
+    def test_yields_all_pages(self, edgar_parser):
+        """The stream should follow next links like parse_entries."""
+        stream = edgar_parser.iter_entries(
+            response_text=SAMPLE_ATOM_FEED_WITH_NEXT,
+            fetch_page=lambda _url: SAMPLE_ATOM_FEED_NO_NEXT.encode("utf-8"),
+        )
+        titles = [entry["title"] for entry in stream]
+        assert titles == ["10-K - Annual report", "8-K - Current report"]
+
+    def test_matches_parse_entries(self, edgar_parser):
+        """Streamed entries should equal the eagerly parsed ones."""
+        eager = edgar_parser.parse_entries(response_text=SAMPLE_ATOM_FEED)
+        streamed = list(edgar_parser.iter_entries(response_text=SAMPLE_ATOM_FEED))
+        assert streamed == eager
+
+    def test_yields_first_page_before_fetching_is_done(self, edgar_parser):
+        """Entries from page one should arrive before page two is fetched."""
+        release = threading.Event()
+
+        def slow_fetch(_url):
+            release.wait(timeout=5)
+            return SAMPLE_ATOM_FEED_NO_NEXT.encode("utf-8")
+
+        stream = edgar_parser.iter_entries(
+            response_text=SAMPLE_ATOM_FEED_WITH_NEXT, fetch_page=slow_fetch,
+        )
+        assert next(stream)["title"] == "10-K - Annual report"
+        release.set()
+        assert next(stream)["title"] == "8-K - Current report"
+
+    def test_next_page_is_prefetched(self, edgar_parser):
+        """The next page should be requested while page one is consumed."""
+        fetched = threading.Event()
+
+        def fake_fetch(_url):
+            fetched.set()
+            return SAMPLE_ATOM_FEED_NO_NEXT.encode("utf-8")
+
+        stream = edgar_parser.iter_entries(
+            response_text=SAMPLE_ATOM_FEED_WITH_NEXT, fetch_page=fake_fetch,
+        )
+        next(stream)
+        assert fetched.wait(timeout=5)
+        stream.close()
+
+    def test_offset_tracks_finished_entries(self, edgar_parser):
+        """offset should resume right after the last finished entry."""
+        stream = edgar_parser.iter_entries(response_text=SAMPLE_ATOM_FEED, start=40)
+        assert stream.offset == 40
+        next(stream)
+        # The first entry may still be in progress, so it isn't counted yet.
+        assert stream.offset == 40
+        next(stream)
+        assert stream.offset == 41
+        assert not list(stream)
+        assert stream.offset == 42
+
+    def test_limit_stops_early_without_fetching(self, edgar_parser):
+        """A limit reached on page one should not fetch page two."""
+        calls = []
+        stream = edgar_parser.iter_entries(
+            response_text=SAMPLE_ATOM_FEED_WITH_NEXT,
+            fetch_page=calls.append,
+            limit=1,
+        )
+        assert len(list(stream)) == 1
+        assert not calls
+
+    def test_empty_response_yields_nothing(self, edgar_parser):
+        """A missing first page should give an empty stream."""
+        assert not list(edgar_parser.iter_entries(response_text=None))
+
+    def test_malformed_next_page_raises(self, edgar_parser):
+        """A broken next page should surface as EdgarParseError."""
+        stream = edgar_parser.iter_entries(
+            response_text=SAMPLE_ATOM_FEED_WITH_NEXT,
+            fetch_page=lambda _url: SAMPLE_MALFORMED_XML.encode("utf-8"),
+        )
+        next(stream)
+        with pytest.raises(EdgarParseError):
+            next(stream)
+
+
+def _company_feed(count: int) -> str:
+    """Build a getcompany-style Atom feed with ``count`` filing entries."""
+    entries = "".join(
+        "<entry>"
+        f"<category label=\"form type\" scheme=\"https://www.sec.gov/\" term=\"10-Q\"/>"
+        "<content type=\"text/xml\">"
+        f"<accession-number>0000320193-21-{i:06d}</accession-number>"
+        "<act>34</act><file-number>000-10030</file-number>"
+        f"<filing-date>2021-04-29</filing-date><filing-href>https://www.sec.gov/{i}.htm</filing-href>"
+        "<form-name>Quarterly report Série A</form-name><size>5 MB</size>"
+        "<xbrl_href>https://www.sec.gov/cgi-bin/viewer</xbrl_href><items-desc/>"
+        "</content>"
+        f"<id>urn:tag:sec.gov,2008:accession-number=0000320193-21-{i:06d}</id>"
+        "<link href=\"https://www.sec.gov/index.htm\" rel=\"alternate\" type=\"text/html\"/>"
+        "<summary type=\"html\"> &lt;b&gt;Filed:&lt;/b&gt; 2021-04-29 </summary>"
+        "<title>10-Q  - Quarterly report</title><updated>2021-04-29T18:03:20-04:00</updated>"
+        "</entry>"
+        for i in range(count)
+    )
+    return (
+        '<?xml version="1.0" encoding="ISO-8859-1" ?>'
+        '<feed xmlns="http://www.w3.org/2005/Atom">'
+        "<company-info><cik>0000320193</cik><conformed-name>Apple Inc.</conformed-name></company-info>"
+        '<link href="https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&amp;start=40" '
+        'rel="next" type="application/atom+xml"/>'
+        f"{entries}</feed>"
+    )
+
+
+class TestParserBackends:
+    """The lxml backend should produce exactly the ElementTree output."""
+
+    @pytest.fixture
+    def parsers(self):
+        """Return an (etree, lxml) pair of parsers."""
+        pytest.importorskip("lxml")
+        return EdgarParser(backend="etree"), EdgarParser(backend="lxml")
+
+    @pytest.mark.parametrize("feed", [SAMPLE_ATOM_FEED, SAMPLE_ATOM_FEED_WITH_NEXT, _company_feed(3)])
+    def test_pages_are_identical(self, parsers, feed):
+        """Entries and next links should match for str and bytes input."""
+        etree_parser, lxml_parser = parsers
+        assert lxml_parser.parse_page(feed) == etree_parser.parse_page(feed)
+        raw = feed.encode("latin-1")
+        assert lxml_parser.parse_page(raw) == etree_parser.parse_page(raw)
+
+    def test_large_page_spans_chunks(self, parsers):
+        """A page fed to the pull parser in many chunks should parse the same."""
+        etree_parser, lxml_parser = parsers
+        feed = _company_feed(500)
+        assert len(feed) > 4 * FEED_CHUNK_SIZE
+
+        entries, next_page = lxml_parser.parse_page(feed.encode("latin-1"))
+        assert (entries, next_page) == etree_parser.parse_page(feed)
+        assert lxml_parser.parse_page(feed) == (entries, next_page)
+        assert len(entries) == 500
+        assert entries[0]["form_name"] == "Quarterly report Série A"
+        assert entries[0]["category_label"] == "form type"
+        assert "items-desc" not in entries[0]
+
+    def test_other_paths_use_element_tree(self, parsers):
+        """Custom entry paths should give the ElementTree result."""
+        etree_parser, lxml_parser = parsers
+        feed = _company_feed(1)
+        path = "atom:company-info"
+        assert lxml_parser.parse_page(feed, path=path) == etree_parser.parse_page(feed, path=path)
+
+    def test_entities_are_not_expanded(self, parsers):
+        """Internal DTD entities must not be expanded by the lxml backend."""
+        _, lxml_parser = parsers
+        feed = (
+            '<?xml version="1.0"?><!DOCTYPE feed [<!ENTITY x "expanded">]>'
+            '<feed xmlns="http://www.w3.org/2005/Atom"><entry><title>&x;</title></entry></feed>'
+        )
+        entries, _ = lxml_parser.parse_page(feed)
+        assert "expanded" not in str(entries)
+
+    def test_malformed_xml_raises_parse_error(self, parsers):
+        """lxml syntax errors should surface as EdgarParseError."""
+        _, lxml_parser = parsers
+        with pytest.raises(EdgarParseError, match="Failed to parse XML"):
+            lxml_parser.parse_page(SAMPLE_MALFORMED_XML)
+
+    def test_pagination_is_identical(self, parsers):
+        """parse_entries should follow next links the same way on both backends."""
+        results = [
+            parser.parse_entries(
+                response_text=SAMPLE_ATOM_FEED_WITH_NEXT,
+                fetch_page=lambda _url: SAMPLE_ATOM_FEED_NO_NEXT.encode("utf-8"),
+            )
+            for parser in parsers
+        ]
+        assert results[0] == results[1]
+        assert len(results[0]) == 2
+
+    def test_unknown_backend_raises(self):
+        """Verify the backend name is validated."""
+        with pytest.raises(ValueError, match="backend must be one of"):
+            EdgarParser(backend="sax")
+
+
+def _scrape_all(parser: EdgarParser) -> dict:
+    """Run every HTML table scraper over the sample pages."""
+    return {
+        "issuer": parser.parse_issuer_table(
+            SAMPLE_ISSUER_HTML_WITH_NEXT,
+            fetch_page=lambda _url: SAMPLE_ISSUER_HTML.encode("utf-8"),
+        ),
+        "variable_products": parser.parse_variable_products_company_table(
+            SAMPLE_VIP_HTML,
+            fetch_page=lambda _url: SAMPLE_VIP_HTML_PAGE_2.encode("utf-8"),
+        ),
+        "series": parser.parse_series_table(SAMPLE_SERIES_HTML),
+        "current_events": parser.parse_current_event_table(SAMPLE_CURRENT_EVENTS_HTML),
+    }
+
+
+class TestHtmlBackends:
+    """HTML scrapers should give the same rows on every backend."""
+
+    @pytest.fixture
+    def full_tree_result(self, monkeypatch):
+        """Scrape with whole-page html.parser trees, as before partial parsing."""
+        parser = EdgarParser(backend="etree")
+        monkeypatch.setattr(
+            parser, "_make_soup", lambda markup, parse_only: BeautifulSoup(markup, "html.parser"),
+        )
+        return _scrape_all(parser)
+
+    @pytest.mark.parametrize("backend", ["etree", "lxml"])
+    def test_matches_full_tree(self, backend, full_tree_result):
+        """Partial parsing should not change any scraped value."""
+        if backend == "lxml":
+            pytest.importorskip("lxml")
+        assert _scrape_all(EdgarParser(backend=backend)) == full_tree_result
+
+    def test_html_features_follow_backend(self):
+        """The BeautifulSoup tree builder should match the backend."""
+        assert EdgarParser(backend="etree").html_features == "html.parser"
+        pytest.importorskip("lxml")
+        assert EdgarParser(backend="lxml").html_features == "lxml"
+
+    def test_issuer_table_follows_next_button(self, edgar_parser):
+        """The Next button should be followed and both pages scraped."""
+        urls = []
+
+        def fake_fetch(url):
+            urls.append(url)
+            return SAMPLE_ISSUER_HTML.encode("utf-8")
+
+        pages = edgar_parser.parse_issuer_table(SAMPLE_ISSUER_HTML_WITH_NEXT, fetch_page=fake_fetch)
+        assert urls == [
+            "https://www.sec.gov/cgi-bin/own-disp?action=getowner&CIK=0001214128"
+            "&type=&dateb=&owner=include&start=80"
+        ]
+        assert len(pages) == 2
+        assert pages[0]["ownership_transaction_report"][0]["transaction_type"] == "S-Sale"
+
+    def test_variable_products_rows(self, edgar_parser):
+        """Rows should be typed by ID prefix and exclude tables with inputs."""
+        products = edgar_parser.parse_variable_products_company_table(SAMPLE_VIP_HTML)
+        assert [(p["id"], p["id_type"], p["ticker_symbol"]) for p in products] == [
+            ("0000035341", "CIK", "null"),
+            ("S000006037", "Series", "null"),
+            ("C000016671", "Contract", "FMAGX"),
+        ]
+
+    def test_series_table_uses_sixth_table(self, edgar_parser):
+        """Nested tables should still count toward the table index."""
+        records = edgar_parser.parse_series_table(SAMPLE_SERIES_HTML)
+        assert [record["cik"] for record in records] == ["0000061397", "0000035341", "S000006037"]
+        assert records[1]["company"] == "FIDELITY MAGELLAN FUND INC"
+
+    def test_current_event_rows(self, edgar_parser):
+        """The header should be dropped from the first row."""
+        rows = edgar_parser.parse_current_event_table(SAMPLE_CURRENT_EVENTS_HTML)
+        assert rows[0] == {
+            "date_filed": "04-29-2021", "form": "10-Q", "cik": "0000320193", "company_name": "Apple Inc.",
+        }
+        assert rows[2]["form"] == "10-Q/A"
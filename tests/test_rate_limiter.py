@@ -1,14 +1,17 @@
-"""Tests for the sliding-window rate limiter in EdgarSession."""
+"""Tests for the pluggable rate limiters and their use in EdgarSession."""
 
 # Disable protected access warnings since we're testing internal behavior.
 # pylint: disable=redefined-outer-name
 # pylint: disable=protected-access
 # pylint: disable=import-outside-toplevel
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from edgar.rate_limiter import FileRateLimiter, RateLimiter, TokenBucketRateLimiter
 from edgar.session import EdgarSession, MAX_REQUESTS_PER_SECOND
 
 
@@ -49,14 +52,13 @@ class TestConfigurableRateLimit:
             user_agent="Test test@example.com",
             rate_limit=3,
         )
-        with patch("edgar.session.time") as mock_time:
-            mock_time.monotonic.return_value = 100.0
-            for _ in range(3):
-                sess._throttle()
-            # 4th request at same time should trigger sleep.
-            mock_time.monotonic.return_value = 100.0
+        with patch("edgar.rate_limiter.time.monotonic", return_value=100.0), \
+                patch("edgar.session.time.sleep") as mock_sleep:
+            sess.rate_limiter = TokenBucketRateLimiter(rate=3)
             sess._throttle()
-            mock_time.sleep.assert_called()
+            sess._throttle()
+            # Requests are spaced 1/3s apart.
+            assert mock_sleep.call_args[0][0] == pytest.approx(1 / 3)
 
     def test_rate_limit_of_one(self):
         """Verify rate_limit=1 allows only one request per second."""
@@ -66,13 +68,13 @@ class TestConfigurableRateLimit:
             user_agent="Test test@example.com",
             rate_limit=1,
         )
-        with patch("edgar.session.time") as mock_time:
-            mock_time.monotonic.return_value = 100.0
+        with patch("edgar.rate_limiter.time.monotonic", return_value=100.0), \
+                patch("edgar.session.time.sleep") as mock_sleep:
+            sess.rate_limiter = TokenBucketRateLimiter(rate=1)
             sess._throttle()
-            # Second request in the same instant should sleep.
-            mock_time.monotonic.return_value = 100.0
+            # Second request in the same instant should sleep a full second.
             sess._throttle()
-            mock_time.sleep.assert_called()
+            mock_sleep.assert_called_once_with(pytest.approx(1.0))
 
     def test_rate_limit_too_low_raises(self):
         """Verify rate_limit=0 raises ValueError."""
@@ -114,78 +116,161 @@ class TestConfigurableRateLimit:
 
 
 class TestThrottleBasics:
-    """Tests for the _throttle sliding-window algorithm."""
-
-    def test_under_limit_no_sleep(self, session):
-        """Requests under the limit should not trigger any sleep."""
-        with patch("edgar.session.time") as mock_time:
-            mock_time.monotonic.return_value = 100.0
-            # Under the limit — no sleep should be called.
-            for _ in range(MAX_REQUESTS_PER_SECOND - 1):
-                session._throttle()
-            mock_time.sleep.assert_not_called()
-
-    def test_at_limit_triggers_sleep(self, session):
-        """Hitting the limit within 1 second should trigger a sleep."""
-        with patch("edgar.session.time") as mock_time:
-            # All requests at the same instant.
-            mock_time.monotonic.return_value = 100.0
-            for _ in range(MAX_REQUESTS_PER_SECOND):
-                session._throttle()
-
-            # The next request should trigger a sleep.
-            mock_time.monotonic.return_value = 100.5
-            session._throttle()
-            mock_time.sleep.assert_called()
-            # Sleep duration should be ~0.5s (1.0 - 0.5 since oldest is at 100.0).
-            sleep_arg = mock_time.sleep.call_args[0][0]
-            assert 0.4 <= sleep_arg <= 0.6
-
-    def test_expired_timestamps_are_discarded(self, session):
-        """Timestamps older than 1 second should be pruned."""
-        with patch("edgar.session.time") as mock_time:
-            # Fill to capacity at t=100.
-            mock_time.monotonic.return_value = 100.0
-            for _ in range(MAX_REQUESTS_PER_SECOND):
-                session._throttle()
-
-            # At t=101.1, all prior timestamps are >1s old — should not sleep.
-            mock_time.monotonic.return_value = 101.1
-            session._throttle()
-            mock_time.sleep.assert_not_called()
-
-    def test_sliding_window_partial_expiry(self, session):
-        """Only expired timestamps should be pruned; recent ones remain."""
-        with patch("edgar.session.time") as mock_time:
-            # 5 requests at t=100.0
-            mock_time.monotonic.return_value = 100.0
-            for _ in range(5):
-                session._throttle()
-
-            # 5 requests at t=100.6
-            mock_time.monotonic.return_value = 100.6
-            for _ in range(5):
-                session._throttle()
+    """Tests for the token bucket behind _throttle."""
 
-            # At t=100.8 — the t=100.0 group is still within 1s.
-            # Window has 10 requests, so the 11th should trigger sleep.
-            mock_time.monotonic.return_value = 100.8
+    def test_first_request_no_sleep(self, session):
+        """A fresh limiter should let the first request through at once."""
+        with patch("edgar.session.time.sleep") as mock_sleep:
             session._throttle()
-            mock_time.sleep.assert_called()
-
-    def test_deque_tracks_request_count(self, session):
-        """The internal deque should accurately track request timestamps."""
-        with patch("edgar.session.time") as mock_time:
-            mock_time.monotonic.return_value = 100.0
+            mock_sleep.assert_not_called()
+
+    def test_requests_are_evenly_spaced(self):
+        """Back-to-back reservations should be 1/rate seconds apart."""
+        with patch("edgar.rate_limiter.time.monotonic", return_value=100.0):
+            limiter = TokenBucketRateLimiter(rate=MAX_REQUESTS_PER_SECOND)
+            waits = [limiter.reserve() for _ in range(MAX_REQUESTS_PER_SECOND)]
+        assert waits == pytest.approx([i / MAX_REQUESTS_PER_SECOND for i in range(10)])
+
+    def test_never_exceeds_rate_in_one_second(self):
+        """No one-second window may hold more than ``rate`` requests."""
+        with patch("edgar.rate_limiter.time.monotonic", return_value=100.0):
+            limiter = TokenBucketRateLimiter(rate=MAX_REQUESTS_PER_SECOND)
+            send_times = [100.0 + limiter.reserve() for _ in range(50)]
+        for start in send_times:
+            in_window = [t for t in send_times if start <= t < start + 1.0 - 1e-9]
+            assert len(in_window) <= MAX_REQUESTS_PER_SECOND
+
+    def test_idle_time_refills_bucket(self):
+        """After an idle period the next request should not wait."""
+        with patch("edgar.rate_limiter.time.monotonic") as mock_monotonic:
+            mock_monotonic.return_value = 100.0
+            limiter = TokenBucketRateLimiter(rate=MAX_REQUESTS_PER_SECOND)
             for _ in range(5):
-                session._throttle()
-            assert len(session._request_times) == 5
+                limiter.reserve()
+            mock_monotonic.return_value = 102.0
+            assert limiter.reserve() == 0.0
+
+    def test_burst_allows_back_to_back_requests(self):
+        """A larger burst lets that many requests skip the wait."""
+        with patch("edgar.rate_limiter.time.monotonic", return_value=100.0):
+            limiter = TokenBucketRateLimiter(rate=10, burst=3)
+            waits = [limiter.reserve() for _ in range(4)]
+        assert waits == pytest.approx([0.0, 0.0, 0.0, 0.1])
+
+    def test_invalid_arguments_raise(self):
+        """Verify rate and burst are validated."""
+        with pytest.raises(ValueError, match="rate must be positive"):
+            TokenBucketRateLimiter(rate=0)
+        with pytest.raises(ValueError, match="burst must be at least 1"):
+            TokenBucketRateLimiter(rate=10, burst=0)
+
+    def test_session_uses_token_bucket_by_default(self, session):
+        """The default limiter should run at the session's rate_limit."""
+        assert isinstance(session.rate_limiter, TokenBucketRateLimiter)
+        assert session.rate_limiter.rate == MAX_REQUESTS_PER_SECOND
 
     def test_rate_limit_value(self):
         """Verify MAX_REQUESTS_PER_SECOND is 10 per SEC policy."""
         assert MAX_REQUESTS_PER_SECOND == 10
 
 
+class TestSharedRateLimiter:
+    """Tests for sharing one limiter across threads, clients and processes."""
+
+    def test_threads_get_distinct_slots(self):
+        """Concurrent reservations must never hand out the same slot."""
+        with patch("edgar.rate_limiter.time.monotonic", return_value=100.0):
+            limiter = TokenBucketRateLimiter(rate=MAX_REQUESTS_PER_SECOND)
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                waits = sorted(pool.map(lambda _: limiter.reserve(), range(100)))
+        assert waits == pytest.approx([i / MAX_REQUESTS_PER_SECOND for i in range(100)])
+
+    def test_clients_share_custom_limiter(self):
+        """Clients built with the same limiter should share it."""
+        from edgar.client import EdgarClient
+        limiter = TokenBucketRateLimiter(rate=MAX_REQUESTS_PER_SECOND)
+        first = EdgarClient(user_agent="Test test@example.com", rate_limiter=limiter)
+        second = EdgarClient(user_agent="Test test@example.com", rate_limiter=limiter)
+        assert first.edgar_session.rate_limiter is limiter
+        assert second.edgar_session.rate_limiter is limiter
+
+    def test_file_limiter_shares_budget_between_instances(self, tmp_path):
+        """Separate FileRateLimiters on one path draw from one bucket."""
+        path = str(tmp_path / "edgar.ratelimit")
+        first = FileRateLimiter(path, rate=MAX_REQUESTS_PER_SECOND)
+        second = FileRateLimiter(path, rate=MAX_REQUESTS_PER_SECOND)
+        with patch("edgar.rate_limiter.time.time", return_value=1000.0):
+            waits = [limiter.reserve() for limiter in (first, second, first, second)]
+        first.close()
+        second.close()
+        assert waits == pytest.approx([0.0, 0.1, 0.2, 0.3])
+
+    def test_file_limiter_is_thread_safe(self, tmp_path):
+        """Threads sharing one FileRateLimiter get distinct slots."""
+        limiter = FileRateLimiter(str(tmp_path / "edgar.ratelimit"), rate=MAX_REQUESTS_PER_SECOND)
+        with patch("edgar.rate_limiter.time.time", return_value=1000.0):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                waits = sorted(pool.map(lambda _: limiter.reserve(), range(40)))
+        limiter.close()
+        assert waits == pytest.approx([i / MAX_REQUESTS_PER_SECOND for i in range(40)])
+
+    def test_pause_holds_back_every_reservation(self):
+        """pause() pushes the next slot out and later ones queue behind it."""
+        with patch("edgar.rate_limiter.time.monotonic", return_value=100.0):
+            limiter = TokenBucketRateLimiter(rate=MAX_REQUESTS_PER_SECOND)
+            limiter.pause(2.0)
+            waits = [limiter.reserve() for _ in range(2)]
+        assert waits == pytest.approx([2.1, 2.2])
+
+    def test_pause_never_shortens_a_queue(self):
+        """A short pause must not hand back slots already reserved."""
+        with patch("edgar.rate_limiter.time.monotonic", return_value=100.0):
+            limiter = TokenBucketRateLimiter(rate=MAX_REQUESTS_PER_SECOND)
+            for _ in range(30):
+                limiter.reserve()
+            limiter.pause(1.0)
+            assert limiter.reserve() == pytest.approx(3.0)
+
+    def test_file_limiter_pause_is_shared(self, tmp_path):
+        """A pause through one FileRateLimiter delays the others on the path."""
+        path = str(tmp_path / "edgar.ratelimit")
+        first = FileRateLimiter(path, rate=MAX_REQUESTS_PER_SECOND)
+        second = FileRateLimiter(path, rate=MAX_REQUESTS_PER_SECOND)
+        with patch("edgar.rate_limiter.time.time", return_value=1000.0):
+            first.pause(5.0)
+            wait = second.reserve()
+        first.close()
+        second.close()
+        assert wait == pytest.approx(5.1)
+
+    @pytest.mark.asyncio
+    async def test_file_limiter_locks_off_the_event_loop(self, tmp_path):
+        """Async reservations take the file lock in a worker thread, not on the loop."""
+        limiter = FileRateLimiter(str(tmp_path / "edgar.ratelimit"), rate=MAX_REQUESTS_PER_SECOND)
+        threads = []
+        lock_file = limiter._lock_file
+        limiter._lock_file = lambda: (threads.append(threading.get_ident()), lock_file())
+
+        await limiter.reserve_async()
+        await limiter.pause_async(1.0)
+        limiter.close()
+        assert len(threads) == 2
+        assert threading.get_ident() not in threads
+
+    def test_acquire_sleeps_for_reservation(self):
+        """acquire() should sleep for whatever reserve() hands out."""
+
+        class FixedLimiter(RateLimiter):
+            """Limiter that always asks for the same wait."""
+
+            def reserve(self) -> float:
+                return 0.25
+
+        with patch("edgar.rate_limiter.time.sleep") as mock_sleep:
+            assert FixedLimiter().acquire() == 0.25
+        mock_sleep.assert_called_once_with(0.25)
+
+
 class TestThrottleIntegration:
     """Tests that _throttle is called from all request paths."""
 
@@ -0,0 +1,254 @@
+"""Tests for the retry policy and its use in both sessions."""
+
+# pylint: disable=redefined-outer-name
+# pylint: disable=protected-access
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import requests
+
+from edgar.client import EdgarClient
+from edgar.exceptions import EdgarRequestError
+from edgar.retry import RETRYABLE_STATUSES, RetryAttempts, RetryPolicy, parse_retry_after
+
+
+def _mock_response(status_code=200, headers=None):
+    """Build a mock requests/httpx response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.ok = status_code < 400
+    response.content = b'{"ok": true}'
+    response.headers = {"Content-Type": "application/json", "content-type": "application/json", **(headers or {})}
+    response.json.return_value = {"ok": True}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(str(status_code))
+    return response
+
+
+@pytest.fixture
+def session():
+    """Return an EdgarSession with a mocked rate limiter."""
+    edgar_client = EdgarClient(user_agent="Test test@example.com", cache=False)
+    edgar_client.edgar_session.rate_limiter = MagicMock()
+    edgar_client.edgar_session.rate_limiter.reserve.return_value = 0.0
+    return edgar_client.edgar_session
+
+
+# ---------------------------------------------------------------------------
+# RetryPolicy
+# ---------------------------------------------------------------------------
+
+
+class TestParseRetryAfter:
+    """Tests for parsing Retry-After headers."""
+
+    def test_delay_seconds(self):
+        """Verify delay-seconds values are returned as floats."""
+        assert parse_retry_after("7") == 7.0
+
+    def test_http_date(self):
+        """Verify HTTP-dates are converted to seconds from now."""
+        now = 1445412480.0  # Wed, 21 Oct 2015 07:28:00 GMT
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:30 GMT", now=now) == pytest.approx(30.0)
+        assert parse_retry_after("Wed, 21 Oct 2015 07:27:00 GMT", now=now) == 0.0
+
+    @pytest.mark.parametrize("value", [None, "", "soon", "-5"])
+    def test_unparseable(self, value):
+        """Verify missing or invalid headers are ignored."""
+        assert parse_retry_after(value) is None
+
+
+class TestRetryPolicy:
+    """Tests for retry decisions and backoff delays."""
+
+    def test_retryable_statuses(self):
+        """Verify throttling and 5xx errors are retried but 4xx errors are not."""
+        policy = RetryPolicy()
+        assert all(policy.is_retryable(status) for status in RETRYABLE_STATUSES)
+        assert not policy.is_retryable(404)
+        assert not policy.is_retryable(403)
+
+    def test_backoff_is_jittered_and_capped(self):
+        """Verify delays fall between half and all of the capped exponential."""
+        policy = RetryPolicy(backoff_base=1.0, backoff_cap=4.0)
+        for attempt, ceiling in [(1, 1.0), (2, 2.0), (3, 4.0), (10, 4.0)]:
+            delays = [policy.backoff(attempt) for _ in range(50)]
+            assert all(ceiling / 2 <= delay <= ceiling for delay in delays)
+
+    def test_retry_after_raises_the_delay(self):
+        """Verify Retry-After is honored when it asks for longer than the backoff."""
+        policy = RetryPolicy(backoff_base=0.5)
+        assert policy.next_delay(1, elapsed=0.0, retry_after="3") == 3.0
+
+    def test_gives_up_after_max_retries(self):
+        """Verify no delay is returned past max_retries."""
+        policy = RetryPolicy(max_retries=2)
+        assert policy.next_delay(2, elapsed=0.0) is not None
+        assert policy.next_delay(3, elapsed=0.0) is None
+
+    def test_gives_up_at_deadline(self):
+        """Verify a retry that would start after the deadline is not made."""
+        policy = RetryPolicy(deadline=10.0)
+        assert policy.next_delay(1, elapsed=9.9, retry_after="1") is None
+        assert policy.next_delay(1, elapsed=0.0, retry_after="120") is None
+
+    def test_invalid_arguments_raise(self):
+        """Verify nonsensical policies are rejected."""
+        with pytest.raises(ValueError):
+            RetryPolicy(max_retries=-1)
+        with pytest.raises(ValueError):
+            RetryPolicy(backoff_base=2.0, backoff_cap=1.0)
+        with pytest.raises(ValueError):
+            RetryPolicy(deadline=0)
+
+
+class TestRetryAttempts:
+    """Tests for classifying the attempts of one request."""
+
+    def test_final_response_ends_the_request(self):
+        """Verify a success or a non-retryable status is returned as is."""
+        hooks = MagicMock()
+        attempts = RetryAttempts(RetryPolicy(), hooks, "get", "/test")
+        assert attempts.next_delay(_mock_response(404), None, started=0.0) is None
+        assert attempts.attempt == 0
+        assert [c.args[0] for c in hooks.notify.call_args_list] == ["on_request_start", "on_response"]
+
+    def test_retryable_status_gets_a_delay(self):
+        """Verify a retryable status is reported and given a backoff delay."""
+        hooks = MagicMock()
+        attempts = RetryAttempts(RetryPolicy(), hooks, "get", "/test")
+        delay = attempts.next_delay(_mock_response(429, headers={"Retry-After": "2"}), None, started=0.0)
+        assert delay == 2.0
+        assert attempts.attempt == 1
+        assert hooks.notify.call_args.args[0] == "on_retry"
+
+    def test_gives_up_on_transport_error(self):
+        """Verify the transport error is raised once the policy gives up."""
+        attempts = RetryAttempts(RetryPolicy(max_retries=0), MagicMock(), "get", "/test")
+        with pytest.raises(requests.ConnectionError):
+            attempts.next_delay(None, requests.ConnectionError("reset"), started=0.0)
+
+
+# ---------------------------------------------------------------------------
+# EdgarSession
+# ---------------------------------------------------------------------------
+
+
+class TestSessionRetries:
+    """Tests for retries in EdgarSession request paths."""
+
+    def test_adapter_does_not_retry(self, session):
+        """Verify urllib3 retries are disabled so requests are never retried twice."""
+        adapter = session.http_session.get_adapter("https://www.sec.gov")
+        assert adapter.max_retries.total == 0
+
+    def test_not_found_is_not_retried(self, session):
+        """Verify a 404 fails immediately."""
+        session.http_session.request = MagicMock(return_value=_mock_response(404))
+        with patch("edgar.session.time.sleep") as mock_sleep, pytest.raises(EdgarRequestError, match="404"):
+            session.make_request("get", "/missing")
+        session.http_session.request.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_server_error_is_retried(self, session):
+        """Verify a 503 is retried with a short backoff, throttling each attempt."""
+        session.http_session.request = MagicMock(side_effect=[_mock_response(503), _mock_response()])
+        with patch("edgar.session.time.sleep") as mock_sleep:
+            assert session.make_request("get", "/test") == {"ok": True}
+        assert session.http_session.request.call_count == 2
+        assert session.rate_limiter.reserve.call_count == 2
+        assert mock_sleep.call_args[0][0] <= session.retry_policy.backoff_base
+
+    def test_too_many_requests_pauses_limiter(self, session):
+        """Verify a 429 honors Retry-After and pauses the shared limiter."""
+        session.http_session.request = MagicMock(
+            side_effect=[_mock_response(429, headers={"Retry-After": "2"}), _mock_response()]
+        )
+        with patch("edgar.session.time.sleep") as mock_sleep:
+            session.make_request("get", "/test")
+        mock_sleep.assert_called_once_with(2.0)
+        session.rate_limiter.pause.assert_called_once_with(2.0)
+
+    def test_gives_up_with_last_status(self, session):
+        """Verify the last response's status is reported once retries run out."""
+        session.retry_policy = RetryPolicy(max_retries=2)
+        session.http_session.request = MagicMock(return_value=_mock_response(502))
+        with patch("edgar.session.time.sleep"), pytest.raises(EdgarRequestError, match="502"):
+            session.make_request("get", "/test")
+        assert session.http_session.request.call_count == 3
+
+    def test_connection_errors_are_retried(self, session):
+        """Verify transient connection errors are retried on every request path."""
+        session.http_session.get = MagicMock(
+            side_effect=[requests.ConnectionError("reset"), _mock_response()]
+        )
+        with patch("edgar.session.time.sleep"):
+            assert session.fetch_page("https://www.sec.gov/page") == b'{"ok": true}'
+        assert session.http_session.get.call_count == 2
+
+    def test_retries_disabled(self, session):
+        """Verify max_retries=0 sends each request once."""
+        session.retry_policy = RetryPolicy(max_retries=0)
+        session.http_session.get = MagicMock(return_value=_mock_response(503))
+        assert session.fetch_page("https://www.sec.gov/page") is None
+        session.http_session.get.assert_called_once()
+
+    def test_client_passes_policy(self):
+        """Verify EdgarClient hands its retry_policy to the session."""
+        policy = RetryPolicy(max_retries=1)
+        edgar_client = EdgarClient(user_agent="Test test@example.com", retry_policy=policy)
+        assert edgar_client.edgar_session.retry_policy is policy
+
+
+# ---------------------------------------------------------------------------
+# EdgarAsyncSession
+# ---------------------------------------------------------------------------
+
+
+class TestAsyncSessionRetries:
+    """Tests for retries in EdgarAsyncSession."""
+
+    @pytest.fixture
+    def async_session(self):
+        """Return an EdgarAsyncSession with throttling disabled."""
+        pytest.importorskip("httpx")
+        from edgar.async_client import EdgarAsyncClient  # pylint: disable=import-outside-toplevel
+
+        async_session = EdgarAsyncClient(user_agent="Test test@example.com").edgar_session
+        async_session._throttle = AsyncMock()
+        async_session.rate_limiter = MagicMock()
+        async_session.rate_limiter.pause_async = AsyncMock()
+        return async_session
+
+    @pytest.mark.asyncio
+    async def test_transport_error_then_success(self, async_session):
+        """Verify httpx transport errors are retried."""
+        import httpx  # pylint: disable=import-outside-toplevel
+
+        async_session.http_client.get = AsyncMock(
+            side_effect=[httpx.ConnectError("refused"), _mock_response()]
+        )
+        with patch("edgar.async_session.asyncio.sleep", new=AsyncMock()):
+            assert await async_session.fetch_page("https://www.sec.gov/page") == b'{"ok": true}'
+        assert async_session.http_client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_too_many_requests_pauses_limiter(self, async_session):
+        """Verify a 429 pauses the limiter for the Retry-After delay."""
+        async_session.http_client.request = AsyncMock(
+            side_effect=[_mock_response(429, headers={"Retry-After": "3"}), _mock_response()]
+        )
+        with patch("edgar.async_session.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            assert await async_session.make_request("get", "/test") == {"ok": True}
+        mock_sleep.assert_awaited_once_with(3.0)
+        async_session.rate_limiter.pause_async.assert_awaited_once_with(3.0)
+
+    @pytest.mark.asyncio
+    async def test_not_found_is_not_retried(self, async_session):
+        """Verify a 404 fails immediately."""
+        async_session.http_client.request = AsyncMock(return_value=_mock_response(404))
+        with pytest.raises(EdgarRequestError, match="404"):
+            await async_session.make_request("get", "/missing")
+        async_session.http_client.request.assert_awaited_once()
+        await async_session.close()
@@ -8,8 +8,16 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from edgar.exceptions import EdgarRequestError
 from edgar.models import SearchResult
-from edgar.search import Search, EFTS_BASE_URL
+from edgar.search import (
+    EFTS_BASE_URL,
+    EFTS_MAX_RESULTS,
+    EFTS_PAGE_SIZE,
+    Search,
+    plan_offsets,
+    split_date_range,
+)
 from edgar.client import EdgarClient
 
 
@@ -430,6 +438,137 @@ class TestClientSearch:
         assert service1 is service2
 
 
+def _page(offset, total, relation="eq", count=EFTS_PAGE_SIZE, prefix="doc"):
+    """Build an EFTS response with *count* hits numbered from *offset*."""
+    hits = [
+        {"_id": f"0000000000-24-{i:06d}:{prefix}{i}.htm", "_source": {"adsh": f"0000000000-24-{i:06d}"}}
+        for i in range(offset, min(offset + count, total))
+    ]
+    return {"hits": {"total": {"value": total, "relation": relation}, "hits": hits}}
+
+
+def _paged_session(total):
+    """Return a mock session serving *total* hits in pages of EFTS_PAGE_SIZE."""
+    session = MagicMock()
+    session.make_request.side_effect = lambda **kwargs: _page(kwargs["params"]["from"], total)
+    return session
+
+
+class TestIterSearch:
+    """Tests for Search.iter_search() pagination, de-duplication and date splitting."""
+
+    def test_plan_offsets(self):
+        """Verify page offsets stop at the total and at the EFTS result window."""
+        assert list(plan_offsets(250)) == [100, 200]
+        assert not list(plan_offsets(100))
+        assert plan_offsets(50_000)[-1] == EFTS_MAX_RESULTS - EFTS_PAGE_SIZE
+
+    def test_split_date_range(self):
+        """Verify ranges split into adjacent halves and single days don't split."""
+        assert split_date_range("2024-01-01", "2024-01-10") == [
+            ("2024-01-01", "2024-01-05"), ("2024-01-06", "2024-01-10"),
+        ]
+        assert split_date_range("2024-01-01", "2024-01-02") == [
+            ("2024-01-01", "2024-01-01"), ("2024-01-02", "2024-01-02"),
+        ]
+        assert split_date_range("2024-01-01", "2024-01-01") is None
+        assert split_date_range(None, "2001-01-03")[0][0] == "2001-01-01"
+
+    def test_streams_every_page_in_order(self):
+        """Verify all pages are fetched and hits come back in page order."""
+        session = _paged_session(total=250)
+        results = list(Search(session=session).iter_search(q="climate risk", max_workers=3))
+
+        assert len(results) == 250
+        assert all(isinstance(r, SearchResult) for r in results)
+        assert [r.accession_number for r in results] == [f"0000000000-24-{i:06d}" for i in range(250)]
+        offsets = sorted(c.kwargs["params"]["from"] for c in session.make_request.call_args_list)
+        assert offsets == [0, 100, 200]
+
+    def test_deduplicates_by_id(self):
+        """Verify a hit repeated on a later page is yielded once."""
+        session = MagicMock()
+        first, second = _page(0, 150), _page(100, 150)
+        second["hits"]["hits"].append(first["hits"]["hits"][0])
+        session.make_request.side_effect = lambda **kwargs: second if kwargs["params"]["from"] else first
+
+        results = list(Search(session=session).iter_search(q="test"))
+        assert len(results) == 150
+        assert len({r.raw["_id"] for r in results}) == 150
+
+    def test_splits_ranges_over_the_result_window(self):
+        """Verify a range matching too many hits is searched as two halves."""
+        def make_request(**kwargs):
+            params = kwargs["params"]
+            if (params["startdt"], params["enddt"]) == ("2024-01-01", "2024-01-10"):
+                return _page(params["from"], EFTS_MAX_RESULTS, relation="gte")
+            return _page(params["from"], 3, prefix=params["startdt"])
+
+        session = MagicMock()
+        session.make_request.side_effect = make_request
+        results = list(Search(session=session).iter_search(
+            q="test", start_date="2024-01-01", end_date="2024-01-10"
+        ))
+
+        assert [r.raw["_id"].split(":")[1] for r in results] == [
+            "2024-01-010.htm", "2024-01-011.htm", "2024-01-012.htm",
+            "2024-01-060.htm", "2024-01-061.htm", "2024-01-062.htm",
+        ]
+        ranges = [
+            (c.kwargs["params"]["startdt"], c.kwargs["params"]["enddt"])
+            for c in session.make_request.call_args_list
+        ]
+        assert ranges == [
+            ("2024-01-01", "2024-01-10"), ("2024-01-01", "2024-01-05"), ("2024-01-06", "2024-01-10"),
+        ]
+
+    def test_single_day_over_window_is_truncated(self, caplog):
+        """Verify a single day over the window returns the pages EFTS allows and warns."""
+        session = MagicMock()
+        session.make_request.side_effect = lambda **kwargs: _page(
+            kwargs["params"]["from"], EFTS_MAX_RESULTS, relation="gte"
+        )
+
+        results = list(Search(session=session).iter_search(
+            q="test", start_date="2024-01-02", end_date="2024-01-02"
+        ))
+        assert len(results) == EFTS_MAX_RESULTS
+        assert session.make_request.call_count == EFTS_MAX_RESULTS // EFTS_PAGE_SIZE
+        assert "only the first" in caplog.text
+
+    def test_failed_page_raises(self):
+        """Verify a missing page raises instead of silently dropping hits."""
+        session = MagicMock()
+        session.make_request.side_effect = lambda **kwargs: None if kwargs["params"]["from"] else _page(0, 300)
+
+        with pytest.raises(EdgarRequestError, match="offset 100"):
+            list(Search(session=session).iter_search(q="test"))
+
+    def test_failed_first_page_raises(self):
+        """Verify a missing first page raises instead of yielding nothing."""
+        session = MagicMock()
+        session.make_request.return_value = None
+
+        with pytest.raises(EdgarRequestError, match="offset 0"):
+            list(Search(session=session).iter_search(q="test"))
+        session.make_request.assert_called_once()
+
+    def test_rejects_bad_max_workers(self):
+        """Verify max_workers is validated when the iterator is created."""
+        with pytest.raises(ValueError, match="max_workers"):
+            Search(session=MagicMock()).iter_search(q="test", max_workers=0)
+
+    def test_client_iter_search(self):
+        """Verify EdgarClient.iter_search() streams through the Search service."""
+        client = EdgarClient.__new__(EdgarClient)
+        client.edgar_session = _paged_session(total=120)
+        client._services = {}
+
+        results = list(client.iter_search(q="test", form_types=["10-K"]))
+        assert len(results) == 120
+        assert client.edgar_session.make_request.call_args.kwargs["params"]["forms"] == "10-K"
+
+
 # ---------------------------------------------------------------------------
 # Session build_url base_url tests
 # ---------------------------------------------------------------------------
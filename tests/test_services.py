@@ -2,7 +2,7 @@
 
 import copy
 import json
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 import requests as req
@@ -101,11 +101,14 @@ class TestSession:
         edgar_client.edgar_session.http_session.request = MagicMock(
             side_effect=req.ConnectionError("Connection refused")
         )
-        with pytest.raises(EdgarRequestError, match="Connection refused"):
+        with patch("edgar.session.time.sleep"), \
+                pytest.raises(EdgarRequestError, match="Connection refused"):
             edgar_client.edgar_session.make_request(
                 method="get",
                 endpoint="/cgi-bin/browse-edgar",
             )
+        # Connection errors are retried before giving up.
+        assert edgar_client.edgar_session.http_session.request.call_count > 1
 
     def test_user_agent_set_on_session(self, edgar_session):
         """The session should have the user-agent header set."""
@@ -163,6 +166,26 @@ class TestCompaniesService:
         result = companies.get_company_by_cik(cik="1326801")
         assert isinstance(result, list)
 
+    def test_iter_query_streams_and_sends_start(self, edgar_client):
+        """iter_query should stream entries and request the resume offset."""
+        _patch_session_request(
+            edgar_client,
+            _mock_response(
+                content_type="application/atom+xml",
+                text=SAMPLE_ATOM_FEED,
+            ),
+        )
+        stream = edgar_client.companies().iter_query(state="TX", start=200)
+        assert len(list(stream)) == 2
+        assert stream.offset == 202
+        params = edgar_client.edgar_session.http_session.request.call_args.kwargs["params"]
+        assert params["start"] == 200
+
+    def test_iter_query_requires_a_filter(self, edgar_client):
+        """iter_query without filters should raise ValueError."""
+        with pytest.raises(ValueError):
+            edgar_client.companies().iter_query()
+
 
 # ---------------------------------------------------------------------------
 # Submissions service tests
@@ -282,6 +305,20 @@ class TestArchivesService:
 class TestFilingsService:
     """Tests for the Filings service with mocked HTTP."""
 
+    def test_iter_query_matches_query(self, edgar_client):
+        """iter_query should yield the same entries as query."""
+        _patch_session_request(
+            edgar_client,
+            _mock_response(
+                content_type="application/atom+xml",
+                text=SAMPLE_ATOM_FEED,
+            ),
+        )
+        filings = edgar_client.filings()
+        eager = filings.query(cik="1326801", filing_type=FilingTypeCodes.FILING_10K)
+        streamed = list(filings.iter_query(cik="1326801", filing_type=FilingTypeCodes.FILING_10K))
+        assert streamed == eager
+
     def test_get_filings_by_cik(self, edgar_client):
         """get_filings_by_cik should parse XML entries."""
         _patch_session_request(
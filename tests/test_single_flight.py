@@ -0,0 +1,218 @@
+"""Tests for in-flight request coalescing."""
+
+# pylint: disable=protected-access
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from edgar.async_client import EdgarAsyncClient
+from edgar.client import EdgarClient
+from edgar.instrumentation import MetricsCollector
+from edgar.single_flight import AsyncSingleFlight, SingleFlight
+
+SAMPLE_TICKERS_JSON = {"0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."}}
+
+CALLERS = 8
+
+
+def _mock_response(payload):
+    """Build a mock JSON response returning *payload*."""
+    response = MagicMock()
+    response.status_code = 200
+    response.ok = True
+    response.headers = {"Content-Type": "application/json", "content-type": "application/json"}
+    response.content = b"{}"
+    response.json.return_value = payload
+    return response
+
+
+class TestSingleFlight:
+    """Tests for the thread-based ``SingleFlight``."""
+
+    def test_concurrent_calls_share_one_run(self):
+        """Verify callers arriving while a call runs wait for it instead of running their own."""
+        flights = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(timeout=5)
+            return {"name": "Apple Inc."}
+
+        with ThreadPoolExecutor(max_workers=CALLERS) as pool:
+            futures = [pool.submit(flights.do, "CIK0000320193", fetch) for _ in range(CALLERS)]
+            threading.Event().wait(0.1)
+            release.set()
+            results = [future.result(timeout=5) for future in futures]
+
+        assert len(calls) == 1
+        assert all(value == {"name": "Apple Inc."} for value, _ in results)
+        assert [shared for _, shared in results].count(False) == 1
+        assert len(flights) == 0
+
+    def test_followers_get_leader_exception(self):
+        """Verify an exception raised by the call reaches every waiting caller."""
+        flights = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+
+        def fetch():
+            started.set()
+            release.wait(timeout=5)
+            raise ConnectionError("offline")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(flights.do, "key", fetch)
+            started.wait(timeout=5)
+            follower = pool.submit(flights.do, "key", MagicMock())
+            while not follower.running():
+                threading.Event().wait(0.01)
+            release.set()
+            for future in (leader, follower):
+                with pytest.raises(ConnectionError, match="offline"):
+                    future.result(timeout=5)
+
+    def test_finished_calls_are_not_reused(self):
+        """Verify a call after the previous one finished runs again."""
+        flights = SingleFlight()
+        fetch = MagicMock(side_effect=[1, 2])
+        assert flights.do("key", fetch) == (1, False)
+        assert flights.do("key", fetch) == (2, False)
+        assert flights.do("other", lambda: 3) == (3, False)
+
+
+class TestAsyncSingleFlight:
+    """Tests for ``AsyncSingleFlight``."""
+
+    @pytest.mark.asyncio
+    async def test_gathered_calls_share_one_run(self):
+        """Verify concurrent tasks await one run of the coroutine."""
+        flights = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "body"
+
+        results = await asyncio.gather(*(flights.do("key", fetch) for _ in range(CALLERS)))
+        assert len(calls) == 1
+        assert [value for value, _ in results] == ["body"] * CALLERS
+        assert [shared for _, shared in results].count(False) == 1
+        assert len(flights) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_leaves_others_running(self):
+        """Verify cancelling the leading caller doesn't cancel the shared call."""
+        flights = AsyncSingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "body"
+
+        leader = asyncio.create_task(flights.do("key", fetch))
+        follower = asyncio.create_task(flights.do("key", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        release.set()
+
+        assert await follower == ("body", True)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+
+class TestSessionCoalescing:
+    """Tests for sessions sending concurrent identical GETs once."""
+
+    def test_concurrent_gets_send_one_request(self):
+        """Verify threads requesting one URL together share a single HTTP request."""
+        edgar_client = EdgarClient(user_agent="Test test@example.com", cache=False)
+        session = edgar_client.edgar_session
+        metrics = MetricsCollector()
+        session.hooks.subscribe(metrics)
+        release = threading.Event()
+
+        def request(*_, **__):
+            release.wait(timeout=5)
+            return _mock_response({"name": "Apple Inc."})
+
+        session.http_session.request = MagicMock(side_effect=request)
+
+        with ThreadPoolExecutor(max_workers=CALLERS) as pool:
+            futures = [
+                pool.submit(session.make_request, "get", "/submissions/CIK0000320193.json")
+                for _ in range(CALLERS)
+            ]
+            threading.Event().wait(0.1)
+            release.set()
+            results = [future.result(timeout=5) for future in futures]
+
+        assert results == [{"name": "Apple Inc."}] * CALLERS
+        assert len({id(result) for result in results}) == CALLERS
+        session.http_session.request.assert_called_once()
+        assert metrics.snapshot().cache_hits == {"coalesced": CALLERS - 1}
+
+    def test_posts_are_not_coalesced(self):
+        """Verify non-GET requests are always sent."""
+        session = EdgarClient(user_agent="Test test@example.com", cache=False).edgar_session
+        session.http_session.request = MagicMock(return_value=_mock_response({}))
+        session._request = MagicMock(wraps=session._request)
+        session.in_flight = MagicMock()
+
+        session.make_request("post", "/LATEST/search-index", json_payload={"q": "10-K"})
+        session.in_flight.do.assert_not_called()
+        session._request.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_gets_send_one_request(self):
+        """Verify gathered async GETs for one URL share a single HTTP request."""
+        async with EdgarAsyncClient(user_agent="Test test@example.com") as client:
+            session = client.edgar_session
+            metrics = MetricsCollector()
+            session.hooks.subscribe(metrics)
+
+            async def request(*_, **__):
+                await asyncio.sleep(0.01)
+                return _mock_response({"name": "Apple Inc."})
+
+            session.http_client.request = AsyncMock(side_effect=request)
+            results = await asyncio.gather(
+                *(session.make_request("get", "/submissions/CIK0000320193.json") for _ in range(CALLERS))
+            )
+
+        assert results == [{"name": "Apple Inc."}] * CALLERS
+        assert len({id(result) for result in results}) == CALLERS
+        session.http_client.request.assert_called_once()
+        assert metrics.snapshot().cache_hits == {"coalesced": CALLERS - 1}
+
+    @pytest.mark.asyncio
+    async def test_async_ticker_stampede_loads_once(self):
+        """Verify concurrent first lookups on a fresh client load the tickers once."""
+        async with EdgarAsyncClient(user_agent="Test test@example.com") as client:
+            async def make_request(**_):
+                await asyncio.sleep(0.01)
+                return SAMPLE_TICKERS_JSON
+
+            client.edgar_session.make_request = AsyncMock(side_effect=make_request)
+            results = await asyncio.gather(*(client.resolve_ticker("AAPL") for _ in range(CALLERS)))
+
+        assert results == ["0000320193"] * CALLERS
+        client.edgar_session.make_request.assert_called_once()
+
+    def test_client_built_outside_a_loop(self):
+        """Verify a client made before the loop starts can load tickers in it."""
+        client = EdgarAsyncClient(user_agent="Test test@example.com")
+        client.edgar_session.make_request = AsyncMock(return_value=SAMPLE_TICKERS_JSON)
+
+        async def resolve():
+            try:
+                return await client.resolve_ticker("AAPL")
+            finally:
+                await client.close()
+
+        assert asyncio.run(resolve()) == "0000320193"
@@ -0,0 +1,206 @@
+"""Tests for the memory-mapped ticker snapshot."""
+
+# pylint: disable=redefined-outer-name
+
+import gc
+import os
+import time
+import weakref
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from edgar.async_client import EdgarAsyncClient
+from edgar.client import EdgarClient
+from edgar.instrumentation import MetricsCollector
+from edgar.snapshot import SNAPSHOT_FILENAME, TickerSnapshot, TickerTable, write_snapshot
+from edgar.tickers import Tickers
+
+SAMPLE_TICKERS_JSON = {
+    "0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."},
+    "1": {"cik_str": 789019, "ticker": "MSFT", "title": "MICROSOFT CORP"},
+    "2": {"cik_str": 1326801, "ticker": "META", "title": "Meta Platforms, Inc."},
+    "3": {"cik_str": 320193, "ticker": "AAPL34", "title": "Apple Inc."},
+    "4": {"cik_str": 1067983, "ticker": "BRK-B", "title": "BERKSHIRE HATHAWAY INC"},
+}
+ENTRIES = list(SAMPLE_TICKERS_JSON.values())
+
+
+@pytest.fixture
+def table(tmp_path):
+    """Return a TickerTable over ENTRIES."""
+    path = str(tmp_path / SNAPSHOT_FILENAME)
+    write_snapshot(path, ENTRIES)
+    mapped = TickerTable(path)
+    yield mapped
+    mapped.close()
+
+
+def _session(snapshot):
+    """Return a mock EdgarSession serving SAMPLE_TICKERS_JSON with *snapshot*."""
+    session = MagicMock()
+    session.cache = None
+    session.ticker_snapshot = snapshot
+    session.make_request.return_value = SAMPLE_TICKERS_JSON
+    return session
+
+
+class TestTickerTable:
+    """Tests for reading a snapshot file."""
+
+    def test_entries_round_trip(self, table):
+        """Verify entries read back in SEC's order."""
+        assert len(table) == len(ENTRIES)
+        assert list(table) == ENTRIES
+        assert table[-1] == ENTRIES[-1]
+        assert table[1:3] == ENTRIES[1:3]
+        with pytest.raises(IndexError):
+            _ = table[len(ENTRIES)]
+
+    def test_ticker_lookup(self, table):
+        """Verify tickers resolve by binary search, unknown ones are absent."""
+        assert table.ticker_to_cik["BRK-B"] == 1067983
+        assert table.ticker_to_cik["AAPL"] == 320193
+        assert table.ticker_to_cik.get("AAPL3") is None
+        assert "ZZZZ" not in table.ticker_to_cik
+        assert set(table.ticker_to_cik) == {entry["ticker"] for entry in ENTRIES}
+
+    def test_cik_lookup(self, table):
+        """Verify every entry of a CIK is returned in SEC's order."""
+        assert table.cik_to_entries[320193] == [ENTRIES[0], ENTRIES[3]]
+        assert table.cik_to_entries.get(1) is None
+        assert len(table.cik_to_entries) == 4
+
+    def test_rejects_other_files(self, tmp_path):
+        """Verify files that aren't snapshots are refused."""
+        path = tmp_path / SNAPSHOT_FILENAME
+        path.write_bytes(b"{}" * 20)
+        with pytest.raises(ValueError, match="not a version"):
+            TickerTable(str(path))
+
+
+class TestTickerSnapshot:
+    """Tests for loading, replacing and refreshing the snapshot file."""
+
+    def test_missing_or_corrupt_is_absent(self, tmp_path):
+        """Verify a missing or unreadable file loads as None."""
+        snapshot = TickerSnapshot(str(tmp_path))
+        assert snapshot.load() is None
+        with open(snapshot.path, "wb") as file:
+            file.write(b"garbage")
+        assert snapshot.load() is None
+
+    def test_load_remaps_after_replace(self, tmp_path):
+        """Verify the table is mapped once and remapped when another writer replaces the file."""
+        snapshot = TickerSnapshot(str(tmp_path))
+        snapshot.save(ENTRIES)
+        first = snapshot.load()
+        assert snapshot.load() is first
+
+        snapshot.save(ENTRIES[:2])
+        second = snapshot.load()
+        assert len(second) == 2
+        # Readers of the old mapping are unaffected.
+        assert first.ticker_to_cik["META"] == 1326801
+
+    def test_replaced_table_unmaps_with_last_reference(self, tmp_path):
+        """Verify a remapped-away table is released without waiting for the cyclic GC."""
+        snapshot = TickerSnapshot(str(tmp_path))
+        snapshot.save(ENTRIES)
+        first = snapshot.load()
+        buffer = weakref.ref(first._buffer)  # pylint: disable=protected-access
+        lookup = first.ticker_to_cik
+
+        gc.disable()
+        try:
+            snapshot.save(ENTRIES[:2])
+            snapshot.load()
+            del first
+            assert buffer() is not None
+            del lookup
+            assert buffer() is None
+        finally:
+            gc.enable()
+
+    def test_stale(self, tmp_path):
+        """Verify snapshots older than max_age are stale."""
+        snapshot = TickerSnapshot(str(tmp_path), max_age=60)
+        write_snapshot(snapshot.path, ENTRIES, created_at=time.time() - 120)
+        assert snapshot.stale(snapshot.load())
+        snapshot.save(ENTRIES)
+        assert not snapshot.stale(snapshot.load())
+
+    def test_failed_refresh_keeps_snapshot(self, tmp_path):
+        """Verify a refresh that raises leaves the old file in place."""
+        snapshot = TickerSnapshot(str(tmp_path))
+        snapshot.save(ENTRIES)
+        snapshot.refresh(MagicMock(side_effect=ConnectionError("offline")))
+        assert len(snapshot.load()) == len(ENTRIES)
+
+
+class TestTickersWarmStart:
+    """Tests for the Tickers service and clients reading the snapshot."""
+
+    def test_fetch_writes_snapshot_for_next_process(self, tmp_path):
+        """Verify the first load writes the snapshot and the next one skips the request."""
+        first = _session(TickerSnapshot(str(tmp_path)))
+        Tickers(session=first).resolve_ticker("MSFT")
+        first.make_request.assert_called_once()
+        assert os.path.exists(tmp_path / SNAPSHOT_FILENAME)
+
+        second = _session(TickerSnapshot(str(tmp_path)))
+        service = Tickers(session=second)
+        assert service.resolve_ticker("msft") == "0000789019"
+        assert service.resolve_cik("320193") == [ENTRIES[0], ENTRIES[3]]
+        assert service.search("berkshire")[0]["ticker"] == "BRK-B"
+        second.make_request.assert_not_called()
+        second.hooks.notify.assert_called_once()
+        assert second.hooks.notify.call_args.kwargs["cache"] == "snapshot"
+
+    def test_stale_snapshot_refreshes_in_background(self, tmp_path):
+        """Verify a stale snapshot is served at once and rewritten by a background fetch."""
+        snapshot = TickerSnapshot(str(tmp_path), max_age=60)
+        write_snapshot(snapshot.path, ENTRIES[:1], created_at=time.time() - 120)
+        session = _session(snapshot)
+        threads = []
+        start_refresh = snapshot.refresh_in_background
+        snapshot.refresh_in_background = lambda fetch: threads.append(start_refresh(fetch))
+
+        service = Tickers(session=session)
+        assert service.resolve_ticker("AAPL") == "0000320193"
+
+        threads[0].join(timeout=5)
+        session.make_request.assert_called_once()
+        refreshed = snapshot.load()
+        assert len(refreshed) == len(ENTRIES)
+        assert not snapshot.stale(refreshed)
+
+    def test_clients_share_cache_dir(self, tmp_path):
+        """Verify EdgarClient keeps the snapshot in cache_dir."""
+        edgar_client = EdgarClient(user_agent="Test test@example.com", cache_dir=str(tmp_path))
+        assert edgar_client.edgar_session.ticker_snapshot.path == str(tmp_path / SNAPSHOT_FILENAME)
+        assert EdgarClient(user_agent="Test test@example.com").edgar_session.ticker_snapshot is None
+
+    @pytest.mark.asyncio
+    async def test_async_client_reads_snapshot(self, tmp_path):
+        """Verify EdgarAsyncClient resolves from a snapshot written by another client."""
+        TickerSnapshot(str(tmp_path)).save(ENTRIES)
+        metrics = MetricsCollector()
+
+        async with EdgarAsyncClient(user_agent="Test test@example.com", cache_dir=str(tmp_path)) as client:
+            client.hooks.subscribe(metrics)
+            client.edgar_session.make_request = AsyncMock()
+            assert await client.resolve_ticker("META") == "0001326801"
+            assert await client.resolve_cik(789019) == [ENTRIES[1]]
+            client.edgar_session.make_request.assert_not_called()
+
+        assert metrics.snapshot().cache_hits == {"snapshot": 1}
+
+    @pytest.mark.asyncio
+    async def test_async_client_writes_snapshot(self, tmp_path):
+        """Verify EdgarAsyncClient saves what it fetched."""
+        async with EdgarAsyncClient(user_agent="Test test@example.com", cache_dir=str(tmp_path)) as client:
+            client.edgar_session.make_request = AsyncMock(return_value=SAMPLE_TICKERS_JSON)
+            await client.resolve_ticker("AAPL")
+
+        assert list(TickerSnapshot(str(tmp_path)).load()) == ENTRIES
@@ -6,7 +6,8 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from edgar.tickers import Tickers
+from edgar.cache import TTLCache
+from edgar.tickers import TickerIndex, Tickers
 from edgar.exceptions import EdgarRequestError
 
 
@@ -27,6 +28,7 @@ def mock_session():
     """Return a mock EdgarSession whose make_request returns sample tickers."""
     session = MagicMock()
     session.cache = None
+    session.ticker_snapshot = None
     session.make_request.return_value = SAMPLE_TICKERS_JSON
     return session
 
@@ -130,6 +132,47 @@ class TestSearch:
         assert results == []
 
 
+    def test_search_ranks_ticker_matches_first(self):
+        """Verify exact tickers, then ticker prefixes, then name matches are returned in that order."""
+        index = TickerIndex([
+            {"cik_str": 1, "ticker": "PINE", "title": "Pineapple Corp"},
+            {"cik_str": 2, "ticker": "APLE", "title": "Apple Hospitality REIT"},
+            {"cik_str": 3, "ticker": "APP", "title": "AppLovin Corp"},
+            {"cik_str": 4, "ticker": "APPF", "title": "AppFolio Inc"},
+        ])
+        assert [r["ticker"] for r in index.search("app")] == ["APP", "APPF", "APLE", "PINE"]
+
+    def test_search_limit(self, tickers_service):
+        """Verify limit caps the number of results."""
+        results = tickers_service.search("inc", limit=1)
+        assert [r["ticker"] for r in results] == ["AAPL"]
+
+    def test_search_short_query_matches_substrings(self, tickers_service):
+        """Verify one- and two-letter queries match anywhere, prefixes ranked first."""
+        assert [r["ticker"] for r in tickers_service.search("m")] == ["MSFT", "META"]
+        assert [r["ticker"] for r in tickers_service.search("pl")] == ["META", "AAPL", "AAPL34"]
+        index = TickerIndex([
+            {"cik_str": 1067983, "ticker": "BRK-A", "title": "BERKSHIRE HATHAWAY INC"},
+            {"cik_str": 1067983, "ticker": "BRK-B", "title": "BERKSHIRE HATHAWAY INC"},
+        ])
+        assert [r["ticker"] for r in index.search("-b")] == ["BRK-B"]
+
+    def test_search_keeps_surrounding_spaces(self, tickers_service):
+        """Verify the query isn't stripped, so spaces are part of the match."""
+        assert [r["ticker"] for r in tickers_service.search(" inc")] == ["AAPL", "META", "AAPL34"]
+        assert not tickers_service.search("inc ")
+
+    def test_search_fuzzy(self, tickers_service):
+        """Verify fuzzy search tolerates a typo."""
+        assert tickers_service.search("microsfot") == []
+        results = tickers_service.search("microsfot", fuzzy=True)
+        assert [r["ticker"] for r in results] == ["MSFT"]
+
+    def test_empty_query_returns_everything(self, tickers_service):
+        """Verify an empty query lists every entry in file order."""
+        assert len(tickers_service.search("")) == len(SAMPLE_TICKERS_JSON)
+
+
 # ---------------------------------------------------------------------------
 # caching tests
 # ---------------------------------------------------------------------------
@@ -151,8 +194,22 @@ class TestCaching:
         """Verify a None response from the API raises EdgarRequestError."""
         session = MagicMock()
         session.cache = None
+        session.ticker_snapshot = None
         session.make_request.return_value = None
         service = Tickers(session=session)
 
         with pytest.raises(EdgarRequestError):
             service.resolve_ticker("AAPL")
+
+    def test_search_index_built_once(self, mock_session):
+        """Verify the search index is cached with the ticker data and reused by other instances."""
+        mock_session.cache = TTLCache()
+        first = Tickers(session=mock_session)
+        first.search("Apple")
+        index = mock_session.cache.get("tickers:index")
+        assert isinstance(index, TickerIndex)
+
+        second = Tickers(session=mock_session)
+        assert second.search("MSFT")[0]["cik_str"] == 789019
+        assert second._search_index() is index  # pylint: disable=protected-access
+        mock_session.make_request.assert_called_once()
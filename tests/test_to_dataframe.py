@@ -280,6 +280,34 @@ class TestFactsToDataFrame:
             assert df.iloc[i]["value"] == fact.value
 
 
+    def test_matches_fact_list_export(self):
+        """Verify the columnar export equals to_dataframe(list[Fact])."""
+        facts_obj = Facts(raw=SAMPLE_COMPANY_FACTS)
+        expected = to_dataframe(facts_obj.get("us-gaap", "Revenue"))
+        df = facts_obj.to_dataframe("us-gaap", "Revenue")
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_taxonomy_panel(self):
+        """Verify omitting concept exports every concept with key columns."""
+        facts_obj = Facts(raw=SAMPLE_COMPANY_FACTS)
+        df = facts_obj.to_dataframe("us-gaap")
+        assert list(df.columns[:3]) == ["taxonomy", "concept", "unit"]
+        assert set(df["concept"]) == {"Revenue"}
+        assert len(df) == 2
+
+    def test_full_panel_with_unit_filter(self):
+        """Verify a full panel can be filtered by unit."""
+        facts_obj = Facts(raw=SAMPLE_COMPANY_FACTS)
+        assert len(facts_obj.to_dataframe(unit="USD")) == 2
+        assert len(facts_obj.to_dataframe(unit="EUR")) == 0
+
+    def test_concept_without_taxonomy_raises(self):
+        """Verify concept requires a taxonomy."""
+        facts_obj = Facts(raw=SAMPLE_COMPANY_FACTS)
+        with pytest.raises(ValueError, match="taxonomy is required"):
+            facts_obj.to_dataframe(concept="Revenue")
+
+
 # ---------------------------------------------------------------------------
 # Graceful error when pandas is missing
 # ---------------------------------------------------------------------------
@@ -0,0 +1,139 @@
+"""Tests for the local Parquet warehouse of DERA datasets."""
+
+# pylint: disable=redefined-outer-name
+
+import os
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from edgar.client import EdgarClient
+from tests.test_datasets import _build_zip_bytes, _stream_zip
+
+pa = pytest.importorskip("pyarrow", reason="pyarrow required")
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Return an EdgarClient with a warehouse and a mocked download."""
+    edgar_client = EdgarClient(
+        user_agent="Test test@example.com", warehouse_dir=str(tmp_path / "warehouse"),
+    )
+    edgar_client.edgar_session.stream_to_file = _stream_zip()
+    return edgar_client
+
+
+@pytest.fixture
+def warehouse(client):
+    """Return the client's DatasetWarehouse."""
+    return client.datasets().warehouse
+
+
+class TestDatasetWarehouse:
+    """Tests for DatasetWarehouse ingestion and reads."""
+
+    def test_ingest_writes_partitions(self, warehouse):
+        """Verify each table lands in its own quarter partition."""
+        assert warehouse.ingest(2023, 4)
+        for table in ("sub", "num", "tag", "pre"):
+            path = os.path.join(warehouse.path, table, "quarter=2023q4", "part-0.parquet")
+            assert os.path.exists(path)
+        assert warehouse.quarters() == ["2023q4"]
+        assert warehouse.has_quarter(2023, 4)
+
+    def test_ingest_downloads_once(self, client, warehouse):
+        """Verify an ingested quarter is not downloaded again."""
+        warehouse.ingest(2023, 4)
+        warehouse.ingest(2023, 4)
+        warehouse.read("num", quarters=[(2023, 4)])
+        assert client.edgar_session.stream_to_file.call_count == 1
+
+    def test_overwrite_reingests(self, client, warehouse):
+        """Verify overwrite=True downloads the quarter again."""
+        warehouse.ingest(2023, 4)
+        warehouse.ingest(2023, 4, overwrite=True)
+        assert client.edgar_session.stream_to_file.call_count == 2
+
+    def test_missing_quarter_returns_false(self, client, warehouse):
+        """Verify a quarter SEC doesn't publish is reported, not written."""
+        client.edgar_session.stream_to_file = MagicMock(return_value=False)
+        assert not warehouse.ingest(2009, 1)
+        assert warehouse.quarters() == []
+
+    def test_typed_columns(self, warehouse):
+        """Verify columns keep the DERA_SCHEMAS types."""
+        num = warehouse.read("num", quarters=[(2023, 4)], ingest=True)
+        assert num.schema.field("value").type == pa.decimal128(28, 4)
+        assert num.schema.field("ddate").type == pa.date32()
+        assert num.schema.field("qtrs").type == pa.int64()
+        row = num.to_pylist()[0]
+        assert row["value"] == Decimal("383285000000")
+        assert row["ddate"] == date(2023, 9, 30)
+        assert row["coreg"] is None
+
+        tag = warehouse.read("tag", quarters=[(2023, 4)])
+        assert tag.column("custom").to_pylist() == [False]
+
+    def test_columns_where_and_partition(self, warehouse):
+        """Verify projection, filters and the quarter partition column."""
+        table = warehouse.read(
+            "sub",
+            quarters=[(2023, 4)],
+            columns=["name", "quarter"],
+            where={"cik": {789019}},
+            ingest=True,
+        )
+        assert table.to_pylist() == [{"name": "Microsoft Corp", "quarter": "2023q4"}]
+
+    def test_reads_only_requested_quarters(self, client, warehouse):
+        """Verify quarters outside the request are pruned."""
+        warehouse.ingest(2023, 4)
+        client.edgar_session.stream_to_file = _stream_zip(_build_zip_bytes({
+            "sub.txt": "adsh\tcik\tname\n0002\t1\tOther Co\n",
+            "num.txt": "adsh\ttag\tvalue\n0002\tRevenues\t1\n",
+            "tag.txt": "tag\tversion\nRevenues\tus-gaap/2023\n",
+            "pre.txt": "adsh\treport\n0002\t1\n",
+        }))
+        warehouse.ingest(2024, 1)
+
+        assert warehouse.quarters() == ["2023q4", "2024q1"]
+        assert warehouse.read("sub", quarters=[(2024, 1)]).column("name").to_pylist() == ["Other Co"]
+        assert warehouse.read("sub").num_rows == 3
+
+    def test_read_does_not_ingest_unless_asked(self, client, warehouse):
+        """Verify a missing quarter raises instead of starting a download."""
+        with pytest.raises(ValueError, match="ingest=True"):
+            warehouse.read("num", quarters=[(2023, 4)])
+        client.edgar_session.stream_to_file.assert_not_called()
+
+        client.edgar_session.stream_to_file = MagicMock(return_value=False)
+        assert warehouse.read("num", quarters=[(2009, 1)], columns=["adsh"], ingest=True).num_rows == 0
+
+    def test_unknown_table_raises(self, warehouse):
+        """Verify table names are validated."""
+        with pytest.raises(ValueError, match="table must be one of"):
+            warehouse.read("cal")
+
+
+class TestWarehouseDataframes:
+    """Tests for get_financial_statements_dataframes with a warehouse."""
+
+    def test_dataframes_come_from_warehouse(self, client):
+        """Verify frames are typed and served without re-downloading."""
+        pytest.importorskip("pandas", reason="pandas required")
+        datasets = client.datasets()
+
+        first = datasets.get_financial_statements_dataframes(2023, 4)
+        second = datasets.get_financial_statements_dataframes(2023, 4)
+
+        assert set(first) == {"sub", "num", "tag", "pre"}
+        assert list(second["sub"]["name"]) == ["Apple Inc.", "Microsoft Corp"]
+        assert second["num"]["value"].iloc[0] == Decimal("383285000000")
+        assert client.edgar_session.stream_to_file.call_count == 1
+
+    def test_client_without_warehouse(self):
+        """Verify the warehouse is opt-in."""
+        edgar_client = EdgarClient(user_agent="Test test@example.com")
+        assert edgar_client.datasets().warehouse is None
@@ -203,6 +203,10 @@ class TestFact:
         with pytest.raises(AttributeError):
             fact.raw = {}
 
+    def test_slots(self):
+        """Verify facts carry no per-instance dict."""
+        assert not hasattr(Fact(raw={"val": 1}), "__dict__")
+
 
 # ---------------------------------------------------------------------------
 # Facts model tests
@@ -375,6 +379,47 @@ class TestFacts:
             facts.raw = {}
 
 
+    def test_get_multi_unit_order_is_stable(self):
+        """Verify ties on end date keep unit order, as a stable sort would."""
+        facts = Facts(raw=SAMPLE_COMPANY_FACTS)
+        all_facts = facts.get("us-gaap", "AccountsPayableCurrent")
+        assert [f.value for f in all_facts] == [64115000000, 62611000000, 59000000000]
+
+    def test_get_reuses_raw_entries(self):
+        """Verify get() wraps the raw dicts instead of copying them."""
+        facts = Facts(raw=SAMPLE_COMPANY_FACTS)
+        raw_eur = SAMPLE_COMPANY_FACTS["facts"]["us-gaap"]["AccountsPayableCurrent"]["units"]["EUR"]
+        assert facts.get("us-gaap", "AccountsPayableCurrent", unit="EUR")[0].raw is raw_eur[0]
+
+    def test_fact_table_is_built_once(self):
+        """Verify the columnar table is built lazily and cached."""
+        facts = Facts(raw=SAMPLE_COMPANY_FACTS)
+        assert "_table" not in facts.__dict__
+        facts.get("us-gaap", "Revenue")
+        table = facts.__dict__["_table"]
+        facts.get("us-gaap", "AccountsPayableCurrent", unit="USD")
+        assert facts.__dict__["_table"] is table
+
+    def test_fact_table_slices(self):
+        """Verify taxonomy and concept lookups are contiguous ranges."""
+        table = Facts(raw=SAMPLE_COMPANY_FACTS)._table  # pylint: disable=protected-access
+        concept_rows = table.select("us-gaap", "AccountsPayableCurrent")
+        assert isinstance(concept_rows, range)
+        assert len(concept_rows) == 3
+        assert isinstance(table.select("us-gaap"), range)
+        assert list(table.select("us-gaap", "AccountsPayableCurrent", "EUR")) == [concept_rows[2]]
+        assert table.columns["fiscal_year"][concept_rows[0]] == 2022
+
+    def test_fact_table_unit_selection(self):
+        """Verify unit-only selections match a row-by-row unit filter, in row order."""
+        table = Facts(raw=SAMPLE_COMPANY_FACTS)._table  # pylint: disable=protected-access
+        for taxonomy in (None, *table._taxonomies):  # pylint: disable=protected-access
+            span = table.select(taxonomy)
+            for unit in ("USD", "EUR", "shares", "nope"):
+                expected = [i for i in span if table.unit[i] == unit]
+                assert list(table.select(taxonomy, unit=unit)) == expected
+
+
 # ---------------------------------------------------------------------------
 # Company.get_facts() integration tests
 # ---------------------------------------------------------------------------
@@ -398,6 +443,7 @@ class TestCompanyGetFacts:
         """Verify get_facts() returns a Facts model instance."""
         session = MagicMock()
         session.cache = None
+        session.bulk_data = None
         session.make_request.return_value = SAMPLE_COMPANY_FACTS
         session.edgar_utilities = MagicMock()
 
@@ -412,6 +458,7 @@ class TestCompanyGetFacts:
         """Verify get_facts() returns None when xbrl_facts returns None."""
         session = MagicMock()
         session.cache = None
+        session.bulk_data = None
         session.make_request.return_value = None
         session.edgar_utilities = MagicMock()
 
@@ -431,6 +478,7 @@ class TestXbrlGetFacts:
         """Verify Xbrl.get_facts() returns a Facts model instance."""
         session = MagicMock()
         session.cache = None
+        session.bulk_data = None
         session.make_request.return_value = SAMPLE_COMPANY_FACTS
         session.edgar_utilities = MagicMock()
 
@@ -444,6 +492,7 @@ class TestXbrlGetFacts:
         """Verify Xbrl.get_facts() returns None when company_facts returns None."""
         session = MagicMock()
         session.cache = None
+        session.bulk_data = None
         session.make_request.return_value = None
         session.edgar_utilities = MagicMock()
 